@@ -0,0 +1,82 @@
+"""Attaching patrol AI to a garrison of guards.
+
+The legacy path created one persistent Script per guard, each with its own
+database row, attributes and reactor timer. The AI ticker subscribes the
+guards to one shared bucket per interval and keeps their state in memory.
+"""
+
+import time
+from unittest.mock import patch
+
+from django.db import connection
+from evennia import create_object
+from evennia.scripts.models import ScriptDB
+from evennia.utils.test_resources import EvenniaTest
+
+from scripts.guard_patrol import GuardPatrol
+from typeclasses.npcs import BaseNPC
+from typeclasses.scripts import Script
+from world.npc_handlers import ai_ticker
+
+GUARDS = 500
+
+
+class LegacyGuardPatrol(Script):
+    def at_script_creation(self):
+        self.key = "guard_patrol"
+        self.interval = 10
+        self.persistent = True
+        self.db.skip_move_if_target = False
+        self.db.patrol = []
+        self.db.index = 0
+
+
+class BenchAITicker(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        ai_ticker.reset()
+        self.addCleanup(ai_ticker.reset)
+        self.guards = [
+            create_object(BaseNPC, key=f"guard{i}", location=self.room1) for i in range(GUARDS)
+        ]
+
+    def _measure(self, func):
+        queries = []
+
+        def _count(execute, sql, params, many, context):
+            queries.append(sql)
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(_count):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+        return elapsed, len(queries)
+
+    def test_attach(self):
+        before = ScriptDB.objects.count()
+
+        def legacy():
+            for guard in self.guards:
+                guard.scripts.add(LegacyGuardPatrol, autostart=False)
+
+        legacy_time, legacy_queries = self._measure(legacy)
+        legacy_rows = ScriptDB.objects.count() - before
+        ScriptDB.objects.filter(db_typeclass_path__endswith="LegacyGuardPatrol").delete()
+
+        def subscribed():
+            for guard in self.guards:
+                ai_ticker.subscribe(guard, GuardPatrol, state={"patrol": ["east", "west"]})
+            ai_ticker.flush()
+
+        with patch("world.npc_handlers.ai_ticker.delay"):
+            new_time, new_queries = self._measure(subscribed)
+            metrics = ai_ticker.get_metrics()
+        self.assertEqual(metrics["subscriptions"], GUARDS)
+
+        print(
+            f"\nAttach patrol AI to {GUARDS} guards: scripts {legacy_time * 1000:.1f} ms "
+            f"({legacy_queries} queries, {legacy_rows} rows, {legacy_rows} timers), "
+            f"ticker {new_time * 1000:.1f} ms ({new_queries} queries, 0 rows, "
+            f"{metrics['timers']} timer)"
+        )
@@ -0,0 +1,68 @@
+"""Cost of one global tick with 10k stored characters, 200 of them online.
+
+The legacy path scanned every ``Character`` row and ticked it; the timer
+queue only wakes characters whose effects or hunger are due.
+"""
+
+import time
+
+from evennia.objects.models import ObjectDB
+from evennia.typeclasses.attributes import Attribute
+from evennia.utils.test_resources import EvenniaTest
+
+from world.system import effect_timers, state_manager
+from world.system.constants import MAX_SATED
+
+STORED = 10_000
+ONLINE = 200
+TICKS = 60
+CHARACTER = "typeclasses.characters.Character"
+
+
+def _legacy_tick_all():
+    from typeclasses.characters import Character
+
+    for chara in Character.objects.all():
+        state_manager.tick_character(chara)
+
+
+class BenchEffectExpiry(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        effect_timers.reset()
+        ObjectDB.objects.bulk_create(
+            ObjectDB(db_key=f"char{i}", db_typeclass_path=CHARACTER)
+            for i in range(STORED)
+        )
+        chars = list(ObjectDB.objects.filter(db_typeclass_path=CHARACTER))
+        attrs = Attribute.objects.bulk_create(
+            Attribute(db_key="sated", db_value=MAX_SATED, db_model="objectdb")
+            for _ in chars
+        )
+        through = ObjectDB.db_attributes.through
+        through.objects.bulk_create(
+            through(objectdb_id=char.id, attribute_id=attr.id)
+            for char, attr in zip(chars, attrs)
+        )
+        self.online = chars[:ONLINE]
+        for i, char in enumerate(self.online):
+            state_manager.sync_timers(char)
+            if i % 4 == 0:
+                state_manager.add_status_effect(char, "stunned", 1 + i % 10)
+
+    def test_tick_cost(self):
+        start = time.perf_counter()
+        for _ in range(TICKS):
+            state_manager.tick_all()
+        queued = (time.perf_counter() - start) / TICKS
+
+        start = time.perf_counter()
+        _legacy_tick_all()
+        legacy = time.perf_counter() - start
+
+        print(
+            f"\nglobal tick ({STORED} stored, {ONLINE} online): "
+            f"full scan {legacy * 1000:.1f} ms, "
+            f"timer queue {queued * 1000:.2f} ms avg over {TICKS} ticks"
+        )
+        self.assertLess(queued, legacy)
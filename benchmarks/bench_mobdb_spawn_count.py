@@ -0,0 +1,60 @@
+"""Spawn counter updates with 5k prototypes stored in the MobDB.
+
+The legacy MobDB kept every prototype in one ``db.vnums`` dict, so each
+spawn re-pickled and rewrote the whole dict. Records are now stored per
+VNUM and counters are written back in batches.
+"""
+
+import time
+from unittest.mock import patch
+
+from evennia.utils.test_resources import EvenniaTest
+
+from world.scripts.mob_db import get_mobdb
+
+PROTOS = 5_000
+SPAWNS = 50
+
+
+def _legacy_increment(vnums, vnum):
+    # ``vnums`` is the saved dict of the old MobDB; every assignment re-pickles it
+    proto = vnums.get(vnum)
+    proto["spawn_count"] = int(proto.get("spawn_count", 0)) + 1
+    vnums[vnum] = proto
+    vnums[str(vnum)] = proto
+
+
+class BenchMobDBSpawnCount(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        self.mob_db = get_mobdb()
+        protos = {
+            vnum: {"key": f"mob{vnum}", "level": vnum % 50, "desc": "x" * 200}
+            for vnum in range(1, PROTOS + 1)
+        }
+        self.mob_db.replace_protos(protos)
+        legacy = {}
+        for vnum, proto in protos.items():
+            legacy[vnum] = legacy[str(vnum)] = dict(proto, spawn_count=0)
+        self.mob_db.attributes.add("legacy_vnums", legacy)
+
+    def test_increment_cost(self):
+        legacy_vnums = self.mob_db.db.legacy_vnums
+        start = time.perf_counter()
+        for i in range(SPAWNS):
+            _legacy_increment(legacy_vnums, 1 + i % PROTOS)
+        legacy = (time.perf_counter() - start) / SPAWNS
+
+        with patch("world.scripts.mob_db.delay"):
+            start = time.perf_counter()
+            for i in range(SPAWNS):
+                self.mob_db.increment_spawn_count(1 + i % PROTOS)
+            self.mob_db.flush_spawn_counts()
+            batched = (time.perf_counter() - start) / SPAWNS
+
+        print(
+            f"\nspawn counter update ({PROTOS} prototypes): "
+            f"whole dict {legacy * 1000:.2f} ms, per-vnum batched {batched * 1000:.3f} ms "
+            f"({legacy / batched:.0f}x)"
+        )
+        self.assertLess(batched, legacy)
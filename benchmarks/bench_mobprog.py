@@ -0,0 +1,103 @@
+"""Interpreted versus compiled mob program execution.
+
+The interpreter re-split the program, walked ``if``/``else``/``endif`` with
+a runtime stack, parsed every condition with ``simple_eval`` and
+re-tokenized every command on each run. The compiler turns the program
+into a cached instruction tuple with jump targets, parsed conditions and
+bound handlers.
+"""
+
+import time
+
+from evennia import create_object
+from evennia.utils.test_resources import EvenniaTest
+from evennia.utils.utils import simple_eval
+
+from typeclasses.npcs import BaseNPC
+from world.mpcommands import _run_single, execute_mpcommand
+
+RUNS = 2_000
+PROGRAM = """
+if mob.key == 'guard'
+    echo The guard eyes you warily.
+    if mob.location is not None
+        say Halt! State your business.
+    else
+        say Where am I?
+    endif
+    emote taps his spear.
+else
+    echo Someone stirs.
+    break
+endif
+if mob.db is not None and 1 + 1 == 2
+    say Move along; emote points down the road.
+endif
+echo The guard goes back to his post.
+"""
+
+
+def _interpret(mob, commands):
+    parts = []
+    for line in commands.splitlines():
+        parts.extend(x.strip() for x in line.split(";") if x.strip())
+    commands = parts
+    idx = 0
+    stack = []
+    while idx < len(commands):
+        cmd = commands[idx].strip()
+        lcmd = cmd.lower()
+        if lcmd.startswith("if "):
+            cond = bool(simple_eval(cmd[3:].strip(), names={"mob": mob}))
+            stack.append({"cond": cond, "execute": cond})
+        elif lcmd == "else":
+            if stack:
+                stack[-1]["execute"] = not stack[-1]["cond"]
+        elif lcmd == "endif":
+            if stack:
+                stack.pop()
+        elif lcmd == "break":
+            if not stack:
+                break
+            depth = len(stack)
+            stack.pop()
+            idx += 1
+            while idx < len(commands):
+                ncmd = commands[idx].strip().lower()
+                if ncmd.startswith("if "):
+                    depth += 1
+                elif ncmd == "endif":
+                    depth -= 1
+                    if depth == len(stack):
+                        break
+                idx += 1
+        elif all(frame["execute"] for frame in stack):
+            _run_single(mob, cmd)
+        idx += 1
+
+
+class BenchMobProg(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        self.mob = create_object(BaseNPC, key="guard", location=self.room1)
+        self.calls = []
+        self.mob.execute_cmd = self.room1.msg_contents = self.calls.append
+
+    def _measure(self, func):
+        self.calls.clear()
+        start = time.perf_counter()
+        for _ in range(RUNS):
+            func(self.mob, PROGRAM)
+        elapsed = time.perf_counter() - start
+        return elapsed / RUNS, list(self.calls)
+
+    def test_execute(self):
+        interpreted, interpreted_calls = self._measure(_interpret)
+        compiled, compiled_calls = self._measure(execute_mpcommand)
+        self.assertEqual(interpreted_calls, compiled_calls)
+
+        print(
+            f"\n{RUNS} runs of a {len(PROGRAM.splitlines())}-line mob program: interpreted "
+            f"{interpreted * 1e6:.1f} us/run, compiled {compiled * 1e6:.1f} us/run, "
+            f"{interpreted / compiled:.1f}x"
+        )
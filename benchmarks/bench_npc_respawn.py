@@ -0,0 +1,94 @@
+"""Kill/respawn cycles of an equipped NPC prototype.
+
+The legacy path deletes the dead NPC and builds a new one from the
+prototype (spawner, typeclass, equipment, finalization). With the NPC pool
+the dead NPC is parked with its gear and moved back on respawn.
+"""
+
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import override_settings
+from evennia import create_object
+from evennia.utils.test_resources import EvenniaTest
+
+from typeclasses.rooms import Room
+from utils import npc_pool, prototype_manager
+from utils.mob_proto import spawn_from_vnum
+from world.scripts.mob_db import get_mobdb
+
+CYCLES = 30
+VNUM = 5
+PROTO = {
+    "key": "goblin",
+    "typeclass": "typeclasses.npcs.BaseNPC",
+    "level": 3,
+    "actflags": ["noloot"],
+    "equipped": {"mainhand": 100001, "body": 100002},
+}
+ITEMS = {
+    100001: {"key": "club", "typeclass": "typeclasses.objects.Object"},
+    100002: {"key": "vest", "typeclass": "typeclasses.objects.Object"},
+}
+
+
+def _kill(npc):
+    with patch("world.mechanics.on_death_manager.handle_death", return_value=None), patch(
+        "utils.script_utils.get_respawn_manager", return_value=None
+    ):
+        npc.on_death(None)
+
+
+@override_settings(NPC_POOL_SIZE=5)
+class BenchNPCRespawn(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        self.tmp = TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patcher = patch.dict(prototype_manager.CATEGORY_DIRS, {"object": Path(self.tmp.name)})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for vnum, item in ITEMS.items():
+            prototype_manager.save_prototype("object", item, vnum=vnum)
+        get_mobdb().add_proto(VNUM, dict(PROTO))
+        self.room = create_object(Room, key="arena")
+        npc_pool.reset()
+        self.addCleanup(npc_pool.reset)
+
+    def _respawn(self, npc):
+        npc = npc_pool.acquire(VNUM, self.room) or spawn_from_vnum(VNUM, location=self.room)
+        npc.db.prototype_key = VNUM
+        return npc
+
+    def _cycle(self):
+        npc = self._respawn(None)
+        queries = []
+
+        def _count(execute, sql, params, many, context):
+            queries.append(sql)
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(_count):
+            start = time.perf_counter()
+            for _ in range(CYCLES):
+                _kill(npc)
+                npc = self._respawn(npc)
+            elapsed = (time.perf_counter() - start) / CYCLES
+        return elapsed, len(queries) / CYCLES
+
+    def test_respawn_cost(self):
+        with override_settings(NPC_POOL_ENABLED=False):
+            legacy, legacy_queries = self._cycle()
+        with override_settings(NPC_POOL_ENABLED=True):
+            pooled, pooled_queries = self._cycle()
+            self.assertEqual(npc_pool.get_metrics()["reused"], CYCLES)
+
+        print(
+            f"\nNPC death + respawn: delete/create {legacy * 1000:.1f} ms "
+            f"({legacy_queries:.0f} queries), pool {pooled * 1000:.1f} ms "
+            f"({pooled_queries:.0f} queries), {legacy / pooled:.1f}x"
+        )
+        self.assertLess(pooled, legacy)
@@ -0,0 +1,113 @@
+"""Overworld steps and biome cap checks.
+
+The legacy provider split and reversed ``MAP_STR`` for every coordinate
+check, name and minimap, and counted the biome population with a tag
+query on every spawn attempt. The compiled tile grid answers from
+memory, and the population is counted once and then kept up to date.
+"""
+
+import time
+
+from evennia.objects.models import ObjectDB
+from evennia.typeclasses.tags import Tag
+from evennia.utils.search import search_tag
+from evennia.utils.test_resources import EvenniaTest
+
+from world.maps import overworld
+from world.maps.overworld import MAP_KEY, MAP_STR, OverworldMapProvider
+
+STEPS = 20_000
+CHECKS = 200
+TAGGED = 2_000
+
+
+def _legacy_step(x, y):
+    rows = MAP_STR.split("\n")
+    rows.reverse()
+    if y not in range(len(rows)) or x not in range(len(rows[y])):
+        return None
+    if rows[y][x] not in MAP_KEY:
+        return None
+    rows = MAP_STR.split("\n")
+    rows.reverse()
+    name = f"In the {MAP_KEY[rows[y][x]].get('biome', 'wilderness')}"
+    rows = MAP_STR.split("\n")
+    rows.reverse()
+    minimap = ["-" * 29]
+    for i in range(y + 2, y - 3, -1):
+        row = rows[i][x - 2 : x + 3]
+        if i == y:
+            row = row[:2] + "|g@|n" + row[3:]
+        minimap.append(" " * 12 + row + " " * 12)
+    minimap.append("-" * 29)
+    return name, "\n".join(minimap)
+
+
+def _new_step(provider, x, y):
+    if not provider.is_valid_coordinates(None, (x, y)):
+        return None
+    return provider.get_location_name((x, y)), overworld.GRID.minimaps[(x, y)]
+
+
+class BenchOverworld(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        overworld.reset_population()
+        rows = MAP_STR.split("\n")
+        rows.reverse()
+        self.coords = [
+            (x, y) for y, row in enumerate(rows) for x, char in enumerate(row) if char in MAP_KEY
+        ]
+        ObjectDB.objects.bulk_create(
+            (ObjectDB(db_key=f"deer{i}") for i in range(TAGGED)), batch_size=1_000
+        )
+        tag = Tag.objects.create(db_key="forest", db_category="mob", db_model="objectdb")
+        ObjectDB.db_tags.through.objects.bulk_create(
+            ObjectDB.db_tags.through(objectdb_id=obj_id, tag_id=tag.id)
+            for obj_id in ObjectDB.objects.filter(db_key__startswith="deer").values_list(
+                "id", flat=True
+            )
+        )
+
+    def tearDown(self):
+        overworld.reset_population()
+        super().tearDown()
+
+    def test_steps(self):
+        provider = OverworldMapProvider()
+        coords = (self.coords * (STEPS // len(self.coords) + 1))[:STEPS]
+        for x, y in coords[:50]:
+            self.assertEqual(_legacy_step(x, y), _new_step(provider, x, y))
+
+        start = time.perf_counter()
+        for x, y in coords:
+            _legacy_step(x, y)
+        legacy = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for x, y in coords:
+            _new_step(provider, x, y)
+        new = time.perf_counter() - start
+
+        print(
+            f"\n{STEPS} overworld steps: legacy {legacy * 1000:.1f} ms "
+            f"({legacy / STEPS * 1e6:.2f} us/step), grid {new * 1000:.1f} ms "
+            f"({new / STEPS * 1e6:.2f} us/step)"
+        )
+
+    def test_cap_checks(self):
+        start = time.perf_counter()
+        for _ in range(CHECKS):
+            legacy_count = len(search_tag(key="forest", category="mob"))
+        legacy = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(CHECKS):
+            count = overworld.biome_population("forest", "mob")
+        new = time.perf_counter() - start
+        self.assertEqual(count, legacy_count)
+
+        print(
+            f"\n{CHECKS} cap checks with {TAGGED} tagged objects: search_tag "
+            f"{legacy * 1000:.1f} ms, counters {new * 1000:.1f} ms"
+        )
@@ -0,0 +1,61 @@
+"""Refreshes per second for a fully geared character.
+
+Compares a full ``refresh_stats`` rescan with the incremental mode used after
+a buff change.
+"""
+
+import time
+
+from evennia.utils import create
+from evennia.utils.test_resources import EvenniaTest
+
+from utils.slots import SLOT_ORDER
+from world import stats
+from world.system import stat_manager
+
+ITERATIONS = 200
+
+
+def _rate(func, iterations=ITERATIONS):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - start
+    return iterations / elapsed if elapsed else float("inf")
+
+
+class BenchRefreshStats(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        char = self.char1
+        stats.apply_stats(char)
+        equipment = {}
+        for slot in SLOT_ORDER:
+            item = create.create_object(
+                "typeclasses.objects.ClothingObject", key=slot, location=char
+            )
+            item.tags.add("equipment", category="flag")
+            item.db.stat_mods = {"STR": 1, "DEX": 1, "HP": 5, "armor": 2}
+            equipment[slot] = item
+        char.db.equipment = equipment
+        char.db.active_effects = {"STR": 2}
+        stat_manager.refresh_stats(char)
+
+    def test_refreshes_per_second(self):
+        char = self.char1
+
+        def full():
+            stat_manager.clear_stat_cache(char)
+            stat_manager.refresh_stats(char)
+
+        def incremental():
+            stat_manager.refresh_stats(char, changed=("buffs",))
+
+        full_rate = _rate(full)
+        inc_rate = _rate(incremental)
+        print(
+            f"\nrefresh_stats ({len(SLOT_ORDER)} items): "
+            f"full {full_rate:.0f}/s, incremental {inc_rate:.0f}/s "
+            f"({inc_rate / full_rate:.1f}x)"
+        )
+        self.assertGreater(inc_rate, full_rate)
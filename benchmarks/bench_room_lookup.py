@@ -0,0 +1,84 @@
+"""Room lookups by VNUM with 50k rooms in the database.
+
+The legacy path filtered on the pickled ``room_id`` attribute value, which
+no database index covers; the room index answers from memory after one
+warm-up read of the ``room_vnum`` tags.
+"""
+
+import time
+
+from evennia.objects.models import ObjectDB
+from evennia.typeclasses.attributes import Attribute
+from evennia.typeclasses.tags import Tag
+from evennia.utils.test_resources import EvenniaTest
+
+from utils import room_index
+
+ROOMS = 50_000
+LOOKUPS = 20
+ROOM = "typeclasses.rooms.Room"
+
+
+def _legacy_get(vnum):
+    return ObjectDB.objects.filter(
+        db_attributes__db_key="room_id", db_attributes__db_value=vnum
+    ).first()
+
+
+def _bulk_link(through, field, objs, targets):
+    through.objects.bulk_create(
+        (through(objectdb_id=obj.id, **{field: target.id}) for obj, target in zip(objs, targets)),
+        batch_size=5_000,
+    )
+
+
+class BenchRoomLookup(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        room_index.reset()
+        ObjectDB.objects.bulk_create(
+            (ObjectDB(db_key=f"room{i}", db_typeclass_path=ROOM) for i in range(ROOMS)),
+            batch_size=5_000,
+        )
+        rooms = list(ObjectDB.objects.filter(db_typeclass_path=ROOM).order_by("id"))
+        self.vnums = list(range(100_000, 100_000 + len(rooms)))
+        attrs = Attribute.objects.bulk_create(
+            (Attribute(db_key="room_id", db_value=vnum, db_model="objectdb") for vnum in self.vnums),
+            batch_size=5_000,
+        )
+        tags = Tag.objects.bulk_create(
+            (
+                Tag(db_key=str(vnum), db_category=room_index.TAG_CATEGORY, db_model="objectdb")
+                for vnum in self.vnums
+            ),
+            batch_size=5_000,
+        )
+        _bulk_link(ObjectDB.db_attributes.through, "attribute_id", rooms, attrs)
+        _bulk_link(ObjectDB.db_tags.through, "tag_id", rooms, tags)
+
+    def tearDown(self):
+        room_index.reset()
+        super().tearDown()
+
+    def test_lookup_cost(self):
+        start = time.perf_counter()
+        loaded = room_index.load()
+        warm = time.perf_counter() - start
+        self.assertGreaterEqual(loaded, ROOMS)
+
+        targets = self.vnums[-LOOKUPS:]
+        start = time.perf_counter()
+        legacy_rooms = [_legacy_get(vnum) for vnum in targets]
+        legacy = (time.perf_counter() - start) / LOOKUPS
+
+        start = time.perf_counter()
+        indexed_rooms = [room_index.get_room(vnum) for vnum in targets]
+        indexed = (time.perf_counter() - start) / LOOKUPS
+        self.assertEqual(indexed_rooms, legacy_rooms)
+
+        print(
+            f"\nroom lookup by VNUM ({ROOMS} rooms): "
+            f"attribute filter {legacy * 1000:.2f} ms, index {indexed * 1000:.4f} ms "
+            f"({legacy / indexed:.0f}x), warm-up {warm * 1000:.0f} ms"
+        )
+        self.assertLess(indexed, legacy)
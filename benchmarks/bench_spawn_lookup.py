@@ -0,0 +1,78 @@
+"""Spawn entry lookups with 5k spawn entries registered.
+
+The legacy path matched every entry of the room's ``spawn_entries`` in
+turn on each ``record_spawn``/``record_death``. The index goes straight
+to the entry for ``(prototype, room id)``.
+"""
+
+import time
+
+from evennia import create_object
+from evennia.utils import create
+from evennia.utils.test_resources import EvenniaTest
+
+from scripts.mob_respawn_manager import MobRespawnManager
+from typeclasses.rooms import Room
+
+ENTRIES = 5_000
+LOOKUPS = 200
+#: spawn entries per room for the live respawn manager
+ROOM_ENTRIES = 100
+
+
+def _legacy_room_find(script, proto, room):
+    norm = script._normalize_proto(proto)
+    for idx, entry in enumerate(room.db.spawn_entries or []):
+        if script._normalize_proto(entry.get("prototype")) == norm:
+            return idx, entry
+    return None, None
+
+
+def _avg_ms(func, iterations=LOOKUPS):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+class BenchRespawnManagerLookup(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        self.script = create.create_script(
+            MobRespawnManager, key="mob_respawn_manager", autostart=False
+        )
+        self.rooms = []
+        for vnum in range(1, ENTRIES // ROOM_ENTRIES + 1):
+            room = create_object(Room, key=f"room{vnum}")
+            room.set_area("bench", vnum)
+            room.db.spawn_entries = [
+                {
+                    "area": "bench",
+                    "prototype": f"mob{num}",
+                    "room_id": vnum,
+                    "max_count": 1,
+                    "respawn_rate": 60,
+                    "active_mobs": [],
+                    "dead_mobs": [],
+                    "last_spawn": 0.0,
+                }
+                for num in range(ROOM_ENTRIES)
+            ]
+            self.rooms.append(room)
+        self.script._trackers()
+
+    def test_lookup_cost(self):
+        room = self.rooms[-1]
+        # the last entry of the room, the worst case for a scan
+        proto = f"mob{ROOM_ENTRIES - 1}"
+        found = self.script._find_entry(proto, room)
+        self.assertEqual(found, _legacy_room_find(self.script, proto, room))
+
+        legacy = _avg_ms(lambda: _legacy_room_find(self.script, proto, room))
+        indexed = _avg_ms(lambda: self.script._find_entry(proto, room))
+        print(
+            f"\nrespawn manager entry lookup ({ENTRIES} entries, {ROOM_ENTRIES} per room): "
+            f"room scan {legacy:.3f} ms, index {indexed:.4f} ms "
+            f"({legacy / indexed:.0f}x)"
+        )
+        self.assertLess(indexed, legacy)
@@ -0,0 +1,94 @@
+"""Hourly trigger dispatch with many trigger-carrying objects.
+
+The legacy dispatch loaded every object holding a trigger attribute and
+checked each of them. The hour/time index only touches the objects with
+a trigger due at that hour.
+"""
+
+import time
+from datetime import datetime
+
+from django.db import connection
+from evennia.objects.models import ObjectDB
+from evennia.typeclasses.attributes import Attribute
+from evennia.utils.dbserialize import to_pickle
+from evennia.utils.test_resources import EvenniaTest
+
+from world import triggers
+from world.triggers import TriggerManager
+
+OBJECTS = 3_000
+HOURLY = 30
+OBJ = "typeclasses.objects.Object"
+
+
+def _legacy_hour(now):
+    hour = now.hour
+    seen = set()
+    for attr in ("triggers", "obj_triggers", "room_triggers"):
+        for obj in ObjectDB.objects.get_by_attribute(key=attr):
+            if obj.id in seen:
+                continue
+            seen.add(obj.id)
+            TriggerManager(obj, attr=attr).check("hour", hour=hour)
+
+
+class BenchTimeTriggers(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        triggers.reset_time_index()
+        triggers.clear_trigger_cache()
+        ObjectDB.objects.bulk_create(
+            (ObjectDB(db_key=f"thing{i}", db_typeclass_path=OBJ) for i in range(OBJECTS)),
+            batch_size=1_000,
+        )
+        objs = list(ObjectDB.objects.filter(db_typeclass_path=OBJ).order_by("id"))
+        values = []
+        for i in range(len(objs)):
+            if i % (OBJECTS // HOURLY) == 0:
+                trigs = {"hour": [{"hour": i % 24, "response": "emote stretches"}]}
+            else:
+                trigs = {"on_look": [{"response": "emote shines"}]}
+            values.append(to_pickle(trigs))
+        attrs = Attribute.objects.bulk_create(
+            (Attribute(db_key="obj_triggers", db_value=v, db_model="objectdb") for v in values),
+            batch_size=1_000,
+        )
+        ObjectDB.db_attributes.through.objects.bulk_create(
+            (
+                ObjectDB.db_attributes.through(objectdb_id=obj.id, attribute_id=attr.id)
+                for obj, attr in zip(objs, attrs)
+            ),
+            batch_size=1_000,
+        )
+
+    def tearDown(self):
+        triggers.reset_time_index()
+        triggers.clear_trigger_cache()
+        super().tearDown()
+
+    def _measure(self, func, hours):
+        queries = []
+
+        def _count(execute, sql, params, many, context):
+            queries.append(sql)
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(_count):
+            start = time.perf_counter()
+            for hour in hours:
+                func(datetime(2024, 1, 1, hour))
+            elapsed = time.perf_counter() - start
+        return elapsed / len(hours), len(queries) / len(hours)
+
+    def test_hourly_dispatch(self):
+        hours = list(range(24))
+        legacy, legacy_queries = self._measure(_legacy_hour, hours)
+        triggers.process_hour_triggers(datetime(2024, 1, 1, 0))
+        indexed, indexed_queries = self._measure(triggers.process_hour_triggers, hours)
+
+        print(
+            f"\nHourly dispatch over {OBJECTS} trigger objects ({HOURLY} hourly): legacy "
+            f"{legacy * 1000:.1f} ms ({legacy_queries:.0f} queries), index "
+            f"{indexed * 1000:.2f} ms ({indexed_queries:.0f} queries) per hour"
+        )
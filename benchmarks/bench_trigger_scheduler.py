@@ -0,0 +1,80 @@
+"""Registering the random triggers of freshly spawned NPCs.
+
+The legacy path armed one persistent ``delay()`` task per trigger. Every
+task is written to the task handler table, which is saved whole on each
+add and on each re-arm. The trigger scheduler keeps the schedule in memory
+and saves a compact table only every ``FLUSH_TICKS`` ticks.
+"""
+
+import time
+from unittest.mock import patch
+
+from django.db import connection
+from evennia import create_object
+from evennia.objects.objects import DefaultObject
+from evennia.scripts.taskhandler import TASK_HANDLER
+from evennia.utils import delay
+from evennia.utils.test_resources import EvenniaTest
+
+from world import trigger_scheduler
+from world.triggers import TriggerManager
+
+NPCS = 1000
+TRIGGER = {"interval": 60, "response": "say hello"}
+
+
+def _legacy_random(obj, trig):
+    TriggerManager(obj)._evaluate(trig)
+    delay(int(trig.get("interval", 60)), _legacy_random, obj, trig, persistent=True)
+
+
+class BenchTriggerScheduler(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        trigger_scheduler.reset()
+        self.addCleanup(trigger_scheduler.reset)
+        patcher = patch("world.trigger_scheduler.delay")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.npcs = []
+        for i in range(NPCS):
+            npc = create_object(DefaultObject, key=f"npc{i}", location=self.room1)
+            npc.db.triggers = {"random": [dict(TRIGGER)]}
+            self.npcs.append(npc)
+
+    def tearDown(self):
+        TASK_HANDLER.clear()
+        super().tearDown()
+
+    def _measure(self, func):
+        queries = []
+
+        def _count(execute, sql, params, many, context):
+            queries.append(sql)
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(_count):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+        return elapsed, len(queries)
+
+    def test_register(self):
+        def legacy():
+            for npc in self.npcs:
+                delay(60, _legacy_random, npc, dict(TRIGGER), persistent=True)
+
+        def scheduled():
+            for npc in self.npcs:
+                TriggerManager(npc, attr="triggers").start_random_triggers()
+            trigger_scheduler.flush()
+
+        legacy_time, legacy_queries = self._measure(legacy)
+        new_time, new_queries = self._measure(scheduled)
+        self.assertEqual(trigger_scheduler.get_metrics()["scheduled"], NPCS)
+
+        print(
+            f"\nRegister {NPCS} random triggers: persistent delay {legacy_time * 1000:.1f} ms "
+            f"({legacy_queries} queries, {len(TASK_HANDLER.tasks)} tasks), "
+            f"scheduler {new_time * 1000:.1f} ms ({new_queries} queries)"
+        )
@@ -0,0 +1,90 @@
+"""Trigger checks on an NPC with a handful of mob programs.
+
+The legacy path scanned the alias table, read the trigger attribute and
+re-parsed every condition with ``simple_eval`` on each check. The compiled
+table answers from prepared triggers cached per object and event.
+"""
+
+import time
+from unittest.mock import patch
+
+from evennia import create_object
+from evennia.objects.objects import DefaultObject
+from evennia.utils.test_resources import EvenniaTest
+from evennia.utils.utils import simple_eval
+
+from world import triggers
+from world.triggers import TriggerManager
+
+CHECKS = 5_000
+TRIGGERS = {
+    "greet_prog": [
+        {"conditions": "caller is not None and npc is not None", "response": "say Welcome"},
+        {"match": ["HELLO", "Hail"], "response": "bow"},
+    ],
+    "speech_prog": [
+        {"match": "quest", "conditions": "room is not None", "response": "say Seek the cave"},
+        {"match": "buy", "response": "say Browse my wares"},
+    ],
+    "fight_prog": [{"hp_pct": 20, "response": "flee"}],
+    "random": [{"interval": 30, "percent": 10, "response": "emote yawns"}],
+}
+EVENTS = ("on_enter", "on_speak", "on_leave", "on_attack", "on_look")
+
+
+def _legacy_check(manager, event, **kwargs):
+    events = [event]
+    if alias := manager.ALIASES.get(event):
+        events.append(alias)
+    for key, val in manager.ALIASES.items():
+        if val == event:
+            events.append(key)
+    data = getattr(manager.obj.db, manager.attr, {}) or {}
+    fired = 0
+    for ev in dict.fromkeys(events):
+        for trig in data.get(ev) or ():
+            cond = trig.get("conditions")
+            if isinstance(cond, str):
+                names = {"caller": kwargs.get("caller"), "npc": manager.obj, "room": None}
+                if not simple_eval(cond, names=names):
+                    continue
+            match = trig.get("match")
+            if match:
+                text = str(kwargs.get("message") or "").lower()
+                if isinstance(match, str):
+                    match = [match]
+                if not any(m.lower() in text for m in match):
+                    continue
+            fired += 1
+    return fired
+
+
+class BenchTriggerTables(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        triggers.clear_trigger_cache()
+        self.addCleanup(triggers.clear_trigger_cache)
+        self.npc = create_object(DefaultObject, key="innkeeper", location=self.room1)
+        self.npc.db.triggers = TRIGGERS
+
+    def test_check(self):
+        manager = TriggerManager(self.npc, attr="triggers")
+        kwargs = {"caller": self.char1, "message": "hello quest"}
+        calls = [(EVENTS[i % len(EVENTS)], kwargs) for i in range(CHECKS)]
+
+        start = time.perf_counter()
+        for event, kwargs in calls:
+            _legacy_check(manager, event, **kwargs)
+        legacy = time.perf_counter() - start
+
+        with patch.object(TriggerManager, "_execute"):
+            start = time.perf_counter()
+            for event, kwargs in calls:
+                manager.check(event, **kwargs)
+            compiled = time.perf_counter() - start
+
+        print(
+            f"\n{CHECKS} trigger checks: legacy {legacy * 1000:.1f} ms "
+            f"({legacy / CHECKS * 1e6:.1f} us/check), compiled {compiled * 1000:.1f} ms "
+            f"({compiled / CHECKS * 1e6:.1f} us/check)"
+        )
@@ -0,0 +1,83 @@
+"""VNUM allocations with 60k numbers already used in the room range.
+
+The legacy registry reloaded the JSON file, rebuilt a set, walked VNUMs one
+at a time and rewrote the sorted ``used`` list on every allocation. The
+bitmap registry answers from memory and writes one compressed bitmap per
+category.
+"""
+
+import json
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from evennia.utils.test_resources import EvenniaTest
+
+from utils import vnum_registry
+
+USED = 60_000
+ALLOCATIONS = 50
+
+
+def _legacy_next(path, category):
+    start, end = vnum_registry.VNUM_RANGES[category]
+    with path.open() as f:
+        data = json.load(f)
+    entry = data.setdefault(category, {"used": [], "next": start})
+    vnum = max(entry.get("next", start), start)
+    used = set(entry.get("used", []))
+    while vnum in used and vnum <= end:
+        vnum += 1
+    used.add(vnum)
+    entry["used"] = sorted(used)
+    entry["next"] = vnum + 1
+    with path.open("w") as f:
+        json.dump(data, f, indent=4)
+    return vnum
+
+
+class BenchVnumRegistry(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        self.tmp = TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = Path(self.tmp.name) / "vnums.json"
+        patcher = patch.object(vnum_registry, "_REG_PATH", self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        vnum_registry.reset()
+        self.addCleanup(vnum_registry.reset)
+        start = vnum_registry.VNUM_RANGES["room"][0]
+        # every other number in the first stretch is used, so searches walk
+        self.used = list(range(start, start + USED, 2)) + list(
+            range(start + USED, start + USED + USED // 2)
+        )
+
+    def _seed(self):
+        start = vnum_registry.VNUM_RANGES["room"][0]
+        with self.path.open("w") as f:
+            json.dump({"room": {"used": self.used, "next": start}}, f)
+
+    def test_allocation_cost(self):
+        self._seed()
+        start = time.perf_counter()
+        legacy_vnums = [_legacy_next(self.path, "room") for _ in range(ALLOCATIONS)]
+        legacy = (time.perf_counter() - start) / ALLOCATIONS
+
+        self._seed()
+        vnum_registry.reset()
+        start = time.perf_counter()
+        vnum_registry.validate_vnum(vnum_registry.VNUM_RANGES["room"][0], "room")
+        warm = time.perf_counter() - start
+        start = time.perf_counter()
+        vnums = [vnum_registry.get_next_vnum("room") for _ in range(ALLOCATIONS)]
+        bitmap = (time.perf_counter() - start) / ALLOCATIONS
+        self.assertEqual(vnums, legacy_vnums)
+
+        print(
+            f"\nVNUM allocation ({len(self.used)} used): JSON list {legacy * 1000:.2f} ms, "
+            f"bitmap {bitmap * 1000:.3f} ms ({legacy / bitmap:.0f}x), "
+            f"file {self.path.stat().st_size} bytes, legacy import {warm * 1000:.0f} ms"
+        )
+        self.assertLess(bitmap, legacy)
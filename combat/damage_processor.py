@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from typing import Dict, List
-from evennia.utils import delay
 from django.conf import settings
 
 from combat.combatants import CombatParticipant, _current_hp
@@ -15,6 +14,7 @@ from combat.aggro_tracker import AggroTracker
 from combat.damage_types import DamageType
 from combat.events import combatant_defeated
 from world.system import state_manager
+from utils import occupancy
 
 
 class DamageProcessor:
@@ -168,7 +168,7 @@ class DamageProcessor:
         room = getattr(target, "location", None) or prev_loc
         if not room:
             return
-        for obj in room.contents:
+        for obj in occupancy.characters(room):
             has_hp = hasattr(obj, "hp") or getattr(getattr(obj, "traits", None), "health", None) is not None
             if not has_hp:
                 continue
@@ -330,6 +330,14 @@ class DamageProcessor:
 
     def process_round(self) -> None:
         self.turn_manager.start_round()
+        try:
+            self._resolve_round()
+        finally:
+            self.turn_manager.end_round()
+
+        self.engine.round += 1
+
+    def _resolve_round(self) -> None:
         self.round_output = []
         damage_totals: Dict[object, int] = {}
 
@@ -352,7 +360,3 @@ class DamageProcessor:
         self.round_output.append("\n")
         self._broadcast_round_output(room)
 
-        self.engine.round += 1
-        if self.engine.round_time is not None and any(_current_hp(p.actor) > 0 for p in self.turn_manager.participants):
-            delay(self.engine.round_time, self.engine.process_round)
-
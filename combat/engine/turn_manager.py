@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Iterable, List
 
-from world.system import state_manager
+from world.system import state_manager, stat_snapshot
 
 from .common import HASTE_PER_EXTRA_ATTACK, MAX_ATTACKS_PER_ROUND
 from ..combatants import CombatParticipant, _current_hp
@@ -20,6 +20,7 @@ class TurnManager:
         self.use_initiative = use_initiative
         self.participants: List[CombatParticipant] = []
         self.queue: List[CombatParticipant] = []
+        self.snapshot_actors: List[object] = []
         if participants:
             for p in participants:
                 self.add_participant(p)
@@ -81,6 +82,16 @@ class TurnManager:
         if self.use_initiative:
             self.queue.sort(key=lambda p: p.initiative, reverse=True)
 
+        # freeze stat inputs so combat math reads each actor once per round
+        stat_snapshot.release_snapshots(self.snapshot_actors)
+        self.snapshot_actors = [p.actor for p in self.participants]
+        stat_snapshot.take_snapshots(self.snapshot_actors)
+
+    def end_round(self) -> None:
+        """Release the stat snapshots taken by :meth:`start_round`."""
+        stat_snapshot.release_snapshots(self.snapshot_actors)
+        self.snapshot_actors = []
+
     # -------------------------------------------------------------
     # action gathering
     # -------------------------------------------------------------
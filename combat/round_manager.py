@@ -5,6 +5,8 @@ re-exports these classes for backward compatibility."""
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import time
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Set
@@ -18,6 +20,152 @@ from combat.events import combat_started, round_processed, combat_ended
 
 logger = logging.getLogger(__name__)
 
+class ScheduledTick:
+    """Heap entry for a pending combat round."""
+
+    __slots__ = ("due", "seq", "instance", "cancelled")
+
+    def __init__(self, due: float, seq: int, instance: "CombatInstance") -> None:
+        self.due = due
+        self.seq = seq
+        self.instance = instance
+        self.cancelled = False
+
+    def __lt__(self, other: "ScheduledTick") -> bool:
+        return (self.due, self.seq) < (other.due, other.seq)
+
+    def cancel(self) -> None:
+        """Drop this entry; it is discarded lazily when it reaches the heap top."""
+        self.cancelled = True
+
+
+class CombatScheduler:
+    """Drive every combat instance from a single reactor timer.
+
+    Pending rounds live in a min-heap ordered by due time. Only the earliest
+    entry holds a reactor callback; when it fires, every instance due within
+    ``tick_slice`` seconds is processed in the same batch before the timer is
+    re-armed for the next entry.
+    """
+
+    def __init__(self, tick_slice: Optional[float] = None) -> None:
+        if tick_slice is None:
+            tick_slice = getattr(settings, "COMBAT_TICK_SLICE", 0.1)
+        self.tick_slice = tick_slice
+        self._heap: List[ScheduledTick] = []
+        self._seq = itertools.count()
+        self._handle = None
+        self._armed_for: Optional[float] = None
+        self._running = False
+        self.reset_metrics()
+
+    # ------------------------------------------------------------------
+    # scheduling
+    # ------------------------------------------------------------------
+
+    def schedule(self, instance: "CombatInstance", seconds: float) -> ScheduledTick:
+        """Queue ``instance`` to tick after ``seconds`` and return its entry."""
+        entry = ScheduledTick(time.monotonic() + max(seconds or 0, 0), next(self._seq), instance)
+        heapq.heappush(self._heap, entry)
+        if not self._running:
+            self._arm()
+        return entry
+
+    def pending(self) -> int:
+        """Return the number of live entries waiting to fire."""
+        return sum(1 for entry in self._heap if not entry.cancelled)
+
+    def clear(self) -> None:
+        """Drop every pending entry and cancel the reactor timer."""
+        for entry in self._heap:
+            entry.cancel()
+        self._heap.clear()
+        self._disarm()
+
+    def _discard_cancelled(self) -> None:
+        while self._heap and self._heap[0].cancelled:
+            heapq.heappop(self._heap)
+
+    def _disarm(self) -> None:
+        if self._handle:
+            try:
+                self._handle.cancel()
+            except Exception:  # pragma: no cover - safety
+                pass
+        self._handle = None
+        self._armed_for = None
+
+    def _arm(self) -> None:
+        """Make sure a reactor callback is pending for the earliest entry."""
+        self._discard_cancelled()
+        if not self._heap:
+            self._disarm()
+            return
+        due = self._heap[0].due
+        if self._handle and self._armed_for is not None and self._armed_for <= due:
+            return
+        self._disarm()
+        self._armed_for = due
+        self._handle = delay(max(due - time.monotonic(), 0), self._run)
+
+    def _run(self) -> None:
+        """Process every entry due in the current time slice."""
+        self._handle = None
+        self._armed_for = None
+        now = time.monotonic()
+        horizon = now + self.tick_slice
+        batch = []
+        while self._heap and self._heap[0].due <= horizon:
+            entry = heapq.heappop(self._heap)
+            if not entry.cancelled:
+                batch.append(entry)
+
+        self._running = True
+        try:
+            for entry in batch:
+                if entry.cancelled:
+                    continue
+                entry.cancelled = True
+                self._record_lag(max(now - entry.due, 0.0))
+                try:
+                    entry.instance._tick()
+                except Exception as err:  # pragma: no cover - safety
+                    log_trace(f"Error running combat tick: {err}")
+        finally:
+            self._running = False
+        if batch:
+            self.metrics["batches"] += 1
+        self._arm()
+
+    # ------------------------------------------------------------------
+    # metrics
+    # ------------------------------------------------------------------
+
+    def reset_metrics(self) -> None:
+        """Reset the tick-lag counters."""
+        self.metrics = {
+            "batches": 0,
+            "ticks": 0,
+            "last_lag": 0.0,
+            "max_lag": 0.0,
+            "total_lag": 0.0,
+        }
+
+    def _record_lag(self, lag: float) -> None:
+        self.metrics["ticks"] += 1
+        self.metrics["last_lag"] = lag
+        self.metrics["total_lag"] += lag
+        if lag > self.metrics["max_lag"]:
+            self.metrics["max_lag"] = lag
+
+    def get_metrics(self) -> Dict:
+        """Return tick-lag statistics in seconds along with queue size."""
+        data = dict(self.metrics)
+        ticks = data["ticks"]
+        data["avg_lag"] = data["total_lag"] / ticks if ticks else 0.0
+        data["pending"] = self.pending()
+        return data
+
 
 @dataclass
 class CombatInstance:
@@ -78,7 +226,9 @@ class CombatInstance:
                 self.round_number + 1,
                 self.round_time,
             )
-        self.tick_handle = delay(self.round_time, self._tick)
+        self.tick_handle = CombatRoundManager.get().scheduler.schedule(
+            self, self.round_time
+        )
 
     def cancel_tick(self) -> None:
         """Cancel any pending tick."""
@@ -306,6 +456,7 @@ class CombatRoundManager:
         self.combats: Dict[int, CombatInstance] = {}
         self.combatant_to_combat: Dict[object, int] = {}
         self._next_id = 1
+        self.scheduler = CombatScheduler()
 
     @classmethod
     def get(cls) -> "CombatRoundManager":
@@ -425,10 +576,15 @@ class CombatRoundManager:
     # ------------------------------------------------------------------
     # debugging helpers
     # ------------------------------------------------------------------
+    def get_tick_metrics(self) -> Dict:
+        """Return scheduler tick-lag metrics."""
+        return self.scheduler.get_metrics()
+
     def get_combat_status(self) -> Dict:
         status = {
             "total_instances": len(self.combats),
             "instances": [],
+            "scheduler": self.get_tick_metrics(),
         }
 
         for inst in self.combats.values():
@@ -452,13 +608,20 @@ class CombatRoundManager:
             inst.end_combat("Force ended by admin")
         self.combats.clear()
         self.combatant_to_combat.clear()
+        self.scheduler.clear()
 
     def debug_info(self) -> str:
         """Return formatted debug information about the combat manager."""
         status = self.get_combat_status()
+        metrics = status["scheduler"]
         lines = [
             "Combat Manager Status:",
             f"  Active Instances: {status['total_instances']}",
+            f"  Pending Ticks: {metrics['pending']}",
+            f"  Tick Lag: last {metrics['last_lag'] * 1000:.1f}ms, "
+            f"avg {metrics['avg_lag'] * 1000:.1f}ms, "
+            f"max {metrics['max_lag'] * 1000:.1f}ms over {metrics['ticks']} ticks "
+            f"in {metrics['batches']} batches",
             "",
         ]
 
@@ -503,4 +666,9 @@ def leave_combat(chara) -> None:
         del chara.ndb.damage_log
 
 
-__all__ = ["CombatInstance", "CombatRoundManager", "leave_combat"]
+__all__ = [
+    "CombatInstance",
+    "CombatRoundManager",
+    "CombatScheduler",
+    "leave_combat",
+]
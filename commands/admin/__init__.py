@@ -19,7 +19,7 @@ from ..building import (
     CmdInitMidgard,
 )
 from world.stats import CORE_STAT_KEYS, ALL_STATS
-from world.system import stat_manager
+from world.system import stat_manager, state_manager
 from world.system.constants import MAX_LEVEL
 from utils.stats_utils import get_display_scroll, normalize_stat_key
 from utils import VALID_SLOTS, normalize_slot
@@ -61,6 +61,7 @@ from ..builder_types import CmdBuilderTypes
 from ..hedit import CmdHEdit
 from ..opedit import CmdOPEdit
 from ..rpedit import CmdRPEdit
+from .aimigrate import CmdAIMigrate
 from .resetworld import CmdResetWorld
 from .spawncontrol import CmdSpawnReload, CmdForceRespawn, CmdShowSpawns
 
@@ -193,7 +194,9 @@ class CmdSetStat(Command):
             return
 
         if stat_key_low == "sated":
+            state_manager.sync_timers(target)
             target.db.sated = value
+            state_manager.sync_timers(target)
             stat_manager.refresh_stats(target)
             self.msg(f"sated set to {value} on {target.key}.")
             self.msg(get_display_scroll(target))
@@ -1445,6 +1448,7 @@ class AdminCmdSet(CmdSet):
         self.add(CmdSpawnReload)
         self.add(CmdForceRespawn)
         self.add(CmdShowSpawns)
+        self.add(CmdAIMigrate)
         self.add(CmdScan)
 
 
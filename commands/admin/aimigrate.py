@@ -0,0 +1,41 @@
+from evennia import CmdSet
+
+from world.npc_handlers import ai_ticker
+
+from ..command import Command
+
+
+class CmdAIMigrate(Command):
+    """
+    Convert per-NPC AI scripts to shared ticker subscriptions.
+
+    Usage:
+        @aimigrate
+
+    Every Script attached to an object whose typeclass is an AI behavior,
+    such as ``scripts.guard_patrol.GuardPatrol``, is deleted and its NPC
+    subscribed to the behavior with the script's interval and attributes.
+    """
+
+    key = "@aimigrate"
+    locks = "cmd:perm(Admin)"
+    help_category = "Admin"
+
+    def func(self):
+        converted = ai_ticker.migrate_scripts()
+        metrics = ai_ticker.get_metrics()
+        buckets = ", ".join(
+            f"{interval}s: {count}" for interval, count in sorted(metrics["buckets"].items())
+        )
+        self.msg(
+            f"Converted {converted} AI scripts. {metrics['subscriptions']} behaviors "
+            f"subscribed on {metrics['timers']} timers ({buckets or 'none'})."
+        )
+
+
+class AIMigrateCmdSet(CmdSet):
+    key = "AIMigrateCmdSet"
+
+    def at_cmdset_creation(self):
+        super().at_cmdset_creation()
+        self.add(CmdAIMigrate)
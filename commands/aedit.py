@@ -7,12 +7,14 @@ from evennia.utils.evtable import EvTable
 
 from olc.base import OLCValidator
 from typeclasses.rooms import Room
+from utils import room_index
 from utils.prototype_manager import (load_all_prototypes, load_prototype,
                                      save_prototype)
 from world import area_npcs
-from world.areas import (Area, delete_area, find_area, get_areas,
-                         parse_area_identifier, rename_area, save_area,
-                         update_area)
+from world.areas import (Area, delete_area, find_area,
+                         find_overlapping_areas, get_areas,
+                         get_prototype_rooms, parse_area_identifier,
+                         rename_area, save_area, update_area)
 
 from .command import Command, MuxCommand
 
@@ -36,18 +38,7 @@ def _gather_room_ids(area: Area) -> list[int]:
             except (TypeError, ValueError):
                 pass
 
-    protos = load_all_prototypes("room")
-    for num, proto in protos.items():
-        if not proto:
-            continue
-        name = proto.get("area")
-        if not name or name.lower() != area.key.lower():
-            continue
-        rid = proto.get("room_id", num)
-        try:
-            ids.add(int(rid))
-        except (TypeError, ValueError):
-            continue
+    ids |= get_prototype_rooms(area.key)
 
     return sorted(ids)
 
@@ -222,13 +213,7 @@ class CmdASave(Command):
         for idx, area in enumerate(get_areas()):
             rooms = []
             for room_vnum in area.rooms:
-                objs = ObjectDB.objects.filter(
-                    db_attributes__db_key="room_id",
-                    db_attributes__db_value=room_vnum,
-                )
-                room = next(
-                    (o for o in objs if o.is_typeclass(Room, exact=False)), None
-                )
+                room = room_index.get_room(room_vnum)
                 if room:
                     rooms.append(room)
             if rooms:
@@ -343,15 +328,11 @@ class CmdAEdit(Command):
             for warn in AreaValidator().validate({"start": start_val, "end": end_val}):
                 self.msg(warn)
             start, end = min(start_val, end_val), max(start_val, end_val)
-            areas = get_areas()
-            for other in areas:
-                if other.key.lower() == area.key.lower():
-                    continue
-                if not (end < other.start or start > other.end):
-                    self.msg(
-                        f"Area '{name}' range overlaps with {other.key} ({other.start}-{other.end})"
-                    )
-                    return
+            for other in find_overlapping_areas(start, end, exclude=area.key):
+                self.msg(
+                    f"Area '{name}' range overlaps with {other.key} ({other.start}-{other.end})"
+                )
+                return
             area.start = start
             area.end = end
             update_area(idx, area)
@@ -4,9 +4,11 @@ from evennia.prototypes import spawner
 from evennia.utils.evtable import EvTable
 
 from typeclasses.rooms import Room
+from utils import room_index
 from utils.prototype_manager import load_all_prototypes, load_prototype
 from utils.script_utils import get_respawn_manager, respawn_area
-from world.areas import (Area, find_area, get_areas, parse_area_identifier,
+from world.areas import (Area, find_area, find_overlapping_areas, get_areas,
+                         get_prototype_rooms, parse_area_identifier,
                          save_area, update_area)
 
 from .aedit import CmdAEdit, CmdAList, CmdAreaAge, CmdAreaReset, CmdASave
@@ -43,35 +45,36 @@ class CmdAMake(Command):
             return
         if start > end:
             start, end = end, start
-        areas = get_areas()
-        for area in areas:
-            if not (end < area.start or start > area.end):
-                gaps: list[tuple[int, int | None]] = []
-                sorted_areas = sorted(areas, key=lambda a: a.start)
-                prev_end: int | None = None
-                for ar in sorted_areas:
-                    if prev_end is None:
-                        if ar.start > 1:
-                            gaps.append((1, ar.start - 1))
-                    else:
-                        if ar.start > prev_end + 1:
-                            gaps.append((prev_end + 1, ar.start - 1))
-                    prev_end = max(prev_end if prev_end is not None else ar.end, ar.end)
-                if prev_end is not None:
-                    gaps.append((prev_end + 1, None))
-
-                range_strs = []
-                for s, e in gaps:
-                    if e is None:
-                        range_strs.append(f"{s}-")
-                    else:
-                        range_strs.append(f"{s}-{e}")
+        overlaps = find_overlapping_areas(start, end)
+        if overlaps:
+            area = overlaps[0]
+            areas = get_areas()
+            gaps: list[tuple[int, int | None]] = []
+            sorted_areas = sorted(areas, key=lambda a: a.start)
+            prev_end: int | None = None
+            for ar in sorted_areas:
+                if prev_end is None:
+                    if ar.start > 1:
+                        gaps.append((1, ar.start - 1))
+                else:
+                    if ar.start > prev_end + 1:
+                        gaps.append((prev_end + 1, ar.start - 1))
+                prev_end = max(prev_end if prev_end is not None else ar.end, ar.end)
+            if prev_end is not None:
+                gaps.append((prev_end + 1, None))
+
+            range_strs = []
+            for s, e in gaps:
+                if e is None:
+                    range_strs.append(f"{s}-")
+                else:
+                    range_strs.append(f"{s}-{e}")
 
-                self.msg(
-                    f"Range overlaps with {area.key} ({area.start}-{area.end}). "
-                    f"Available ranges: {', '.join(range_strs)}"
-                )
-                return
+            self.msg(
+                f"Range overlaps with {area.key} ({area.start}-{area.end}). "
+                f"Available ranges: {', '.join(range_strs)}"
+            )
+            return
         new_area = Area(key=name, start=start, end=end)
         save_area(new_area)
         # tag the current room as the first room of this area
@@ -120,15 +123,11 @@ class CmdASet(Command):
                 return
             if start > end:
                 start, end = end, start
-            areas = get_areas()
-            for other in areas:
-                if other is area:
-                    continue
-                if not (end < other.start or start > other.end):
-                    self.msg(
-                        f"Range overlaps with {other.key} ({other.start}-{other.end})"
-                    )
-                    return
+            for other in find_overlapping_areas(start, end, exclude=area.key):
+                self.msg(
+                    f"Range overlaps with {other.key} ({other.start}-{other.end})"
+                )
+                return
             area.start = start
             area.end = end
         elif prop in ("desc", "description"):
@@ -222,16 +221,7 @@ class CmdRList(Command):
             if obj.is_typeclass(Room, exact=False)
         }
 
-        protos = load_all_prototypes("room")
-        proto_nums = set()
-        for num, proto in protos.items():
-            proto_area = proto.get("area")
-            if proto_area and proto_area.lower() == area.key.lower():
-                rid = proto.get("room_id", num)
-                try:
-                    proto_nums.add(int(rid))
-                except (TypeError, ValueError):
-                    continue
+        proto_nums = get_prototype_rooms(area.key)
 
         vnums = set(area.rooms) | set(rooms.keys()) | proto_nums
         if not vnums:
@@ -294,15 +284,9 @@ class CmdRMake(MuxCommand):
             self.msg(f"Room prototype {room_id} not found.")
             return
 
-        objs = ObjectDB.objects.filter(
-            db_attributes__db_key="area",
-            db_attributes__db_strvalue__iexact=area.key,
-        )
-        existing = None
-        for obj in objs:
-            if obj.db.room_id == room_id and obj.is_typeclass(Room, exact=False):
-                existing = obj
-                break
+        existing = room_index.get_room(room_id)
+        if existing and (existing.db.area or "").lower() != area.key.lower():
+            existing = None
 
         if existing:
             if force:
@@ -428,17 +412,11 @@ class CmdRSet(Command):
             if area_data and not (area_data.start <= room_id <= area_data.end):
                 self.msg("Number outside area range.")
                 return
-            objs = ObjectDB.objects.filter(
-                db_attributes__db_key="area",
-                db_attributes__db_strvalue__iexact=area,
-            )
-            for obj in objs:
-                if obj == room:
-                    continue
-                if obj.db.room_id == room_id:
-                    self.msg("Room already exists.")
-                    return
-            room.db.room_id = room_id
+            other = room_index.get_room(room_id)
+            if other and other != room and (other.db.area or "").lower() == area.lower():
+                self.msg("Room already exists.")
+                return
+            room.set_room_id(room_id)
             self.msg(f"Room id set to {room_id}.")
         else:
             self.msg("Usage: rset <area|id> <value>")
@@ -5,9 +5,9 @@ from evennia.objects.models import ObjectDB
 from .command import Command, MuxCommand
 from typeclasses.rooms import Room
 from world.areas import find_area, parse_area_identifier, find_area_by_vnum, update_area
-from utils import vnum_registry
+from utils import room_index, vnum_registry
 from utils import VALID_SLOTS, normalize_slot
-from utils.prototype_manager import CATEGORY_DIRS
+from utils.prototype_manager import delete_prototype
 
 
 DIR_FULL = {
@@ -183,14 +183,10 @@ class CmdDig(MuxCommand):
         if not area_data:
             caller.msg("No area found for that VNUM.")
             return
-        objs = ObjectDB.objects.filter(
-            db_attributes__db_key="area",
-            db_attributes__db_strvalue__iexact=area_data.key,
-        )
-        for obj in objs:
-            if obj.db.room_id == vnum and obj.is_typeclass(Room, exact=False):
-                caller.msg("Room already exists.")
-                return
+        existing = room_index.get_room(vnum)
+        if existing and (existing.db.area or "").lower() == area_data.key.lower():
+            caller.msg("Room already exists.")
+            return
 
         new_room = create_object(Room, key="Room")
         new_room.set_area(area_data.key, vnum)
@@ -258,14 +254,9 @@ class CmdTeleport(Command):
                 self.msg("Number outside area range.")
                 return
 
-        objs = ObjectDB.objects.filter(db_attributes__db_key="room_id", db_attributes__db_value=room_id)
-        if area_part:
-            objs = [obj for obj in objs if (obj.db.area or "").lower() == area_part.lower()]
-        room = None
-        for obj in objs:
-            if obj.is_typeclass(Room, exact=False):
-                room = obj
-                break
+        room = room_index.get_room(room_id)
+        if room and area_part and (room.db.area or "").lower() != area_part.lower():
+            room = None
         if not room:
             self.msg("That room does not exist.")
             return
@@ -474,11 +465,7 @@ class CmdRDel(Command):
             return
 
         vnum = int(self.args.strip())
-        objs = ObjectDB.objects.filter(
-            db_attributes__db_key="room_id",
-            db_attributes__db_value=vnum,
-        )
-        room = next((o for o in objs if o.is_typeclass(Room, exact=False)), None)
+        room = room_index.get_room(vnum)
         if not room:
             self.msg(f"Room VNUM {vnum} not found.")
             return
@@ -486,9 +473,7 @@ class CmdRDel(Command):
         self.unlink_room(room)
         room.delete()
 
-        path = CATEGORY_DIRS["room"] / f"{vnum}.json"
-        if path.exists():
-            path.unlink()
+        delete_prototype("room", vnum)
         vnum_registry.unregister_vnum(vnum, "room")
 
         area = room.db.area
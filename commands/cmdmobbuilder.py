@@ -106,12 +106,13 @@ class CmdMobProto(Command):
     def _sub_list(self):
         caller = self.caller
         mob_db = get_mobdb()
-        if not mob_db.db.vnums:
+        protos = mob_db.all_protos()
+        if not protos:
             caller.msg("No mob prototypes registered.")
             return
         lines = ["|wVNUM|n |wName|n |wSpawns|n"]
-        for vnum in sorted(str(v) for v in mob_db.db.vnums):
-            proto = mob_db.db.vnums[vnum]
+        for vnum in sorted(protos, key=str):
+            proto = protos[vnum]
             name = proto.get("key", "--")
             count = proto.get("spawn_count", 0)
             lines.append(f"{vnum:>5} {name} {count}")
@@ -146,7 +147,7 @@ class CmdMobProto(Command):
             return
         vnum = int(rest)
         mob_db = get_mobdb()
-        if not mob_db.get_proto(vnum):
+        if not mob_db.has_proto(vnum):
             caller.msg("Prototype not found.")
             return
         npcs = [
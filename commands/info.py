@@ -638,8 +638,10 @@ class CmdBuffs(Command):
 
     def func(self):
         from world.effects import EFFECTS
+        from world.system import state_manager
 
         caller = self.caller
+        state_manager.sync_timers(caller)
         rows = []
 
         for tag in caller.tags.get(category="buff", return_list=True):
@@ -690,8 +692,10 @@ class CmdAffects(Command):
 
     def func(self):
         from world.effects import EFFECTS
+        from world.system import state_manager
 
         caller = self.caller
+        state_manager.sync_timers(caller)
         rows = []
 
         cd_lines = []
@@ -1,6 +1,7 @@
 from .command import Command
 from evennia import CmdSet
 from evennia.utils import make_iter
+from world.system import state_manager
 from world.system.constants import MAX_SATED, MAX_LEVEL
 
 
@@ -78,6 +79,7 @@ class CmdEat(Command):
 
         sated = obj.attributes.get("sated", 0)
         if (caller.db.level or 1) < MAX_LEVEL:
+            state_manager.sync_timers(caller)
             caller.db.sated = min((caller.db.sated or 0) + sated, MAX_SATED)
 
         caller.at_emote(
@@ -475,7 +475,7 @@ class CmdMList(Command):
         mob_db = get_mobdb()
         vnum_lookup = {}
         finalized_lookup = {}
-        for vnum, data in mob_db.db.vnums.items():
+        for vnum, data in mob_db.all_protos().items():
             pkey = data.get("proto_key") or data.get("prototype_key") or data.get("key")
             if pkey:
                 vnum_lookup[pkey] = vnum
@@ -510,7 +510,7 @@ class CmdMList(Command):
                 or proto.get("vnum")
             )
             finalized = False
-            if vnum is not None and str(vnum) in mob_db.db.vnums:
+            if vnum is not None and mob_db.has_proto(vnum):
                 finalized = True
             elif key in finalized_lookup or proto.get("key") in finalized_lookup:
                 finalized = True
@@ -546,7 +546,7 @@ class CmdMList(Command):
 
         lines = [str(table)]
         if not (area or filter_by or rangestr or show_room or show_area):
-            finalized = sorted(str(v) for v in mob_db.db.vnums)
+            finalized = sorted(str(v) for v in mob_db.all_protos())
             lines.append("\n|wFinalized VNUMs|n")
             if finalized:
                 lines.append(", ".join(str(v) for v in finalized))
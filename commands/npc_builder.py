@@ -30,6 +30,8 @@ from world.mob_constants import (ACTFLAGS, AFFECTED_BY, ATTACK_TYPES,
 from world.npc_roles import (BankerRole, CombatTrainerRole, EventNPCRole,
                              GuildmasterRole, GuildReceptionistRole,
                              MerchantRole, QuestGiverRole, TrainerRole)
+from world.npc_handlers import ai_ticker
+from world.npc_handlers.ai_ticker import AIBehavior
 from world.scripts import classes
 from world.scripts.mob_db import get_mobdb
 from world.triggers import TriggerManager
@@ -679,7 +681,10 @@ def finalize_mob_prototype(caller, npc):
     if meta.get("script"):
         try:
             script_cls = _import_script(meta["script"])
-            if not npc.scripts.get(script_cls.__name__):
+            if isinstance(script_cls, type) and issubclass(script_cls, AIBehavior):
+                if not ai_ticker.get_behavior(npc.id, script_cls.key):
+                    ai_ticker.subscribe(npc, script_cls)
+            elif not npc.scripts.get(script_cls.__name__):
                 npc.scripts.add(script_cls, key=script_cls.__name__)
         except Exception as err:  # pragma: no cover - log errors
             logger.log_err(f"Could not attach script {meta['script']}: {err}")
@@ -944,7 +949,7 @@ class CmdEditNPC(Command):
         data = self.caller.ndb.buildnpc
         mob_db = get_mobdb()
         vnum = data.get("vnum") or npc.db.vnum
-        finalized = vnum is not None and str(vnum) in mob_db.db.vnums
+        finalized = vnum is not None and mob_db.has_proto(vnum)
         status = "✅" if finalized else "🚫"
         roles = data.get("roles") or []
         if isinstance(roles, str):
@@ -1213,7 +1218,8 @@ class CmdMSpawn(Command):
         else:
             mob_db = get_mobdb()
             vmatch = next(
-                (num for num, p in mob_db.db.vnums.items() if p.get("key") == arg), None
+                (num for num, p in mob_db.all_protos().items() if p.get("key") == arg),
+                None,
             )
             if vmatch is not None:
                 try:
@@ -5,13 +5,14 @@ from __future__ import annotations
 import json
 from functools import wraps
 
-from evennia.objects.models import ObjectDB
 from evennia.prototypes import spawner
 
 from olc.base import OLCEditor, OLCState, OLCValidator
 from typeclasses.rooms import Room
-from utils.prototype_manager import (CATEGORY_DIRS, load_all_prototypes,
-                                     load_prototype, save_prototype)
+from utils import room_index
+from utils.prototype_manager import (CATEGORY_DIRS, delete_prototype,
+                                     load_all_prototypes, load_prototype,
+                                     save_prototype)
 from utils.vnum_registry import (VNUM_RANGES, peek_next_vnum, register_vnum,
                                  unregister_vnum, validate_vnum)
 from world import prototypes
@@ -392,7 +393,7 @@ def _handle_spawn_cmd(caller, raw_string, **kwargs):
         proto_exists = False
         if isinstance(proto_key, int):
             mob_db = get_mobdb()
-            proto_exists = mob_db.get_proto(proto_key) is not None
+            proto_exists = mob_db.has_proto(proto_key)
             if proto_exists:
                 path = CATEGORY_DIRS["npc"] / f"{proto_key}.json"
                 if not path.exists():
@@ -445,11 +446,7 @@ def menunode_done(caller, raw_string="", **kwargs):
             existing = {}
 
         # reload current room exits so changes outside the editor are kept
-        objs = ObjectDB.objects.filter(
-            db_attributes__db_key="room_id",
-            db_attributes__db_value=vnum,
-        )
-        room_obj = next((o for o in objs if o.is_typeclass(Room, exact=False)), None)
+        room_obj = room_index.get_room(vnum)
 
         current_exits = {}
         if room_obj:
@@ -539,11 +536,8 @@ def menunode_done(caller, raw_string="", **kwargs):
             if exits_data is not None:
                 exits = {}
                 for dirkey, dest in exits_data.items():
-                    dest_obj = ObjectDB.objects.filter(
-                        db_attributes__db_key="room_id",
-                        db_attributes__db_value=dest,
-                    ).first()
-                    if dest_obj and dest_obj.is_typeclass(Room, exact=False):
+                    dest_obj = room_index.get_room(dest)
+                    if dest_obj:
                         exits[dirkey] = dest_obj
                 room.db.exits = exits
 
@@ -600,13 +594,7 @@ class CmdREdit(Command):
                 _clear_state()
                 return
             if proto is None:
-                objs = ObjectDB.objects.filter(
-                    db_attributes__db_key="room_id",
-                    db_attributes__db_value=vnum,
-                )
-                room = next(
-                    (o for o in objs if o.is_typeclass(Room, exact=False)), None
-                )
+                room = room_index.get_room(vnum)
                 if room:
                     proto = proto_from_room(room)
                     self.msg(f"Editing live room #{vnum} (no prototype found).")
@@ -618,14 +606,7 @@ class CmdREdit(Command):
                     return
             else:
                 if "area" not in proto:
-                    objs = ObjectDB.objects.filter(
-                        db_attributes__db_key="room_id",
-                        db_attributes__db_value=vnum,
-                    )
-                    room_obj = next(
-                        (o for o in objs if o.is_typeclass(Room, exact=False)),
-                        None,
-                    )
+                    room_obj = room_index.get_room(vnum)
                     if room_obj and room_obj.db.area:
                         proto["area"] = room_obj.db.area
             self.caller.ndb.room_protos = {vnum: proto}
@@ -667,9 +648,7 @@ class CmdREdit(Command):
                 _clear_state()
                 return
             save_prototype("room", proto, vnum=new_vnum)
-            old_path = CATEGORY_DIRS["room"] / f"{old_vnum}.json"
-            if old_path.exists():
-                old_path.unlink()
+            delete_prototype("room", old_vnum)
             unregister_vnum(old_vnum, "room")
             register_vnum(new_vnum)
 
@@ -719,17 +698,15 @@ class CmdREdit(Command):
                     self.msg(f"Number outside area range {area.start}-{area.end}.")
                     _clear_state()
                     return
-                objs = ObjectDB.objects.filter(
-                    db_attributes__db_key="area",
-                    db_attributes__db_strvalue__iexact=area_name,
-                )
-                for obj in objs:
-                    if obj == room:
-                        continue
-                    if obj.db.room_id == vnum and obj.is_typeclass(Room, exact=False):
-                        self.msg("Room already exists.")
-                        _clear_state()
-                        return
+                other = room_index.get_room(vnum)
+                if (
+                    other
+                    and other != room
+                    and (other.db.area or "").lower() == area_name.lower()
+                ):
+                    self.msg("Room already exists.")
+                    _clear_state()
+                    return
 
             register_vnum(vnum)
             proto = {
@@ -774,11 +751,7 @@ class CmdREdit(Command):
 
         if sub == "live" and len(parts) == 2 and parts[1].isdigit():
             vnum = int(parts[1])
-            objs = ObjectDB.objects.filter(
-                db_attributes__db_key="room_id",
-                db_attributes__db_value=vnum,
-            )
-            room = next((o for o in objs if o.is_typeclass(Room, exact=False)), None)
+            room = room_index.get_room(vnum)
             if not room:
                 self.msg(f"Room VNUM {vnum} not found.")
                 _clear_state()
@@ -842,7 +815,7 @@ class CmdREdit(Command):
             if area:
                 idx, _ = find_area(area.key)
         room = spawner.spawn(proto)[0]
-        room.db.room_id = vnum
+        room.set_room_id(vnum)
         if area:
             room.set_area(area.key, vnum)
             if vnum not in area.rooms:
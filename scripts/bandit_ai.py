@@ -3,10 +3,8 @@ from .combat_ai import BaseCombatAI
 class BanditAI(BaseCombatAI):
     """Roams around and attacks weaker players."""
 
-    def at_script_creation(self):
-        super().at_script_creation()
-        self.key = "bandit_ai"
-        self.desc = "Bandit combat behavior"
+    key = "bandit_ai"
+    desc = "Bandit combat behavior"
 
     def select_target(self):
         npc = self.obj
@@ -1,16 +1,17 @@
 from random import choice
-from typeclasses.scripts import Script
+from world.npc_handlers.ai_ticker import AIBehavior
 
-class BaseCombatAI(Script):
+class BaseCombatAI(AIBehavior):
     """Base class for simple combat AI behavior."""
 
-    def at_script_creation(self):
-        self.interval = 5
-        self.persistent = True
+    key = "combat_ai"
+    interval = 5
+    defaults = {
         # Optional flag controlling movement when players are in the same room.
         # When ``True`` the NPC will remain in place if ``select_target`` finds a
         # player in the current location.
-        self.db.skip_move_if_target = False
+        "skip_move_if_target": False,
+    }
 
     def find_target(self, predicate):
         """Return the first object in the room matching ``predicate``."""
@@ -1,13 +1,20 @@
-"""Global script processing AI for all NPCs each tick."""
+"""Global script processing AI for NPCs near players each tick."""
 
+from django.conf import settings
 from evennia.utils import logger
 from typeclasses.scripts import Script
+from world.npc_handlers import active_set, mob_ai
+from world.npc_handlers.ai_shards import AIShardRunner
 from world.npc_handlers.mob_ai import process_mob_ai
-from typeclasses.npcs import BaseNPC
 
 
 class GlobalNPCAI(Script):
-    """Iterate over all NPCs and run their AI once per tick."""
+    """Run AI once per tick for NPCs sharing a room with a player or fighting.
+
+    NPCs elsewhere are swept every ``NPC_AI_IDLE_INTERVAL`` ticks instead.
+    Each tick is spread over ``NPC_AI_SHARDS`` sub-ticks limited to
+    ``NPC_AI_TICK_BUDGET_MS`` milliseconds each; see :class:`AIShardRunner`.
+    """
 
     def at_script_creation(self):
         self.key = "global_npc_ai"
@@ -15,12 +22,38 @@ class GlobalNPCAI(Script):
         self.interval = 1
         self.persistent = True
 
+    def at_start(self, **kwargs):
+        self.load_active_set()
+
+    def load_active_set(self):
+        """Rebuild the in-memory set of AI NPCs and restart the tick count."""
+        active_set.load(getattr(settings, "NPC_AI_IDLE_INTERVAL", 30))
+        self.ndb.ai_tick = 0
+        self.ndb.ai_runner = AIShardRunner(self.process_npc)
+
+    def process_npc(self, npc):
+        """Run one AI step for ``npc`` if it still has AI configured."""
+        if not (npc.db.ai_type or npc.db.actflags):
+            return
+        try:
+            process_mob_ai(npc)
+        except Exception as err:  # pragma: no cover - log errors
+            logger.log_err(f"GlobalNPCAI error on {npc}: {err}")
+
     def at_repeat(self):
-        for npc in BaseNPC.objects.filter(db_tags__db_key="npc_ai"):
-            if not (npc.db.ai_type or npc.db.actflags):
-                continue
-            try:
-                process_mob_ai(npc)
-            except Exception as err:  # pragma: no cover - log errors
-                logger.log_err(f"GlobalNPCAI error on {npc}: {err}")
-        # end npc loop
+        if self.ndb.ai_tick is None:
+            self.load_active_set()
+        self.ndb.ai_tick += 1
+        self.ndb.ai_runner.run_tick(
+            active_set.due(self.ndb.ai_tick),
+            interval=self.interval if self.interval and self.interval > 0 else 1,
+        )
+
+    def get_metrics(self):
+        """Return sub-tick, per-behavior and active set statistics."""
+        runner = self.ndb.ai_runner
+        return {
+            "subticks": runner.get_metrics() if runner else {},
+            "behaviors": mob_ai.get_timings(),
+            "active_set": active_set.counts(),
+        }
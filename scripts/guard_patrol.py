@@ -3,13 +3,10 @@ from .combat_ai import BaseCombatAI
 class GuardPatrol(BaseCombatAI):
     """Walk a patrol path and attack wanted players."""
 
-    def at_script_creation(self):
-        super().at_script_creation()
-        self.key = "guard_patrol"
-        self.desc = "Guard patrol behavior"
-        self.interval = 10
-        self.db.patrol = []
-        self.db.index = 0
+    key = "guard_patrol"
+    desc = "Guard patrol behavior"
+    interval = 10
+    defaults = {**BaseCombatAI.defaults, "patrol": [], "index": 0}
 
     def select_target(self):
         npc = self.obj
@@ -1,24 +1,29 @@
 from __future__ import annotations
 
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from evennia.objects.models import ObjectDB
 from evennia.prototypes import spawner
 from evennia.utils import logger, search
+from evennia.utils.dbserialize import deserialize
 
 from typeclasses.rooms import Room
 from typeclasses.scripts import Script
+from utils import npc_pool, room_index
 from utils.mob_proto import apply_proto_items, spawn_from_vnum
 from world import prototypes
 
+from .respawn_queue import RespawnQueueMixin
+
 
 class MobRespawnTracker:
-    """Track respawns for a single area."""
+    """Group the rooms with spawn entries of a single area."""
 
-    def __init__(self, area: str):
+    def __init__(self, area: str, manager: "MobRespawnManager" | None = None):
         self.area = (area or "").lower()
         self.rooms: Dict[int, Room] = {}
+        self.manager = manager
 
     # ------------------------------------------------------------
     # public API
@@ -33,109 +38,168 @@ class MobRespawnTracker:
         if rid is not None and rid in self.rooms:
             self.rooms.pop(rid)
 
+    def process(self) -> None:
+        """Top up the spawn entries of every room in the area."""
+        for room in list(self.rooms.values()):
+            if not room.pk:
+                self.remove_room(room)
+                continue
+            self.manager.top_up_room(room)
+
+
+class MobRespawnManager(RespawnQueueMixin, Script):
+    """Global script handling mob respawns for all areas.
+
+    :meth:`record_death` pushes the time a dead mob is due back onto the
+    respawn queue, which wakes the script with a single timer. Live mobs per
+    spawn entry are tracked in memory from spawn and death events. The
+    minute repeat only tops up entries whose mobs wandered off or were
+    removed without dying.
+    """
+
+    def at_script_creation(self):
+        if self.pk:
+            self.key = "mob_respawn_manager"
+            self.desc = "Handles mob respawning"
+        else:
+            self.db_key = "mob_respawn_manager"
+            self.db_desc = "Handles mob respawning"
+        self.interval = 60
+        self.persistent = True
+        self.repeats = -1
+        self.start_delay = False
+        self.db.respawn_queue = self.db.respawn_queue or []
+
+    # ------------------------------------------------------------
+    # public API
+    # ------------------------------------------------------------
+    def get_tracker(self, area: str) -> MobRespawnTracker:
+        area = (area or "").lower()
+        trackers = self._trackers()
+        tracker = trackers.get(area)
+        if not tracker:
+            tracker = trackers[area] = MobRespawnTracker(area, self)
+        return tracker
+
+    def register_room_spawn(self, proto: Dict[str, Any]) -> None:
+        spawns = proto.get("spawns") or []
+        room_id = proto.get("room_id") or proto.get("vnum")
+        if room_id is None:
+            return
+        room = room_index.get_room(room_id)
+        if not room:
+            return
+        entries: List[Dict[str, Any]] = []
+        for entry in spawns:
+            proto_key = entry.get("prototype") or entry.get("proto")
+            if not proto_key:
+                continue
+            entries.append(
+                {
+                    "area": (proto.get("area") or "").lower(),
+                    "prototype": (
+                        int(proto_key) if str(proto_key).isdigit() else proto_key
+                    ),
+                    "room_id": int(room_id),
+                    "max_count": int(
+                        entry.get("max_spawns", entry.get("max_count", 1))
+                    ),
+                    "respawn_rate": int(
+                        entry.get("spawn_interval", entry.get("respawn_rate", 60))
+                    ),
+                    "active_mobs": [],
+                    "dead_mobs": [],
+                    "last_spawn": 0.0,
+                }
+            )
+        if entries != (room.db.spawn_entries or []):
+            room.db.spawn_entries = entries
+            room.save()
+        self._index_room(room, entries)
+        tracker = self.get_tracker(room.db.area)
+        tracker.add_room(room)
+
+    def force_respawn(self, room_vnum: int) -> None:
+        """Fill every spawn entry of the room up to its capacity."""
+        room = room_index.get_room(room_vnum)
+        if not room:
+            return
+        tracker = self.get_tracker(room.db.area)
+        tracker.add_room(room)
+        for idx, entry in enumerate(self._room_entries(room)):
+            missing = entry.get("max_count", 0) - len(self._prune_live(entry, room))
+            for _ in range(max(0, missing)):
+                self._spawn_entry(entry, room, idx)
+
     def record_death(
         self, prototype: Any, room: Room, npc_id: int | None = None
     ) -> None:
-        norm = self._normalize_proto(prototype)
-        entries = room.db.spawn_entries or []
+        if not room:
+            return
+        idx, entry = self._find_entry(prototype, room, npc_id)
+        if entry is None:
+            return
         now = time.time()
-        changed = False
-        for idx, entry in enumerate(entries):
-            if self._normalize_proto(entry.get("prototype")) != norm:
-                continue
-            active = [sid for sid in entry.get("active_mobs", []) if sid != npc_id]
-            if active != entry.get("active_mobs", []):
-                entry["active_mobs"] = active
-                changed = True
-            if npc_id is not None:
-                dead = entry.get("dead_mobs", [])
-                dead.append({"id": npc_id, "time_of_death": now})
-                entry["dead_mobs"] = dead
-                changed = True
-            entry["last_spawn"] = now
-            entries[idx] = entry
-            break
-        if changed:
-            room.db.spawn_entries = entries
-            room.save()
+        active = [sid for sid in entry.get("active_mobs", []) if sid != npc_id]
+        entry["active_mobs"] = active
+        if npc_id is not None:
+            dead = entry.get("dead_mobs", [])
+            dead.append({"id": npc_id, "time_of_death": now})
+            entry["dead_mobs"] = dead
+        entry["last_spawn"] = now
+        self._save_entries(room)
+        self._live_ids(entry, room).discard(npc_id)
+        self._touch(entry, room, now)
+        self._push_respawn(
+            now + entry.get("respawn_rate", 60),
+            self._normalize_proto(entry.get("prototype")),
+            room,
+            npc_id,
+        )
 
     def record_spawn(
         self, prototype: Any, room: Room, npc_id: int | None = None
     ) -> None:
-        norm = self._normalize_proto(prototype)
-        entries = room.db.spawn_entries or []
-        changed = False
-        for idx, entry in enumerate(entries):
-            if self._normalize_proto(entry.get("prototype")) != norm:
-                continue
-            if npc_id is not None:
-                active = entry.get("active_mobs", [])
-                if npc_id not in active:
-                    active.append(npc_id)
-                    entry["active_mobs"] = active
-                    changed = True
-            entry["last_spawn"] = time.time()
-            entries[idx] = entry
-            break
-        if changed:
-            room.db.spawn_entries = entries
-            room.save()
-
-    def process_room(self, room: Room) -> None:
+        if not room:
+            return
+        idx, entry = self._find_entry(prototype, room)
+        if entry is None:
+            return
         now = time.time()
-        entries = room.db.spawn_entries or []
-        updated = False
-        for idx, entry in enumerate(entries):
-            proto = entry.get("prototype")
-            max_count = entry.get("max_count", 0)
-            respawn = entry.get("respawn_rate", 60)
-            live_objs = [
-                obj
-                for obj in room.contents
-                if self._normalize_proto(getattr(obj.db, "prototype_key", None))
-                == self._normalize_proto(proto)
-                and obj.db.spawn_room == room
-            ]
-            live_count = len(live_objs)
-            entry["active_mobs"] = [obj.id for obj in live_objs]
-            dead_list = entry.get("dead_mobs", [])
-            ready = [d for d in dead_list if now - d.get("time_of_death", 0) >= respawn]
-            remaining = [
-                d for d in dead_list if now - d.get("time_of_death", 0) < respawn
-            ]
-            if (
-                not ready
-                and live_count < max_count
-                and now - entry.get("last_spawn", 0) >= respawn
-            ):
-                ready.append({})
-            to_spawn = min(max_count - live_count, len(ready))
-            for _ in range(to_spawn):
-                npc = self._spawn(proto, room)
-                if npc:
-                    entry["active_mobs"].append(npc.id)
-                    entry["last_spawn"] = now
-                if ready:
-                    ready.pop(0)
-            entry["dead_mobs"] = remaining + ready
-            entries[idx] = entry
-            updated = True
-        if updated:
-            room.db.spawn_entries = entries
-            room.save()
+        if npc_id is not None:
+            active = entry.get("active_mobs", [])
+            if npc_id not in active:
+                active.append(npc_id)
+                entry["active_mobs"] = active
+            self._live_ids(entry, room).add(npc_id)
+        entry["last_spawn"] = now
+        self._save_entries(room)
+        self._touch(entry, room, now)
 
-    def process(self) -> None:
-        for room in list(self.rooms.values()):
-            if not room.pk:
-                self.remove_room(room)
+    def top_up_room(self, room: Room) -> None:
+        """Spawn one mob for each entry below capacity whose interval passed."""
+        now = time.time()
+        for idx, entry in enumerate(self._room_entries(room)):
+            if now - self._last_spawn(entry, room) < entry.get("respawn_rate", 60):
                 continue
-            if not (room.db.spawn_entries):
+            if len(self._prune_live(entry, room)) >= entry.get("max_count", 0):
                 continue
-            self.process_room(room)
+            self._spawn_entry(entry, room, idx)
 
     # ------------------------------------------------------------
     # helpers
     # ------------------------------------------------------------
+    def _trackers(self) -> Dict[str, MobRespawnTracker]:
+        """Return the area trackers, loading the spawn rooms once."""
+        trackers = self.ndb.trackers
+        if trackers is None:
+            trackers = self.ndb.trackers = {}
+            for room in ObjectDB.objects.get_by_attribute(key="spawn_entries"):
+                if room.db.spawn_entries:
+                    self._index_room(room)
+                    self.get_tracker(room.db.area).add_room(room)
+        return trackers
+
     def _normalize_proto(self, proto: Any) -> Any:
         if isinstance(proto, int):
             return proto
@@ -146,20 +210,178 @@ class MobRespawnTracker:
             pass
         return proto
 
+    def _get_room(self, entry: Dict) -> Room | None:
+        return room_index.get_room(entry.get("room_id") or entry.get("room"))
+
+    def _index_room(self, room: Room, entries: List[Dict] | None = None) -> Dict[Any, int]:
+        """Load the spawn entries of ``room`` and rebuild its entry index.
+
+        The manager keeps a plain copy of each room's ``spawn_entries`` so
+        lookups don't unpickle the attribute; changes are written back with
+        :meth:`_save_entries`.
+        """
+        if entries is None:
+            entries = deserialize(room.db.spawn_entries or [])
+        if self.ndb.entry_index is None:
+            self.ndb.entry_index = {}
+            self.ndb.room_entries = {}
+        slots: Dict[Any, int] = {}
+        for idx, entry in enumerate(entries):
+            slots.setdefault(self._normalize_proto(entry.get("prototype")), idx)
+        self.ndb.entry_index[room.id] = slots
+        self.ndb.room_entries[room.id] = list(entries)
+        # live counts of replaced entries are no longer valid
+        for cache in (self.ndb.live, self.ndb.last_spawn):
+            for key in [key for key in cache or () if key[1] == room.id]:
+                del cache[key]
+        return slots
+
+    def _room_entries(self, room: Room) -> List[Dict]:
+        """Return the in-memory spawn entries of ``room``."""
+        entries = (self.ndb.room_entries or {}).get(room.id)
+        if entries is None:
+            self._index_room(room)
+            entries = self.ndb.room_entries[room.id]
+        return entries
+
+    def _save_entries(self, room: Room) -> None:
+        room.db.spawn_entries = self._room_entries(room)
+
+    def _find_entry(
+        self, prototype: Any, room: Room, npc_id: int | None = None
+    ) -> Tuple[int | None, Dict | None]:
+        """Return the index and spawn entry of ``prototype`` in ``room``.
+
+        Entries are found through an in-memory index keyed by room id and
+        normalized prototype. Falls back to the entry tracking ``npc_id``
+        when the prototype does not match any entry.
+        """
+        slots = (self.ndb.entry_index or {}).get(room.id)
+        if slots is None:
+            slots = self._index_room(room)
+        entries = self.ndb.room_entries[room.id]
+        idx = slots.get(self._normalize_proto(prototype))
+        if idx is None and npc_id is not None:
+            idx = next(
+                (
+                    i
+                    for i in slots.values()
+                    if i < len(entries) and npc_id in self._live_ids(entries[i], room)
+                ),
+                None,
+            )
+        if idx is None or idx >= len(entries):
+            return None, None
+        return idx, entries[idx]
+
+    def _key(self, entry: Dict, room: Room) -> tuple:
+        return (self._normalize_proto(entry.get("prototype")), room.id)
+
+    def _live_ids(self, entry: Dict, room: Room) -> set:
+        """Return the ids of mobs alive for ``entry``, seeding from ``room``."""
+        live = self.ndb.live
+        if live is None:
+            live = self.ndb.live = {}
+        key = self._key(entry, room)
+        ids = live.get(key)
+        if ids is None:
+            target = key[0]
+            ids = live[key] = {
+                obj.id
+                for obj in room.contents
+                if self._normalize_proto(getattr(obj.db, "prototype_key", None))
+                == target
+                and obj.db.spawn_room == room
+            }
+        return ids
+
+    def _prune_live(self, entry: Dict, room: Room) -> set:
+        """Drop mobs that were deleted, pooled or left ``room`` from the live ids."""
+        ids = self._live_ids(entry, room)
+        for npc_id in list(ids):
+            npc = ObjectDB.objects.get_id(npc_id)
+            if npc is None or npc.location != room:
+                ids.discard(npc_id)
+        return ids
+
+    def _live_count(self, proto: Any, room: Room) -> int:
+        _, entry = self._find_entry(proto, room)
+        if entry is None:
+            return 0
+        return len(self._live_ids(entry, room))
+
+    def _last_spawn(self, entry: Dict, room: Room) -> float:
+        """Return when ``entry`` last spawned or lost a mob."""
+        last = self.ndb.last_spawn
+        if last is None:
+            last = self.ndb.last_spawn = {}
+        key = self._key(entry, room)
+        if key not in last:
+            last[key] = entry.get("last_spawn", 0)
+        return last[key]
+
+    def _touch(self, entry: Dict, room: Room, when: float) -> None:
+        self._last_spawn(entry, room)
+        self.ndb.last_spawn[self._key(entry, room)] = when
+
+    def _spawn_entry(self, entry: Dict, room: Room, idx: int):
+        """Spawn one mob for ``entry`` and record it as alive."""
+        proto = self._normalize_proto(entry.get("prototype"))
+        npc = self._spawn(proto, room)
+        if not npc:
+            return None
+        if npc.location != room:
+            npc.location = room
+        npc.db.spawn_room = room
+        if npc.db.prototype_key is None:
+            npc.db.prototype_key = proto
+        self.record_spawn(proto, room, npc_id=npc.id)
+        return npc
+
+    def _clear_dead(self, room: Room, idx: int, npc_id: int | None) -> None:
+        """Drop the death record of ``npc_id`` now that it is being replaced."""
+        entries = self._room_entries(room)
+        if idx >= len(entries):
+            return
+        dead = entries[idx].get("dead_mobs", [])
+        remaining = [d for d in dead if d.get("id") != npc_id]
+        if len(remaining) != len(dead):
+            entries[idx]["dead_mobs"] = remaining
+            self._save_entries(room)
+
+    def _respawn_due(self, proto: Any, room_id: int, npc_id: int | None) -> float | None:
+        room = ObjectDB.objects.get_id(room_id)
+        if room is None:
+            return None
+        idx, entry = self._find_entry(proto, room)
+        if entry is None:
+            return None
+        self._clear_dead(room, idx, npc_id)
+        if len(self._prune_live(entry, room)) >= entry.get("max_count", 0):
+            return None
+        if not self._spawn_entry(entry, room, idx):
+            # try again after another respawn interval
+            return entry.get("respawn_rate", 60)
+        return None
+
     def _spawn(self, proto: Any, room: Room):
         npc = None
         proto = self._normalize_proto(proto)
         proto_is_digit = isinstance(proto, int)
         try:
-            if proto_is_digit:
+            npc = npc_pool.acquire(proto, room)
+            reused = npc is not None
+            if reused:
+                npc.db.prototype_key = proto
+            elif proto_is_digit:
                 from world.scripts.mob_db import get_mobdb
 
                 mob_db = get_mobdb()
-                if mob_db.get_proto(proto):
+                if mob_db.has_proto(proto):
                     npc = spawn_from_vnum(int(proto), location=room)
                     npc.db.prototype_key = int(proto)
                 else:
-                    p_data = prototypes.get_npc_prototypes().get(str(proto))
+                    p_data = prototypes.get_npc_prototype(str(proto))
                     if not p_data:
                         logger.log_warn(
                             f"RespawnManager: prototype {proto} not found for room {room.dbref}"
@@ -181,7 +403,7 @@ class MobRespawnTracker:
                     npc.db.prototype_key = proto
                     apply_proto_items(npc, data)
             else:
-                p_data = prototypes.get_npc_prototypes().get(str(proto))
+                p_data = prototypes.get_npc_prototype(str(proto))
                 if not p_data:
                     logger.log_warn(
                         f"RespawnManager: prototype {proto} not found for room {room.dbref}"
@@ -209,117 +431,29 @@ class MobRespawnTracker:
             try:
                 from commands.npc_builder import finalize_mob_prototype
 
-                if not proto_is_digit:
+                if not proto_is_digit and not reused:
                     finalize_mob_prototype(npc, npc)
             except Exception as err:
                 logger.log_err(f"Finalize error on {npc}: {err}")
         return npc
 
-
-class MobRespawnManager(Script):
-    """Global script handling mob respawns for all areas."""
-
-    def at_script_creation(self):
-        if self.pk:
-            self.key = "mob_respawn_manager"
-            self.desc = "Handles mob respawning"
-        else:
-            self.db_key = "mob_respawn_manager"
-            self.db_desc = "Handles mob respawning"
-        self.interval = 60
-        self.persistent = True
-        self.repeats = -1
-        self.start_delay = False
-        self.db.trackers = self.db.trackers or {}
-
     # ------------------------------------------------------------
-    # public API
+    # script hooks
     # ------------------------------------------------------------
-    def get_tracker(self, area: str) -> MobRespawnTracker:
-        area = (area or "").lower()
-        trackers = self.db.trackers or {}
-        tracker = trackers.get(area)
-        if not tracker:
-            tracker = MobRespawnTracker(area)
-            trackers[area] = tracker
-            self.db.trackers = trackers
-        return tracker
+    def at_start(self, **kwargs):
+        # area trackers used to be pickled here; they are rebuilt in memory
+        if self.attributes.has("trackers"):
+            self.attributes.remove("trackers")
+        self._arm()
 
-    def register_room_spawn(self, proto: Dict[str, Any]) -> None:
-        spawns = proto.get("spawns") or []
-        room_id = proto.get("room_id") or proto.get("vnum")
-        if room_id is None:
-            return
-        objs = ObjectDB.objects.get_by_attribute(key="room_id", value=int(room_id))
-        room = objs[0] if objs else None
-        if not room:
-            return
-        entries: List[Dict[str, Any]] = []
-        for entry in spawns:
-            proto_key = entry.get("prototype") or entry.get("proto")
-            if not proto_key:
-                continue
-            entries.append(
-                {
-                    "area": (proto.get("area") or "").lower(),
-                    "prototype": (
-                        int(proto_key) if str(proto_key).isdigit() else proto_key
-                    ),
-                    "room_id": int(room_id),
-                    "max_count": int(
-                        entry.get("max_spawns", entry.get("max_count", 1))
-                    ),
-                    "respawn_rate": int(
-                        entry.get("spawn_interval", entry.get("respawn_rate", 60))
-                    ),
-                    "active_mobs": [],
-                    "dead_mobs": [],
-                    "last_spawn": 0.0,
-                }
-            )
-        if entries != (room.db.spawn_entries or []):
-            room.db.spawn_entries = entries
-            room.save()
-        tracker = self.get_tracker(room.db.area)
-        tracker.add_room(room)
+    def at_server_start(self):
+        self._arm()
 
-    def force_respawn(self, room_vnum: int) -> None:
-        objs = ObjectDB.objects.get_by_attribute(key="room_id", value=room_vnum)
-        room = objs[0] if objs else None
-        if not room:
-            return
-        tracker = self.get_tracker(room.db.area)
-        tracker.add_room(room)
-        tracker.process_room(room)
+    def at_stop(self, **kwargs):
+        self._disarm()
 
-    def record_death(
-        self, prototype: Any, room: Room, npc_id: int | None = None
-    ) -> None:
-        tracker = self.get_tracker(room.db.area)
-        tracker.record_death(prototype, room, npc_id)
-
-    def record_spawn(
-        self, prototype: Any, room: Room, npc_id: int | None = None
-    ) -> None:
-        tracker = self.get_tracker(room.db.area)
-        tracker.record_spawn(prototype, room, npc_id)
-
-    # ------------------------------------------------------------
-    # script hooks
-    # ------------------------------------------------------------
     def at_repeat(self):
-        trackers = self.db.trackers or {}
-        from evennia.objects.models import ObjectDB
-
-        objs = ObjectDB.objects.get_by_attribute(key="spawn_entries")
-        area_map: Dict[str, List[Room]] = {}
-        for room in objs:
-            if not room.db.spawn_entries:
-                continue
-            area = (room.db.area or "").lower()
-            area_map.setdefault(area, []).append(room)
-        for area, rooms in area_map.items():
-            tracker = self.get_tracker(area)
-            tracker.rooms = {getattr(r.db, "room_id", 0): r for r in rooms}
-            tracker.process()
-        self.db.trackers = trackers
+        self._process_due()
+        for tracker in list(self._trackers().values()):
+            if tracker.rooms:
+                tracker.process()
@@ -1,15 +1,14 @@
-"""Script that drives NPC AI behavior."""
+"""Behavior that drives NPC AI."""
 
-from typeclasses.scripts import Script
+from world.npc_handlers.ai_ticker import AIBehavior
 from world.npc_handlers.mob_ai import process_mob_ai
 
 
-class NPCAIScript(Script):
+class NPCAIScript(AIBehavior):
     """Periodically call :func:`process_ai` for the attached NPC."""
 
-    def at_script_creation(self):
-        self.interval = 1
-        self.persistent = True
+    key = "npc_ai"
+    interval = 1
 
     def at_repeat(self):
         if self.obj:
@@ -0,0 +1,98 @@
+"""Persistent respawn queue used by :class:`~scripts.mob_respawn_manager.MobRespawnManager`."""
+
+from __future__ import annotations
+
+import heapq
+import time
+from typing import Any, List
+
+from evennia.utils import delay
+
+
+class RespawnQueueMixin:
+    """Min-heap of due respawns woken by a single timer.
+
+    Entries are ``[due, seq, proto, room id, npc id]`` and are saved in
+    ``db.respawn_queue``. ``seq`` keeps entries with the same due time in
+    push order, so the heap never has to compare prototypes or NPC ids.
+    Scripts using the queue implement :meth:`_respawn_due`.
+    """
+
+    def _queue(self) -> List[list]:
+        """Return the in-memory respawn heap, loading it from the database."""
+        heap = self.ndb.respawn_heap
+        if heap is None:
+            heap = []
+            for item in self.db.respawn_queue or []:
+                item = list(item)
+                if len(item) == 4:
+                    # saved before entries carried a sequence number
+                    item.insert(1, 0)
+                heap.append(item)
+            heapq.heapify(heap)
+            self.ndb.respawn_heap = heap
+            self.ndb.respawn_seq = max((item[1] for item in heap), default=0)
+        return heap
+
+    def _save_queue(self) -> None:
+        self.db.respawn_queue = list(self._queue())
+
+    def _queue_item(self, due: float, proto: Any, room_id: int, npc_id: int | None) -> list:
+        self._queue()
+        self.ndb.respawn_seq += 1
+        return [due, self.ndb.respawn_seq, proto, room_id, npc_id]
+
+    def _push_respawn(self, due: float, proto: Any, room: Any, npc_id: int | None) -> None:
+        """Queue a respawn of ``proto`` in ``room`` at time ``due``."""
+        heapq.heappush(self._queue(), self._queue_item(due, proto, room.id, npc_id))
+        self._save_queue()
+        self._arm()
+
+    def _disarm(self) -> None:
+        handle = self.ndb.respawn_timer
+        if handle:
+            try:
+                handle.cancel()
+            except Exception:  # pragma: no cover - safety
+                pass
+        self.ndb.respawn_timer = None
+        self.ndb.armed_for = None
+
+    def _arm(self) -> None:
+        """Make sure a timer is pending for the earliest queued respawn."""
+        heap = self._queue()
+        if not heap:
+            self._disarm()
+            return
+        due = heap[0][0]
+        armed_for = self.ndb.armed_for
+        if self.ndb.respawn_timer and armed_for is not None and armed_for <= due:
+            return
+        self._disarm()
+        self.ndb.armed_for = due
+        self.ndb.respawn_timer = delay(max(due - time.time(), 0), self._process_due)
+
+    def _process_due(self) -> None:
+        """Respawn every queued NPC whose time has come."""
+        self.ndb.respawn_timer = None
+        self.ndb.armed_for = None
+        heap = self._queue()
+        now = time.time()
+        due = []
+        while heap and heap[0][0] <= now:
+            due.append(heapq.heappop(heap))
+        for _, _, proto, room_id, npc_id in due:
+            retry = self._respawn_due(proto, room_id, npc_id)
+            if retry:
+                heapq.heappush(heap, self._queue_item(now + retry, proto, room_id, npc_id))
+        if due:
+            self._save_queue()
+        self._arm()
+
+    def _respawn_due(self, proto: Any, room_id: int, npc_id: int | None) -> float | None:
+        """Handle one due respawn.
+
+        Returns the seconds to wait before trying again if the spawn
+        failed, or ``None`` when the entry is done.
+        """
+        return None
@@ -12,6 +12,7 @@ if not hasattr(logger, "log_debug"):
 from typeclasses.rooms import Room
 
 from typeclasses.scripts import Script
+from utils import npc_pool, room_index
 from utils.mob_proto import apply_proto_items, spawn_from_vnum, load_npc_prototypes
 from world import prototypes
 
@@ -354,8 +355,7 @@ class SpawnManager(Script):
         elif rid is None:
             rid = self._normalize_room_id(room)
         if rid is not None:
-            objs = ObjectDB.objects.get_by_attribute(key="room_id", value=rid)
-            obj = objs[0] if objs else None
+            obj = room_index.get_room(rid)
             if obj:
                 entry["room"] = obj
             return obj
@@ -385,7 +385,11 @@ class SpawnManager(Script):
         room_ref = getattr(room, "dbref", room)
         room_id = getattr(room.db, "room_id", None)
         try:
-            if proto_is_digit:
+            npc = npc_pool.acquire(proto, room)
+            reused = npc is not None
+            if reused:
+                npc.db.prototype_key = proto
+            elif proto_is_digit:
                 from world.scripts.mob_db import get_mobdb
 
                 mob_db = get_mobdb()
@@ -393,7 +397,7 @@ class SpawnManager(Script):
                     npc = spawn_from_vnum(int(proto), location=room)
                     npc.db.prototype_key = int(proto)
                 else:
-                    p_data = prototypes.get_npc_prototypes().get(str(proto))
+                    p_data = prototypes.get_npc_prototype(str(proto))
                     if not p_data:
                         logger.log_warn(
                             f"SpawnManager: prototype {proto} not found for room {room_ref} (id {room_id}) after MobDB and JSON lookup"
@@ -415,7 +419,7 @@ class SpawnManager(Script):
                     npc.db.prototype_key = proto
                     apply_proto_items(npc, data)
             else:
-                p_data = prototypes.get_npc_prototypes().get(str(proto))
+                p_data = prototypes.get_npc_prototype(str(proto))
                 if not p_data:
                     logger.log_warn(
                         f"SpawnManager: prototype {proto} not found for room {room_ref} (id {room_id}) in JSON registry"
@@ -449,7 +453,7 @@ class SpawnManager(Script):
                         entries[idx]["active_mobs"] = active
                         room.db.spawn_entries = entries
                         room.save()
-            if not proto_is_digit:
+            if not proto_is_digit and not reused:
                 try:
                     from commands.npc_builder import finalize_mob_prototype
 
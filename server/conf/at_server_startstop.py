@@ -22,25 +22,21 @@ import time
 from evennia.server.models import ServerConfig
 from evennia.utils import logger
 
-from utils.prototype_manager import load_all_prototypes
+from utils import prototype_manager
 from utils.script_utils import get_respawn_manager, resume_paused_scripts
 
-_PROTOTYPE_CACHE = {}
-
 
 def _build_caches():
     """Load prototypes into memory for quick access."""
 
-    _PROTOTYPE_CACHE["room"] = load_all_prototypes("room")
-    _PROTOTYPE_CACHE["npc"] = load_all_prototypes("npc")
-    _PROTOTYPE_CACHE["object"] = load_all_prototypes("object")
-    logger.log_info("Prototype cache built")
+    count = prototype_manager.warm_cache(("room", "npc", "object"))
+    logger.log_info(f"Prototype cache built ({count} prototypes)")
 
 
 def _clear_caches():
     """Clear the in-memory caches."""
 
-    _PROTOTYPE_CACHE.clear()
+    prototype_manager.clear_cache()
     logger.log_info("Prototype cache cleared")
 
 
@@ -228,6 +224,24 @@ def at_server_start():
 
     _build_caches()
     _ensure_room_areas()
+
+    from utils import room_index
+
+    logger.log_info(f"[Startup] Indexed {room_index.load()} rooms by VNUM")
+
+    from world import trigger_scheduler
+
+    logger.log_info(f"[Startup] Scheduled {trigger_scheduler.load()} random triggers")
+
+    from world.npc_handlers import ai_ticker
+
+    logger.log_info(f"[Startup] Subscribed {ai_ticker.load()} NPC AI behaviors")
+    # old per-NPC AI scripts no longer load as Scripts; convert them before
+    # Evennia restarts script timers
+    migrated = ai_ticker.migrate_scripts()
+    if migrated:
+        logger.log_info(f"[Startup] Converted {migrated} per-NPC AI scripts")
+
     from typeclasses.rooms import Room
     from world.scripts import create_midgard_area
 
@@ -252,7 +266,12 @@ def at_server_stop():
     logger.log_info("at_server_stop: cleaning up")
     from combat.round_manager import CombatRoundManager
 
+    from world import trigger_scheduler
+    from world.npc_handlers import ai_ticker
+
     CombatRoundManager.get().force_end_all_combat()
+    trigger_scheduler.flush()
+    ai_ticker.flush()
     _clear_caches()
     ServerConfig.objects.conf("server_start_time", delete=True)
 
@@ -96,11 +96,26 @@ VNUM_REGISTRY_FILE = Path(GAME_DIR) / "world" / "vnum_registry.json"
 
 # Log each combat tick when set to True
 COMBAT_DEBUG_TICKS = False
+# Rounds due within this many seconds of each other run in one scheduler batch
+COMBAT_TICK_SLICE = 0.1
 # When True, include a damage summary at the end of each combat round
 COMBAT_DEBUG_SUMMARY = False
 
+# Ticks between AI updates for NPCs with no player in their room and not
+# fighting. Set to 0 to skip such NPCs entirely.
+NPC_AI_IDLE_INTERVAL = 30
+# Each NPC AI tick is split into this many sub-ticks spread over the second
+NPC_AI_SHARDS = 4
+# Milliseconds of AI work allowed per sub-tick; NPCs not reached carry over
+NPC_AI_TICK_BUDGET_MS = 20
+
 # Class implementing death cleanup logic
 DEATH_HANDLER_CLASS = "world.mechanics.death_handlers.DefaultDeathHandler"
+# Keep dead spawner-managed NPCs dormant and reuse them on respawn instead of
+# deleting and recreating them
+NPC_POOL_ENABLED = False
+# Dormant NPCs kept per prototype; further deaths delete the NPC
+NPC_POOL_SIZE = 10
 
 # Clothing - https://www.evennia.com/docs/latest/Contribs/Contrib-Clothing.html#configuration
 CLOTHING_WEARSTYLE_MAXLENGTH = 40
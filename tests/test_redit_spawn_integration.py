@@ -52,7 +52,6 @@ class TestReditSpawnIntegration(EvenniaTest):
 
         with (
             patch("commands.redit.save_prototype"),
-            patch("commands.redit.ObjectDB.objects.filter", return_value=[self.room]),
             patch("commands.redit.get_respawn_manager", return_value=self.script),
             patch.object(self.script, "_spawn") as mock_spawn,
         ):
@@ -90,7 +89,7 @@ class TestReditSpawnIntegration(EvenniaTest):
             patch("commands.redit.get_mobdb") as mock_db,
             patch("commands.redit.prototypes.get_npc_prototypes", return_value={}),
         ):
-            mock_db.return_value.get_proto.return_value = None
+            mock_db.return_value.has_proto.return_value = False
             result = redit._handle_spawn_cmd(self.char1, "add unknown 1 5")
 
         assert result == "menunode_spawns"
@@ -296,6 +296,7 @@ class Character(TriggerMixin, ObjectParent, ClothedCharacter):
         from world.system import stat_manager
 
         # check if this object was equipped when removed
+        was_equipped = True
         if obj in self.wielding:
             # clear from wielded mapping without moving it back
             wielded = self.attributes.get("_wielded", {})
@@ -316,9 +317,12 @@ class Character(TriggerMixin, ObjectParent, ClothedCharacter):
                     break
             self.db.equipment = eq
             stat_manager.remove_item_bonuses(self, obj)
+        else:
+            was_equipped = False
 
         self.update_carry_weight()
-        stat_manager.refresh_stats(self)
+        # only rescan gear when the departing item was actually equipped
+        stat_manager.refresh_stats(self, changed=("gear",) if was_equipped else ())
 
     def at_pre_move(self, destination, **kwargs):
         """
@@ -754,11 +758,11 @@ class Character(TriggerMixin, ObjectParent, ClothedCharacter):
         return " - ".join(chunks)
 
     def get_resource_prompt(self):
-        """Return the player's prompt string."""
-        from world.system import stat_manager
-
-        stat_manager.refresh_stats(self)
+        """Return the player's prompt string.
 
+        The values come straight from the traits; stats are refreshed by
+        whatever changes them, not on every prompt.
+        """
         hp_cur = int(self.traits.health.current)
         hp_max = int(self.traits.health.max)
         mp_cur = int(self.traits.mana.current)
@@ -838,9 +842,24 @@ class Character(TriggerMixin, ObjectParent, ClothedCharacter):
             self.refresh_prompt()
 
     def refresh_prompt(self):
-        """Refresh the player's prompt display."""
+        """Refresh the player's prompt display.
+
+        Refreshes are batched by :mod:`world.system.prompt_manager`, which
+        renders once per reactor tick and skips prompts that did not change.
+        """
+        from world.system import prompt_manager
+
         if self.sessions.count():
-            self.msg(prompt=self.get_resource_prompt())
+            prompt_manager.request(self)
+
+    def msg(self, text=None, from_obj=None, session=None, **kwargs):
+        if "prompt" in kwargs:
+            # remember what the client shows so unchanged prompts are skipped
+            self.ndb.last_prompt = kwargs["prompt"]
+        elif text is not None:
+            # output scrolls the prompt away, so the next one must be sent
+            self.ndb.last_prompt = None
+        super().msg(text=text, from_obj=from_obj, session=session, **kwargs)
 
     def get_attack_weapon(self):
         """Return the weapon to use for an attack.
@@ -929,9 +948,26 @@ class PlayerCharacter(Character):
         self.db._wielded = {"left": None, "right": None}
 
     def at_post_puppet(self, **kwargs):
+        from world.npc_handlers import active_set
+        from world.system import state_manager
+
         super().at_post_puppet(**kwargs)
         if self.db.sated is None:
             self.db.sated = MAX_SATED
+        # apply the ticks missed while offline and resume expiry wake-ups
+        state_manager.sync_timers(self)
+        # the room hook ran before the account was attached
+        active_set.object_arrived(self.location, self, player=True)
+
+    def at_post_unpuppet(self, account=None, session=None, **kwargs):
+        from world.npc_handlers import active_set
+        from world.system import state_manager
+
+        location = self.location
+        super().at_post_unpuppet(account=account, session=session, **kwargs)
+        if not self.sessions.count():
+            state_manager.suspend_timers(self)
+            active_set.object_departed(location, self)
 
     def get_display_name(self, looker, **kwargs):
         """
@@ -1035,6 +1071,8 @@ class NPC(Character):
     ``reactions`` keys. See :mod:`world.triggers` for details.
     """
 
+    # cached apart from player characters in each room's contents
+    _content_types = ("character", "npc")
     # defines what color this NPC's name will display in
     name_color = AttributeProperty("w")
     # mapping of event triggers -> reactions
@@ -1134,7 +1172,9 @@ class NPC(Character):
         as ``npc_vnum`` when available.
 
         Respawn timing is based on when this method records the death in the
-        global :class:`~scripts.spawn_manager.SpawnManager`.
+        global :class:`~scripts.spawn_manager.SpawnManager`. With
+        ``settings.NPC_POOL_ENABLED`` the NPC is parked in
+        :mod:`utils.npc_pool` instead of being deleted.
 
         Returns
         -------
@@ -1159,7 +1199,11 @@ class NPC(Character):
                 self.db.prototype_key, self.db.spawn_room, npc_id=self.id
             )
 
-        self.delete()
+        from utils import npc_pool
+
+        # dormant NPCs are reused by the next respawn of their prototype
+        if not npc_pool.release(self):
+            self.delete()
 
         return corpse
 
@@ -14,6 +14,8 @@ from evennia.objects.models import ObjectDB
 from .objects import ObjectParent
 from .scripts import RestockScript
 from world.triggers import TriggerMixin
+from world.npc_handlers import active_set
+from utils import occupancy, room_index
 
 from commands.shops import ShopCmdSet
 from commands.skills import TrainCmdSet
@@ -37,6 +39,7 @@ class RoomParent(TriggerMixin, ObjectParent):
 
     def at_object_receive(self, mover, source_location, move_type=None, **kwargs):
         super().at_object_receive(mover, source_location, **kwargs)
+        active_set.object_arrived(self, mover)
         if "character" in mover._content_types:
             for obj in self.contents_get(content_type="character"):
                 if obj != mover:
@@ -47,6 +50,7 @@ class RoomParent(TriggerMixin, ObjectParent):
         super().at_object_leave(mover, destination, **kwargs)
         from combat.round_manager import leave_combat
         leave_combat(mover)
+        active_set.object_departed(self, mover)
         if "character" in mover._content_types:
             for obj in self.contents_get(content_type="character"):
                 if obj != mover:
@@ -60,6 +64,7 @@ class RoomParent(TriggerMixin, ObjectParent):
                 self.db.room_id = int(room_id)
             except (TypeError, ValueError):
                 self.db.room_id = None
+            room_index.update(self)
 
     def get_area(self):
         return self.db.area
@@ -69,6 +74,7 @@ class RoomParent(TriggerMixin, ObjectParent):
             self.db.room_id = int(room_id)
         except (TypeError, ValueError):
             self.db.room_id = None
+        room_index.update(self)
 
     def get_room_id(self):
         return self.db.room_id
@@ -134,46 +140,47 @@ class RoomParent(TriggerMixin, ObjectParent):
         text = f"|c{title}|n\n{self.db.desc}\n"
         text += f"\n{self.get_display_exits(looker)}"
 
-        visible = [
-            obj
-            for obj in self.contents
-            if obj != looker
-            and obj.access(looker, "view")
-            and (not hasattr(looker, "can_see") or looker.can_see(obj))
-            and not getattr(obj.db, "dead", False)
-            and not getattr(obj.db, "_dead", False)
-        ]
-
-        characters = [
-            obj for obj in visible
-            if obj.is_typeclass("typeclasses.npcs.NPC", exact=False)
-            or obj.is_typeclass("typeclasses.characters.Character", exact=False)
-        ]
-        in_combat_present = any(getattr(c, "in_combat", False) for c in characters)
+        def visible(objs):
+            return [
+                obj
+                for obj in objs
+                if obj != looker
+                and obj.access(looker, "view")
+                and (not hasattr(looker, "can_see") or looker.can_see(obj))
+                and not getattr(obj.db, "dead", False)
+                and not getattr(obj.db, "_dead", False)
+            ]
+
+        npc_objs = visible(occupancy.npcs(self))
+        player_objs = visible(occupancy.players(self))
+        other_objs = visible(occupancy.items(self) + occupancy.exits(self))
+        in_combat_present = any(
+            getattr(c, "in_combat", False) for c in npc_objs + player_objs
+        )
 
         env_objects, npcs, items, players = [], [], [], []
-        for obj in visible:
-            if obj.db.display_priority == "environment":
-                env_objects.append(obj.get_display_name(looker))
-                continue
-
-            tag = ""
-            if in_combat_present and (
-                obj.is_typeclass("typeclasses.npcs.NPC", exact=False)
-                or obj.is_typeclass("typeclasses.characters.Character", exact=False)
-            ):
-                if getattr(obj, "in_combat", False) and obj.db.combat_target:
-                    target_name = obj.db.combat_target.get_display_name(looker)
-                    tag = f" [fighting {target_name}]"
+        for group, objs in ((npcs, npc_objs), (players, player_objs), (items, other_objs)):
+            for obj in objs:
+                if obj.db.display_priority == "environment":
+                    env_objects.append(obj.get_display_name(looker))
+                    continue
+
+                if group is items:
+                    items.append(obj.get_display_name(looker))
+                    continue
+
+                tag = ""
+                if in_combat_present:
+                    if getattr(obj, "in_combat", False) and obj.db.combat_target:
+                        target_name = obj.db.combat_target.get_display_name(looker)
+                        tag = f" [fighting {target_name}]"
+                    else:
+                        tag = " [idle]"
+
+                if group is npcs:
+                    npcs.append(f"{obj.return_appearance(looker, room=True)}{tag}")
                 else:
-                    tag = " [idle]"
-
-            if obj.is_typeclass("typeclasses.npcs.NPC", exact=False):
-                npcs.append(f"{obj.return_appearance(looker, room=True)}{tag}")
-            elif obj.is_typeclass("typeclasses.characters.Character", exact=False):
-                players.append(f"{obj.get_display_name(looker)}{tag}")
-            else:
-                items.append(obj.get_display_name(looker))
+                    players.append(f"{obj.get_display_name(looker)}{tag}")
 
         for category in (env_objects, npcs, items, players):
             if category:
@@ -0,0 +1,104 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from world.npc_handlers import mob_ai
+from world.npc_handlers.ai_shards import AIShardRunner
+
+
+def _npcs(count):
+    return [MagicMock(id=num, pk=num) for num in range(1, count + 1)]
+
+
+class TestAIShardRunner(unittest.TestCase):
+    def setUp(self):
+        self.delay_patch = patch("world.npc_handlers.ai_shards.delay")
+        self.mock_delay = self.delay_patch.start()
+        self.processed = []
+
+    def tearDown(self):
+        self.delay_patch.stop()
+
+    def test_shards_spread_over_interval(self):
+        runner = AIShardRunner(self.processed.append, shards=4, budget_ms=0)
+        npcs = _npcs(8)
+        runner.run_tick(npcs, interval=1.0)
+        self.assertEqual(self.processed, [npcs[0], npcs[4]])
+        delays = [call.args[0] for call in self.mock_delay.call_args_list]
+        self.assertEqual(delays, [0.25, 0.5, 0.75])
+        for call in self.mock_delay.call_args_list:
+            call.args[1](*call.args[2:])
+        self.assertCountEqual(self.processed, npcs)
+
+    def test_budget_carries_over_unprocessed(self):
+        runner = AIShardRunner(self.processed.append, shards=1, budget_ms=5)
+        npcs = _npcs(5)
+        with patch(
+            "world.npc_handlers.ai_shards.time.perf_counter",
+            side_effect=[0.0, 0.001, 0.002, 0.006, 0.006, 0.0, 0.0, 0.0, 0.0],
+        ):
+            self.assertEqual(runner.run_shard(npcs), 3)
+            self.assertEqual(runner.get_metrics()["queued"], 2)
+            self.assertEqual(runner.run_shard(), 2)
+        self.assertEqual(self.processed, npcs)
+        metrics = runner.get_metrics()
+        self.assertEqual(metrics["over_budget"], 1)
+        self.assertEqual(metrics["carried"], 2)
+        self.assertEqual(metrics["processed"], 5)
+
+    def test_queued_npc_not_added_twice(self):
+        runner = AIShardRunner(self.processed.append, shards=2, budget_ms=0)
+        npcs = _npcs(4)
+        runner.run_tick(npcs)
+        # the second shard never ran before the next tick started
+        runner.run_tick(npcs)
+        self.assertEqual(len(self.processed), 5)
+        self.assertEqual(runner.get_metrics()["queued"], 0)
+
+    def test_overrun_shards_cancelled(self):
+        handles = [MagicMock(), MagicMock()]
+        self.mock_delay.side_effect = handles
+        runner = AIShardRunner(self.processed.append, shards=2, budget_ms=0)
+        first = _npcs(4)
+        runner.run_tick(first)
+        second = [MagicMock(id=num, pk=num) for num in range(5, 9)]
+        # the first tick's second shard is still pending when the next starts
+        runner.run_tick(second)
+        handles[0].cancel.assert_called_once()
+        self.assertEqual(
+            self.processed, [first[0], first[2], first[1], first[3], second[0], second[2]]
+        )
+        call = self.mock_delay.call_args_list[1]
+        call.args[1](*call.args[2:])
+        self.assertEqual(self.processed[-2:], [second[1], second[3]])
+        # a callback that fires anyway finds nothing left to run
+        call.args[1](*call.args[2:])
+        self.assertEqual(len(self.processed), 8)
+
+    def test_deleted_npc_skipped(self):
+        runner = AIShardRunner(self.processed.append, shards=1, budget_ms=0)
+        gone = MagicMock(id=1, pk=None)
+        runner.run_shard([gone])
+        self.assertEqual(self.processed, [])
+
+
+class TestBehaviorTimings(unittest.TestCase):
+    def setUp(self):
+        mob_ai.reset_timings()
+
+    def test_process_mob_ai_records_behaviors(self):
+        npc = MagicMock()
+        npc.db.special_funcs = []
+        npc.db.actflags = []
+        npc.db.memory = []
+        npc.db.charmed_by = None
+        npc.db.auto_assist = False
+        npc.in_combat = False
+        npc.location = None
+        mob_ai.process_mob_ai(npc)
+        mob_ai.process_mob_ai(npc)
+        timings = mob_ai.get_timings()
+        for name in ("specials", "assist", "roam", "aggressive", "charm"):
+            self.assertEqual(timings[name]["calls"], 2)
+        self.assertNotIn("combat", timings)
+        mob_ai.reset_timings()
+        self.assertEqual(mob_ai.get_timings(), {})
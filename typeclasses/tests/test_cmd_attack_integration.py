@@ -33,7 +33,6 @@ class TestCmdAttackIntegration(EvenniaTest):
             patch("combat.combat_actions.CombatMath.check_hit", return_value=(True, "")),
             patch("combat.combat_actions.CombatMath.calculate_damage", return_value=(1, None)),
             patch("combat.combat_actions.CombatMath.apply_critical", return_value=(1, False)),
-            patch("combat.engine.damage_processor.delay"),
             patch("world.system.state_manager.apply_regen"),
             patch("world.system.state_manager.get_effective_stat", return_value=0),
             patch("random.randint", return_value=0),
@@ -20,7 +20,7 @@ class TestBaseCombatAI(EvenniaTest):
         self.exit_other = create.create_object(
             Exit, key="north", location=self.room1, destination=self.room3
         )
-        self.script = self.npc.scripts.add(BaseCombatAI, key="combat_ai", autostart=False)
+        self.script = BaseCombatAI(self.npc)
 
     def test_move_prefers_adjacent_target(self):
         self.char1.location = self.room2
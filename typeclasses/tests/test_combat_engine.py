@@ -166,27 +166,24 @@ class TestCombatEngine(unittest.TestCase):
         a.key = "dummy"
         a.tags = MagicMock()
         with patch('world.system.state_manager.apply_regen'), \
-             patch('combat.engine.damage_processor.delay') as mock_delay, \
              patch('random.randint', return_value=0):
             engine = CombatEngine([a], round_time=0)
             engine.queue_action(a, KillAction(a, a))
             engine.start_round()
             engine.process_round()
             self.assertEqual(len(engine.participants), 0)
-            mock_delay.assert_not_called()
 
-    def test_schedules_next_round(self):
+    def test_process_round_advances_round(self):
         a = Dummy()
         b = Dummy()
         with patch('world.system.state_manager.apply_regen'), \
              patch('world.system.state_manager.get_effective_stat', return_value=0), \
-             patch('combat.engine.damage_processor.delay') as mock_delay, \
              patch('random.randint', return_value=0):
             engine = CombatEngine([a, b], round_time=0)
             engine.start_round()
             engine.process_round()
             self.assertEqual(len(engine.participants), 2)
-            mock_delay.assert_called_with(0, engine.process_round)
+            self.assertEqual(engine.round, 1)
 
     def test_condition_messages_broadcast(self):
         class DamageAction(Action):
@@ -207,8 +204,7 @@ class TestCombatEngine(unittest.TestCase):
 
             with patch('world.system.state_manager.apply_regen'), \
                  patch('world.system.state_manager.get_effective_stat', return_value=0), \
-                 patch('random.randint', return_value=0), \
-                 patch('combat.engine.damage_processor.delay'):
+                 patch('random.randint', return_value=0):
                 engine = CombatEngine([a, b], round_time=0)
                 engine.queue_action(a, act_cls(a, b))
                 engine.start_round()
@@ -234,8 +230,7 @@ class TestCombatEngine(unittest.TestCase):
 
         with patch('world.system.state_manager.apply_regen'), \
              patch('world.system.state_manager.get_effective_stat', return_value=0), \
-             patch('random.randint', return_value=0), \
-             patch('combat.engine.damage_processor.delay'):
+             patch('random.randint', return_value=0):
             engine = CombatEngine([a, b], round_time=0)
             engine.queue_action(a, DamageAction(a, b))
             engine.start_round()
@@ -769,7 +764,6 @@ class TestCombatNPCTurn(EvenniaTest):
         with patch('world.system.state_manager.apply_regen'), \
              patch('world.system.state_manager.get_effective_stat', return_value=0), \
              patch('random.randint', return_value=0), \
-             patch('combat.engine.damage_processor.delay'), \
              patch.object(engine, 'queue_action', wraps=engine.queue_action) as mock_queue:
             engine.start_round()
             engine.process_round()
@@ -839,7 +833,6 @@ def test_no_recovery_message_after_target_cleared():
     engine.queue_action(player, KillAction(player, mob))
 
     with patch("world.system.state_manager.apply_regen"), \
-         patch("combat.engine.damage_processor.delay"), \
          patch("random.randint", return_value=0):
         engine.start_round()
         engine.process_round()
@@ -864,8 +857,7 @@ class TestUnsavedPrototypeCombat(unittest.TestCase):
         with patch("world.system.state_manager.apply_regen"), \
              patch("world.system.state_manager.check_level_up"), \
              patch("world.system.state_manager.get_effective_stat", return_value=0), \
-             patch("random.randint", return_value=0), \
-             patch("combat.engine.damage_processor.delay"):
+             patch("random.randint", return_value=0):
             engine.start_round()
             engine.process_round()
 
@@ -932,7 +924,6 @@ def test_clearing_target_leaves_combat():
     engine = CombatEngine([player, mob], round_time=0)
 
     with patch("world.system.state_manager.apply_regen"), \
-         patch("combat.engine.damage_processor.delay"), \
          patch("random.randint", return_value=0):
         engine.start_round()
         engine.process_round()
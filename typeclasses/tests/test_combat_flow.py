@@ -538,7 +538,6 @@ def test_npc_death_flow_keeps_combat_active_until_end():
         patch("world.mechanics.on_death_manager.handle_death", side_effect=fake_handle),
         patch("combat.damage_processor.handle_death", side_effect=fake_handle),
         patch.object(engine, "award_experience", side_effect=xp_award) as mock_xp,
-        patch("combat.engine.damage_processor.delay"),
         patch("world.system.state_manager.apply_regen"),
         patch("world.system.state_manager.check_level_up"),
         patch("random.randint", return_value=0),
@@ -0,0 +1,67 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from combat.round_manager import CombatScheduler
+
+
+class TestCombatScheduler(unittest.TestCase):
+    def setUp(self):
+        self.delay_patch = patch("combat.round_manager.delay")
+        self.mock_delay = self.delay_patch.start()
+        self.mock_delay.return_value = MagicMock()
+        self.scheduler = CombatScheduler(tick_slice=0.5)
+
+    def tearDown(self):
+        self.delay_patch.stop()
+
+    def test_single_timer_for_many_instances(self):
+        for _ in range(50):
+            self.scheduler.schedule(MagicMock(), 2.0)
+        self.assertEqual(self.mock_delay.call_count, 1)
+        self.assertEqual(self.scheduler.pending(), 50)
+
+    def test_earlier_entry_rearms_timer(self):
+        self.scheduler.schedule(MagicMock(), 5.0)
+        self.scheduler.schedule(MagicMock(), 1.0)
+        self.assertEqual(self.mock_delay.call_count, 2)
+        self.assertLessEqual(self.mock_delay.call_args[0][0], 1.0)
+
+    def test_batch_runs_all_due_instances(self):
+        first = MagicMock()
+        second = MagicMock()
+        later = MagicMock()
+        self.scheduler.schedule(first, 0)
+        self.scheduler.schedule(second, 0.2)
+        self.scheduler.schedule(later, 10)
+        self.scheduler._run()
+        first._tick.assert_called_once()
+        second._tick.assert_called_once()
+        later._tick.assert_not_called()
+        metrics = self.scheduler.get_metrics()
+        self.assertEqual(metrics["ticks"], 2)
+        self.assertEqual(metrics["batches"], 1)
+        self.assertEqual(metrics["pending"], 1)
+
+    def test_cancelled_entry_skipped(self):
+        inst = MagicMock()
+        entry = self.scheduler.schedule(inst, 0)
+        entry.cancel()
+        self.scheduler._run()
+        inst._tick.assert_not_called()
+        self.assertEqual(self.scheduler.pending(), 0)
+
+    def test_reschedule_during_batch_arms_once(self):
+        inst = MagicMock()
+        inst._tick.side_effect = lambda: self.scheduler.schedule(inst, 2.0)
+        self.scheduler.schedule(inst, 0)
+        self.mock_delay.reset_mock()
+        self.scheduler._run()
+        self.assertEqual(self.mock_delay.call_count, 1)
+        self.assertEqual(self.scheduler.pending(), 1)
+
+    def test_lag_recorded(self):
+        inst = MagicMock()
+        entry = self.scheduler.schedule(inst, 0)
+        entry.due -= 1.0
+        self.scheduler._run()
+        self.assertGreaterEqual(self.scheduler.get_metrics()["max_lag"], 1.0)
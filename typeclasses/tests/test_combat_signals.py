@@ -38,7 +38,6 @@ class TestCombatSignals(EvenniaTest):
         with (
             patch("world.system.state_manager.apply_regen"),
             patch("world.system.state_manager.check_level_up"),
-            patch("combat.engine.damage_processor.delay"),
             patch("random.randint", return_value=0),
         ):
             inst.process_round()
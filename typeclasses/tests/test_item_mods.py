@@ -0,0 +1,78 @@
+from unittest.mock import patch
+
+from evennia.utils import create
+from evennia.utils.test_resources import EvenniaTest
+
+from world import stats
+from world.system import item_mods, stat_manager
+
+
+class TestItemMods(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        item_mods.clear_cache()
+        self.item = create.create_object(
+            "typeclasses.objects.Object", key="ring", location=self.char1
+        )
+        self.item.db.stat_mods = {"STR": 2}
+        self.item.db.dex_bonus = 1
+        self.item.db.armor = 3
+
+    def test_compiled_once(self):
+        first = item_mods.get_item_mods(self.item)
+        self.assertEqual(dict(first.mods), {"STR": 2, "DEX": 1})
+        self.assertEqual(first.armor, 3)
+        with patch.object(item_mods, "compile_item_mods") as mock_compile:
+            self.assertEqual(stat_manager.collect_item_mods(self.item), {"STR": 2, "DEX": 1})
+            stat_manager._gear_mods(self.char1)
+        mock_compile.assert_not_called()
+
+    def test_attribute_update_invalidates(self):
+        item_mods.get_item_mods(self.item)
+        self.item.db.stat_mods = {"STR": 5}
+        self.assertEqual(item_mods.get_item_mods(self.item).mods["STR"], 5)
+
+    def test_in_place_mutation_invalidates(self):
+        item_mods.get_item_mods(self.item)
+        self.item.db.stat_mods["CON"] = 4
+        self.assertEqual(item_mods.get_item_mods(self.item).mods["CON"], 4)
+
+    def test_new_and_deleted_attributes_invalidate(self):
+        item_mods.get_item_mods(self.item)
+        self.item.db.wis_bonus = 2
+        self.assertEqual(item_mods.get_item_mods(self.item).mods["WIS"], 2)
+        del self.item.db.dex_bonus
+        self.assertNotIn("DEX", item_mods.get_item_mods(self.item).mods)
+
+    def test_tag_change_invalidates(self):
+        item_mods.get_item_mods(self.item)
+        with patch.object(
+            item_mods, "compile_item_mods", wraps=item_mods.compile_item_mods
+        ) as mock_compile:
+            self.item.tags.add("shiny")
+            item_mods.get_item_mods(self.item)
+            self.item.tags.clear()
+            item_mods.get_item_mods(self.item)
+        self.assertEqual(mock_compile.call_count, 2)
+
+    def test_deleted_item_is_dropped(self):
+        item_mods.get_item_mods(self.item)
+        item_id = self.item.id
+        self.item.delete()
+        self.assertNotIn(item_id, item_mods._CACHE)
+        self.assertNotIn(item_id, item_mods._ITEM_ATTRS)
+
+    def test_sum_bonus_reads_worn_bonuses(self):
+        stats.apply_stats(self.char1)
+        cloak = create.create_object(
+            "typeclasses.objects.ClothingObject", key="cloak", location=self.char1
+        )
+        cloak.db.STR_bonus = 3
+        base = self.char1.traits.STR.value
+        with patch(
+            "evennia.contrib.game_systems.clothing.clothing.get_worn_clothes",
+            return_value=[cloak],
+        ):
+            self.assertEqual(stats.sum_bonus(self.char1, "STR"), base + 3)
+            cloak.db.STR_bonus = 1
+            self.assertEqual(stats.sum_bonus(self.char1, "STR"), base + 1)
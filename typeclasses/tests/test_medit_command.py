@@ -143,7 +143,8 @@ class TestMEditCommand(EvenniaTest):
         from world.scripts.mob_db import get_mobdb
 
         mob_db = get_mobdb()
-        mob_db.db.vnums["5"] = {"key": "orc", "vnum": 5}
+        # prototypes saved by the old single-Attribute MobDB are migrated
+        mob_db.db.vnums = {"5": {"key": "orc", "vnum": 5}}
 
         with patch("commands.rom_mob_editor.EvMenu") as mock_menu:
             self.char1.execute_cmd("medit 5")
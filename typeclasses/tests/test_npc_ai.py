@@ -32,6 +32,76 @@ class TestGlobalNPCAI(EvenniaTest):
             script.at_repeat()
             mock_proc.assert_not_called()
 
+    def _tick_calls(self, script, ticks=1):
+        with patch("scripts.global_npc_ai.process_mob_ai") as mock_proc:
+            for _ in range(ticks):
+                script.at_repeat()
+        return [call.args[0] for call in mock_proc.call_args_list]
+
+    @override_settings(NPC_AI_IDLE_INTERVAL=0)
+    def test_player_arrival_activates_npc(self):
+        from scripts.global_npc_ai import GlobalNPCAI
+        from typeclasses.npcs import BaseNPC
+
+        room = create.create_object("typeclasses.rooms.Room", key="den")
+        npc = create.create_object(BaseNPC, key="mob", location=room)
+        npc.db.ai_type = "aggressive"
+        npc.tags.add("npc_ai")
+        script = GlobalNPCAI()
+
+        self.assertEqual(self._tick_calls(script), [])
+        self.char1.move_to(room)
+        self.assertEqual(self._tick_calls(script), [npc])
+        self.char1.move_to(self.room1)
+        self.assertEqual(self._tick_calls(script), [])
+
+    @override_settings(NPC_AI_IDLE_INTERVAL=3)
+    def test_idle_npc_runs_at_slow_cadence(self):
+        from scripts.global_npc_ai import GlobalNPCAI
+        from typeclasses.npcs import BaseNPC
+
+        npc = create.create_object(BaseNPC, key="mob", location=self.room2)
+        npc.db.ai_type = "aggressive"
+        npc.tags.add("npc_ai")
+        script = GlobalNPCAI()
+
+        self.assertEqual(self._tick_calls(script, ticks=6), [npc, npc])
+
+    @override_settings(NPC_AI_IDLE_INTERVAL=0)
+    def test_npc_in_combat_stays_active(self):
+        from combat.events import combat_ended, combat_started
+        from scripts.global_npc_ai import GlobalNPCAI
+        from typeclasses.npcs import BaseNPC
+
+        npc = create.create_object(BaseNPC, key="mob", location=self.room2)
+        npc.db.ai_type = "aggressive"
+        npc.tags.add("npc_ai")
+        script = GlobalNPCAI()
+        script.at_repeat()
+        instance = MagicMock(combat_id=99, combatants={npc}, engine=None)
+
+        combat_started.send(sender=None, instance=instance)
+        self.assertEqual(self._tick_calls(script), [npc])
+        combat_ended.send(sender=None, instance=instance)
+        self.assertEqual(self._tick_calls(script), [])
+
+    @override_settings(NPC_AI_IDLE_INTERVAL=0)
+    def test_deleted_npc_leaves_active_set(self):
+        from scripts.global_npc_ai import GlobalNPCAI
+        from typeclasses.npcs import BaseNPC
+        from world.npc_handlers import active_set
+
+        npc = create.create_object(BaseNPC, key="mob", location=self.room1)
+        npc.db.ai_type = "aggressive"
+        npc.tags.add("npc_ai")
+        script = GlobalNPCAI()
+        script.at_repeat()
+        npc_id = npc.id
+        self.assertIn(npc_id, active_set._NPCS)
+        npc.delete()
+        self.assertNotIn(npc_id, active_set._NPCS)
+        self.assertNotIn(npc_id, active_set._NPC_ROOM)
+
     def test_base_npc_tagged_for_ai(self):
         from typeclasses.npcs import BaseNPC
 
@@ -0,0 +1,69 @@
+from unittest.mock import MagicMock, patch
+
+from evennia.utils.test_resources import EvenniaTest
+from django.test import override_settings
+
+from world.system import prompt_manager
+
+
+@override_settings(DEFAULT_HOME=None)
+class TestPromptManager(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        prompt_manager.reset()
+        self.char1.sessions.count = MagicMock(return_value=1)
+
+    def tearDown(self):
+        prompt_manager.reset()
+        super().tearDown()
+
+    def test_refreshes_coalesce_into_one_send(self):
+        with patch("world.system.prompt_manager.delay") as mock_delay:
+            for _ in range(5):
+                self.char1.refresh_prompt()
+        mock_delay.assert_called_once_with(0, prompt_manager.flush)
+        self.assertEqual(prompt_manager.pending(), 1)
+
+        with patch.object(self.char1, "get_resource_prompt", return_value="P") as mock_render, patch.object(
+            self.char1, "msg"
+        ) as mock_msg:
+            prompt_manager.flush()
+        mock_render.assert_called_once()
+        mock_msg.assert_called_once_with(prompt="P")
+        self.assertEqual(prompt_manager.pending(), 0)
+
+    def test_unchanged_prompt_is_not_resent(self):
+        self.char1.msg(prompt="P")
+        with patch.object(self.char1, "get_resource_prompt", return_value="P"), patch(
+            "evennia.objects.objects.DefaultObject.msg"
+        ) as mock_msg:
+            prompt_manager.send(self.char1)
+        mock_msg.assert_not_called()
+        self.assertEqual(prompt_manager.get_metrics()["skipped"], 1)
+
+        # another prompt was shown in between, so the same text is sent again
+        self.char1.msg(prompt="status")
+        with patch.object(self.char1, "get_resource_prompt", return_value="P"), patch(
+            "evennia.objects.objects.DefaultObject.msg"
+        ) as mock_msg:
+            prompt_manager.send(self.char1)
+        mock_msg.assert_called_once()
+
+    def test_prompt_is_resent_after_text_output(self):
+        self.char1.msg(prompt="P")
+        self.char1.msg("You see nothing special.")
+        with patch("world.system.prompt_manager.delay"):
+            self.char1.refresh_prompt()
+        with patch.object(self.char1, "get_resource_prompt", return_value="P"), patch(
+            "evennia.objects.objects.DefaultObject.msg"
+        ) as mock_msg:
+            prompt_manager.flush()
+        mock_msg.assert_called_once()
+        self.assertEqual(mock_msg.call_args.kwargs["prompt"], "P")
+        self.assertEqual(prompt_manager.get_metrics(), {"sent": 1, "skipped": 0})
+
+    def test_render_does_not_refresh_stats(self):
+        with patch("world.system.stat_manager.refresh_stats") as mock_refresh:
+            prompt = self.char1.get_resource_prompt()
+        mock_refresh.assert_not_called()
+        self.assertIn(str(int(self.char1.traits.health.current)), prompt)
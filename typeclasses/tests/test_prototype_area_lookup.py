@@ -10,6 +10,7 @@ from commands.admin import BuilderCmdSet
 from commands import aedit
 from commands.areas import CmdRReg
 from commands.building import CmdTeleport
+from world import areas
 
 
 @override_settings(DEFAULT_HOME=None)
@@ -20,6 +21,9 @@ class TestPrototypeAreaLookup(EvenniaTest):
         super().setUp()
         self.char1.msg = MagicMock()
         self.char1.cmdset.add_default(BuilderCmdSet)
+        # the registry is read through the patched ``_load_registry``
+        areas.clear_area_cache()
+        self.addCleanup(areas.clear_area_cache)
 
     @patch("world.areas._load_registry", return_value=([], []))
     @patch("world.areas.load_all_prototypes")
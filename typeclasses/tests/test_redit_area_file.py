@@ -34,8 +34,7 @@ class TestREditAreaFile(EvenniaTest):
         room.db.area = 'zone'
         self.char1.location = room
         with patch('commands.redit.load_prototype', return_value=None), \
-             patch('commands.redit.OLCEditor') as mock_editor, \
-             patch('commands.redit.ObjectDB.objects.filter', return_value=[room]):
+             patch('commands.redit.OLCEditor') as mock_editor:
             self.char1.execute_cmd('redit 3')
             mock_editor.assert_called()
         with patch('commands.redit.save_prototype'):
@@ -68,9 +68,6 @@ class TestREditCommand(EvenniaTest):
         with (
             patch("commands.redit.load_prototype", return_value=None),
             patch("commands.redit.OLCEditor") as mock_editor,
-            patch(
-                "commands.redit.ObjectDB.objects.filter", return_value=[room]
-            ),
         ):
             self.char1.execute_cmd("redit 5")
             mock_editor.assert_called()
@@ -130,7 +127,6 @@ class TestREditCommand(EvenniaTest):
         with (
             patch("commands.redit.load_prototype", return_value=None),
             patch("commands.redit.OLCEditor"),
-            patch("commands.redit.ObjectDB.objects.filter", return_value=[room]),
         ):
             self.char1.msg.reset_mock()
             self.char1.execute_cmd("redit 6")
@@ -156,9 +152,6 @@ class TestREditCommand(EvenniaTest):
 
         with (
             patch("commands.redit.load_prototype") as mock_load,
-            patch(
-                "commands.redit.ObjectDB.objects.filter", return_value=[room]
-            ),
             patch("commands.redit.OLCEditor") as mock_editor,
         ):
             self.char1.execute_cmd("redit live 7")
@@ -174,7 +167,6 @@ class TestREditCommand(EvenniaTest):
     def test_live_not_found(self):
         with (
             patch("commands.redit.load_prototype") as mock_load,
-            patch("commands.redit.ObjectDB.objects.filter", return_value=[]),
         ):
             self.char1.msg.reset_mock()
             self.char1.execute_cmd("redit live 99")
@@ -237,10 +229,6 @@ class TestREditCommand(EvenniaTest):
 
         with (
             patch("commands.redit.save_prototype") as mock_save,
-            patch(
-                "commands.redit.ObjectDB.objects.filter",
-                return_value=[room],
-            ),
         ):
             redit.menunode_done(self.char1)
             mock_save.assert_called()
@@ -303,7 +291,6 @@ class TestREditCommand(EvenniaTest):
         with (
             patch("commands.redit.load_prototype", return_value=None),
             patch("commands.redit.OLCEditor") as mock_editor,
-            patch("commands.redit.ObjectDB.objects.filter", return_value=[room]),
         ):
             self.char1.execute_cmd("redit 9")
             mock_editor.assert_called()
@@ -314,7 +301,6 @@ class TestREditCommand(EvenniaTest):
         self.char1.msg.reset_mock()
         with (
             patch("commands.redit.save_prototype") as mock_save,
-            patch("commands.redit.ObjectDB.objects.filter", return_value=[room]),
         ):
             redit.menunode_done(self.char1)
             mock_save.assert_not_called()
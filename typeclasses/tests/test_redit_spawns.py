@@ -80,7 +80,6 @@ class TestReditSpawns(EvenniaTest):
         mock_script = MagicMock()
         with (
             patch("commands.redit.save_prototype"),
-            patch("commands.redit.ObjectDB.objects.filter", return_value=[room]),
             patch("commands.redit.get_respawn_manager", return_value=mock_script),
         ):
             redit.menunode_done(self.char1)
@@ -1,4 +1,7 @@
+from unittest.mock import patch
+
 from evennia.utils.test_resources import EvenniaTest
+from evennia.typeclasses.attributes import Attribute
 from evennia.utils import create
 from django.test import override_settings
 from world.system import stat_manager, state_manager
@@ -297,3 +300,58 @@ class TestBonusPersistence(EvenniaTest):
         obj = create.create_object("typeclasses.objects.Object", key="rock")
         self.assertEqual(stat_manager.get_effective_stat(obj, "STR"), 0)
         self.assertEqual(state_manager.get_effective_stat(obj, "STR"), 0)
+
+
+class TestIncrementalRefresh(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        stats.apply_stats(self.char1)
+        stat_manager.refresh_stats(self.char1)
+
+    def test_incremental_matches_full_refresh(self):
+        char = self.char1
+        char.db.active_effects = {"STR": 2}
+        char.tags.add("STR", category="buff")
+        stat_manager.refresh_stats(char, changed=("buffs",))
+        derived = dict(char.db.derived_stats)
+        primary = dict(char.db.primary_stats)
+        stat_manager.clear_stat_cache(char)
+        stat_manager.refresh_stats(char)
+        self.assertEqual(dict(char.db.derived_stats), derived)
+        self.assertEqual(dict(char.db.primary_stats), primary)
+
+    def test_unchanged_inputs_are_not_rescanned(self):
+        with patch.object(stat_manager, "_gear_mods") as mock_gear, patch.object(
+            stat_manager, "_buff_mods"
+        ) as mock_buff:
+            stat_manager.refresh_stats(self.char1, changed=())
+        mock_gear.assert_not_called()
+        mock_buff.assert_not_called()
+
+    def test_only_changed_values_written(self):
+        char = self.char1
+        with patch.object(Attribute, "save") as mock_save:
+            stat_manager.refresh_stats(char, changed=("gear", "buffs"))
+        mock_save.assert_not_called()
+
+    def test_effect_counts_once(self):
+        char = self.char1
+        before_state = state_manager.get_effective_stat(char, "STR")
+        before_stat = stat_manager.get_effective_stat(char, "STR")
+        state_manager.add_effect(char, "STR", 2)
+        self.assertEqual(state_manager.get_effective_stat(char, "STR"), before_state + 5)
+        self.assertEqual(stat_manager.get_effective_stat(char, "STR"), before_stat + 5)
+        stat_manager.refresh_stats(char)
+        self.assertEqual(state_manager.get_effective_stat(char, "STR"), before_state + 5)
+        state_manager.remove_effect(char, "STR")
+        self.assertEqual(state_manager.get_effective_stat(char, "STR"), before_state)
+
+    def test_buff_change_updates_dependent_stats(self):
+        char = self.char1
+        attack = char.db.derived_stats["attack_power"]
+        armor = char.db.derived_stats["armor"]
+        char.db.active_effects = {"STR": 2}
+        stat_manager.refresh_stats(char, changed=("buffs",))
+        self.assertGreater(char.db.derived_stats["attack_power"], attack)
+        self.assertGreater(char.db.derived_stats["armor"], armor)
+        self.assertEqual(char.traits.attack_power.base, char.db.derived_stats["attack_power"])
@@ -0,0 +1,52 @@
+from unittest.mock import patch
+
+from evennia.utils.test_resources import EvenniaTest
+
+from combat.engine import CombatEngine
+from world import stats
+from world.system import stat_manager, state_manager, stat_snapshot
+
+
+class TestStatSnapshot(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        stats.apply_stats(self.char1)
+        stat_manager.refresh_stats(self.char1)
+        self.char1.db.STR_bonus = 2
+        self.char1.db.temp_bonuses = {"DEX": [{"amount": 3, "duration": 5, "key": None}]}
+        self.char1.db.active_effects = {"speed": 2}
+
+    def tearDown(self):
+        stat_snapshot.release_snapshots([self.char1, self.char2])
+        super().tearDown()
+
+    def test_snapshot_matches_live_values(self):
+        keys = ("STR", "DEX", "haste", "hit_chance", "dodge", "evasion")
+        live_state = {k: state_manager.get_effective_stat(self.char1, k) for k in keys}
+        live_stat = {k: stat_manager.get_effective_stat(self.char1, k) for k in keys}
+        stat_snapshot.take_snapshots([self.char1])
+        for key in keys:
+            self.assertEqual(state_manager.get_effective_stat(self.char1, key), live_state[key])
+            self.assertEqual(stat_manager.get_effective_stat(self.char1, key), live_stat[key])
+
+    def test_snapshot_avoids_repeat_reads(self):
+        stat_snapshot.take_snapshots([self.char1])
+        with patch.object(state_manager, "get_temp_bonus") as mock_temp:
+            for _ in range(5):
+                state_manager.get_effective_stat(self.char1, "DEX")
+                stat_manager.get_effective_stat(self.char1, "dodge")
+        mock_temp.assert_not_called()
+
+    def test_invalidated_by_effect_change(self):
+        stat_snapshot.take_snapshots([self.char1])
+        before = state_manager.get_effective_stat(self.char1, "STR")
+        state_manager.add_effect(self.char1, "STR", 2)
+        self.assertEqual(state_manager.get_effective_stat(self.char1, "STR"), before + 5)
+
+    def test_released_after_round(self):
+        engine = CombatEngine([self.char1, self.char2], round_time=0)
+        with patch("world.system.state_manager.apply_regen"):
+            engine.start_round()
+            self.assertIsNotNone(stat_snapshot.get_snapshot(self.char1))
+            engine.turn_manager.end_round()
+        self.assertIsNone(stat_snapshot.get_snapshot(self.char1))
@@ -1,6 +1,9 @@
+from unittest.mock import patch
+
 from evennia.utils.test_resources import EvenniaTest
 from django.test import override_settings
-from world.system import state_manager
+from world.system import effect_timers, state_manager
+from world.system.constants import MAX_SATED
 
 
 @override_settings(DEFAULT_HOME=None)
@@ -170,3 +173,75 @@ class TestStateManager(EvenniaTest):
         for key, regen in expected.items():
             trait = char.traits.get(key)
             self.assertEqual(trait.current, trait.max // 2 + regen)
+
+
+@override_settings(DEFAULT_HOME=None)
+class TestEffectTimers(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        effect_timers.reset()
+        self.char1.db.sated = MAX_SATED
+        self.char2.db.sated = MAX_SATED
+
+    def test_only_due_characters_are_woken(self):
+        state_manager.add_status_effect(self.char1, "stunned", 2)
+        self.assertEqual(effect_timers.due_at(self.char1), effect_timers.current_tick() + 2)
+        self.assertIsNone(effect_timers.due_at(self.char2))
+        with patch.object(state_manager, "tick_character") as mock_tick:
+            state_manager.tick_all()
+        mock_tick.assert_not_called()
+        state_manager.tick_all()
+        self.assertFalse(self.char1.tags.has("stunned", category="status"))
+
+    def test_sync_catches_up_missed_ticks(self):
+        state_manager.add_effect(self.char1, "STR", 5)
+        for _ in range(3):
+            state_manager.tick_all()
+        self.assertEqual(self.char1.db.active_effects["STR"], 5)
+        state_manager.sync_timers(self.char1)
+        self.assertEqual(self.char1.db.active_effects["STR"], 2)
+        self.assertEqual(self.char1.db.sated, MAX_SATED - 3)
+
+    def test_hunger_wakes_when_sated_runs_out(self):
+        self.char1.db.sated = 2
+        state_manager.sync_timers(self.char1)
+        hp = self.char1.traits.health.current
+        state_manager.tick_all()
+        self.assertEqual(self.char1.db.sated, 2)
+        state_manager.tick_all()
+        self.assertEqual(self.char1.db.sated, 0)
+        self.assertLess(self.char1.traits.health.current, hp)
+        self.assertEqual(effect_timers.due_at(self.char1), effect_timers.current_tick() + 1)
+
+    def test_queue_restored_after_reload(self):
+        state_manager.add_status_effect(self.char1, "stunned", 3)
+        due = effect_timers.due_at(self.char1)
+        effect_timers.reset()
+        self.assertEqual(effect_timers.due_at(self.char1), due)
+
+    def test_timers_from_before_the_queue_are_migrated(self):
+        from evennia.server.models import ServerConfig
+        from typeclasses.npcs import BaseNPC
+        from evennia.utils import create
+
+        npc = create.create_object(BaseNPC, key="mob", location=self.room1)
+        npc.db.status_effects = {"stunned": 2}
+        npc.tags.add("stunned", category="status")
+        self.char2.db.active_effects = {}
+        effect_timers.reset()
+        self.assertEqual(effect_timers.due_at(npc), effect_timers.current_tick() + 2)
+        self.assertIsNone(effect_timers.due_at(self.char2))
+        self.assertTrue(ServerConfig.objects.conf(effect_timers.MIGRATED_KEY))
+
+        state_manager.tick_all()
+        state_manager.tick_all()
+        self.assertFalse(npc.tags.has("stunned", category="status"))
+        self.assertEqual(npc.db.status_effects, {})
+
+    def test_suspended_character_catches_up_on_resume(self):
+        state_manager.add_status_effect(self.char1, "stunned", 1)
+        state_manager.suspend_timers(self.char1)
+        state_manager.tick_all()
+        self.assertTrue(self.char1.tags.has("stunned", category="status"))
+        state_manager.sync_timers(self.char1)
+        self.assertFalse(self.char1.tags.has("stunned", category="status"))
@@ -2,16 +2,56 @@ from __future__ import annotations
 
 """Helper for safely evaluating condition strings."""
 
+from functools import lru_cache
 from typing import Any, Mapping
 from evennia.utils import logger
-from evennia.utils.utils import simple_eval
+from simpleeval import SimpleEval
 
-__all__ = ["eval_safe"]
+__all__ = ["eval_safe", "compile_expr", "CompiledExpr"]
+
+# one evaluator is enough: names are swapped in for every evaluation and
+# the default functions never evaluate another expression
+_EVALUATOR = SimpleEval()
+
+
+class CompiledExpr:
+    """An expression parsed once and evaluated against changing names."""
+
+    __slots__ = ("expr", "node", "error")
+
+    def __init__(self, expr: str):
+        self.expr = expr
+        self.node = None
+        self.error = None
+        try:
+            self.node = SimpleEval.parse(expr)
+        except Exception as err:
+            self.error = err
+
+    def __call__(self, context: Mapping[str, Any] | None = None) -> Any:
+        """Return the value of the expression, or ``False`` if it fails."""
+        err = self.error
+        if err is None:
+            try:
+                _EVALUATOR.names = dict(context or {})
+                return _EVALUATOR.eval(self.expr, previously_parsed=self.node)
+            except Exception as exc:  # pragma: no cover - log errors
+                err = exc
+        logger.log_err(f"Condition eval failed for '{self.expr}': {err}")
+        return False
+
+
+@lru_cache(maxsize=2048)
+def compile_expr(expr: str) -> CompiledExpr:
+    """Return the parsed form of ``expr``, shared by every caller."""
+    return CompiledExpr(expr)
 
 
 def eval_safe(expr: str, context: Mapping[str, Any] | None = None) -> Any:
     """Safely evaluate a Python expression using ``simple_eval``.
 
+    The expression is parsed once and the parse tree reused on later calls.
+
     Args:
         expr: The expression to evaluate.
         context: Optional mapping of names to values available in the expression.
@@ -19,8 +59,4 @@ def eval_safe(expr: str, context: Mapping[str, Any] | None = None) -> Any:
     Returns:
         The evaluated value or ``False`` if evaluation failed.
     """
-    try:
-        return simple_eval(expr, names=dict(context or {}))
-    except Exception as err:  # pragma: no cover - log errors
-        logger.log_err(f"Condition eval failed for '{expr}': {err}")
-        return False
+    return compile_expr(expr)(context)
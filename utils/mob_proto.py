@@ -83,21 +83,7 @@ def get_prototype(vnum: int | str) -> Optional[dict]:
     attempt to look up either form in the mob database.
     """
 
-    mob_db = get_mobdb()
-
-    # try integer lookup first
-    try:
-        vnum_int = int(vnum)
-    except (TypeError, ValueError):
-        vnum_int = None
-
-    if vnum_int is not None:
-        proto = mob_db.get_proto(vnum_int)
-        if proto is not None:
-            return proto
-
-    # fall back to string key
-    return mob_db.db.vnums.get(str(vnum))
+    return get_mobdb().get_proto(vnum)
 
 
 def _spawn_item(vnum: int) -> Any | None:
@@ -244,9 +230,7 @@ def spawn_from_vnum(vnum: int, location=None):
 def load_npc_prototypes() -> None:
     """Load all NPC prototype files into the MobDB."""
     mob_db = get_mobdb()
-    mob_db.db.vnums = {}
     protos = load_all_prototypes("npc")
-    for vnum, proto in protos.items():
-        mob_db.add_proto(int(vnum), proto)
+    mob_db.replace_protos(protos)
     if protos:
         mob_db.db.next_vnum = max(int(v) for v in protos) + 1
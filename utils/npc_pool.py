@@ -0,0 +1,243 @@
+# Pool of dormant NPCs reused on respawn
+
+from __future__ import annotations
+
+import json
+import zlib
+from typing import Any, Dict, Optional, Set
+
+from django.conf import settings
+from evennia.objects.models import ObjectDB
+from evennia.utils import logger
+
+from utils.object_signals import on_object_deleted
+
+#: Tag category marking a dormant NPC. The tag key is its prototype key.
+TAG_CATEGORY = "npc_pool"
+
+# dormant NPC ids by prototype key
+_POOL: Dict[Any, Set[int]] = {}
+_STATE = {"loaded": False, "released": 0, "reused": 0, "stale": 0}
+
+# attributes a death leaves behind that a fresh spawn does not have
+_DEATH_ATTRS = ("_dead", "dead", "is_dead", "combat_target")
+_STATUS_TAGS = ("unconscious", "lying down")
+
+
+def enabled() -> bool:
+    """Return ``True`` if dead NPCs should be pooled (``settings.NPC_POOL_ENABLED``)."""
+
+    return bool(getattr(settings, "NPC_POOL_ENABLED", False))
+
+
+def _limit() -> int:
+    return int(getattr(settings, "NPC_POOL_SIZE", 10))
+
+
+def _norm(key):
+    if isinstance(key, int):
+        return key
+    if str(key).isdigit():
+        return int(key)
+    return str(key)
+
+
+def _pool() -> Dict[Any, Set[int]]:
+    if not _STATE["loaded"]:
+        _POOL.clear()
+        rows = (
+            ObjectDB.objects.get_queryset()
+            .filter(db_tags__db_category=TAG_CATEGORY)
+            .values_list("id", "db_tags__db_key")
+        )
+        for obj_id, key in rows:
+            _POOL.setdefault(_norm(key), set()).add(obj_id)
+        _STATE["loaded"] = True
+    return _POOL
+
+
+def _proto_data(key) -> Optional[dict]:
+    """Return the prototype an NPC with ``key`` is spawned from."""
+
+    from world import prototypes
+
+    if isinstance(key, int):
+        from world.scripts.mob_db import get_mobdb
+
+        proto = get_mobdb().get_proto(key)
+        if proto:
+            data = dict(proto)
+            data.pop("spawn_count", None)
+            prototypes._normalize_proto(data)
+            return data
+    return prototypes.get_npc_prototype(str(key))
+
+
+def _signature(data: dict) -> int:
+    return zlib.crc32(json.dumps(data, sort_keys=True, default=str).encode())
+
+
+def _reset_state(npc) -> None:
+    """Clear what the death left on ``npc`` and restore its resources."""
+
+    from world.system import state_manager
+
+    for attr in _DEATH_ATTRS:
+        npc.attributes.remove(attr)
+    for tag in _STATUS_TAGS:
+        npc.tags.remove(tag, category="status")
+    state_manager.clear_timed_effects(npc)
+    for trait in ("health", "mana", "stamina"):
+        if handler := npc.traits.get(trait):
+            handler.reset()
+
+
+def is_dormant(obj) -> bool:
+    """Return ``True`` if ``obj`` is a pooled NPC waiting to be reused."""
+
+    return bool(obj.tags.get(category=TAG_CATEGORY))
+
+
+def release(npc) -> bool:
+    """Park the dead ``npc`` in the pool instead of deleting it.
+
+    The NPC is reset, removed from the map and its scripts are paused.
+    Returns ``False`` if pooling is disabled, the NPC was not spawned from
+    a prototype or the pool for its prototype is full; the caller should
+    then delete it as usual.
+    """
+
+    if not enabled() or not npc.pk:
+        return False
+    key = npc.db.prototype_key
+    if key is None:
+        return False
+    key = _norm(key)
+    ids = _pool().setdefault(key, set())
+    if len(ids) >= _limit():
+        return False
+    data = _proto_data(key)
+    if not data:
+        return False
+
+    from world.npc_handlers import active_set
+
+    _reset_state(npc)
+    for script in npc.scripts.all():
+        if script.is_active:
+            script.pause()
+    npc.location = None
+    active_set.forget(npc.id)
+    npc.db.pool_sig = _signature(data)
+    npc.tags.add(str(key), category=TAG_CATEGORY)
+    ids.add(npc.id)
+    _STATE["released"] += 1
+    return True
+
+
+def acquire(key, room):
+    """Return a dormant NPC of prototype ``key`` placed in ``room``.
+
+    Pooled NPCs whose prototype changed since they died are deleted.
+    Equipment looted from the corpse is spawned again from the prototype.
+    Returns ``None`` if no usable NPC is pooled.
+    """
+
+    if not enabled():
+        return None
+    key = _norm(key)
+    ids = _pool().get(key)
+    data = None
+    while ids:
+        npc = ObjectDB.objects.get_id(ids.pop())
+        if npc is None:
+            continue
+        if data is None:
+            data = _proto_data(key)
+            if not data:
+                ids.add(npc.id)
+                return None
+        if npc.db.pool_sig != _signature(data):
+            _STATE["stale"] += 1
+            npc.delete()
+            continue
+        _activate(npc, key, data, room)
+        return npc
+    return None
+
+
+def _activate(npc, key, data: dict, room) -> None:
+    from utils.mob_proto import apply_proto_items
+    from world.npc_handlers import active_set
+
+    npc.tags.remove(str(key), category=TAG_CATEGORY)
+    npc.attributes.remove("pool_sig")
+    if not npc.contents:
+        apply_proto_items(npc, data)
+    npc.location = room
+    for script in npc.scripts.all():
+        if script.db._paused_time:
+            script.unpause()
+    active_set.object_arrived(room, npc)
+    if isinstance(key, int):
+        from world.scripts.mob_db import get_mobdb
+
+        get_mobdb().increment_spawn_count(key)
+    _STATE["reused"] += 1
+
+
+def purge(key=None) -> int:
+    """Delete the dormant NPCs of ``key`` (or of every prototype).
+
+    Returns the number of deleted NPCs.
+    """
+
+    pool = _pool()
+    keys = [_norm(key)] if key is not None else list(pool)
+    count = 0
+    for pkey in keys:
+        for obj_id in list(pool.pop(pkey, ())):
+            npc = ObjectDB.objects.get_id(obj_id)
+            if npc is None:
+                continue
+            try:
+                npc.delete()
+                count += 1
+            except Exception as err:  # pragma: no cover - safety
+                logger.log_err(f"NPC pool: could not delete {npc}: {err}")
+    return count
+
+
+def size(key=None) -> int:
+    """Return the number of dormant NPCs of ``key`` (or in total)."""
+
+    pool = _pool()
+    if key is not None:
+        return len(pool.get(_norm(key), ()))
+    return sum(len(ids) for ids in pool.values())
+
+
+def get_metrics() -> Dict[str, int]:
+    """Return the pool size and how many NPCs were parked, reused or dropped."""
+
+    return {
+        "dormant": size(),
+        "released": _STATE["released"],
+        "reused": _STATE["reused"],
+        "stale": _STATE["stale"],
+    }
+
+
+def reset() -> None:
+    """Forget the in-memory pool; it is rebuilt from the tags on next use."""
+
+    _POOL.clear()
+    _STATE.update(loaded=False, released=0, reused=0, stale=0)
+
+
+def _forget(obj_id: int) -> None:
+    for ids in _POOL.values():
+        ids.discard(obj_id)
+
+
+on_object_deleted(_forget)
@@ -0,0 +1,37 @@
+# Shared object signal receivers for in-memory caches
+
+from __future__ import annotations
+
+from typing import Callable, Dict
+
+from django.db.models.signals import post_delete
+from evennia.objects.models import ObjectDB
+
+# callbacks by "<module>.<name>" so a reloaded module replaces its old one
+_DELETE_CALLBACKS: Dict[str, Callable[[int], None]] = {}
+
+
+def on_object_deleted(callback: Callable[[int], None]) -> Callable[[int], None]:
+    """Call ``callback(obj_id)`` after any object is deleted.
+
+    All callbacks run from a single ``post_delete`` receiver, so caches
+    keyed by object id can forget deleted objects without each module
+    connecting its own. Returns ``callback`` so it can be used as a
+    decorator.
+    """
+
+    _DELETE_CALLBACKS[f"{callback.__module__}.{callback.__qualname__}"] = callback
+    return callback
+
+
+def _on_object_deleted(sender, instance, **kwargs):
+    # typeclassed objects send their own proxy class, not ObjectDB, so the
+    # receiver can't filter on sender and checks the instance instead
+    if not isinstance(instance, ObjectDB):
+        return
+    obj_id = instance.id
+    for callback in list(_DELETE_CALLBACKS.values()):
+        callback(obj_id)
+
+
+post_delete.connect(_on_object_deleted, dispatch_uid="object_signals_delete")
@@ -0,0 +1,130 @@
+"""Per-room occupancy lookups split into players, NPCs, items and exits.
+
+Every location already keeps a contents cache keyed by content type which
+Evennia updates whenever an object's location changes. NPCs add an ``npc``
+content type on top of ``character`` so the cache separates them from
+player characters; players are the characters that are not NPCs. Counting
+players is therefore two ``len`` calls instead of a scan of the room.
+
+Locations without a contents cache (such as test doubles) fall back to
+classifying ``location.contents``.
+"""
+
+from __future__ import annotations
+
+from typing import List
+
+from evennia.objects.models import ContentsHandler
+
+PLAYER = "player"
+NPC = "npc"
+ITEM = "object"
+EXIT = "exit"
+CHARACTER = "character"
+
+
+def _typecache(location):
+    cache = getattr(location, "contents_cache", None)
+    if isinstance(cache, ContentsHandler):
+        return cache._typecache
+    return None
+
+
+def _category(obj) -> str | None:
+    ctypes = getattr(obj, "_content_types", None)
+    if not isinstance(ctypes, (tuple, list, set, frozenset)):
+        return None
+    if NPC in ctypes:
+        return NPC
+    if CHARACTER in ctypes:
+        return PLAYER
+    if EXIT in ctypes:
+        return EXIT
+    if ITEM in ctypes:
+        return ITEM
+    return None
+
+
+def count(location, category: str) -> int:
+    """Return how many objects of ``category`` are in ``location``."""
+
+    if not location:
+        return 0
+    cache = _typecache(location)
+    if cache is None:
+        return len(get(location, category))
+    if category == PLAYER:
+        return len(cache.get(CHARACTER, ())) - len(cache.get(NPC, ()))
+    return len(cache.get(category, ()))
+
+
+def has_players(location) -> bool:
+    """Return ``True`` if a player character is in ``location``."""
+
+    return count(location, PLAYER) > 0
+
+
+def get(location, category: str, exclude=None) -> List:
+    """Return the objects of ``category`` in ``location``."""
+
+    if not location:
+        return []
+    if _typecache(location) is None:
+        found = [
+            obj
+            for obj in getattr(location, "contents", None) or []
+            if _category(obj) == category
+        ]
+    elif category == PLAYER:
+        found = [
+            obj
+            for obj in location.contents_get(content_type=CHARACTER)
+            if NPC not in obj._content_types
+        ]
+    else:
+        found = location.contents_get(content_type=category)
+    if exclude is not None:
+        found = [obj for obj in found if obj is not exclude]
+    return found
+
+
+def players(location, exclude=None) -> List:
+    """Return player characters in ``location``."""
+
+    if not has_players(location):
+        return []
+    return get(location, PLAYER, exclude=exclude)
+
+
+def npcs(location, exclude=None) -> List:
+    """Return NPCs in ``location``."""
+
+    return get(location, NPC, exclude=exclude)
+
+
+def characters(location, exclude=None) -> List:
+    """Return every player character and NPC in ``location``."""
+
+    if _typecache(location) is None:
+        # unknown objects may still be able to fight, so keep them
+        return [
+            obj
+            for obj in getattr(location, "contents", None) or []
+            if obj is not exclude and _category(obj) not in (ITEM, EXIT)
+        ]
+    found = location.contents_get(content_type=CHARACTER)
+    if exclude is not None:
+        found = [obj for obj in found if obj is not exclude]
+    return found
+
+
+def items(location) -> List:
+    """Return objects in ``location`` that are neither characters nor exits."""
+
+    return get(location, ITEM)
+
+
+def exits(location) -> List:
+    """Return exits in ``location``."""
+
+    return get(location, EXIT)
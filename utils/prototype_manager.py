@@ -6,11 +6,19 @@ This module centralizes handling of prototype files for different
 categories (rooms, mobs, objects and areas). It also hooks into the
 :mod:`utils.vnum_registry` to keep track of which VNUMs are in use and
 to make sure VNUMs fall within defined ranges.
+
+Parsed prototypes are cached in memory. A cached file is only checked
+against its modification time and size once per
+``settings.PROTOTYPE_CACHE_TTL`` seconds, so repeated loads (spawns, loot
+rolls) do not touch the disk. Saves and deletes made through this module
+update the cache directly.
 """
 
 from pathlib import Path
 import json
-from typing import Dict, Optional, Mapping, Sequence
+import pickle
+import time
+from typing import Dict, Optional, Mapping, Sequence, Tuple
 
 from evennia.utils import logger
 
@@ -27,7 +35,10 @@ __all__ = [
     "CATEGORY_DIRS",
     "load_prototype",
     "save_prototype",
+    "delete_prototype",
     "load_all_prototypes",
+    "warm_cache",
+    "clear_cache",
     "is_in_range",
 ]
 
@@ -42,6 +53,19 @@ CATEGORY_DIRS: Dict[str, Path] = {
     "area": _BASE_PATH / "areas",
 }
 
+#: Seconds a cached file or directory listing is trusted before its
+#: modification time is checked again.
+CACHE_TTL = float(getattr(settings, "PROTOTYPE_CACHE_TTL", 2.0))
+
+# file path -> (stat signature, time of last check, pickled prototype).
+# Prototypes are stored pickled so every caller gets its own copy to mutate.
+_FILES: Dict[Path, Tuple[tuple, float, bytes]] = {}
+# directory -> (stat signature, time of last check, {vnum: file path})
+_LISTINGS: Dict[Path, Tuple[tuple, float, Dict[int, Path]]] = {}
+_STATS = {"hits": 0, "reads": 0}
+# bumped whenever a cached prototype or listing changes
+_VERSION = {"value": 0}
+
 
 def _json_safe(value):
     """Return ``value`` converted to JSON-serializable built-ins."""
@@ -60,40 +84,155 @@ def _proto_file(category: str, vnum: int) -> Path:
     return CATEGORY_DIRS[category] / f"{int(vnum)}.json"
 
 
-def load_prototype(category: str, vnum: int) -> Optional[dict]:
-    """Load and return prototype ``vnum`` for ``category`` if it exists."""
-    path = _proto_file(category, vnum)
+def _signature(path: Path) -> tuple:
+    st = path.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _store(path: Path, sig: tuple, proto) -> bytes:
+    blob = pickle.dumps(proto, pickle.HIGHEST_PROTOCOL)
+    _FILES[path] = (sig, time.monotonic(), blob)
+    _VERSION["value"] += 1
+    return blob
+
+
+def _read(path: Path) -> Optional[bytes]:
+    """Return the pickled prototype stored at ``path``.
+
+    The file is only parsed again when its modification time or size
+    changed since it was cached. ``None`` is returned for missing files.
+    """
+
+    now = time.monotonic()
+    cached = _FILES.get(path)
+    if cached and now - cached[1] < CACHE_TTL:
+        _STATS["hits"] += 1
+        return cached[2]
+    try:
+        sig = _signature(path)
+    except FileNotFoundError:
+        _FILES.pop(path, None)
+        return None
+    if cached and cached[0] == sig:
+        _FILES[path] = (sig, now, cached[2])
+        _STATS["hits"] += 1
+        return cached[2]
+    _FILES.pop(path, None)
     try:
         with path.open("r") as f:
-            return json.load(f)
+            proto = json.load(f)
+    except FileNotFoundError:
+        return None
+    _STATS["reads"] += 1
+    return _store(path, sig, proto)
+
+
+def _listing(directory: Path) -> Dict[int, Path]:
+    """Return ``vnum`` -> file path for the prototype files in ``directory``."""
+
+    now = time.monotonic()
+    cached = _LISTINGS.get(directory)
+    if cached and now - cached[1] < CACHE_TTL:
+        return cached[2]
+    try:
+        sig = _signature(directory)
+    except FileNotFoundError:
+        _LISTINGS.pop(directory, None)
+        return {}
+    if cached and cached[0] == sig:
+        _LISTINGS[directory] = (sig, now, cached[2])
+        return cached[2]
+    files: Dict[int, Path] = {}
+    for file in directory.glob("*.json"):
+        try:
+            files[int(file.stem)] = file
+        except ValueError:
+            logger.log_info(f"Skipped non-numeric prototype file: {file.name}")
+    _LISTINGS[directory] = (sig, now, files)
+    _VERSION["value"] += 1
+    return files
+
+
+def _update_listing(path: Path, vnum: int, present: bool) -> None:
+    cached = _LISTINGS.get(path.parent)
+    if not cached:
+        return
+    files = dict(cached[2])
+    if present:
+        files[vnum] = path
+    else:
+        files.pop(vnum, None)
+    try:
+        sig = _signature(path.parent)
     except FileNotFoundError:
+        _LISTINGS.pop(path.parent, None)
+        return
+    _LISTINGS[path.parent] = (sig, time.monotonic(), files)
+
+
+def load_prototype(category: str, vnum: int) -> Optional[dict]:
+    """Load and return prototype ``vnum`` for ``category`` if it exists."""
+    path = _proto_file(category, vnum)
+    # Decode errors propagate so callers can differentiate between an
+    # unreadable file and one that simply does not exist.
+    blob = _read(path)
+    if blob is None:
         return None
-    except json.JSONDecodeError as err:
-        # Propagate decode errors so callers can differentiate between an
-        # unreadable file and one that simply does not exist.
-        raise err
+    return pickle.loads(blob)
 
 
 def load_all_prototypes(category: str) -> Dict[int, dict]:
     """Return mapping of all ``vnum`` -> prototype for ``category``."""
     result: Dict[int, dict] = {}
     directory = CATEGORY_DIRS[category]
-    if not directory.exists():
-        return result
-    for file in directory.glob("*.json"):
+    for vnum, file in _listing(directory).items():
         try:
-            with file.open("r") as f:
-                proto = json.load(f)
-            try:
-                result[int(file.stem)] = proto
-            except ValueError:
-                logger.log_info(f"Skipped non-numeric prototype file: {file.name}")
-                continue
+            blob = _read(file)
         except json.JSONDecodeError:
             continue
+        if blob is not None:
+            result[vnum] = pickle.loads(blob)
     return result
 
 
+def warm_cache(categories: Sequence[str] | None = None) -> int:
+    """Parse every prototype file of ``categories`` into the cache.
+
+    Returns the number of cached prototypes.
+    """
+    count = 0
+    for category in categories or CATEGORY_DIRS:
+        for file in _listing(CATEGORY_DIRS[category]).values():
+            try:
+                if _read(file) is not None:
+                    count += 1
+            except json.JSONDecodeError:
+                logger.log_info(f"Skipped unreadable prototype file: {file.name}")
+    return count
+
+
+def clear_cache() -> None:
+    """Forget every cached prototype and directory listing."""
+    _FILES.clear()
+    _LISTINGS.clear()
+    _STATS.update(hits=0, reads=0)
+    _VERSION["value"] += 1
+
+
+def get_cache_metrics() -> Dict[str, int]:
+    """Return cache size plus how many loads were served from memory or disk."""
+    return {"files": len(_FILES), "hits": _STATS["hits"], "reads": _STATS["reads"]}
+
+
+def get_cache_version() -> int:
+    """Return a counter that changes whenever cached prototypes change.
+
+    Callers deriving data from prototypes can compare it to decide
+    whether their own indexes need rebuilding.
+    """
+    return _VERSION["value"]
+
+
 def save_prototype(category: str, data: dict, vnum: int | None = None) -> int:
     """Save ``data`` under ``vnum`` for ``category``.
 
@@ -107,11 +246,28 @@ def save_prototype(category: str, data: dict, vnum: int | None = None) -> int:
             register_vnum(vnum)
     path = _proto_file(category, vnum)
     path.parent.mkdir(parents=True, exist_ok=True)
+    text = json.dumps(_json_safe(data), indent=4)
     with path.open("w") as f:
-        json.dump(_json_safe(data), f, indent=4)
+        f.write(text)
+    # cache what a later load would parse from the file
+    _store(path, _signature(path), json.loads(text))
+    _update_listing(path, int(vnum), True)
     return vnum
 
 
+def delete_prototype(category: str, vnum: int) -> bool:
+    """Remove prototype ``vnum`` of ``category``. Returns ``True`` if a file was removed."""
+    path = _proto_file(category, vnum)
+    _FILES.pop(path, None)
+    _VERSION["value"] += 1
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        return False
+    _update_listing(path, int(vnum), False)
+    return True
+
+
 def is_in_range(category: str, vnum: int) -> bool:
     """Return ``True`` if ``vnum`` falls within the allowed range."""
     if category not in VNUM_RANGES:
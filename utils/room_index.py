@@ -0,0 +1,183 @@
+# In-memory VNUM -> room index
+
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+from django.db.models.signals import m2m_changed, post_save, pre_delete
+from evennia.objects.models import ObjectDB
+from evennia.typeclasses.attributes import Attribute
+
+from utils.object_signals import on_object_deleted
+
+#: Tag category mirroring ``db.room_id`` so the index can be rebuilt without
+#: unpickling every attribute. The tag key is the VNUM as a string.
+TAG_CATEGORY = "room_vnum"
+
+# rooms by VNUM and the VNUM of each indexed room id
+_ROOMS: Dict[int, object] = {}
+_VNUMS: Dict[int, int] = {}
+_STATE = {"loaded": False, "hits": 0, "misses": 0}
+
+
+def _is_room(obj) -> bool:
+    return "room" in getattr(obj, "_content_types", ())
+
+
+def _vnum(value) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _tag(room, vnum: Optional[int]) -> None:
+    """Keep the ``room_vnum`` tag of ``room`` in line with ``vnum``."""
+
+    current = room.tags.get(category=TAG_CATEGORY, return_list=True)
+    if vnum is not None and current == [str(vnum)]:
+        return
+    if current:
+        room.tags.clear(category=TAG_CATEGORY)
+    if vnum is not None:
+        room.tags.add(str(vnum), category=TAG_CATEGORY)
+
+
+def _store(room, vnum: Optional[int]) -> None:
+    old = _VNUMS.pop(room.id, None)
+    if old is not None and _ROOMS.get(old) is room:
+        del _ROOMS[old]
+    if vnum is not None:
+        _ROOMS[vnum] = room
+        _VNUMS[room.id] = vnum
+
+
+def _index(room, value) -> None:
+    if not _is_room(room) or not room.pk:
+        return
+    vnum = _vnum(value)
+    _store(room, vnum)
+    _tag(room, vnum)
+
+
+def update(room) -> None:
+    """Index ``room`` under its current ``db.room_id``."""
+
+    _index(room, room.db.room_id)
+
+
+def forget(obj_id: int) -> None:
+    """Drop the room with ``obj_id`` from the index."""
+
+    vnum = _VNUMS.pop(obj_id, None)
+    room = _ROOMS.get(vnum)
+    if room is not None and room.id == obj_id:
+        del _ROOMS[vnum]
+
+
+def load() -> int:
+    """Rebuild the index from the database.
+
+    Rooms already carrying a ``room_vnum`` tag are read in one query; rooms
+    that only have the ``room_id`` attribute (created before the index
+    existed) are tagged on the way. Returns the number of indexed rooms.
+    """
+
+    _ROOMS.clear()
+    _VNUMS.clear()
+    objects = ObjectDB.objects.get_queryset()
+    rows = ObjectDB.db_tags.through.objects.filter(
+        tag__db_category=TAG_CATEGORY
+    ).values_list("objectdb_id", "tag__db_key")
+    tagged = {obj_id: _vnum(key) for obj_id, key in rows}
+    for room in objects.filter(db_tags__db_category=TAG_CATEGORY).distinct():
+        _store(room, tagged.get(room.id))
+    untagged = (
+        objects.filter(db_attributes__db_key="room_id")
+        .exclude(db_tags__db_category=TAG_CATEGORY)
+        .distinct()
+    )
+    for obj in untagged:
+        update(obj)
+    _STATE["loaded"] = True
+    return len(_ROOMS)
+
+
+def _current(room):
+    """Return the live instance of ``room`` or ``None`` if it is gone."""
+
+    cached = ObjectDB.get_cached_instance(room.id)
+    if cached is not None:
+        return cached
+    return ObjectDB.objects.get_id(room.id)
+
+
+def get_room(vnum):
+    """Return the room with ``vnum`` or ``None``."""
+
+    vnum = _vnum(vnum)
+    if vnum is None:
+        return None
+    if not _STATE["loaded"]:
+        load()
+    room = _ROOMS.get(vnum)
+    if room is not None:
+        live = _current(room)
+        if live is None:
+            forget(room.id)
+            room = None
+        elif live is not room:
+            _store(live, vnum)
+            room = live
+    _STATE["hits" if room is not None else "misses"] += 1
+    return room
+
+
+def get_metrics() -> Dict[str, int]:
+    """Return the index size and lookup counters."""
+
+    return {"rooms": len(_ROOMS), "hits": _STATE["hits"], "misses": _STATE["misses"]}
+
+
+def reset() -> None:
+    """Forget the index; the next lookup reloads it."""
+
+    _ROOMS.clear()
+    _VNUMS.clear()
+    _STATE.update(loaded=False, hits=0, misses=0)
+
+
+def _room_id_attr(attr) -> bool:
+    return attr.db_key == "room_id" and not attr.db_category
+
+
+def _on_attribute_added(sender, instance, action, reverse, pk_set, **kwargs):
+    # new attributes are linked after being saved, so post_save cannot see
+    # which room they belong to yet
+    if action != "post_add" or reverse or not _is_room(instance):
+        return
+    for attr in Attribute.objects.filter(pk__in=pk_set or (), db_key="room_id"):
+        if _room_id_attr(attr):
+            _index(instance, attr.value)
+
+
+def _on_attribute_saved(sender, instance, created, **kwargs):
+    if created or not _room_id_attr(instance):
+        return
+    for obj in instance.objectdb_set.all():
+        _index(obj, instance.value)
+
+
+def _on_attribute_deleted(sender, instance, **kwargs):
+    if not _room_id_attr(instance):
+        return
+    for obj_id in instance.objectdb_set.values_list("id", flat=True):
+        forget(obj_id)
+
+
+m2m_changed.connect(
+    _on_attribute_added, sender=ObjectDB.db_attributes.through, dispatch_uid="room_index_attr_add"
+)
+post_save.connect(_on_attribute_saved, sender=Attribute, dispatch_uid="room_index_attr_save")
+pre_delete.connect(_on_attribute_deleted, sender=Attribute, dispatch_uid="room_index_attr_delete")
+on_object_deleted(forget)
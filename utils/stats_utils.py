@@ -52,7 +52,7 @@ from world.stats import (
     sum_bonus,
     apply_stats,
 )
-from world.system import stat_manager
+from world.system import stat_manager, state_manager
 from world.system.constants import MAX_SATED, MAX_LEVEL
 import math
 import re
@@ -167,6 +167,7 @@ def _db_get(obj, key, default=None):
 def get_display_scroll(chara):
     """Return a formatted character sheet for ``chara``."""
 
+    state_manager.sync_timers(chara)
     stat_manager.refresh_stats(chara)
 
     lines = []
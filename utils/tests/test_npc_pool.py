@@ -0,0 +1,126 @@
+from unittest.mock import patch
+
+from django.test import override_settings
+from evennia import create_object
+from evennia.utils import create
+from evennia.utils.test_resources import EvenniaTest
+
+from scripts.mob_respawn_manager import MobRespawnManager
+from typeclasses.rooms import Room
+from utils import npc_pool
+from utils.mob_proto import spawn_from_vnum
+from world.scripts.mob_db import get_mobdb
+from world.system import effect_timers, state_manager
+
+PROTO = {"key": "goblin", "typeclass": "typeclasses.npcs.BaseNPC", "level": 1}
+
+
+@override_settings(NPC_POOL_ENABLED=True, NPC_POOL_SIZE=2)
+class TestNPCPool(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        npc_pool.reset()
+        self.addCleanup(npc_pool.reset)
+        self.room = create_object(Room, key="R")
+        self.mob_db = get_mobdb()
+        self.mob_db.add_proto(5, dict(PROTO))
+
+    def _spawn(self):
+        npc = spawn_from_vnum(5, location=self.room)
+        npc.db.prototype_key = 5
+        npc.db.spawn_room = self.room
+        return npc
+
+    def _kill(self, npc):
+        with patch("world.mechanics.on_death_manager.handle_death", return_value=None), patch(
+            "utils.script_utils.get_respawn_manager", return_value=None
+        ):
+            npc.db._dead = False
+            npc.on_death(self.char1)
+
+    def test_dead_npc_is_parked_and_reused(self):
+        npc = self._spawn()
+        npc.traits.health.current = 1
+        npc.db.dead = True
+        self._kill(npc)
+        self.assertIsNotNone(npc.pk)
+        self.assertIsNone(npc.location)
+        self.assertEqual(npc_pool.size(5), 1)
+
+        with patch("evennia.prototypes.spawner.spawn") as mock_spawn:
+            reused = npc_pool.acquire(5, self.room)
+        mock_spawn.assert_not_called()
+        self.assertIs(reused, npc)
+        self.assertEqual(npc.location, self.room)
+        self.assertFalse(npc.attributes.has("dead"))
+        self.assertEqual(npc.traits.health.current, npc.traits.health.max)
+        self.assertEqual(npc_pool.size(5), 0)
+        self.assertEqual(npc_pool.get_metrics()["reused"], 1)
+
+    def test_pool_is_bounded_and_survives_reset(self):
+        npcs = [self._spawn() for _ in range(3)]
+        for npc in npcs:
+            self._kill(npc)
+        self.assertEqual(npc_pool.size(5), 2)
+        self.assertIsNone(npcs[2].pk)
+
+        npc_pool.reset()
+        self.assertEqual(npc_pool.size(5), 2)
+
+    def test_changed_prototype_drops_dormant_npc(self):
+        npc = self._spawn()
+        self._kill(npc)
+        self.mob_db.add_proto(5, dict(PROTO, level=2))
+        self.assertIsNone(npc_pool.acquire(5, self.room))
+        self.assertIsNone(npc.pk)
+        self.assertEqual(npc_pool.get_metrics()["stale"], 1)
+
+    @override_settings(NPC_POOL_ENABLED=False)
+    def test_disabled_pool_deletes(self):
+        npc = self._spawn()
+        self._kill(npc)
+        self.assertIsNone(npc.pk)
+        self.assertEqual(npc_pool.size(), 0)
+
+    def test_respawn_manager_respawns_from_pool(self):
+        script = create.create_script(
+            MobRespawnManager, key="mob_respawn_manager", autostart=False
+        )
+        npc = self._spawn()
+        self._kill(npc)
+        with patch("scripts.mob_respawn_manager.spawn_from_vnum") as mock_spawn, patch(
+            "commands.npc_builder.finalize_mob_prototype"
+        ) as mock_finalize:
+            respawned = script._spawn("5", self.room)
+        mock_spawn.assert_not_called()
+        mock_finalize.assert_not_called()
+        self.assertIs(respawned, npc)
+        self.assertEqual(npc.location, self.room)
+        self.assertEqual(npc.db.prototype_key, 5)
+        self.assertEqual(npc.db.spawn_room, self.room)
+
+    def test_effects_do_not_survive_death(self):
+        npc = self._spawn()
+        base_str = npc.traits.STR.base
+        state_manager.add_effect(npc, "STR", 5)
+        state_manager.add_status_effect(npc, "stunned", 3)
+        state_manager.add_temp_stat_bonus(npc, "DEX", 2, 4)
+        self.assertIsNotNone(effect_timers.due_at(npc))
+        self._kill(npc)
+
+        self.assertFalse(npc.db.active_effects)
+        self.assertFalse(npc.db.status_effects)
+        self.assertFalse(npc.db.temp_bonuses)
+        self.assertFalse(npc.tags.has("STR", category="buff"))
+        self.assertFalse(npc.tags.has("stunned", category="status"))
+        self.assertIsNone(effect_timers.due_at(npc))
+        self.assertFalse(npc.tags.has(effect_timers.TIMER_TAG, category=effect_timers.TIMER_CATEGORY))
+        self.assertEqual(npc.traits.STR.base, base_str)
+        self.assertIs(npc_pool.acquire(5, self.room), npc)
+
+    def test_deleted_dormant_npc_leaves_pool(self):
+        npc = self._spawn()
+        self._kill(npc)
+        self.assertEqual(npc_pool.size(5), 1)
+        npc.delete()
+        self.assertEqual(npc_pool.size(5), 0)
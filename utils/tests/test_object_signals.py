@@ -0,0 +1,36 @@
+from unittest.mock import MagicMock
+
+from evennia.utils import create
+from evennia.utils.test_resources import EvenniaTest
+
+from utils import object_signals
+
+
+class TestOnObjectDeleted(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        self.callback = MagicMock(__module__="tests", __qualname__="callback")
+        object_signals.on_object_deleted(self.callback)
+
+    def tearDown(self):
+        object_signals._DELETE_CALLBACKS.pop("tests.callback", None)
+        super().tearDown()
+
+    def test_called_with_id_of_typeclassed_object(self):
+        obj = create.create_object("typeclasses.objects.Object", key="rock")
+        obj_id = obj.id
+        obj.delete()
+        self.callback.assert_called_once_with(obj_id)
+
+    def test_ignores_other_models(self):
+        self.char1.attributes.add("foo", 1)
+        self.char1.attributes.remove("foo")
+        self.callback.assert_not_called()
+
+    def test_reregistering_replaces_callback(self):
+        other = MagicMock(__module__="tests", __qualname__="callback")
+        object_signals.on_object_deleted(other)
+        obj = create.create_object("typeclasses.objects.Object", key="rock")
+        obj.delete()
+        self.callback.assert_not_called()
+        other.assert_called_once()
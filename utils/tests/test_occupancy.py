@@ -0,0 +1,46 @@
+from unittest.mock import MagicMock
+
+from evennia.utils import create
+from evennia.utils.test_resources import EvenniaTest
+from django.test import override_settings
+
+from utils import occupancy
+
+
+@override_settings(DEFAULT_HOME=None)
+class TestOccupancy(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        self.room = create.create_object("typeclasses.rooms.Room", key="hall")
+        self.npc = create.create_object(
+            "typeclasses.npcs.BaseNPC", key="guard", location=self.room
+        )
+        self.item = create.create_object(
+            "typeclasses.objects.Object", key="rock", location=self.room
+        )
+
+    def test_categories(self):
+        self.char1.move_to(self.room, quiet=True)
+        self.assertEqual(occupancy.players(self.room), [self.char1])
+        self.assertEqual(occupancy.npcs(self.room), [self.npc])
+        self.assertEqual(occupancy.items(self.room), [self.item])
+        self.assertCountEqual(occupancy.characters(self.room), [self.char1, self.npc])
+        self.assertEqual(occupancy.npcs(self.room, exclude=self.npc), [])
+
+    def test_player_count_follows_moves(self):
+        self.assertFalse(occupancy.has_players(self.room))
+        self.char1.move_to(self.room, quiet=True)
+        self.char2.move_to(self.room, quiet=True)
+        self.assertEqual(occupancy.count(self.room, occupancy.PLAYER), 2)
+        self.char1.move_to(self.room1, quiet=True)
+        self.assertEqual(occupancy.players(self.room), [self.char2])
+        self.char2.location = None
+        self.assertFalse(occupancy.has_players(self.room))
+        self.assertEqual(occupancy.count(self.room, occupancy.NPC), 1)
+
+    def test_plain_contents_fallback(self):
+        room = MagicMock()
+        room.contents = [self.npc, self.item, self.char1]
+        self.assertTrue(occupancy.has_players(room))
+        self.assertEqual(occupancy.npcs(room), [self.npc])
+        self.assertEqual(occupancy.items(room), [self.item])
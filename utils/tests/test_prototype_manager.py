@@ -38,3 +38,62 @@ class TestLoadAllPrototypes(EvenniaTest):
         result = prototype_manager.load_all_prototypes("room")
         assert 100 in result
         assert all(key != 200 for key in result)
+
+
+@override_settings(DEFAULT_HOME=None)
+class TestPrototypeCache(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        self.tmp = TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patcher = mock.patch.dict(
+            prototype_manager.CATEGORY_DIRS, {"object": Path(self.tmp.name)}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        prototype_manager.clear_cache()
+        self.addCleanup(prototype_manager.clear_cache)
+        self.path = Path(self.tmp.name) / "5.json"
+        self.path.write_text(json.dumps({"key": "sword"}))
+
+    def test_repeat_loads_stay_in_memory(self):
+        self.assertEqual(prototype_manager.load_all_prototypes("object")[5]["key"], "sword")
+        with mock.patch.object(Path, "open") as mock_open, mock.patch.object(
+            Path, "stat"
+        ) as mock_stat:
+            proto = prototype_manager.load_prototype("object", 5)
+            prototype_manager.load_all_prototypes("object")
+        mock_open.assert_not_called()
+        mock_stat.assert_not_called()
+        # callers get their own copy
+        proto["key"] = "changed"
+        self.assertEqual(prototype_manager.load_prototype("object", 5)["key"], "sword")
+        self.assertEqual(prototype_manager.get_cache_metrics()["reads"], 1)
+
+    def test_changed_file_is_reloaded_after_ttl(self):
+        prototype_manager.load_prototype("object", 5)
+        self.path.write_text(json.dumps({"key": "longsword"}))
+        with mock.patch.object(prototype_manager, "CACHE_TTL", 0):
+            self.assertEqual(
+                prototype_manager.load_prototype("object", 5)["key"], "longsword"
+            )
+            self.path.unlink()
+            self.assertIsNone(prototype_manager.load_prototype("object", 5))
+
+    def test_save_and_delete_write_through(self):
+        self.assertEqual(list(prototype_manager.load_all_prototypes("object")), [5])
+        with mock.patch("utils.prototype_manager.validate_vnum", return_value=False):
+            prototype_manager.save_prototype("object", {"key": "axe", 1: "x"}, vnum=6)
+        with mock.patch.object(Path, "open") as mock_open:
+            protos = prototype_manager.load_all_prototypes("object")
+        mock_open.assert_not_called()
+        self.assertEqual(protos[6], {"key": "axe", "1": "x"})
+
+        self.assertTrue(prototype_manager.delete_prototype("object", 6))
+        self.assertFalse((Path(self.tmp.name) / "6.json").exists())
+        self.assertIsNone(prototype_manager.load_prototype("object", 6))
+        self.assertEqual(list(prototype_manager.load_all_prototypes("object")), [5])
+
+    def test_warm_cache(self):
+        self.assertEqual(prototype_manager.warm_cache(["object"]), 1)
+        self.assertEqual(prototype_manager.get_cache_metrics()["files"], 1)
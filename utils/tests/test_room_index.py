@@ -0,0 +1,60 @@
+from evennia.utils import create
+from evennia.utils.test_resources import EvenniaTest
+
+from utils import room_index
+
+
+class TestRoomIndex(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        room_index.reset()
+        self.room = create.create_object("typeclasses.rooms.Room", key="hall")
+        self.room.set_area("zone", 5)
+
+    def tearDown(self):
+        room_index.reset()
+        super().tearDown()
+
+    def test_resolves_and_tags_rooms(self):
+        self.assertEqual(room_index.get_room(5), self.room)
+        self.assertEqual(room_index.get_room("5"), self.room)
+        self.assertIsNone(room_index.get_room(6))
+        self.assertEqual(self.room.tags.get(category=room_index.TAG_CATEGORY), "5")
+
+    def test_follows_room_id_changes(self):
+        room_index.get_room(5)
+        self.room.db.room_id = 6
+        self.assertIsNone(room_index.get_room(5))
+        self.assertEqual(room_index.get_room(6), self.room)
+        self.assertEqual(self.room.tags.get(category=room_index.TAG_CATEGORY), "6")
+
+        self.room.attributes.remove("room_id")
+        self.assertIsNone(room_index.get_room(6))
+
+        other = create.create_object("typeclasses.rooms.Room", key="other")
+        other.db.room_id = 7
+        self.assertEqual(room_index.get_room(7), other)
+
+    def test_forgets_deleted_rooms(self):
+        room_index.get_room(5)
+        self.room.delete()
+        self.assertIsNone(room_index.get_room(5))
+
+        # rooms indexed from their tag alone are dropped by the delete itself
+        tagged = create.create_object("typeclasses.rooms.Room", key="tagged")
+        tagged.tags.add("9", category=room_index.TAG_CATEGORY)
+        room_index.load()
+        self.assertEqual(room_index.get_metrics()["rooms"], 1)
+        tagged.delete()
+        self.assertEqual(room_index.get_metrics()["rooms"], 0)
+
+    def test_non_rooms_are_ignored(self):
+        self.obj1.db.room_id = 8
+        self.assertIsNone(room_index.get_room(8))
+
+    def test_load_reads_tags_and_backfills(self):
+        self.room.tags.clear(category=room_index.TAG_CATEGORY)
+        room_index.reset()
+        self.assertEqual(room_index.load(), 1)
+        self.assertEqual(self.room.tags.get(category=room_index.TAG_CATEGORY), "5")
+        self.assertEqual(room_index.get_room(5), self.room)
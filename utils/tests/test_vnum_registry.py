@@ -24,7 +24,14 @@ class TestVnumRegistry(EvenniaTest):
         )
         patcher.start()
         self.addCleanup(patcher.stop)
+        path_patcher = mock.patch.object(
+            vnum_registry, "_REG_PATH", Path(self.tmp.name) / "vnums.json"
+        )
+        path_patcher.start()
+        self.addCleanup(path_patcher.stop)
         self.addCleanup(self.tmp.cleanup)
+        vnum_registry.reset()
+        self.addCleanup(vnum_registry.reset)
 
     def test_next_vnum_for_area(self):
         area = Area(key="town", start=100, end=105, reset_interval=0)
@@ -34,9 +41,10 @@ class TestVnumRegistry(EvenniaTest):
             self.assertEqual(val1, 100)
             val2 = vnum_registry.get_next_vnum_for_area("town", "npc", builder=None)
             self.assertEqual(val2, 101)
-            data = json.load(open(Path(self.tmp.name) / "vnums.json"))
-            self.assertIn(100, data["npc"]["used"])
-            self.assertIn(101, data["npc"]["used"])
+            vnum_registry.reset()
+            self.assertFalse(vnum_registry.validate_vnum(100, "npc"))
+            self.assertFalse(vnum_registry.validate_vnum(101, "npc"))
+            self.assertTrue(vnum_registry.validate_vnum(102, "npc"))
 
     def test_builder_permissions(self):
         area = Area(key="town", start=100, end=105, builders=["Alice"], reset_interval=0)
@@ -48,3 +56,52 @@ class TestVnumRegistry(EvenniaTest):
              mock.patch("world.areas.find_area", return_value=(0, area)):
             vnum_registry.get_next_vnum_for_area("town", "npc", builder="Alice")
 
+
+    def test_next_vnum_skips_used_runs(self):
+        for vnum in range(1, 20):
+            vnum_registry.register_vnum(vnum)
+        vnum_registry.register_vnum(21)
+        self.assertEqual(vnum_registry.peek_next_vnum("npc"), 22)
+        vnum_registry.unregister_vnum(5, "npc")
+        self.assertEqual(vnum_registry.get_next_vnum("npc"), 5)
+        self.assertEqual(vnum_registry.get_next_vnum("npc"), 20)
+
+    def test_area_allocation_wraps_to_free_numbers(self):
+        area = Area(key="town", start=100, end=102)
+        for vnum in (100, 102):
+            vnum_registry.register_vnum(vnum)
+        with mock.patch("world.areas.find_area", return_value=(0, area)):
+            self.assertEqual(vnum_registry.get_next_vnum_for_area("town", "npc"), 101)
+            with self.assertRaises(ValueError):
+                vnum_registry.get_next_vnum_for_area("town", "npc")
+
+    def test_legacy_used_list_is_read(self):
+        path = Path(self.tmp.name) / "vnums.json"
+        with path.open("w") as f:
+            json.dump({"npc": {"used": [1, 2, 4], "next": 3}}, f)
+        self.assertFalse(vnum_registry.validate_vnum(4, "npc"))
+        self.assertEqual(vnum_registry.get_next_vnum("npc"), 3)
+        self.assertEqual(vnum_registry.get_next_vnum("npc"), 5)
+        with path.open() as f:
+            data = json.load(f)
+        self.assertNotIn("used", data["npc"])
+        self.assertEqual(data["npc"]["next"], 6)
+
+    def test_saves_are_atomic_and_outside_changes_reload(self):
+        vnum_registry.register_vnum(7)
+        self.assertEqual([p.name for p in Path(self.tmp.name).iterdir()], ["vnums.json"])
+        with mock.patch("utils.vnum_registry._read", wraps=vnum_registry._read) as mock_read:
+            vnum_registry.validate_vnum(8, "npc")
+            vnum_registry.register_vnum(8)
+        mock_read.assert_not_called()
+
+        # another process rewrote the file
+        path = Path(self.tmp.name) / "vnums.json"
+        with path.open("w") as f:
+            json.dump({"npc": {"used": [9], "next": 1}}, f)
+        self.assertTrue(vnum_registry.validate_vnum(7, "npc"))
+        self.assertFalse(vnum_registry.validate_vnum(9, "npc"))
+
+        with mock.patch("utils.vnum_registry.os.replace", side_effect=OSError), self.assertRaises(OSError):
+            vnum_registry.register_vnum(10)
+        self.assertEqual([p.name for p in Path(self.tmp.name).iterdir()], ["vnums.json"])
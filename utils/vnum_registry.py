@@ -1,8 +1,23 @@
+"""Registry of used VNUMs per prototype category.
+
+Used VNUMs are held in memory as one bitmap per category, giving constant
+time membership checks and a byte-wise search for the next free number.
+The registry file stores each bitmap zlib-compressed and is replaced
+atomically on every change. Before any operation the file is checked for
+changes made by another process and reloaded if needed.
+"""
+
 from __future__ import annotations
 
+import base64
 import json
+import os
+import re
+import tempfile
+import threading
+import zlib
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 from django.conf import settings
 
@@ -25,8 +40,99 @@ VNUM_RANGES: Dict[str, Tuple[int, int]] = {
 
 _REG_PATH = Path(getattr(settings, "VNUM_REGISTRY_FILE", Path(settings.GAME_DIR) / "world" / "vnum_registry.json"))
 
+# first byte with at least one free bit
+_FREE_BYTE = re.compile(rb"[^\xff]")
+
+_LOCK = threading.RLock()
+# registry file the state was read from, its stat signature and the
+# per-category bitmaps
+_STATE = {"path": None, "sig": None, "maps": {}}
+
+
+class _VnumMap:
+    """Bitmap of the used VNUMs of one category plus its ``next`` counter."""
+
+    def __init__(self, start: int, end: int, next_vnum: Optional[int] = None):
+        self.start = start
+        self.end = end
+        self.next = start if next_vnum is None else int(next_vnum)
+        size = end - start + 1
+        self.bits = bytearray((size + 7) // 8)
+        # padding past ``end`` counts as used so searches never return it
+        for offset in range(size, len(self.bits) * 8):
+            self.bits[offset >> 3] |= 1 << (offset & 7)
+
+    def __contains__(self, vnum: int) -> bool:
+        if not (self.start <= vnum <= self.end):
+            return False
+        offset = vnum - self.start
+        return bool(self.bits[offset >> 3] & (1 << (offset & 7)))
 
-def _load() -> Dict[str, Dict]:
+    def add(self, vnum: int) -> bool:
+        """Mark ``vnum`` as used. Returns ``False`` if it already was."""
+        if vnum in self or not (self.start <= vnum <= self.end):
+            return False
+        offset = vnum - self.start
+        self.bits[offset >> 3] |= 1 << (offset & 7)
+        return True
+
+    def discard(self, vnum: int) -> bool:
+        """Mark ``vnum`` as free. Returns ``False`` if it already was."""
+        if vnum not in self:
+            return False
+        offset = vnum - self.start
+        self.bits[offset >> 3] &= ~(1 << (offset & 7)) & 0xFF
+        return True
+
+    def first_free(self, low: int, high: int) -> Optional[int]:
+        """Return the lowest free VNUM in ``low``-``high`` or ``None``."""
+        low = max(low, self.start)
+        high = min(high, self.end)
+        if low > high:
+            return None
+        offset = low - self.start
+        byte = offset >> 3
+        # bits below ``low`` in its byte are treated as used
+        value = self.bits[byte] | ((1 << (offset & 7)) - 1)
+        while value == 0xFF:
+            match = _FREE_BYTE.search(self.bits, byte + 1)
+            if match is None:
+                return None
+            byte = match.start()
+            value = self.bits[byte]
+        inverted = ~value & 0xFF
+        vnum = self.start + byte * 8 + (inverted & -inverted).bit_length() - 1
+        return vnum if vnum <= high else None
+
+    def dump(self) -> Dict:
+        return {
+            "next": self.next,
+            "bitmap": base64.b64encode(zlib.compress(bytes(self.bits))).decode("ascii"),
+        }
+
+    @classmethod
+    def load(cls, category: str, entry: Dict) -> "_VnumMap":
+        start, end = VNUM_RANGES[category]
+        vmap = cls(start, end, entry.get("next", start))
+        if "bitmap" in entry:
+            bits = zlib.decompress(base64.b64decode(entry["bitmap"]))
+            if len(bits) == len(vmap.bits):
+                vmap.bits[:] = bits
+        # registries written before bitmaps listed the used numbers
+        for vnum in entry.get("used", []):
+            vmap.add(int(vnum))
+        return vmap
+
+
+def _signature() -> Optional[tuple]:
+    try:
+        st = _REG_PATH.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read() -> Dict[str, Dict]:
     try:
         with _REG_PATH.open("r") as f:
             return json.load(f)
@@ -36,10 +142,53 @@ def _load() -> Dict[str, Dict]:
         return {}
 
 
-def _save(data: Dict[str, Dict]):
+def _maps() -> Dict[str, _VnumMap]:
+    """Return the bitmaps, reloading them if the registry file changed."""
+    sig = _signature()
+    if _STATE["path"] == _REG_PATH and _STATE["sig"] == sig:
+        return _STATE["maps"]
+    data = _read()
+    maps = {}
+    for category in VNUM_RANGES:
+        entry = data.get(category)
+        if isinstance(entry, dict):
+            maps[category] = _VnumMap.load(category, entry)
+    _STATE.update(path=_REG_PATH, sig=sig, maps=maps)
+    return maps
+
+
+def _map(category: str) -> _VnumMap:
+    maps = _maps()
+    vmap = maps.get(category)
+    if vmap is None:
+        vmap = maps[category] = _VnumMap(*VNUM_RANGES[category])
+    return vmap
+
+
+def _save() -> None:
+    """Atomically replace the registry file with the in-memory state."""
+    data = {category: vmap.dump() for category, vmap in _STATE["maps"].items()}
     _REG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with _REG_PATH.open("w") as f:
-        json.dump(data, f, indent=4)
+    fd, tmp = tempfile.mkstemp(dir=_REG_PATH.parent, prefix=f".{_REG_PATH.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, _REG_PATH)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    _STATE["sig"] = _signature()
+
+
+def reset() -> None:
+    """Forget the in-memory registry; the next call reads the file again."""
+    with _LOCK:
+        _STATE.update(path=None, sig=None, maps={})
 
 
 def validate_vnum(vnum: int, category: str) -> bool:
@@ -49,23 +198,20 @@ def validate_vnum(vnum: int, category: str) -> bool:
     start, end = VNUM_RANGES[category]
     if not (start <= vnum <= end):
         return False
-    data = _load()
-    used = set(data.get(category, {}).get("used", []))
-    return vnum not in used
+    with _LOCK:
+        return vnum not in _map(category)
 
 
 def register_vnum(vnum: int):
     """Record ``vnum`` as used in its category."""
-    data = _load()
     for cat, (start, end) in VNUM_RANGES.items():
         if start <= vnum <= end:
-            entry = data.setdefault(cat, {"used": [], "next": start})
-            if vnum not in entry["used"]:
-                entry["used"].append(vnum)
-                if entry["next"] <= vnum:
-                    entry["next"] = vnum + 1
-                data[cat] = entry
-                _save(data)
+            with _LOCK:
+                vmap = _map(cat)
+                if vmap.add(vnum):
+                    if vmap.next <= vnum:
+                        vmap.next = vnum + 1
+                    _save()
             return
     raise ValueError("VNUM outside defined ranges")
 
@@ -74,16 +220,12 @@ def unregister_vnum(vnum: int, category: str) -> None:
     """Remove ``vnum`` from the registry for ``category``."""
     if category not in VNUM_RANGES:
         raise KeyError(f"Unknown category: {category}")
-    data = _load()
-    entry = data.get(category, {"used": [], "next": VNUM_RANGES[category][0]})
-    used = set(entry.get("used", []))
-    if vnum in used:
-        used.remove(vnum)
-        entry["used"] = sorted(used)
-        if vnum < entry.get("next", VNUM_RANGES[category][0]):
-            entry["next"] = vnum
-        data[category] = entry
-        _save(data)
+    with _LOCK:
+        vmap = _map(category)
+        if vmap.discard(vnum):
+            if vnum < vmap.next:
+                vmap.next = vnum
+            _save()
 
 
 def get_next_vnum(category: str) -> int:
@@ -91,19 +233,14 @@ def get_next_vnum(category: str) -> int:
     if category not in VNUM_RANGES:
         raise KeyError(f"Unknown category: {category}")
     start, end = VNUM_RANGES[category]
-    data = _load()
-    entry = data.setdefault(category, {"used": [], "next": start})
-    vnum = max(entry.get("next", start), start)
-    used = set(entry.get("used", []))
-    while vnum in used and vnum <= end:
-        vnum += 1
-    if vnum > end:
-        raise ValueError("No available VNUMs in range")
-    used.add(vnum)
-    entry["used"] = sorted(used)
-    entry["next"] = vnum + 1
-    data[category] = entry
-    _save(data)
+    with _LOCK:
+        vmap = _map(category)
+        vnum = vmap.first_free(max(vmap.next, start), end)
+        if vnum is None:
+            raise ValueError("No available VNUMs in range")
+        vmap.add(vnum)
+        vmap.next = vnum + 1
+        _save()
     return vnum
 
 
@@ -113,13 +250,10 @@ def peek_next_vnum(category: str) -> int:
     if category not in VNUM_RANGES:
         raise KeyError(f"Unknown category: {category}")
     start, end = VNUM_RANGES[category]
-    data = _load()
-    entry = data.get(category, {"used": [], "next": start})
-    vnum = max(entry.get("next", start), start)
-    used = set(entry.get("used", []))
-    while vnum in used and vnum <= end:
-        vnum += 1
-    if vnum > end:
+    with _LOCK:
+        vmap = _map(category)
+        vnum = vmap.first_free(max(vmap.next, start), end)
+    if vnum is None:
         raise ValueError("No available VNUMs in range")
     return vnum
 
@@ -131,18 +265,17 @@ def get_next_vnum_for_area(area_name: str, category: str, *, builder: str | None
     is given, they must be listed as an authorized builder for the area. The
     returned VNUM will be persisted as used in the registry.
     """
-    from world.areas import get_area_vnum_range, find_area
+    from world.areas import find_area
 
     if category not in VNUM_RANGES:
         raise KeyError(f"Unknown category: {category}")
 
-    area_range = get_area_vnum_range(area_name)
-    if not area_range:
+    _, area = find_area(area_name)
+    if not area:
         raise ValueError(f"Unknown area: {area_name}")
-    if builder is not None:
-        _, area = find_area(area_name)
-        if area and area.builders and builder not in area.builders:
-            raise PermissionError("Builder not authorized for this area")
+    area_range = (area.start, area.end)
+    if builder is not None and area.builders and builder not in area.builders:
+        raise PermissionError("Builder not authorized for this area")
 
     cat_start, cat_end = VNUM_RANGES[category]
     start = max(area_range[0], cat_start)
@@ -150,28 +283,15 @@ def get_next_vnum_for_area(area_name: str, category: str, *, builder: str | None
     if start > end:
         raise ValueError("Area range does not overlap with category range")
 
-    data = _load()
-    entry = data.setdefault(category, {"used": [], "next": start})
-    used = set(entry.get("used", []))
-
-    # start searching from the larger of area start or stored next counter
-    vnum = max(entry.get("next", start), start)
-    for num in range(vnum, end + 1):
-        if num not in used:
-            vnum = num
-            break
-    else:
-        for num in range(start, vnum):
-            if num not in used:
-                vnum = num
-                break
-        else:
+    with _LOCK:
+        vmap = _map(category)
+        # search from the stored next counter, then wrap to the area start
+        vnum = vmap.first_free(max(vmap.next, start), end)
+        if vnum is None:
+            vnum = vmap.first_free(start, end)
+        if vnum is None:
             raise ValueError("No available VNUMs in area range")
-
-    used.add(vnum)
-    entry["used"] = sorted(used)
-    entry["next"] = vnum + 1
-    data[category] = entry
-    _save(data)
+        vmap.add(vnum)
+        vmap.next = vnum + 1
+        _save()
     return vnum
-
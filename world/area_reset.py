@@ -1,9 +1,16 @@
 from evennia.scripts.scripts import DefaultScript
-from world.areas import get_areas, update_area
+from world.areas import flush_areas, tick_areas
 from utils.script_utils import respawn_area
 
 class AreaReset(DefaultScript):
-    """Global script that increments area ages and performs resets."""
+    """Global script that increments area ages and performs resets.
+
+    Ages are advanced in memory every tick and written to the area files
+    every ``flush_ticks`` ticks and when the server stops or reloads.
+    """
+
+    #: Number of ticks between writes of the area ages.
+    flush_ticks = 10
 
     def at_script_creation(self):
         self.key = "area_reset"
@@ -12,10 +19,19 @@ class AreaReset(DefaultScript):
         self.persistent = True
 
     def at_repeat(self):
-        areas = get_areas()
-        for idx, area in enumerate(areas):
-            area.age += 1
-            if area.reset_interval and area.age >= area.reset_interval:
-                area.age = 0
-                respawn_area(area.key.lower())
-            update_area(idx, area)
+        for area in tick_areas():
+            respawn_area(area.key.lower())
+        ticks = (self.ndb.ticks or 0) + 1
+        if ticks >= self.flush_ticks:
+            flush_areas()
+            ticks = 0
+        self.ndb.ticks = ticks
+
+    def at_stop(self, **kwargs):
+        flush_areas()
+
+    def at_server_reload(self):
+        flush_areas()
+
+    def at_server_shutdown(self):
+        flush_areas()
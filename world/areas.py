@@ -1,9 +1,26 @@
-from dataclasses import dataclass, asdict, field
+"""Area definitions stored as JSON files.
+
+Areas are read once into an in-memory registry which is revalidated
+against the area directory at most every ``settings.AREA_REGISTRY_TTL``
+seconds. Lookups by name use a dict and lookups by VNUM an interval index
+that splits the VNUM line into segments owned by a single area, so a
+lookup is one binary search. Areas only known from room or NPC prototypes
+are resolved through a reverse map built from the prototype cache. Age
+counters advanced by :func:`tick_areas` stay in memory until
+:func:`flush_areas` writes them back.
+"""
+
+from bisect import bisect_right
+import heapq
+from dataclasses import dataclass, asdict, field, replace
 from typing import List, Dict, Optional
 
 from pathlib import Path
 import json
+import time
 from django.conf import settings
+from evennia.utils import logger
+from utils import prototype_manager
 from utils.prototype_manager import load_all_prototypes, save_prototype
 
 
@@ -43,6 +60,37 @@ class Area:
 
 _BASE_PATH = Path(settings.GAME_DIR) / "world" / "prototypes" / "areas"
 
+#: Seconds between checks of the area directory for outside changes.
+REGISTRY_TTL = float(getattr(settings, "AREA_REGISTRY_TTL", 2.0))
+
+# Areas in file order with their paths, the directory signature they were
+# read with and a lower-cased key -> position map. ``bounds``/``owners`` is
+# the interval index: VNUMs from ``bounds[i]`` up to ``bounds[i + 1]`` belong
+# to the area at position ``owners[i]`` (``None`` for gaps). ``spans`` are
+# the ranges sorted by start for overlap queries and ``overlaps`` the pairs
+# of areas whose ranges intersect. ``dirty`` holds paths whose age changed
+# since they were last written.
+_REGISTRY = {
+    "path": None,
+    "sig": None,
+    "checked": 0.0,
+    "areas": [],
+    "files": [],
+    "by_key": {},
+    "bounds": [],
+    "owners": [],
+    "starts": [],
+    "spans": [],
+    "overlaps": [],
+    "dirty": set(),
+}
+# Areas named by room and NPC prototypes: ``vnums`` maps a prototype VNUM to
+# its area name, ``areas`` a lower-cased area name to what the prototypes
+# tell about it. ``key`` identifies the prototype cache state it was built
+# from.
+_PROTO_INDEX = {"key": None, "vnums": {}, "areas": {}}
+_STATS = {"loads": 0, "writes": 0}
+
 
 def _file_path(name: str) -> Path:
     """Return path for area ``name``."""
@@ -66,30 +114,301 @@ def _load_registry() -> tuple[List[Dict], List[Path]]:
     return areas, files
 
 
+def _scan() -> tuple:
+    """Return the names, mtimes and sizes of the area files."""
+    if not _BASE_PATH.exists():
+        return ()
+    sig = []
+    for file in sorted(_BASE_PATH.glob("*.json")):
+        try:
+            st = file.stat()
+        except OSError:
+            continue
+        sig.append((file.name, st.st_mtime_ns, st.st_size))
+    return tuple(sig)
+
+
+def _copy(area: Area) -> Area:
+    return replace(
+        area,
+        builders=list(area.builders),
+        flags=list(area.flags),
+        rooms=list(area.rooms),
+    )
+
+
+def _segments(areas: List[Area]) -> tuple[list, list]:
+    """Split the VNUM line into segments each owned by one area.
+
+    Where ranges overlap the area stored first wins, matching a scan of
+    the areas in file order.
+    """
+    valid = [i for i, area in enumerate(areas) if area.start <= area.end]
+    points = sorted({areas[i].start for i in valid} | {areas[i].end + 1 for i in valid})
+    order = sorted(valid, key=lambda i: areas[i].start)
+    bounds: list = []
+    owners: list = []
+    active: list = []
+    nxt = 0
+    for point in points:
+        while nxt < len(order) and areas[order[nxt]].start <= point:
+            heapq.heappush(active, (order[nxt], areas[order[nxt]].end))
+            nxt += 1
+        while active and active[0][1] < point:
+            heapq.heappop(active)
+        owner = active[0][0] if active else None
+        if owners and owners[-1] == owner:
+            continue
+        bounds.append(point)
+        owners.append(owner)
+    return bounds, owners
+
+
+def _build_index() -> None:
+    """Rebuild the name map, the VNUM interval index and the overlap list."""
+    reg = _REGISTRY
+    areas = reg["areas"]
+    by_key: Dict[str, int] = {}
+    for i, area in enumerate(areas):
+        by_key.setdefault(area.key.lower(), i)
+    order = sorted(range(len(areas)), key=lambda i: (areas[i].start, i))
+    # spans hold (start, end, position, highest end up to here); the running
+    # maximum lets a range query stop once no earlier range can reach it
+    spans = []
+    reach = None
+    overlaps = []
+    for i in order:
+        area = areas[i]
+        if reach is not None and area.start <= reach:
+            for _, end, other, _ in spans:
+                if end >= area.start:
+                    overlaps.append((areas[other].key, area.key))
+        reach = area.end if reach is None else max(reach, area.end)
+        spans.append((area.start, area.end, i, reach))
+    reg["by_key"] = by_key
+    reg["bounds"], reg["owners"] = _segments(areas)
+    reg["starts"] = [span[0] for span in spans]
+    reg["spans"] = spans
+    reg["overlaps"] = overlaps
+
+
+def _reload() -> None:
+    reg = _REGISTRY
+    # keep unsaved age counters across a reload
+    pending = {
+        str(path): area.age
+        for area, path in zip(reg["areas"], reg["files"])
+        if path in reg["dirty"]
+    }
+    data, files = _load_registry()
+    areas = [Area.from_dict(entry) for entry in data]
+    dirty = set()
+    for area, path in zip(areas, files):
+        if str(path) in pending:
+            area.age = pending[str(path)]
+            dirty.add(path)
+    reg.update(
+        path=_BASE_PATH,
+        sig=_scan(),
+        checked=time.monotonic(),
+        areas=areas,
+        files=list(files),
+        dirty=dirty,
+    )
+    _build_index()
+    _STATS["loads"] += 1
+    for first, second in reg["overlaps"]:
+        logger.log_warn(f"Area ranges overlap: {first} and {second}")
+
+
+def _registry() -> dict:
+    """Return the registry, reloading it if the area files changed."""
+    reg = _REGISTRY
+    if reg["path"] != _BASE_PATH:
+        _reload()
+        return reg
+    now = time.monotonic()
+    if now - reg["checked"] >= REGISTRY_TTL:
+        reg["checked"] = now
+        if _scan() != reg["sig"]:
+            _reload()
+    return reg
+
+
+def _write(path: Path, area: Area) -> None:
+    _BASE_PATH.mkdir(parents=True, exist_ok=True)
+    with path.open("w") as f:
+        json.dump(area.to_dict(), f, indent=4)
+    _STATS["writes"] += 1
+
+
+def _written(path: Path, area: Area) -> None:
+    """Update the registry after ``area`` was written to ``path``."""
+    reg = _REGISTRY
+    if reg["path"] != _BASE_PATH:
+        return
+    reg["dirty"].discard(path)
+    if path in reg["files"]:
+        reg["areas"][reg["files"].index(path)] = _copy(area)
+        reg["sig"] = _scan()
+        _build_index()
+    else:
+        # a new file changes the order of the registry
+        reg["path"] = None
+
+
 def get_areas() -> List[Area]:
     """Return all stored areas."""
-    registry, _ = _load_registry()
-    return [Area.from_dict(data) for data in registry]
+    return [_copy(area) for area in _registry()["areas"]]
 
 
 def save_area(area: Area):
     """Add a new area."""
-    _BASE_PATH.mkdir(parents=True, exist_ok=True)
     path = _file_path(area.key)
-    with path.open("w") as f:
-        json.dump(area.to_dict(), f, indent=4)
+    _write(path, area)
+    _written(path, area)
 
 
 def update_area(index: int, area: Area):
     """Update area at ``index``."""
-    _, files = _load_registry()
+    files = _registry()["files"]
     if 0 <= index < len(files):
         path = files[index]
     else:
         path = _file_path(area.key)
-    _BASE_PATH.mkdir(parents=True, exist_ok=True)
-    with path.open("w") as f:
-        json.dump(area.to_dict(), f, indent=4)
+    _write(path, area)
+    _written(path, area)
+
+
+def tick_areas(minutes: int = 1) -> List[Area]:
+    """Advance the age of every area by ``minutes``.
+
+    Ages are only changed in memory. Returns copies of the areas whose
+    ``reset_interval`` was reached; their age is set back to ``0``.
+    """
+    reg = _registry()
+    due = []
+    for area, path in zip(reg["areas"], reg["files"]):
+        area.age += minutes
+        if area.reset_interval and area.age >= area.reset_interval:
+            area.age = 0
+            due.append(_copy(area))
+        reg["dirty"].add(path)
+    return due
+
+
+def flush_areas() -> int:
+    """Write every area with an unsaved age. Returns the number written."""
+    reg = _registry()
+    if not reg["dirty"]:
+        return 0
+    count = 0
+    for area, path in zip(reg["areas"], reg["files"]):
+        if path in reg["dirty"]:
+            _write(path, area)
+            count += 1
+    reg["dirty"].clear()
+    reg["sig"] = _scan()
+    return count
+
+
+def clear_area_cache() -> None:
+    """Forget the in-memory registry. Unsaved ages are discarded."""
+    _REGISTRY.update(path=None, sig=None, checked=0.0, areas=[], files=[], dirty=set())
+    _REGISTRY.update(by_key={}, bounds=[], owners=[], starts=[], spans=[], overlaps=[])
+    _PROTO_INDEX.update(key=None, vnums={}, areas={})
+    _STATS.update(loads=0, writes=0)
+
+
+def _proto_index() -> dict:
+    """Return the prototype area map, rebuilding it if prototypes changed."""
+    dirs = prototype_manager.CATEGORY_DIRS
+    key = (prototype_manager.get_cache_version(), dirs["room"], dirs["npc"])
+    index = _PROTO_INDEX
+    if index["key"] == key:
+        return index
+    room_protos = load_all_prototypes("room")
+    npc_protos = load_all_prototypes("npc")
+    vnums: Dict[int, str] = {}
+    by_room: Dict[int, str] = {}
+    by_npc: Dict[int, str] = {}
+    areas: Dict[str, dict] = {}
+    for num, proto in room_protos.items():
+        name = proto.get("area")
+        if not name:
+            continue
+        info = areas.setdefault(name.lower(), {"rooms": set(), "protos": set()})
+        vnums[int(num)] = name
+        rid = proto.get("room_id")
+        try:
+            rid = int(rid)
+        except (TypeError, ValueError):
+            rid = None
+        if rid is not None:
+            info["rooms"].add(rid)
+            by_room.setdefault(rid, name)
+        info["protos"].add(int(num) if rid is None else rid)
+    for proto in npc_protos.values():
+        name = proto.get("area")
+        if not name:
+            continue
+        areas.setdefault(name.lower(), {"rooms": set(), "protos": set()})
+        try:
+            by_npc.setdefault(int(proto.get("vnum")), name)
+        except (TypeError, ValueError):
+            continue
+    # a room prototype's own VNUM wins over a ``room_id`` match, which in
+    # turn wins over an NPC prototype
+    for mapping in (by_room, by_npc):
+        for num, name in mapping.items():
+            vnums.setdefault(num, name)
+    # the prototype cache version may move while the map is being read
+    key = (prototype_manager.get_cache_version(), dirs["room"], dirs["npc"])
+    index.update(key=key, vnums=vnums, areas=areas)
+    return index
+
+
+def get_prototype_rooms(name: str) -> set[int]:
+    """Return the room VNUMs of room prototypes assigned to area ``name``.
+
+    A prototype's ``room_id`` is used when set, else its own VNUM.
+    """
+    info = _proto_index()["areas"].get(name.lower())
+    return set(info["protos"]) if info else set()
+
+
+def find_overlapping_areas(start: int, end: int, exclude: str | None = None) -> List[Area]:
+    """Return the areas whose range intersects ``start``-``end``.
+
+    The area named ``exclude`` (case-insensitive) is left out. Areas are
+    returned in file order.
+    """
+    reg = _registry()
+    spans = reg["spans"]
+    skip = exclude.lower() if exclude else None
+    found = []
+    for pos in range(bisect_right(reg["starts"], end) - 1, -1, -1):
+        span_start, span_end, i, reach = spans[pos]
+        if reach < start:
+            break
+        if span_end >= start and reg["areas"][i].key.lower() != skip:
+            found.append(i)
+    return [_copy(reg["areas"][i]) for i in sorted(found)]
+
+
+def get_overlaps() -> List[tuple[str, str]]:
+    """Return the pairs of area keys whose stored ranges overlap."""
+    return list(_registry()["overlaps"])
+
+
+def get_registry_metrics() -> Dict[str, int]:
+    """Return the registry size, loads, writes and unsaved areas."""
+    return {
+        "areas": len(_REGISTRY["areas"]),
+        "loads": _STATS["loads"],
+        "writes": _STATS["writes"],
+        "dirty": len(_REGISTRY["dirty"]),
+    }
 
 
 def rename_area(old: str, new: str) -> None:
@@ -111,6 +430,8 @@ def rename_area(old: str, new: str) -> None:
         old_path.rename(new_path)
 
     area.key = new
+    # the old file is gone; reload the registry before writing the new one
+    _REGISTRY["path"] = None
     save_area(area)
 
     room_protos = load_all_prototypes("room")
@@ -131,6 +452,7 @@ def delete_area(name: str) -> bool:
     if path.exists():
         path.unlink()
         removed = True
+        _REGISTRY["path"] = None
 
     # clear area from any rooms currently assigned to it
     from evennia.objects.models import ObjectDB
@@ -148,58 +470,26 @@ def delete_area(name: str) -> bool:
 def find_area(name: str) -> tuple[int, Optional[Area]]:
     """Return index and area matching ``name``.
 
-    The search is case-insensitive. If the area is not stored on disk,
-    loaded room and NPC prototypes will be scanned for ``area`` fields
-    and a temporary :class:`Area` instance constructed if a match is
-    found.
+    The search is case-insensitive. If the area is not stored on disk but
+    room or NPC prototypes name it in their ``area`` field, a temporary
+    :class:`Area` instance is constructed from those prototypes.
     """
 
     key = name.lower()
-    registry, _ = _load_registry()
-    for i, data in enumerate(registry):
-        area = Area.from_dict(data)
-        if area.key.lower() == key:
-            return i, area
-
-    # fallback to prototypes
-    room_protos = load_all_prototypes("room")
-    npc_protos = load_all_prototypes("npc")
-
-    rooms: list[int] = []
-    start: int | None = None
-    end: int | None = None
-    found = False
-
-    for proto in room_protos.values():
-        area_name = proto.get("area")
-        if not area_name or area_name.lower() != key:
-            continue
-        found = True
-        rid = proto.get("room_id")
-        try:
-            rid_int = int(rid)
-        except (TypeError, ValueError):
-            continue
-        rooms.append(rid_int)
-        if start is None or rid_int < start:
-            start = rid_int
-        if end is None or rid_int > end:
-            end = rid_int
-
-    # also check NPC prototypes for the area name
-    if not found:
-        for proto in npc_protos.values():
-            area_name = proto.get("area")
-            if area_name and area_name.lower() == key:
-                found = True
-                break
-
-    if found:
+    reg = _registry()
+    i = reg["by_key"].get(key)
+    if i is not None:
+        return i, _copy(reg["areas"][i])
+
+    # fallback to areas only named by prototypes
+    info = _proto_index()["areas"].get(key)
+    if info is not None:
+        rooms = sorted(info["rooms"])
         area = Area(
             key=name,
-            start=start or 0,
-            end=end or 0,
-            rooms=sorted(set(rooms)),
+            start=rooms[0] if rooms else 0,
+            end=rooms[-1] if rooms else 0,
+            rooms=rooms,
         )
         return -1, area
 
@@ -217,43 +507,21 @@ def get_area_vnum_range(name: str) -> Optional[tuple[int, int]]:
 def find_area_by_vnum(vnum: int) -> Area | None:
     """Return the area whose range includes ``vnum``.
 
-    If no registered area covers ``vnum``, room and NPC prototypes are
-    searched for a matching ``area`` field. If found, a temporary
-    :class:`Area` is returned.
+    If no registered area covers ``vnum``, the area named by the room or
+    NPC prototype with that VNUM is looked up instead. If found, a
+    temporary :class:`Area` is returned.
     """
 
-    for area in get_areas():
-        if area.start <= vnum <= area.end:
-            return area
-
-    room_protos = load_all_prototypes("room")
-    npc_protos = load_all_prototypes("npc")
-
-    area_name: str | None = None
-
-    proto = room_protos.get(int(vnum))
-    if proto and proto.get("area"):
-        area_name = proto.get("area")
-    else:
-        for p in room_protos.values():
-            rid = p.get("room_id")
-            try:
-                if int(rid) == vnum:
-                    area_name = p.get("area")
-                    break
-            except (TypeError, ValueError):
-                continue
-
-    if area_name is None:
-        for p in npc_protos.values():
-            rid = p.get("vnum")
-            try:
-                if rid is not None and int(rid) == vnum and p.get("area"):
-                    area_name = p.get("area")
-                    break
-            except (TypeError, ValueError):
-                continue
+    try:
+        vnum = int(vnum)
+    except (TypeError, ValueError):
+        return None
+    reg = _registry()
+    pos = bisect_right(reg["bounds"], vnum) - 1
+    if pos >= 0 and reg["owners"][pos] is not None:
+        return _copy(reg["areas"][reg["owners"][pos]])
 
+    area_name = _proto_index()["vnums"].get(vnum)
     if area_name:
         _, area = find_area(area_name)
         return area
@@ -88,9 +88,96 @@ MAP_KEY = {
 
 from random import randint, choices
 from evennia.contrib.grid.wilderness import wilderness
+from evennia.objects.models import ObjectDB
 from evennia.prototypes import spawner
-from evennia.utils.search import search_tag
 from evennia.utils import logger, pad
+from utils.object_signals import on_object_deleted
+
+_MINIMAP_BORDER = "-" * 29
+
+
+class TileGrid:
+    """
+    A map string compiled into rows of biome ids.
+
+    Row 0 is the bottom of the map, as the wilderness contrib expects. Id 0
+    marks a tile that is not in the map key; ``biomes[id]`` is the map key
+    entry of any other id. The 5x5 minimap around every valid tile is
+    rendered up front.
+    """
+
+    def __init__(self, map_str, map_key):
+        rows = map_str.split("\n")
+        rows.reverse()
+        symbols = list(map_key)
+        ids = {symbol: i for i, symbol in enumerate(symbols, 1)}
+        self.biomes = [{}] + [map_key[symbol] for symbol in symbols]
+        self.names = ["In the wilderness"] + [
+            f"In the {data.get('biome', 'wilderness')}" for data in self.biomes[1:]
+        ]
+        self.tiles = [bytes(ids.get(char, 0) for char in row) for row in rows]
+        self.height = len(rows)
+
+        # pad the map so tiles near the edge still get a full 5x5 view
+        width = max((len(row) for row in rows), default=0)
+        padded = [" " * (width + 4)] * 2
+        padded += ["  " + row.ljust(width) + "  " for row in rows]
+        padded += [" " * (width + 4)] * 2
+        self.minimaps = {}
+        for y, row in enumerate(self.tiles):
+            for x, biome in enumerate(row):
+                if not biome:
+                    continue
+                minimap = [_MINIMAP_BORDER]
+                for i in range(y + 4, y - 1, -1):
+                    line = padded[i][x : x + 5]
+                    if i == y + 2:
+                        # mark our location
+                        line = line[:2] + "|g@|n" + line[3:]
+                    minimap.append(" " * 12 + line + " " * 12)
+                minimap.append(_MINIMAP_BORDER)
+                self.minimaps[(x, y)] = "\n".join(minimap)
+
+    def biome_id(self, x, y):
+        """Return the biome id at ``x``, ``y``, or 0 if it is off the map."""
+        if 0 <= y < self.height:
+            row = self.tiles[y]
+            if 0 <= x < len(row):
+                return row[x]
+        return 0
+
+
+GRID = TileGrid(MAP_STR, MAP_KEY)
+
+# ids of spawned objects by (biome tag, tag category), filled on first use
+_POPULATION = {}
+
+
+def biome_population(tag, tag_cat):
+    """Return how many objects tagged ``tag`` in ``tag_cat`` exist."""
+    key = (tag.lower(), tag_cat.lower())
+    ids = _POPULATION.get(key)
+    if ids is None:
+        ids = set(
+            ObjectDB.objects.get_queryset()
+            .filter(db_tags__db_key=key[0], db_tags__db_category=key[1])
+            .values_list("id", flat=True)
+        )
+        _POPULATION[key] = ids
+    return len(ids)
+
+
+def reset_population():
+    """Forget the biome counters; they are recounted on next use."""
+    _POPULATION.clear()
+
+
+def _forget(obj_id: int) -> None:
+    for ids in _POPULATION.values():
+        ids.discard(obj_id)
+
+
+on_object_deleted(_forget)
 
 
 class OverworldMapProvider(wilderness.WildernessMapProvider):
@@ -100,55 +187,21 @@ class OverworldMapProvider(wilderness.WildernessMapProvider):
     def is_valid_coordinates(self, wilderness, coordinates):
         "Validates if these coordinates are inside the map"
         x, y = coordinates
-        # split the map into lines, i.e. rows
-        # and reverse the order, since the wilderness contrib considers row 0 to be the bottom
-        rows = MAP_STR.split("\n")
-        rows.reverse()
-        # make sure that y is a valid coordinate
-        if y not in range(len(rows)):
-            return False
-        # get the y-coord row
-        row = rows[y]
-        # validate x as well
-        if x not in range(len(row)):
-            return False
-        # get the specific tile
-        tile = row[x]
-        # if it's a key in the map key dict, it's good
-        return tile in MAP_KEY
+        return GRID.biome_id(x, y) != 0
 
     def get_location_name(self, coordinates):
         """Returns the name for the given coordinate"""
         x, y = coordinates
-
-        # we've already passed coord validation so we can just grab the data
-        rows = MAP_STR.split("\n")
-        rows.reverse()
-        tile = rows[y][x]
-        tile_data = MAP_KEY.get(tile, {})
-        return f"In the {tile_data.get('biome', 'wilderness')}"
+        return GRID.names[GRID.biome_id(x, y)]
 
     def at_prepare_room(self, coordinates, caller, room):
         """Any changes that need to be done to the room after 'moving'."""
         x, y = coordinates
 
         # we've already passed coord validation so we can just grab the data
-        rows = MAP_STR.split("\n")
-        rows.reverse()
-        tile = rows[y][x]
-        tile_data = MAP_KEY.get(tile, {})
+        tile_data = GRID.biomes[GRID.biome_id(x, y)]
         room.ndb.active_desc = tile_data.get("desc")
-        # build the minimap
-        border = "-" * 29
-        minimap = [border]
-        for i in range(y + 2, y - 3, -1):
-            row = rows[i][x - 2 : x + 3]
-            if i == y:
-                # mark our location
-                row = row[:2] + "|g@|n" + row[3:]
-            minimap.append(" " * 12 + row + " " * 12)
-        minimap.append(border)
-        room.ndb.minimap = "\n".join(minimap)
+        room.ndb.minimap = GRID.minimaps.get((x, y), "")
 
         if not randint(0, 5):
             # try to generate a resource
@@ -186,8 +239,7 @@ class OverworldMapProvider(wilderness.WildernessMapProvider):
             # we have a tag specified; check for a spawn cap amt
             if spawn_cap := kwargs.get("cap"):
                 # there's a cap! make sure we don't already have enough
-                tagged = search_tag(key=tag, category=tag_cat)
-                if len(tagged) >= spawn_cap:
+                if biome_population(tag, tag_cat) >= spawn_cap:
                     # too many, don't spawn anything new
                     return
         # we're good to keep going
@@ -203,6 +255,8 @@ class OverworldMapProvider(wilderness.WildernessMapProvider):
         room.wilderness.move_obj(obj, coordinates)
         if tag and tag_cat:
             obj.tags.add(tag, category=tag_cat)
+            biome_population(tag, tag_cat)
+            _POPULATION[(tag.lower(), tag_cat.lower())].add(obj.id)
 
         return obj
 
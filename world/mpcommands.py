@@ -7,6 +7,7 @@ modules listed in :data:`ALLOWED_MPCALL_MODULES` may be imported unless the
 callback is registered in :data:`MPCALL_REGISTRY` using :func:`register_mpcall`.
 """
 
+from functools import lru_cache
 from importlib import import_module
 from typing import Callable, Dict
 
@@ -16,7 +17,7 @@ from evennia.prototypes import spawner
 
 from utils.mob_proto import spawn_from_vnum
 from utils.prototype_manager import load_prototype
-from utils.eval_utils import eval_safe
+from utils.eval_utils import compile_expr
 from world.system import state_manager
 
 # Modules that can be imported for ``mpcall``.
@@ -35,204 +36,275 @@ def register_mpcall(path: str):
 
     return decorator
 
-__all__ = ["execute_mpcommand"]
+__all__ = ["execute_mpcommand", "compile_mobprog"]
 
+# Handlers for each mpcommand keyword, called with the mob and the argument.
+MPCOMMANDS: Dict[str, Callable] = {}
 
-def _run_single(mob, command: str) -> None:
-    """Execute a single mpcommand without condition handling."""
 
-    parts = command.strip().split(None, 1)
-    subcmd = parts[0].lower()
-    arg = parts[1] if len(parts) > 1 else ""
+def _mpcommand(name: str):
+    """Decorator registering the handler of the ``name`` mpcommand."""
 
-    if subcmd == "echo":
-        if mob.location:
-            mob.location.msg_contents(arg)
-        return
+    def decorator(func: Callable) -> Callable:
+        MPCOMMANDS[name] = func
+        return func
 
-    if subcmd == "goto":
-        dest = mob.search(arg)
-        if dest:
-            mob.move_to(dest, quiet=True)
-        return
+    return decorator
 
-    if subcmd == "purge":
-        target = mob.search(arg)
-        if target:
-            target.delete()
-        return
 
-    if subcmd == "mload":
-        try:
-            vnum = int(arg.strip())
-        except (TypeError, ValueError):
-            return
-        try:
-            spawn_from_vnum(vnum, location=mob.location)
-        except ValueError:
-            return
-        return
+@_mpcommand("echo")
+def _mp_echo(mob, arg: str) -> None:
+    if mob.location:
+        mob.location.msg_contents(arg)
 
-    if subcmd == "oload":
-        try:
-            vnum = int(arg.strip())
-        except (TypeError, ValueError):
-            return
-        proto = load_prototype("object", vnum)
-        if proto:
-            obj = spawner.spawn(proto)[0]
-            obj.location = mob.location
-        return
 
-    if subcmd == "transfer":
-        targ_name, _, dest_name = arg.partition(" ")
-        target = mob.search(targ_name.strip())
-        dest = mob.search(dest_name.strip())
-        if target and dest:
-            target.move_to(dest, quiet=True)
-        return
+@_mpcommand("goto")
+def _mp_goto(mob, arg: str) -> None:
+    dest = mob.search(arg)
+    if dest:
+        mob.move_to(dest, quiet=True)
 
-    if subcmd == "force":
-        targ_name, _, cmd = arg.partition(" ")
-        target = mob.search(targ_name.strip())
-        if target and cmd:
-            target.execute_cmd(cmd.strip())
-        return
 
-    if subcmd == "delay":
-        try:
-            ticks, rest = arg.split(" ", 1)
-        except ValueError:
-            return
-        try:
-            ticks = int(ticks)
-        except ValueError:
-            return
-        delay(ticks, mob.execute_cmd, rest)
-        return
+@_mpcommand("purge")
+def _mp_purge(mob, arg: str) -> None:
+    target = mob.search(arg)
+    if target:
+        target.delete()
 
-    if subcmd == "cast":
-        spell = arg
-        target_name = None
-        if " on " in arg:
-            spell, target_name = arg.split(" on ", 1)
-        elif " " in arg:
-            spell, target_name = arg.split(" ", 1)
-        spell = spell.strip().strip("'\"")
-        target = mob.search(target_name.strip()) if target_name else None
-        if hasattr(mob, "cast_spell") and spell:
-            mob.cast_spell(spell.lower(), target=target)
-        return
 
-    if subcmd == "mpdamage":
-        targ_name, _, rest = arg.partition(" ")
-        target = mob.search(targ_name.strip())
-        amount_str, _, dtype = rest.partition(" ")
-        try:
-            amount = int(amount_str)
-        except (TypeError, ValueError):
-            return
-        if target and getattr(target, "traits", None) and callable(getattr(target, "at_damage", None)):
-            target.at_damage(mob, amount, damage_type=dtype or None)
+@_mpcommand("mload")
+def _mp_mload(mob, arg: str) -> None:
+    try:
+        vnum = int(arg.strip())
+    except (TypeError, ValueError):
         return
-
-    if subcmd == "mpapply":
-        targ_name, _, rest = arg.partition(" ")
-        target = mob.search(targ_name.strip())
-        effect, _, dur = rest.partition(" ")
-        try:
-            duration = int(dur) if dur else 1
-        except ValueError:
-            duration = 1
-        if target and effect:
-            state_manager.add_effect(target, effect.strip(), duration)
+    try:
+        spawn_from_vnum(vnum, location=mob.location)
+    except ValueError:
         return
 
-    if subcmd == "mpcall":
-        path = arg.strip()
-        if path:
-            if path in MPCALL_REGISTRY:
-                MPCALL_REGISTRY[path](mob)
-                return
-            module, func = path.rsplit(".", 1)
-            if any(
-                module == allowed or module.startswith(f"{allowed}.")
-                for allowed in ALLOWED_MPCALL_MODULES
-            ):
-                mod = import_module(module)
-                getattr(mod, func)(mob)
-        return
 
-    if subcmd == "kill":
-        target = mob.search(arg)
-        if target and hasattr(mob, "enter_combat"):
-            mob.enter_combat(target)
+@_mpcommand("oload")
+def _mp_oload(mob, arg: str) -> None:
+    try:
+        vnum = int(arg.strip())
+    except (TypeError, ValueError):
+        return
+    proto = load_prototype("object", vnum)
+    if proto:
+        obj = spawner.spawn(proto)[0]
+        obj.location = mob.location
+
+
+@_mpcommand("transfer")
+def _mp_transfer(mob, arg: str) -> None:
+    targ_name, _, dest_name = arg.partition(" ")
+    target = mob.search(targ_name.strip())
+    dest = mob.search(dest_name.strip())
+    if target and dest:
+        target.move_to(dest, quiet=True)
+
+
+@_mpcommand("force")
+def _mp_force(mob, arg: str) -> None:
+    targ_name, _, cmd = arg.partition(" ")
+    target = mob.search(targ_name.strip())
+    if target and cmd:
+        target.execute_cmd(cmd.strip())
+
+
+@_mpcommand("delay")
+def _mp_delay(mob, arg: str) -> None:
+    try:
+        ticks, rest = arg.split(" ", 1)
+    except ValueError:
         return
+    try:
+        ticks = int(ticks)
+    except ValueError:
+        return
+    delay(ticks, mob.execute_cmd, rest)
+
+
+@_mpcommand("cast")
+def _mp_cast(mob, arg: str) -> None:
+    spell = arg
+    target_name = None
+    if " on " in arg:
+        spell, target_name = arg.split(" on ", 1)
+    elif " " in arg:
+        spell, target_name = arg.split(" ", 1)
+    spell = spell.strip().strip("'\"")
+    target = mob.search(target_name.strip()) if target_name else None
+    if hasattr(mob, "cast_spell") and spell:
+        mob.cast_spell(spell.lower(), target=target)
+
+
+@_mpcommand("mpdamage")
+def _mp_damage(mob, arg: str) -> None:
+    targ_name, _, rest = arg.partition(" ")
+    target = mob.search(targ_name.strip())
+    amount_str, _, dtype = rest.partition(" ")
+    try:
+        amount = int(amount_str)
+    except (TypeError, ValueError):
+        return
+    if target and getattr(target, "traits", None) and callable(getattr(target, "at_damage", None)):
+        target.at_damage(mob, amount, damage_type=dtype or None)
+
+
+@_mpcommand("mpapply")
+def _mp_apply(mob, arg: str) -> None:
+    targ_name, _, rest = arg.partition(" ")
+    target = mob.search(targ_name.strip())
+    effect, _, dur = rest.partition(" ")
+    try:
+        duration = int(dur) if dur else 1
+    except ValueError:
+        duration = 1
+    if target and effect:
+        state_manager.add_effect(target, effect.strip(), duration)
+
+
+@_mpcommand("mpcall")
+def _mp_call(mob, arg: str) -> None:
+    path = arg.strip()
+    if path:
+        if path in MPCALL_REGISTRY:
+            MPCALL_REGISTRY[path](mob)
+            return
+        module, func = path.rsplit(".", 1)
+        if any(
+            module == allowed or module.startswith(f"{allowed}.")
+            for allowed in ALLOWED_MPCALL_MODULES
+        ):
+            mod = import_module(module)
+            getattr(mod, func)(mob)
+
 
+@_mpcommand("kill")
+def _mp_kill(mob, arg: str) -> None:
+    target = mob.search(arg)
+    if target and hasattr(mob, "enter_combat"):
+        mob.enter_combat(target)
+
+
+def _mp_default(mob, command: str) -> None:
     # default: run raw command on mob
-    mob.execute_cmd(f"{subcmd} {arg}".strip())
+    mob.execute_cmd(command)
 
 
-def execute_mpcommand(mob, commands: str | list[str]) -> None:
-    """Execute one or multiple MP commands with simple conditionals."""
+def _parse(command: str) -> tuple[Callable, str]:
+    """Return the handler of ``command`` and the argument to call it with."""
 
-    if not commands:
-        return
+    parts = command.strip().split(None, 1)
+    subcmd = parts[0].lower()
+    arg = parts[1] if len(parts) > 1 else ""
+    handler = MPCOMMANDS.get(subcmd)
+    if handler is None:
+        return _mp_default, f"{subcmd} {arg}".strip()
+    return handler, arg
 
-    if isinstance(commands, str):
-        parts: list[str] = []
-        for line in commands.splitlines():
-            parts.extend(x.strip() for x in line.split(";") if x.strip())
-        commands = parts
 
-    idx = 0
-    stack: list[dict] = []
-    while idx < len(commands):
-        cmd = commands[idx].strip()
-        lcmd = cmd.lower()
+def _run_single(mob, command: str) -> None:
+    """Execute a single mpcommand without condition handling."""
 
-        if lcmd.startswith("if "):
-            cond = bool(eval_safe(cmd[3:].strip(), {"mob": mob}))
-            stack.append({"cond": cond, "execute": cond})
-            idx += 1
-            continue
+    handler, arg = _parse(command)
+    handler(mob, arg)
 
-        if lcmd == "else":
-            if stack:
-                frame = stack[-1]
-                frame["execute"] = not frame["cond"]
-            idx += 1
-            continue
 
-        if lcmd == "endif":
-            if stack:
-                stack.pop()
-            idx += 1
-            continue
+# instruction opcodes
+_RUN = 0  # (_RUN, handler, arg): call handler(mob, arg)
+_IF = 1  # (_IF, condition, target): jump to target unless condition holds
+_JUMP = 2  # (_JUMP, target, None)
+
+
+def _split(program: str) -> list[str]:
+    parts: list[str] = []
+    for line in program.splitlines():
+        parts.extend(x.strip() for x in line.split(";") if x.strip())
+    return parts
+
 
-        if lcmd == "break":
+@lru_cache(maxsize=1024)
+def compile_mobprog(program: str | tuple[str, ...]) -> tuple[tuple, ...]:
+    """Compile a mob program into a tuple of instructions.
+
+    ``program`` is either the program text, split on newlines and ``;``, or
+    a tuple holding one command per entry. ``if``/``else``/``endif`` become
+    conditional and unconditional jumps, ``break`` jumps past the innermost
+    ``endif`` and ``return`` jumps past the end. Conditions are parsed once
+    and each command is bound to its handler. Compiled programs are cached
+    by their text.
+    """
+
+    commands = _split(program) if isinstance(program, str) else program
+    code: list[list] = []
+    # open ifs: index of their _IF instruction and of the jumps to their endif
+    stack: list[tuple[int, list[int]]] = []
+    returns: list[int] = []
+
+    for command in commands:
+        cmd = command.strip()
+        lcmd = cmd.lower()
+        if not cmd:
+            continue
+        if lcmd.startswith("if "):
+            stack.append((len(code), []))
+            code.append([_IF, compile_expr(cmd[3:].strip()), None])
+        elif lcmd == "else":
+            if stack:
+                branch, exits = stack[-1]
+                if code[branch][2] is None:
+                    exits.append(len(code))
+                    code.append([_JUMP, None, None])
+                    code[branch][2] = len(code)
+        elif lcmd == "endif":
+            if stack:
+                _close(code, *stack.pop())
+        elif lcmd == "break":
             if stack:
-                depth = len(stack)
-                target_depth = depth - 1
-                stack.pop()
-                idx += 1
-                while idx < len(commands):
-                    ncmd = commands[idx].strip().lower()
-                    if ncmd.startswith("if "):
-                        depth += 1
-                    elif ncmd == "endif":
-                        depth -= 1
-                        if depth == target_depth:
-                            idx += 1
-                            break
-                    idx += 1
-                continue
-            break
-
-        if lcmd == "return":
-            break
-
-        if all(frame.get("execute", True) for frame in stack):
-            _run_single(mob, cmd)
-
-        idx += 1
+                stack[-1][1].append(len(code))
+            else:
+                returns.append(len(code))
+            code.append([_JUMP, None, None])
+        elif lcmd == "return":
+            returns.append(len(code))
+            code.append([_JUMP, None, None])
+        else:
+            code.append([_RUN, *_parse(cmd)])
+
+    while stack:
+        _close(code, *stack.pop())
+    for idx in returns:
+        code[idx][1] = len(code)
+    return tuple(tuple(instr) for instr in code)
+
+
+def _close(code: list[list], branch: int, exits: list[int]) -> None:
+    end = len(code)
+    if code[branch][2] is None:
+        code[branch][2] = end
+    for idx in exits:
+        code[idx][1] = end
+
+
+def execute_mpcommand(mob, commands: str | list[str]) -> None:
+    """Execute one or multiple MP commands with simple conditionals."""
+
+    if not commands:
+        return
+
+    code = compile_mobprog(commands if isinstance(commands, str) else tuple(commands))
+    names = {"mob": mob}
+    pc = 0
+    end = len(code)
+    while pc < end:
+        op, first, second = code[pc]
+        if op == _RUN:
+            first(mob, second)
+            pc += 1
+        elif op == _IF:
+            pc = pc + 1 if first(names) else second
+        else:
+            pc = first
@@ -0,0 +1,277 @@
+# In-memory index of the AI NPCs that currently need processing
+
+from __future__ import annotations
+
+from typing import Dict, List, Set
+
+from django.db.models.signals import m2m_changed
+from evennia.objects.models import ObjectDB
+
+from combat.events import combat_ended, combat_started, round_processed
+from utils.object_signals import on_object_deleted
+
+#: Tag marking NPCs handled by :class:`scripts.global_npc_ai.GlobalNPCAI`.
+AI_TAG = "npc_ai"
+
+# AI NPCs by id and the id of the room each one was last seen in
+_NPCS: Dict[int, object] = {}
+_NPC_ROOM: Dict[int, int] = {}
+_ROOM_NPCS: Dict[int, Set[int]] = {}
+# rooms holding at least one player, and the room of each player
+_PLAYERS: Dict[int, object] = {}
+_PLAYER_ROOMS: Dict[int, Set[int]] = {}
+_PLAYER_ROOM: Dict[int, int] = {}
+# AI NPCs taking part in each running combat, keyed by combat id
+_COMBATS: Dict[int, Set[int]] = {}
+# objects whose tags changed; re-checked at the next tick since the tag
+# handler cache is only updated after the m2m signal fires
+_DIRTY: Set[int] = set()
+# AI NPC ids bucketed by ``id % interval`` for the idle sweep
+_BUCKETS: Dict[int, Set[int]] = {}
+_STATE = {"interval": 0}
+
+
+def _is_player(obj) -> bool:
+    return bool(getattr(obj, "account", None))
+
+
+def _is_ai(obj) -> bool:
+    from typeclasses.npcs import BaseNPC
+
+    return isinstance(obj, BaseNPC) and obj.tags.has(AI_TAG)
+
+
+def _bucket(npc_id: int) -> Set[int]:
+    interval = _STATE["interval"]
+    return _BUCKETS.setdefault(npc_id % interval if interval else 0, set())
+
+
+def _add_npc(npc, room) -> None:
+    _drop_npc(npc.id)
+    _NPCS[npc.id] = npc
+    _NPC_ROOM[npc.id] = room.id
+    _ROOM_NPCS.setdefault(room.id, set()).add(npc.id)
+    _bucket(npc.id).add(npc.id)
+
+
+def _drop_npc(npc_id: int) -> None:
+    if _NPCS.pop(npc_id, None) is None:
+        return
+    room_id = _NPC_ROOM.pop(npc_id, None)
+    npcs = _ROOM_NPCS.get(room_id)
+    if npcs is not None:
+        npcs.discard(npc_id)
+        if not npcs:
+            del _ROOM_NPCS[room_id]
+    _bucket(npc_id).discard(npc_id)
+
+
+def _add_player(player, room) -> None:
+    _drop_player(player.id)
+    _PLAYERS[player.id] = player
+    _PLAYER_ROOM[player.id] = room.id
+    _PLAYER_ROOMS.setdefault(room.id, set()).add(player.id)
+
+
+def _drop_player(player_id: int) -> None:
+    _PLAYERS.pop(player_id, None)
+    room_id = _PLAYER_ROOM.pop(player_id, None)
+    players = _PLAYER_ROOMS.get(room_id)
+    if players is not None:
+        players.discard(player_id)
+        if not players:
+            del _PLAYER_ROOMS[room_id]
+
+
+def object_arrived(room, obj, player: bool = False) -> None:
+    """Record ``obj`` entering ``room``.
+
+    ``player`` forces ``obj`` to count as a player, for use before the
+    puppeting account has been assigned.
+    """
+
+    if room is None or not isinstance(getattr(obj, "id", None), int):
+        return
+    if player or _is_player(obj):
+        _add_player(obj, room)
+    elif _is_ai(obj):
+        _add_npc(obj, room)
+
+
+def object_departed(room, obj) -> None:
+    """Record ``obj`` leaving ``room``."""
+
+    obj_id = getattr(obj, "id", None)
+    if _PLAYER_ROOM.get(obj_id) == getattr(room, "id", None):
+        _drop_player(obj_id)
+    if _NPC_ROOM.get(obj_id) == getattr(room, "id", None):
+        _drop_npc(obj_id)
+
+
+def forget(obj_id: int) -> None:
+    """Remove every trace of the object with ``obj_id``."""
+
+    _drop_player(obj_id)
+    _drop_npc(obj_id)
+    _DIRTY.discard(obj_id)
+    for members in _COMBATS.values():
+        members.discard(obj_id)
+
+
+def load(interval: int = 0) -> None:
+    """Rebuild the index from the database.
+
+    ``interval`` is the number of ticks an idle NPC waits between updates.
+    """
+
+    from typeclasses.npcs import BaseNPC
+
+    reset()
+    _STATE["interval"] = max(0, int(interval or 0))
+    for npc in BaseNPC.objects.filter_family(
+        db_tags__db_key=AI_TAG, db_location__isnull=False
+    ).distinct():
+        _add_npc(npc, npc.location)
+    for player in ObjectDB.objects.filter(
+        db_account__isnull=False, db_location__isnull=False
+    ):
+        _add_player(player, player.location)
+
+
+def _refresh_dirty() -> None:
+    while _DIRTY:
+        obj_id = _DIRTY.pop()
+        if obj_id in _PLAYER_ROOM:
+            continue
+        try:
+            obj = ObjectDB.objects.get(id=obj_id)
+        except ObjectDB.DoesNotExist:
+            forget(obj_id)
+            continue
+        if obj.location and _is_ai(obj):
+            _add_npc(obj, obj.location)
+        else:
+            _drop_npc(obj_id)
+
+
+def _valid(npc_id: int):
+    npc = _NPCS.get(npc_id)
+    if npc is None or npc.pk is None:
+        forget(npc_id)
+        return None
+    location = npc.location
+    if location is None or not npc.tags.has(AI_TAG):
+        _drop_npc(npc_id)
+        return None
+    if location.id != _NPC_ROOM.get(npc_id):
+        _add_npc(npc, location)
+    return npc
+
+
+def _sync_players() -> None:
+    """Catch players moved without the room hooks, e.g. by ``obj.location =``."""
+
+    for player_id, player in list(_PLAYERS.items()):
+        location = player.location if player.pk is not None else None
+        if location is None:
+            _drop_player(player_id)
+        elif location.id != _PLAYER_ROOM.get(player_id):
+            _add_player(player, location)
+
+
+def active_ids() -> Set[int]:
+    """Return ids of AI NPCs sharing a room with a player or in combat."""
+
+    _refresh_dirty()
+    _sync_players()
+    ids: Set[int] = set()
+    for room_id in _PLAYER_ROOMS:
+        ids.update(_ROOM_NPCS.get(room_id, ()))
+    for members in _COMBATS.values():
+        ids.update(npc_id for npc_id in members if npc_id in _NPCS)
+    return ids
+
+
+def due(tick: int) -> List[object]:
+    """Return the AI NPCs to process on global tick ``tick``.
+
+    Active NPCs are returned every tick. Idle ones are split into
+    ``interval`` buckets and one bucket is swept per tick, so each idle
+    NPC runs once every ``interval`` ticks. With an interval of 0 idle
+    NPCs are skipped entirely.
+    """
+
+    ids = active_ids()
+    interval = _STATE["interval"]
+    if interval:
+        ids.update(_BUCKETS.get(tick % interval, ()))
+    npcs = []
+    for npc_id in sorted(ids):
+        npc = _valid(npc_id)
+        if npc is not None:
+            npcs.append(npc)
+    return npcs
+
+
+def counts() -> Dict[str, int]:
+    """Return the size of the tracked sets."""
+
+    return {
+        "npcs": len(_NPCS),
+        "occupied_rooms": len(_PLAYER_ROOMS),
+        "in_combat": len(set().union(*_COMBATS.values())) if _COMBATS else 0,
+    }
+
+
+def reset() -> None:
+    """Forget everything tracked in memory."""
+
+    _NPCS.clear()
+    _NPC_ROOM.clear()
+    _ROOM_NPCS.clear()
+    _PLAYERS.clear()
+    _PLAYER_ROOMS.clear()
+    _PLAYER_ROOM.clear()
+    _COMBATS.clear()
+    _DIRTY.clear()
+    _BUCKETS.clear()
+
+
+def _combat_members(instance) -> Set[int]:
+    fighters = set(getattr(instance, "combatants", ()) or ())
+    engine = getattr(instance, "engine", None)
+    for participant in getattr(engine, "participants", ()) or ():
+        fighters.add(participant.actor)
+    members = set()
+    for fighter in fighters:
+        if isinstance(getattr(fighter, "id", None), int) and _is_ai(fighter):
+            members.add(fighter.id)
+    return members
+
+
+def _on_combat(sender, instance=None, **kwargs):
+    if instance is not None:
+        _COMBATS[instance.combat_id] = _combat_members(instance)
+
+
+def _on_combat_ended(sender, instance=None, **kwargs):
+    if instance is not None:
+        _COMBATS.pop(instance.combat_id, None)
+
+
+def _on_tags_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        _DIRTY.add(instance.id)
+    else:
+        _DIRTY.update(pk_set or ())
+
+
+combat_started.connect(_on_combat, dispatch_uid="npc_active_set_start")
+round_processed.connect(_on_combat, dispatch_uid="npc_active_set_round")
+combat_ended.connect(_on_combat_ended, dispatch_uid="npc_active_set_end")
+m2m_changed.connect(
+    _on_tags_changed, sender=ObjectDB.db_tags.through, dispatch_uid="npc_active_set_tags"
+)
+on_object_deleted(forget)
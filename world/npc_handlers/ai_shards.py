@@ -0,0 +1,146 @@
+"""Spread NPC AI work across sub-ticks under a per-sub-tick time budget."""
+
+from __future__ import annotations
+
+from collections import deque
+import time
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from django.conf import settings
+from evennia.utils import delay
+from evennia.utils.logger import log_trace
+
+
+class AIShardRunner:
+    """Run one global AI tick as ``shards`` sub-ticks.
+
+    The NPCs due on a tick are split round-robin into ``shards`` groups. The
+    first group runs immediately and the rest are spaced evenly over the
+    tick interval so the reactor can serve player commands in between. Each
+    sub-tick stops once ``budget_ms`` milliseconds have been spent; NPCs it
+    did not reach stay in a carry-over queue and are handled first by the
+    next sub-tick. An NPC that is still queued is not added twice.
+    """
+
+    def __init__(
+        self,
+        process: Callable[[object], None],
+        shards: Optional[int] = None,
+        budget_ms: Optional[float] = None,
+    ) -> None:
+        if shards is None:
+            shards = getattr(settings, "NPC_AI_SHARDS", 4)
+        if budget_ms is None:
+            budget_ms = getattr(settings, "NPC_AI_TICK_BUDGET_MS", 20)
+        self.process = process
+        self.shards = max(1, int(shards))
+        self.budget = max(0.0, float(budget_ms)) / 1000.0
+        self.queue: Deque[object] = deque()
+        self._queued: Set[int] = set()
+        # delayed sub-ticks of the current tick by shard index
+        self._pending: Dict[int, Tuple[object, List[object]]] = {}
+        self.reset_metrics()
+
+    # ------------------------------------------------------------------
+    # scheduling
+    # ------------------------------------------------------------------
+
+    def split(self, npcs: Iterable[object]) -> List[List[object]]:
+        """Return ``npcs`` dealt round-robin into one list per shard."""
+        npcs = list(npcs)
+        return [npcs[shard :: self.shards] for shard in range(self.shards)]
+
+    def run_tick(self, npcs: Iterable[object], interval: float = 1.0) -> None:
+        """Process ``npcs`` over the next ``interval`` seconds."""
+        # shards left over from a tick that overran join the carry-over queue
+        self._cancel_pending()
+        groups = self.split(npc for npc in npcs if npc.id not in self._queued)
+        self.run_shard(groups[0])
+        step = max(interval, 0) / self.shards
+        for index, group in enumerate(groups[1:], start=1):
+            if group or self.queue:
+                handle = delay(step * index, self._next_shard, index)
+                self._pending[index] = (handle, group)
+
+    def _cancel_pending(self) -> None:
+        """Cancel the delayed sub-ticks and queue the NPCs they held."""
+        for handle, group in self._pending.values():
+            try:
+                handle.cancel()
+            except Exception:  # pragma: no cover - safety
+                pass
+            self._enqueue(group)
+        self._pending.clear()
+
+    def _next_shard(self, index: int) -> None:
+        _handle, group = self._pending.pop(index, (None, ()))
+        self.run_shard(group)
+
+    def _enqueue(self, npcs: Iterable[object]) -> None:
+        for npc in npcs:
+            if npc.id not in self._queued:
+                self._queued.add(npc.id)
+                self.queue.append(npc)
+
+    def run_shard(self, npcs: Iterable[object] = ()) -> int:
+        """Queue ``npcs`` and drain the queue within the budget.
+
+        Returns the number of NPCs processed. At least one queued NPC is
+        always processed so a slow NPC cannot stall the queue forever.
+        """
+        self._enqueue(npcs)
+
+        start = time.perf_counter()
+        processed = 0
+        while self.queue:
+            if processed and self.budget and time.perf_counter() - start >= self.budget:
+                break
+            npc = self.queue.popleft()
+            self._queued.discard(npc.id)
+            if npc.pk is None:
+                continue
+            try:
+                self.process(npc)
+            except Exception as err:  # pragma: no cover - log errors
+                log_trace(f"NPC AI error on {npc}: {err}")
+            processed += 1
+
+        elapsed = time.perf_counter() - start
+        self._record(processed, elapsed)
+        return processed
+
+    # ------------------------------------------------------------------
+    # metrics
+    # ------------------------------------------------------------------
+
+    def reset_metrics(self) -> None:
+        """Reset the sub-tick counters."""
+        self.metrics = {
+            "subticks": 0,
+            "processed": 0,
+            "over_budget": 0,
+            "carried": 0,
+            "last_ms": 0.0,
+            "max_ms": 0.0,
+            "total_ms": 0.0,
+        }
+
+    def _record(self, processed: int, elapsed: float) -> None:
+        ms = elapsed * 1000.0
+        self.metrics["subticks"] += 1
+        self.metrics["processed"] += processed
+        self.metrics["last_ms"] = ms
+        self.metrics["total_ms"] += ms
+        if ms > self.metrics["max_ms"]:
+            self.metrics["max_ms"] = ms
+        if self.queue:
+            self.metrics["over_budget"] += 1
+            self.metrics["carried"] += len(self.queue)
+
+    def get_metrics(self) -> Dict:
+        """Return sub-tick timings in milliseconds along with queue size."""
+        data = dict(self.metrics)
+        subticks = data["subticks"]
+        data["avg_ms"] = data["total_ms"] / subticks if subticks else 0.0
+        data["queued"] = len(self.queue)
+        return data
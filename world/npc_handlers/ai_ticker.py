@@ -0,0 +1,341 @@
+# Shared ticker buckets running per-NPC AI behaviors
+
+from __future__ import annotations
+
+import copy
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+from evennia.objects.models import ObjectDB
+from evennia.server.models import ServerConfig
+from evennia.utils import delay, logger
+from evennia.utils.dbserialize import deserialize
+from evennia.utils.utils import class_from_module
+
+from utils import npc_pool
+from utils.object_signals import on_object_deleted
+
+#: ServerConfig key holding the saved subscriptions.
+CONFIG_KEY = "ai_subscriptions"
+#: Sub-ticks each interval is split into. Subscribers are spread over them
+#: by object id so a bucket never runs all of its NPCs at once.
+PHASES = 10
+#: Seconds between writes of changed subscriptions.
+FLUSH_SECONDS = 60
+
+
+class AIBehavior:
+    """NPC behavior run from a shared ticker bucket instead of a Script.
+
+    Subclasses set ``key`` and ``interval`` and implement :meth:`at_repeat`.
+    ``db`` holds the per-NPC state in memory, starting from ``defaults``;
+    it is saved with the subscriptions when the ticker flushes.
+    """
+
+    key = "ai_behavior"
+    desc = ""
+    interval = 1
+    defaults: Dict[str, Any] = {}
+
+    def __init__(self, obj, state: Optional[Dict[str, Any]] = None, interval=None):
+        self.obj = obj
+        if interval:
+            self.interval = interval
+        values = copy.deepcopy(self.defaults)
+        values.update(state or {})
+        self.db = SimpleNamespace(**values)
+
+    @classmethod
+    def path(cls) -> str:
+        """Return the import path the behavior is saved under."""
+        return f"{cls.__module__}.{cls.__qualname__}"
+
+    def get_state(self) -> Dict[str, Any]:
+        """Return a copy of the per-NPC state."""
+        return copy.deepcopy(vars(self.db))
+
+    def at_repeat(self):
+        """Run one step of the behavior."""
+
+
+class _Bucket:
+    """Behaviors sharing one interval, spread over ``PHASES`` sub-ticks."""
+
+    __slots__ = ("interval", "slots", "tick", "origin", "handle")
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.slots: List[Dict[Tuple[int, str], AIBehavior]] = [{} for _ in range(PHASES)]
+        self.tick = 0
+        self.origin = 0.0
+        self.handle = None
+
+    def __len__(self):
+        return sum(len(slot) for slot in self.slots)
+
+
+# object id -> behavior key -> behavior
+_SUBS: Dict[int, Dict[str, AIBehavior]] = {}
+_BUCKETS: Dict[float, _Bucket] = {}
+_STATE = {"dirty": False, "flushed": 0.0, "runs": 0, "calls": 0, "skipped": 0, "errors": 0}
+
+
+def _behavior_class(behavior):
+    """Return the behavior class for ``behavior`` or ``None``."""
+
+    if isinstance(behavior, str):
+        try:
+            behavior = class_from_module(behavior)
+        except Exception:
+            return None
+    if isinstance(behavior, type) and issubclass(behavior, AIBehavior):
+        return behavior
+    return None
+
+
+def _add(behavior: AIBehavior) -> None:
+    obj_id = behavior.obj.id
+    _remove(obj_id, behavior.key)
+    _SUBS.setdefault(obj_id, {})[behavior.key] = behavior
+    bucket = _BUCKETS.get(behavior.interval)
+    if bucket is None:
+        bucket = _BUCKETS[behavior.interval] = _Bucket(behavior.interval)
+    bucket.slots[obj_id % PHASES][(obj_id, behavior.key)] = behavior
+    _arm(bucket)
+
+
+def _remove(obj_id: int, key: str) -> Optional[AIBehavior]:
+    behaviors = _SUBS.get(obj_id)
+    if not behaviors or key not in behaviors:
+        return None
+    behavior = behaviors.pop(key)
+    if not behaviors:
+        del _SUBS[obj_id]
+    bucket = _BUCKETS.get(behavior.interval)
+    if bucket is not None:
+        bucket.slots[obj_id % PHASES].pop((obj_id, key), None)
+        if not len(bucket):
+            _disarm(bucket)
+            del _BUCKETS[behavior.interval]
+    return behavior
+
+
+def subscribe(obj, behavior, state=None, interval=None) -> Optional[AIBehavior]:
+    """Run ``behavior`` for ``obj`` from the shared bucket of its interval.
+
+    ``behavior`` is an :class:`AIBehavior` subclass or its import path.
+    ``state`` seeds the behavior's ``db`` and ``interval`` overrides the
+    class default. An existing subscription with the same key is replaced.
+    Returns the new behavior, or ``None`` if it could not be created.
+    """
+
+    cls = _behavior_class(behavior)
+    if cls is None or not isinstance(getattr(obj, "id", None), int):
+        return None
+    instance = cls(obj, state=state, interval=interval)
+    _add(instance)
+    _STATE["dirty"] = True
+    return instance
+
+
+def unsubscribe(obj_id: int, key: Optional[str] = None) -> int:
+    """Drop the behavior ``key`` of the object, or all of them.
+
+    Returns the number of behaviors removed.
+    """
+
+    keys = [key] if key else list(_SUBS.get(obj_id, ()))
+    removed = sum(_remove(obj_id, k) is not None for k in keys)
+    if removed:
+        _STATE["dirty"] = True
+    return removed
+
+
+def get_behavior(obj_id: int, key: str) -> Optional[AIBehavior]:
+    """Return the subscribed behavior ``key`` of the object, if any."""
+
+    return _SUBS.get(obj_id, {}).get(key)
+
+
+def behaviors(obj_id: int) -> List[AIBehavior]:
+    """Return every behavior subscribed for the object."""
+
+    return list(_SUBS.get(obj_id, {}).values())
+
+
+def _arm(bucket: _Bucket) -> None:
+    if bucket.handle is not None:
+        return
+    now = time.monotonic()
+    step = bucket.interval / PHASES
+    if not bucket.origin:
+        bucket.origin = now - bucket.tick * step
+    wait = bucket.origin + (bucket.tick + 1) * step - now
+    bucket.handle = delay(max(wait, 0), _run, bucket.interval)
+
+
+def _disarm(bucket: _Bucket) -> None:
+    if bucket.handle is not None:
+        try:
+            bucket.handle.cancel()
+        except Exception:  # pragma: no cover - safety
+            pass
+    bucket.handle = None
+
+
+def _tick(bucket: _Bucket) -> int:
+    """Run the behaviors of the bucket's next phase and return how many ran."""
+
+    phase = bucket.tick % PHASES
+    bucket.tick += 1
+    ran = 0
+    for behavior in list(bucket.slots[phase].values()):
+        obj = behavior.obj
+        # pooled NPCs keep their place but do nothing
+        if npc_pool.is_dormant(obj):
+            _STATE["skipped"] += 1
+            continue
+        try:
+            behavior.at_repeat()
+        except Exception as err:  # pragma: no cover - log errors
+            _STATE["errors"] += 1
+            logger.log_err(f"AI behavior {behavior.key} error on {obj}: {err}")
+        ran += 1
+    _STATE["calls"] += ran
+    return ran
+
+
+def _run(interval) -> None:
+    """Timer callback running the phases of ``interval`` due since last time."""
+
+    bucket = _BUCKETS.get(interval)
+    if bucket is None:
+        return
+    bucket.handle = None
+    elapsed = int((time.monotonic() - bucket.origin) * PHASES / bucket.interval)
+    # after a stall run at most one full round instead of every missed phase
+    bucket.tick = max(bucket.tick, elapsed - PHASES)
+    while bucket.tick < elapsed:
+        _tick(bucket)
+    _STATE["runs"] += 1
+    if _STATE["dirty"] and time.monotonic() - _STATE["flushed"] >= FLUSH_SECONDS:
+        flush()
+    if _BUCKETS.get(interval) is bucket:
+        _arm(bucket)
+
+
+def flush() -> int:
+    """Save the subscriptions and return how many were written.
+
+    Each one is stored as ``(object id, behavior path, interval, state)``,
+    with the interval ``None`` when it is the class default.
+    """
+
+    table = []
+    for obj_id, subs in _SUBS.items():
+        for behavior in subs.values():
+            cls = type(behavior)
+            interval = behavior.interval if behavior.interval != cls.interval else None
+            table.append((obj_id, cls.path(), interval, behavior.get_state()))
+    ServerConfig.objects.conf(CONFIG_KEY, value=table)
+    _STATE["dirty"] = False
+    _STATE["flushed"] = time.monotonic()
+    return len(table)
+
+
+def load() -> int:
+    """Replace the in-memory subscriptions with the saved ones.
+
+    Returns the number of subscriptions restored.
+    """
+
+    reset()
+    table = ServerConfig.objects.conf(CONFIG_KEY, default=list) or []
+    objs = ObjectDB.objects.in_bulk({row[0] for row in table})
+    restored = 0
+    for obj_id, path, interval, state in table:
+        obj = objs.get(obj_id)
+        cls = _behavior_class(path)
+        if cls is None:
+            logger.log_err(f"Unknown AI behavior {path} on #{obj_id}")
+        if obj is None or cls is None:
+            continue
+        _add(cls(obj, state=state, interval=interval))
+        restored += 1
+    # drop the rows of deleted objects at the next flush
+    _STATE["dirty"] = restored != len(table)
+    _STATE["flushed"] = time.monotonic()
+    return restored
+
+
+def migrate_scripts() -> int:
+    """Turn per-object Scripts of behavior classes into subscriptions.
+
+    Script rows whose typeclass path names an :class:`AIBehavior` are
+    deleted and their object subscribed to that behavior with the row's
+    interval and attributes. Returns the number of scripts converted.
+    """
+
+    from django.conf import settings
+    from evennia.scripts.models import ScriptDB
+
+    rows = [
+        row
+        for row in ScriptDB.objects.filter(db_obj__isnull=False).values_list(
+            "id", "db_typeclass_path", "db_interval"
+        )
+        if _behavior_class(row[1])
+    ]
+    if not rows:
+        return 0
+    # a behavior class is not a valid typeclass; point the rows at the base
+    # script class so they can be loaded and deleted the normal way
+    ids = [row[0] for row in rows]
+    ScriptDB.objects.filter(id__in=ids).update(
+        db_typeclass_path=settings.BASE_SCRIPT_TYPECLASS
+    )
+    for script_id in ids:
+        ScriptDB._flush_cached_by_key(script_id)
+    scripts = ScriptDB.objects.in_bulk(ids)
+    converted = 0
+    for script_id, path, interval in rows:
+        script = scripts[script_id]
+        state = {
+            attr.key: deserialize(attr.value)
+            for attr in script.attributes.all()
+            if not attr.key.startswith("_")
+        }
+        if subscribe(script.obj, path, state=state, interval=interval):
+            converted += 1
+        script.delete()
+    flush()
+    return converted
+
+
+def get_metrics() -> Dict[str, Any]:
+    """Return subscriber counts per interval and how many behaviors ran."""
+
+    return {
+        "subscriptions": sum(len(subs) for subs in _SUBS.values()),
+        "objects": len(_SUBS),
+        "buckets": {interval: len(bucket) for interval, bucket in _BUCKETS.items()},
+        "timers": sum(bucket.handle is not None for bucket in _BUCKETS.values()),
+        "runs": _STATE["runs"],
+        "calls": _STATE["calls"],
+        "skipped": _STATE["skipped"],
+        "errors": _STATE["errors"],
+    }
+
+
+def reset() -> None:
+    """Forget every subscription and stop the bucket timers."""
+
+    for bucket in _BUCKETS.values():
+        _disarm(bucket)
+    _BUCKETS.clear()
+    _SUBS.clear()
+    _STATE.update(dirty=False, flushed=0.0, runs=0, calls=0, skipped=0, errors=0)
+
+
+on_object_deleted(unsubscribe)
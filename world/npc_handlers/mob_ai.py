@@ -5,12 +5,14 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Callable, Iterable
 from random import choice, randint
+import time
 
 from evennia import DefaultObject
 from evennia.utils import logger
 from typeclasses.npcs import BaseNPC
 from typeclasses.characters import Character
 from combat.ai_combat import queue_npc_action
+from utils import occupancy
 
 
 @dataclass
@@ -81,7 +83,7 @@ def _scavenge(npc: BaseNPC) -> None:
     """Pick up the most valuable item in the room."""
     if not npc.location or randint(0, 10):
         return
-    items = [obj for obj in npc.location.contents if obj.access(npc, "get")]
+    items = [obj for obj in occupancy.items(npc.location) if obj.access(npc, "get")]
     if not items:
         return
     best = max(items, key=lambda o: getattr(o.db, "value", 0))
@@ -102,7 +104,7 @@ def _roam(npc: BaseNPC) -> None:
     if not npc.location:
         return
 
-    exits = npc.location.contents_get(content_type="exit")
+    exits = occupancy.exits(npc.location)
     if not exits:
         return
 
@@ -132,7 +134,7 @@ def _aggressive(npc: BaseNPC) -> bool:
     flags = set(npc.db.actflags or [])
     if "aggressive" not in flags or not npc.location:
         return False
-    for obj in npc.location.contents:
+    for obj in occupancy.players(npc.location):
         if obj.has_account and obj.access(npc, "attack"):
             npc.enter_combat(obj)
             return True
@@ -144,7 +146,7 @@ def _memory_attack(npc: BaseNPC) -> bool:
     mem = npc.db.memory or []
     if not mem or not npc.location:
         return False
-    for obj in npc.location.contents:
+    for obj in occupancy.players(npc.location):
         if obj.has_account and obj.account.id in mem:
             npc.enter_combat(obj)
             return True
@@ -169,8 +171,8 @@ def _assist_allies(character: Character) -> None:
     """Join combat to assist allies if auto-assist is enabled."""
     if not character.db.auto_assist or not character.location:
         return
-    for obj in character.location.contents:
-        if obj is character or not isinstance(obj, BaseNPC):
+    for obj in occupancy.npcs(character.location, exclude=character):
+        if not isinstance(obj, BaseNPC):
             continue
         target = getattr(obj.db, "combat_target", None)
         if obj.in_combat and target and not character.in_combat:
@@ -205,8 +207,8 @@ def _call_for_help(npc: BaseNPC) -> None:
     target = npc.db.combat_target
     if not target:
         return
-    for obj in npc.location.contents:
-        if obj is npc or not isinstance(obj, BaseNPC):
+    for obj in occupancy.npcs(npc.location, exclude=npc):
+        if not isinstance(obj, BaseNPC):
             continue
         if obj.in_combat:
             continue
@@ -235,29 +237,72 @@ def _check_wimpy(npc: BaseNPC) -> bool:
     return False
 
 
+# ------------------------------------------------------------
+# Behavior timing counters
+# ------------------------------------------------------------
+
+# behavior name -> [calls, total seconds, slowest call in seconds]
+_TIMINGS: dict[str, list] = {}
+
+
+def _timed(name: str, func: Callable, *args):
+    """Call ``func`` and add its run time to the counters for ``name``."""
+    start = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        elapsed = time.perf_counter() - start
+        record = _TIMINGS.get(name)
+        if record is None:
+            _TIMINGS[name] = [1, elapsed, elapsed]
+        else:
+            record[0] += 1
+            record[1] += elapsed
+            if elapsed > record[2]:
+                record[2] = elapsed
+
+
+def get_timings() -> dict[str, dict]:
+    """Return call counts and run times in milliseconds per behavior."""
+    return {
+        name: {
+            "calls": calls,
+            "total_ms": total * 1000.0,
+            "avg_ms": total * 1000.0 / calls if calls else 0.0,
+            "max_ms": slowest * 1000.0,
+        }
+        for name, (calls, total, slowest) in _TIMINGS.items()
+    }
+
+
+def reset_timings() -> None:
+    """Clear the behavior timing counters."""
+    _TIMINGS.clear()
+
+
 # ------------------------------------------------------------
 # Main AI entry
 # ------------------------------------------------------------
 
 def process_mob_ai(npc: BaseNPC) -> None:
     """Process one AI step for ``npc``."""
-    if _run_specials(npc):
+    if _timed("specials", _run_specials, npc):
         return
 
-    _assist_allies(npc)
-    _call_for_help(npc)
-    if _check_wimpy(npc):
+    _timed("assist", _assist_allies, npc)
+    _timed("call_for_help", _call_for_help, npc)
+    if _timed("wimpy", _check_wimpy, npc):
         return
 
     if npc.in_combat and npc.db.combat_target:
-        queue_npc_action(None, npc, npc.db.combat_target)
+        _timed("combat", queue_npc_action, None, npc, npc.db.combat_target)
         return
 
-    _scavenge(npc)
-    _roam(npc)
+    _timed("scavenge", _scavenge, npc)
+    _timed("roam", _roam, npc)
 
-    if _aggressive(npc):
+    if _timed("aggressive", _aggressive, npc):
         return
 
-    _memory_attack(npc)
-    _charm_rebellion(npc)
+    _timed("memory", _memory_attack, npc)
+    _timed("charm", _charm_rebellion, npc)
@@ -576,11 +576,33 @@ EXAMPLE_LOOT_TABLE = [{"proto": "RAW_MEAT", "chance": 50}]
 # NPC prototype registry utilities
 # ------------------------------------------------------------
 
-from typing import Dict, Optional
+from typing import Dict, Optional, Set
 import json
+import pickle
+import time
 from pathlib import Path
 from django.conf import settings
 
+#: Seconds the cached NPC registry is trusted before the file's modification
+#: time is checked again.
+NPC_REGISTRY_TTL = float(getattr(settings, "PROTOTYPE_CACHE_TTL", 2.0))
+
+#: ``get_npc_prototypes`` filters answered from the registry indexes.
+NPC_FILTERS = ("class", "race", "role", "tag", "zone")
+
+# Parsed and normalized registry of the file at ``path``. Prototypes are
+# kept pickled so every caller gets its own copy; ``index`` maps each filter
+# to ``value -> keys``.
+_NPC_CACHE = {
+    "path": None,
+    "sig": None,
+    "checked": 0.0,
+    "protos": {},
+    "order": {},
+    "index": {},
+    "loads": 0,
+}
+
 
 def _npc_proto_file() -> Path:
     """Return the path to the NPC prototype JSON file."""
@@ -626,8 +648,109 @@ def _normalize_proto(proto: dict) -> None:
 def _save_npc_registry(registry: Dict[str, dict]):
     path = _npc_proto_file()
     path.parent.mkdir(parents=True, exist_ok=True)
+    text = json.dumps(registry, indent=4)
     with path.open("w") as f:
-        json.dump(registry, f, indent=4)
+        f.write(text)
+    # cache what a later read of the file would produce
+    _cache_npc_registry(path, _file_signature(path), json.loads(text))
+
+
+def _file_signature(path: Path):
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _filter_values(proto: dict) -> Dict[str, list]:
+    """Return the values ``proto`` matches for each of :data:`NPC_FILTERS`."""
+    roles = proto.get("roles") or []
+    if isinstance(roles, str):
+        roles = [roles]
+    if not roles and proto.get("npc_type"):
+        roles = [proto.get("npc_type")]
+    tags = []
+    zones = []
+    for entry in proto.get("tags") or []:
+        if isinstance(entry, (list, tuple)):
+            if not entry:
+                continue
+            tags.append(entry[0])
+            if len(entry) == 1 or entry[1] in {"zone", "area"}:
+                zones.append(entry[0])
+        else:
+            tags.append(entry)
+    return {
+        "class": [proto.get("npc_type")],
+        "race": [proto.get("race")],
+        "role": list(roles),
+        "tag": tags,
+        "zone": zones,
+    }
+
+
+def _cache_npc_registry(path: Path, sig, registry: Dict[str, dict]) -> None:
+    """Normalize ``registry`` once and store it with its filter indexes."""
+    protos: Dict[str, bytes] = {}
+    index: Dict[str, Dict[object, Set[str]]] = {name: {} for name in NPC_FILTERS}
+    for key, proto in registry.items():
+        if not isinstance(proto, dict):
+            continue
+        _normalize_proto(proto)
+        if "role" not in proto and proto.get("npc_type"):
+            proto["role"] = proto["npc_type"]
+        protos[key] = pickle.dumps(proto, pickle.HIGHEST_PROTOCOL)
+        for name, values in _filter_values(proto).items():
+            for value in values:
+                try:
+                    index[name].setdefault(value, set()).add(key)
+                except TypeError:
+                    continue
+    _NPC_CACHE.update(
+        path=path,
+        sig=sig,
+        checked=time.monotonic(),
+        protos=protos,
+        order={key: pos for pos, key in enumerate(protos)},
+        index=index,
+        loads=_NPC_CACHE["loads"] + 1,
+    )
+
+
+def _npc_registry() -> Dict[str, bytes]:
+    """Return the cached registry, re-reading the file only when it changed."""
+    path = _npc_proto_file()
+    now = time.monotonic()
+    if _NPC_CACHE["path"] == path:
+        if now - _NPC_CACHE["checked"] < NPC_REGISTRY_TTL:
+            return _NPC_CACHE["protos"]
+        sig = _file_signature(path)
+        if sig == _NPC_CACHE["sig"]:
+            _NPC_CACHE["checked"] = now
+            return _NPC_CACHE["protos"]
+    else:
+        sig = _file_signature(path)
+    _cache_npc_registry(path, sig, _load_npc_registry() if sig else {})
+    return _NPC_CACHE["protos"]
+
+
+def get_npc_registry_metrics() -> Dict[str, int]:
+    """Return the cached prototype count and how often the file was parsed."""
+    return {"prototypes": len(_NPC_CACHE["protos"]), "loads": _NPC_CACHE["loads"]}
+
+
+def clear_npc_registry_cache() -> None:
+    """Forget the cached NPC registry so the next lookup reads the file."""
+    _NPC_CACHE.update(path=None, sig=None, checked=0.0, protos={}, order={}, index={})
+
+
+def get_npc_prototype(key: str) -> Optional[dict]:
+    """Return a copy of the registered NPC prototype ``key`` or ``None``."""
+    blob = _npc_registry().get(key)
+    if blob is None:
+        return None
+    return pickle.loads(blob)
 
 
 def get_npc_prototypes(filter_by: Optional[dict] = None) -> Dict[str, dict]:
@@ -641,57 +764,22 @@ def get_npc_prototypes(filter_by: Optional[dict] = None) -> Dict[str, dict]:
         dict: Mapping of prototype key -> prototype data.
     """
 
-    registry = _load_npc_registry()
-    for proto in registry.values():
-        _normalize_proto(proto)
-        if "role" not in proto and proto.get("npc_type"):
-            proto["role"] = proto["npc_type"]
-    if not filter_by:
-        return registry
-
-    result: Dict[str, dict] = {}
-    for key, proto in registry.items():
-        if "class" in filter_by and proto.get("npc_type") != filter_by["class"]:
-            continue
-        if "race" in filter_by and proto.get("race") != filter_by["race"]:
-            continue
-        if "role" in filter_by:
-            roles = proto.get("roles") or []
-            if isinstance(roles, str):
-                roles = [roles]
-            if not roles and proto.get("npc_type"):
-                roles = [proto.get("npc_type")]
-            if filter_by["role"] not in roles:
-                continue
-        if "tag" in filter_by:
-            tag = filter_by["tag"]
-            tags = proto.get("tags") or []
-
-            def _tag_match(entry):
-                if isinstance(entry, (list, tuple)):
-                    return entry and entry[0] == tag
-                return entry == tag
-
-            if not any(_tag_match(t) for t in tags):
-                continue
-        if "zone" in filter_by:
-            zone = filter_by["zone"]
-            tags = proto.get("tags") or []
-
-            def _zone_match(entry):
-                if isinstance(entry, (list, tuple)):
-                    return (
-                        entry
-                        and entry[0] == zone
-                        and (len(entry) == 1 or entry[1] in {"zone", "area"})
-                    )
-                return False
-
-            if not any(_zone_match(t) for t in tags):
-                continue
-        result[key] = proto
-
-    return result
+    protos = _npc_registry()
+    filters = [name for name in NPC_FILTERS if name in (filter_by or {})]
+    if not filters:
+        return {key: pickle.loads(blob) for key, blob in protos.items()}
+
+    keys: Optional[Set[str]] = None
+    for name in filters:
+        try:
+            matches = _NPC_CACHE["index"][name].get(filter_by[name], set())
+        except TypeError:
+            matches = set()
+        keys = matches if keys is None else keys & matches
+        if not keys:
+            return {}
+    order = _NPC_CACHE["order"]
+    return {key: pickle.loads(protos[key]) for key in sorted(keys, key=order.get)}
 
 
 def register_npc_prototype(key: str, prototype: dict):
@@ -1,8 +1,8 @@
 from evennia import create_object
-from evennia.objects.models import ObjectDB
 from evennia.utils import logger
 from typeclasses.rooms import Room
 from typeclasses.exits import Exit
+from utils import room_index
 
 # short direction aliases used for exit objects
 DIR_SHORT = {
@@ -158,16 +158,13 @@ def create() -> tuple[int, int]:
     rooms_created = 0
 
     for vnum, data in midgard_rooms.items():
-        objs = ObjectDB.objects.filter(
-            db_attributes__db_key="room_id", db_attributes__db_value=vnum
-        )
-        room = next((obj for obj in objs if obj.is_typeclass(Room, exact=False)), None)
+        room = room_index.get_room(vnum)
         if not room:
             room = create_object(Room, key=data["name"])
             rooms_created += 1
 
         room.key = data["name"]
-        room.db.room_id = vnum
+        room.set_room_id(vnum)
         room.db.desc = data.get("desc", "")
         room.tags.add("midgard", category="area")
         rooms[vnum] = room
@@ -1,73 +1,204 @@
-from evennia.utils import create
+import copy
+
+from evennia.utils import create, delay
+from evennia.utils.dbserialize import deserialize
 from evennia.scripts.scripts import DefaultScript
 from evennia.scripts.models import ScriptDB
 
+#: Attribute category holding one record per prototype, keyed by vnum.
+PROTO_CATEGORY = "mob_proto"
+
+# process-local handle returned by ``get_mobdb``
+_HANDLE = {"script": None}
+
+
+def _norm(vnum):
+    """Return ``vnum`` as an int when numeric, else as a string."""
+    try:
+        return int(vnum)
+    except (TypeError, ValueError):
+        return str(vnum)
+
 
 class MobDB(DefaultScript):
-    """Simple in-memory database for NPC prototypes keyed by vnum."""
+    """Database of NPC prototypes keyed by vnum.
+
+    Every prototype is stored in its own Attribute (category
+    ``mob_proto``), so saving or deleting one prototype only writes that
+    record. Records are read once per process into ``ndb.protos``. Spawn
+    counters are updated in memory and written back in batches.
+    """
+
+    #: Seconds a changed spawn counter may wait before being written.
+    flush_interval = 30
+    #: Number of changed counters that triggers an immediate write.
+    flush_batch = 100
 
     def at_script_creation(self):
         """Initialize the script on first creation."""
         self.key = "mob_db"
         self.persistent = True
-        self.db.vnums = {}
         self.db.next_vnum = 1
 
+    def at_server_reload(self):
+        self.flush_spawn_counts()
+
+    def at_server_shutdown(self):
+        self.flush_spawn_counts()
+
+    def at_idmapper_flush(self):
+        # the in-memory records are rebuilt on demand; drop them so they do
+        # not pin the script in the idmapper cache
+        if self.ndb.protos is not None:
+            self.flush_spawn_counts()
+        for key in ("protos", "dirty", "flush_timer"):
+            self.nattributes.remove(key)
+        return super().at_idmapper_flush()
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+    def _protos(self):
+        """Return the in-memory mapping of vnum -> prototype."""
+        protos = self.ndb.protos
+        if protos is None:
+            protos = {}
+            records = self.attributes.get(
+                category=PROTO_CATEGORY, return_obj=True, return_list=True
+            )
+            for attr in records:
+                if attr is not None:
+                    protos[_norm(attr.key)] = deserialize(attr.value)
+            self.ndb.protos = protos
+            self.ndb.dirty = set()
+            self._migrate_legacy()
+        return protos
+
+    def _write(self, *vnums):
+        protos = self._protos()
+        self.attributes.batch_add(
+            *[(str(vnum), protos[vnum], PROTO_CATEGORY) for vnum in vnums if vnum in protos]
+        )
+
+    def _migrate_legacy(self):
+        """Move prototypes from the old single ``vnums`` Attribute into records."""
+        if not self.attributes.has("vnums"):
+            return
+        legacy = deserialize(self.attributes.get("vnums")) or {}
+        protos = self.ndb.protos
+        moved = []
+        for key, proto in legacy.items():
+            vnum = _norm(key)
+            if vnum not in protos and isinstance(proto, dict):
+                protos[vnum] = proto
+                moved.append(vnum)
+        self._write(*moved)
+        self.attributes.remove("vnums")
+
     # ------------------------------------------------------------------
     # Convenience API
     # ------------------------------------------------------------------
+    def _get(self, vnum):
+        """Return the cached prototype dict for ``vnum`` or ``None``."""
+        vnum = _norm(vnum)
+        proto = self._protos().get(vnum)
+        if proto is None and self.attributes.has("vnums"):
+            self._migrate_legacy()
+            proto = self.ndb.protos.get(vnum)
+        return proto
+
     def get_proto(self, vnum):
-        """Return prototype dict for ``vnum`` or ``None``."""
-        try:
-            vnum_int = int(vnum)
-        except (TypeError, ValueError):
-            vnum_int = None
+        """Return a copy of the prototype dict for ``vnum`` or ``None``.
 
-        if vnum_int is not None:
-            proto = self.db.vnums.get(vnum_int)
-            if proto is not None:
-                return proto
+        Changes to the copy are not stored; save them with :meth:`add_proto`.
+        """
+        proto = self._get(vnum)
+        return copy.deepcopy(proto) if proto is not None else None
 
-        return self.db.vnums.get(str(vnum))
+    def has_proto(self, vnum):
+        """Return ``True`` if a prototype is stored for ``vnum``."""
+        return self._get(vnum) is not None
+
+    def all_protos(self):
+        """Return a mapping of every stored vnum -> prototype."""
+        self._protos()
+        if self.attributes.has("vnums"):
+            self._migrate_legacy()
+        return dict(self.ndb.protos)
 
     def add_proto(self, vnum, data):
         """Store ``data`` for ``vnum``. Ensure ``spawn_count`` key exists."""
         vnum = int(vnum)
+        protos = self._protos()
         proto = dict(data)
         # preserve existing spawn counter if re-adding
         if "spawn_count" not in proto:
-            proto["spawn_count"] = self.db.vnums.get(vnum, {}).get("spawn_count", 0)
-        self.db.vnums[vnum] = proto
-        self.db.vnums[str(vnum)] = proto
+            proto["spawn_count"] = protos.get(vnum, {}).get("spawn_count", 0)
+        protos[vnum] = proto
+        self.ndb.dirty.discard(vnum)
+        self._write(vnum)
+
+    def replace_protos(self, protos):
+        """Make ``protos`` (vnum -> data) the full set of stored prototypes.
+
+        Spawn counters of prototypes that stay are kept and only records
+        that changed are written.
+        """
+        current = self._protos()
+        keep = set()
+        changed = []
+        for vnum, data in protos.items():
+            vnum = int(vnum)
+            keep.add(vnum)
+            proto = dict(data)
+            proto.setdefault("spawn_count", current.get(vnum, {}).get("spawn_count", 0))
+            if current.get(vnum) != proto:
+                current[vnum] = proto
+                changed.append(vnum)
+        for vnum in [vnum for vnum in current if vnum not in keep]:
+            self.delete_proto(vnum)
+        self._write(*changed)
 
     def increment_spawn_count(self, vnum):
-        """Increase the stored spawn counter for ``vnum``."""
-        try:
-            vnum_int = int(vnum)
-        except (TypeError, ValueError):
-            vnum_int = None
+        """Increase the spawn counter for ``vnum``.
 
-        proto = self.get_proto(vnum_int if vnum_int is not None else str(vnum))
+        The counter is written back by :meth:`flush_spawn_counts`, either
+        once ``flush_batch`` counters changed or after ``flush_interval``
+        seconds.
+        """
+        proto = self._get(vnum)
         if not proto:
             return
         proto["spawn_count"] = int(proto.get("spawn_count", 0)) + 1
-        if vnum_int is not None:
-            self.db.vnums[vnum_int] = proto
-            self.db.vnums[str(vnum_int)] = proto
-        else:
-            self.db.vnums[str(vnum)] = proto
+        dirty = self.ndb.dirty
+        dirty.add(_norm(vnum))
+        if len(dirty) >= self.flush_batch:
+            self.flush_spawn_counts()
+        elif not self.ndb.flush_timer:
+            self.ndb.flush_timer = delay(self.flush_interval, self.flush_spawn_counts)
+
+    def flush_spawn_counts(self):
+        """Write every changed spawn counter to the database."""
+        timer = self.ndb.flush_timer
+        self.ndb.flush_timer = None
+        if timer:
+            try:
+                timer.cancel()
+            except Exception:  # pragma: no cover - already fired
+                pass
+        dirty = self.ndb.dirty
+        if not dirty:
+            return
+        vnums = list(dirty)
+        dirty.clear()
+        self._write(*vnums)
 
     def delete_proto(self, vnum):
         """Remove ``vnum`` from the database."""
-        try:
-            vnum_int = int(vnum)
-        except (TypeError, ValueError):
-            vnum_int = None
-        if vnum_int is not None:
-            self.db.vnums.pop(vnum_int, None)
-            self.db.vnums.pop(str(vnum_int), None)
-        else:
-            self.db.vnums.pop(str(vnum), None)
+        vnum = _norm(vnum)
+        self._protos().pop(vnum, None)
+        self.ndb.dirty.discard(vnum)
+        self.attributes.remove(str(vnum), category=PROTO_CATEGORY)
 
     def next_vnum(self):
         """Return the next available vnum and increment the counter."""
@@ -78,6 +209,9 @@ class MobDB(DefaultScript):
 
 def get_mobdb():
     """Return the global ``MobDB`` script, creating it if needed."""
+    script = _HANDLE["script"]
+    if script is not None and ScriptDB.get_cached_instance(script.id) is script:
+        return script
     script, _ = ScriptDB.objects.get_or_create(
         db_key="mob_db",
         defaults={"db_typeclass_path": "world.scripts.mob_db.MobDB"},
@@ -86,4 +220,5 @@ def get_mobdb():
     if script.typeclass_path != "world.scripts.mob_db.MobDB":
         script.delete()
         script = create.create_script("world.scripts.mob_db.MobDB", key="mob_db")
+    _HANDLE["script"] = script
     return script
@@ -142,9 +142,11 @@ def sum_bonus(obj, stat_key: str) -> int:
     try:
         from evennia.contrib.game_systems.clothing.clothing import get_worn_clothes
 
+        from world.system import item_mods
+
         for item in get_worn_clothes(obj):
             if hasattr(item, "attributes"):
-                total += item.attributes.get(f"{stat_key}_bonus", default=0)
+                total += item_mods.get_item_mods(item).bonuses.get(stat_key.lower(), 0)
             else:
                 item_get = getattr(getattr(item, "db", None), "get", None)
                 if callable(item_get):
@@ -2,7 +2,11 @@
 
 from . import state_manager
 from . import stat_manager
+from . import stat_snapshot
+from . import item_mods
+from . import effect_timers
+from . import prompt_manager
 from . import constants
 from . import class_skills
 
-__all__ = ["state_manager", "stat_manager", "constants", "class_skills"]
+__all__ = ["state_manager", "stat_manager", "stat_snapshot", "item_mods", "effect_timers", "prompt_manager", "constants", "class_skills"]
@@ -0,0 +1,181 @@
+# Priority queue of characters waiting on effect or hunger timers
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from typing import Dict, List, Optional, Tuple
+
+from evennia.server.models import ServerConfig
+from evennia.utils.logger import log_trace
+
+#: ServerConfig key holding the number of global ticks elapsed so far.
+TICK_KEY = "effect_timer_tick"
+#: Tag marking objects that have a pending wake-up.
+TIMER_TAG = "effect_timer"
+TIMER_CATEGORY = "timers"
+#: Attribute storing the tick an object is due to wake at.
+DUE_ATTR = "timer_due"
+#: ServerConfig key set once objects with timers from before the queue
+#: existed have been scheduled.
+MIGRATED_KEY = "effect_timers_migrated"
+#: Attributes holding effect and status durations.
+TIMER_ATTRS = ("temp_bonuses", "active_effects", "status_effects")
+
+# heap of (due tick, sequence, object id); superseded entries are skipped
+_HEAP: List[Tuple[int, int, int]] = []
+_DUE: Dict[int, int] = {}
+_SEQ = itertools.count()
+_STATE = {"tick": None, "loaded": False}
+
+
+def current_tick() -> int:
+    """Return the number of global ticks elapsed since the clock was created."""
+
+    if _STATE["tick"] is None:
+        _STATE["tick"] = int(ServerConfig.objects.conf(TICK_KEY, default=0) or 0)
+    return _STATE["tick"]
+
+
+def _push(obj_id: int, due: int) -> None:
+    _DUE[obj_id] = due
+    heapq.heappush(_HEAP, (due, next(_SEQ), obj_id))
+
+
+def load() -> None:
+    """Rebuild the queue from the objects tagged as waiting."""
+
+    from evennia.utils.search import search_tag
+
+    _HEAP.clear()
+    _DUE.clear()
+    _STATE["loaded"] = True
+    for obj in search_tag(TIMER_TAG, category=TIMER_CATEGORY):
+        due = obj.attributes.get(DUE_ATTR)
+        if due is None:
+            obj.tags.remove(TIMER_TAG, category=TIMER_CATEGORY)
+            continue
+        _push(obj.id, int(due))
+    if not ServerConfig.objects.conf(MIGRATED_KEY, default=False):
+        migrate()
+
+
+def migrate() -> int:
+    """Schedule every object with effect or status timers that is not queued.
+
+    Objects given effects before the queue existed were never tagged, so
+    NPCs among them would keep their effects forever. Their elapsed ticks
+    are counted from now, as for a player catching up on puppet. Returns
+    the number of objects scheduled.
+    """
+
+    from evennia.objects.models import ObjectDB
+
+    from world.system import state_manager
+
+    _ensure_loaded()
+    queued = ObjectDB.objects.filter(
+        db_tags__db_key=TIMER_TAG, db_tags__db_category=TIMER_CATEGORY
+    ).values("id")
+    objs = (
+        ObjectDB.objects.filter(db_attributes__db_key__in=TIMER_ATTRS)
+        .exclude(id__in=queued)
+        .distinct()
+    )
+    scheduled = 0
+    for obj in objs:
+        if not any(obj.attributes.get(key) for key in TIMER_ATTRS):
+            continue
+        if not isinstance(obj.db.timer_tick, int):
+            obj.db.timer_tick = current_tick()
+        state_manager.schedule_timers(obj)
+        scheduled += obj.id in _DUE
+    ServerConfig.objects.conf(MIGRATED_KEY, value=True)
+    return scheduled
+
+
+def _ensure_loaded() -> None:
+    if not _STATE["loaded"]:
+        load()
+
+
+def schedule(obj, delay: Optional[int]) -> None:
+    """Wake ``obj`` after ``delay`` ticks, or stop waking it if ``delay`` is None."""
+
+    if not isinstance(getattr(obj, "id", None), int):
+        return
+    if delay is None:
+        unschedule(obj)
+        return
+    _ensure_loaded()
+    due = current_tick() + max(1, int(delay))
+    if _DUE.get(obj.id) == due:
+        return
+    _push(obj.id, due)
+    obj.attributes.add(DUE_ATTR, due)
+    if not obj.tags.has(TIMER_TAG, category=TIMER_CATEGORY):
+        obj.tags.add(TIMER_TAG, category=TIMER_CATEGORY)
+
+
+def unschedule(obj) -> None:
+    """Remove ``obj`` from the queue."""
+
+    if not isinstance(getattr(obj, "id", None), int):
+        return
+    _ensure_loaded()
+    if _DUE.pop(obj.id, None) is None and not obj.tags.has(
+        TIMER_TAG, category=TIMER_CATEGORY
+    ):
+        return
+    obj.tags.remove(TIMER_TAG, category=TIMER_CATEGORY)
+    obj.attributes.remove(DUE_ATTR)
+
+
+def due_at(obj) -> Optional[int]:
+    """Return the tick ``obj`` is due to wake at, if it is queued."""
+
+    _ensure_loaded()
+    return _DUE.get(obj.id)
+
+
+def pending() -> int:
+    """Return the number of queued objects."""
+
+    _ensure_loaded()
+    return len(_DUE)
+
+
+def advance() -> List[object]:
+    """Advance the clock by one tick and return the objects now due."""
+
+    from evennia.objects.models import ObjectDB
+
+    _ensure_loaded()
+    tick = current_tick() + 1
+    _STATE["tick"] = tick
+    ServerConfig.objects.conf(TICK_KEY, value=tick)
+
+    woken = []
+    while _HEAP and _HEAP[0][0] <= tick:
+        due, _, obj_id = heapq.heappop(_HEAP)
+        if _DUE.get(obj_id) != due:
+            continue
+        del _DUE[obj_id]
+        try:
+            obj = ObjectDB.objects.get(id=obj_id)
+        except ObjectDB.DoesNotExist:
+            continue
+        except Exception as err:  # pragma: no cover - keep ticking others
+            log_trace(f"Could not wake #{obj_id}: {err}")
+            continue
+        woken.append(obj)
+    return woken
+
+
+def reset() -> None:
+    """Forget the in-memory queue and clock; they are reloaded on next use."""
+
+    _HEAP.clear()
+    _DUE.clear()
+    _STATE["tick"] = None
+    _STATE["loaded"] = False
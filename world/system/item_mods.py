@@ -0,0 +1,250 @@
+# Compiled per-item stat modifiers shared by the gear and bonus helpers
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import re
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Set, Tuple
+
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from evennia.objects.models import ObjectDB
+from evennia.typeclasses.attributes import Attribute
+
+from utils.object_signals import on_object_deleted
+from utils.stats_utils import normalize_stat_key
+
+#: Attributes probed, in order, for a mapping of stat modifiers.
+MOD_FIELDS = ("stat_mods", "bonuses", "modifiers", "buffs")
+
+_TAG_MOD_RE = re.compile(r"([A-Z_]+)([+-]\d+)$")
+
+
+@dataclass(frozen=True)
+class ItemMods:
+    """Stat modifiers compiled from a single item.
+
+    ``mods`` is what :func:`stat_manager.collect_item_mods` returns,
+    ``bonuses`` holds every raw ``<stat>_bonus`` attribute keyed by the
+    lowercased stat name and ``armor`` is the item's flat armor value.
+    ``tags`` are the tag keys the record was compiled from.
+    """
+
+    mods: Mapping[str, int]
+    bonuses: Mapping[str, int]
+    armor: int
+    tags: Tuple[str, ...] = ()
+
+
+# compiled records keyed by item id
+_CACHE: Dict[int, ItemMods] = {}
+# id of every contributing Attribute -> id of the item it belongs to
+_ATTR_OWNERS: Dict[int, int] = {}
+_ITEM_ATTRS: Dict[int, Set[int]] = {}
+
+
+def _stat_keys() -> Dict[str, str]:
+    """Return known stat keys indexed by their lowercased name."""
+
+    from world.system.stat_manager import PRIMARY_STATS, STAT_SCALING
+
+    keys = set(PRIMARY_STATS) | set(STAT_SCALING.keys())
+    return {key.lower(): key for key in keys}
+
+
+def _add(bonus: Dict[str, int], stat: str, val) -> None:
+    stat = normalize_stat_key(stat)
+    bonus[stat] = bonus.get(stat, 0) + int(val)
+
+
+def _read_attributes(item, used: Set[int]):
+    """Read bonuses, modifier mapping and armor with a single attribute scan."""
+
+    raw: Dict[str, int] = {}
+    fields: Dict[str, object] = {}
+    armor = 0
+    for attr in item.attributes.all():
+        if attr.category:
+            continue
+        key = attr.key.lower()
+        if key.endswith("_bonus"):
+            used.add(attr.id)
+            raw[key[: -len("_bonus")]] = attr.value
+        elif key in MOD_FIELDS:
+            used.add(attr.id)
+            fields[key] = attr.value
+        elif key == "armor":
+            used.add(attr.id)
+            armor = attr.value
+    mods = None
+    for field in MOD_FIELDS:
+        mods = fields.get(field)
+        if mods:
+            break
+    return raw, mods, armor
+
+
+def _tag_keys(item) -> Tuple[str, ...]:
+    tags = getattr(item, "tags", None)
+    if tags is None:
+        return ()
+    return tuple(tags.get(return_list=True))
+
+
+def _read_getter(getter, stat_keys):
+    """Fallback for objects exposing only ``db.get``."""
+
+    raw: Dict[str, int] = {}
+    for lower, key in stat_keys.items():
+        try:
+            val = getter(f"{key}_bonus", 0)
+        except Exception:
+            val = 0
+        if val:
+            raw[lower] = val
+    mods = None
+    for field in MOD_FIELDS:
+        try:
+            mods = getter(field, None)
+        except Exception:
+            mods = None
+        if mods:
+            break
+    try:
+        armor = getter("armor", 0)
+    except Exception:
+        armor = 0
+    return raw, mods, armor
+
+
+def compile_item_mods(
+    item, used: Optional[Set[int]] = None, tags: Optional[Tuple[str, ...]] = None
+) -> ItemMods:
+    """Build the :class:`ItemMods` record for ``item`` without caching it.
+
+    ``used`` collects the ids of the Attributes the record was built from.
+    """
+
+    stat_keys = _stat_keys()
+    if used is None:
+        used = set()
+    if tags is None:
+        tags = _tag_keys(item)
+
+    raw: Dict[str, int] = {}
+    mods = None
+    armor = 0
+    if hasattr(item, "attributes"):
+        raw, mods, armor = _read_attributes(item, used)
+    else:
+        getter = getattr(getattr(item, "db", None), "get", None)
+        if callable(getter):
+            raw, mods, armor = _read_getter(getter, stat_keys)
+
+    bonus: Dict[str, int] = {}
+    bonuses: Dict[str, int] = {}
+    for lower, val in raw.items():
+        try:
+            bonuses[lower] = int(val or 0)
+        except (TypeError, ValueError):
+            continue
+        if lower in stat_keys and val:
+            _add(bonus, stat_keys[lower], val)
+    if mods:
+        for stat, val in mods.items():
+            _add(bonus, stat, val)
+
+    known = set(stat_keys.values())
+    for tag in tags:
+        if not isinstance(tag, str):
+            continue
+        m = _TAG_MOD_RE.match(tag)
+        if m:
+            stat, amt = m.groups()
+            if normalize_stat_key(stat) in known:
+                _add(bonus, stat, amt)
+
+    try:
+        armor = int(armor or 0)
+    except (TypeError, ValueError):
+        armor = 0
+
+    return ItemMods(
+        mods=MappingProxyType(bonus),
+        bonuses=MappingProxyType(bonuses),
+        armor=armor,
+        tags=tags,
+    )
+
+
+def get_item_mods(item) -> ItemMods:
+    """Return the compiled modifiers for ``item``, building them once.
+
+    Attribute changes are picked up through model signals. Tags are compared
+    against the handler's in-memory cache on each call since bulk tag removal
+    bypasses the signals.
+    """
+
+    item_id = getattr(item, "id", None)
+    if not item_id or not hasattr(item, "attributes"):
+        return compile_item_mods(item)
+
+    tags = _tag_keys(item)
+    record = _CACHE.get(item_id)
+    if record is None or record.tags != tags:
+        _invalidate_id(item_id)
+        used: Set[int] = set()
+        record = compile_item_mods(item, used, tags)
+        _CACHE[item_id] = record
+        _ITEM_ATTRS[item_id] = used
+        for attr_id in used:
+            _ATTR_OWNERS[attr_id] = item_id
+    return record
+
+
+def _invalidate_id(item_id) -> None:
+    _CACHE.pop(item_id, None)
+    for attr_id in _ITEM_ATTRS.pop(item_id, ()):
+        _ATTR_OWNERS.pop(attr_id, None)
+
+
+def invalidate(item) -> None:
+    """Discard the compiled record for ``item``."""
+
+    _invalidate_id(getattr(item, "id", None))
+
+
+def clear_cache() -> None:
+    """Discard every compiled record."""
+
+    _CACHE.clear()
+    _ATTR_OWNERS.clear()
+    _ITEM_ATTRS.clear()
+
+
+def _on_attribute_changed(sender, instance, **kwargs):
+    item_id = _ATTR_OWNERS.get(instance.id)
+    if item_id is not None:
+        _invalidate_id(item_id)
+
+
+def _on_attribute_added(sender, instance, action, reverse, pk_set, **kwargs):
+    if action != "post_add":
+        return
+    if not reverse:
+        _invalidate_id(instance.id)
+    else:
+        for item_id in pk_set or ():
+            _invalidate_id(item_id)
+
+
+post_save.connect(_on_attribute_changed, sender=Attribute, dispatch_uid="item_mods_attr_save")
+post_delete.connect(
+    _on_attribute_changed, sender=Attribute, dispatch_uid="item_mods_attr_delete"
+)
+m2m_changed.connect(
+    _on_attribute_added,
+    sender=ObjectDB.db_attributes.through,
+    dispatch_uid="item_mods_attr_add",
+)
+on_object_deleted(_invalidate_id)
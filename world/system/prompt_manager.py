@@ -0,0 +1,79 @@
+# Coalesced prompt refreshes for puppeted characters
+
+from __future__ import annotations
+
+from typing import Dict
+
+from evennia.utils import delay
+from evennia.utils.logger import log_trace
+
+# characters waiting for a prompt refresh, keyed by id
+_PENDING: Dict[int, object] = {}
+_STATE = {"handle": None, "sent": 0, "skipped": 0}
+
+
+def request(chara) -> None:
+    """Queue a prompt refresh for ``chara``.
+
+    Every request made during the same reactor tick is merged into a single
+    render per character, sent once the current tick has finished.
+    """
+
+    _PENDING[chara.id] = chara
+    if _STATE["handle"] is None:
+        _STATE["handle"] = delay(0, flush)
+
+
+def send(chara) -> None:
+    """Render the prompt of ``chara`` and send it if it changed.
+
+    Text sent to the character clears the remembered prompt, so a prompt is
+    only skipped when nothing else was shown since the last one.
+    """
+
+    if not chara.sessions.count():
+        return
+    text = chara.get_resource_prompt()
+    if text == chara.ndb.last_prompt:
+        _STATE["skipped"] += 1
+        return
+    _STATE["sent"] += 1
+    chara.msg(prompt=text)
+
+
+def flush() -> None:
+    """Send every queued prompt refresh."""
+
+    _STATE["handle"] = None
+    pending = list(_PENDING.values())
+    _PENDING.clear()
+    for chara in pending:
+        try:
+            send(chara)
+        except Exception as err:  # pragma: no cover - safety
+            log_trace(f"Error refreshing prompt for {chara}: {err}")
+
+
+def pending() -> int:
+    """Return the number of characters waiting for a refresh."""
+
+    return len(_PENDING)
+
+
+def get_metrics() -> Dict[str, int]:
+    """Return how many prompt refreshes were sent or skipped as unchanged."""
+
+    return {"sent": _STATE["sent"], "skipped": _STATE["skipped"]}
+
+
+def reset() -> None:
+    """Drop queued refreshes and counters."""
+
+    handle = _STATE["handle"]
+    if handle:
+        try:
+            handle.cancel()
+        except Exception:  # pragma: no cover - safety
+            pass
+    _PENDING.clear()
+    _STATE.update(handle=None, sent=0, skipped=0)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Dict
 import re
 from random import randint
@@ -9,7 +10,7 @@ from random import randint
 from utils.stats_utils import normalize_stat_key
 
 from world import stats
-from world.system import state_manager
+from world.system import item_mods, state_manager, stat_snapshot
 from .constants import (
     MAX_STR,
     MAX_CON,
@@ -96,72 +97,21 @@ def _class_mods(obj) -> Dict[str, int]:
 
 
 def collect_item_mods(item) -> Dict[str, int]:  # pragma: no cover - helper
-    """Return stat modifiers contributed by a single item."""
-
-    bonus: Dict[str, int] = {}
-
-    stat_keys = set(PRIMARY_STATS) | set(STAT_SCALING.keys())
-
-    if hasattr(item, "attributes"):
-        for key in stat_keys:
-            val = item.attributes.get(f"{key}_bonus", default=0)
-            if val:
-                norm = normalize_stat_key(key)
-                bonus[norm] = bonus.get(norm, 0) + int(val)
-        mods = (
-            item.attributes.get("stat_mods", default=None)
-            or item.attributes.get("bonuses", default=None)
-            or item.attributes.get("modifiers", default=None)
-            or item.attributes.get("buffs", default=None)
-        )
-        if mods:
-            for stat, val in mods.items():
-                stat = normalize_stat_key(stat)
-                bonus[stat] = bonus.get(stat, 0) + int(val)
-    else:
-        getter = getattr(getattr(item, "db", None), "get", None)
-        if callable(getter):
-            for key in stat_keys:
-                try:
-                    val = getter(f"{key}_bonus", 0)
-                except Exception:
-                    val = 0
-                if val:
-                    norm = normalize_stat_key(key)
-                    bonus[norm] = bonus.get(norm, 0) + int(val)
-            mods = None
-            for field in ("stat_mods", "bonuses", "modifiers", "buffs"):
-                try:
-                    mods = getter(field, None)
-                except Exception:
-                    mods = None
-                if mods:
-                    break
-            if mods:
-                for stat, val in mods.items():
-                    stat = normalize_stat_key(stat)
-                    bonus[stat] = bonus.get(stat, 0) + int(val)
+    """Return stat modifiers contributed by a single item.
 
-    if hasattr(item, "tags"):
-        tags = item.tags.get(return_list=True)
-        for tag in tags:
-            if not isinstance(tag, str):
-                continue
-            m = re.match(r"([A-Z_]+)([+-]\d+)$", tag)
-            if m:
-                stat, amt = m.groups()
-                stat = normalize_stat_key(stat)
-                if stat in stat_keys:
-                    bonus[stat] = bonus.get(stat, 0) + int(amt)
+    The modifiers are compiled once per item by :mod:`world.system.item_mods`
+    and reused until one of the item's attributes or tags changes.
+    """
 
-    return bonus
+    return dict(item_mods.get_item_mods(item).mods)
 
 
 def add_equip_bonus(chara, item) -> None:
     """Add ``item`` modifiers to ``chara.db.equip_bonuses``."""
-    mods = collect_item_mods(item)
-    if getattr(item.db, "armor", 0):
-        chara.traits.armor.base += int(item.db.armor)
+    compiled = item_mods.get_item_mods(item)
+    mods = compiled.mods
+    if compiled.armor:
+        chara.traits.armor.base += compiled.armor
     if not mods:
         return
     bonuses = chara.db.equip_bonuses or {}
@@ -173,9 +123,10 @@ def add_equip_bonus(chara, item) -> None:
 
 def remove_equip_bonus(chara, item) -> None:
     """Remove ``item`` modifiers from ``chara.db.equip_bonuses``."""
-    mods = collect_item_mods(item)
-    if getattr(item.db, "armor", 0):
-        chara.traits.armor.base -= int(item.db.armor)
+    compiled = item_mods.get_item_mods(item)
+    mods = compiled.mods
+    if compiled.armor:
+        chara.traits.armor.base -= compiled.armor
     if not mods:
         return
     bonuses = chara.db.equip_bonuses or {}
@@ -196,7 +147,7 @@ def apply_item_bonuses_once(chara, item) -> None:
         return
     add_equip_bonus(chara, item)
     item.db.bonuses_applied = True
-    refresh_stats(chara)
+    refresh_stats(chara, changed=("gear",))
 
 
 def remove_item_bonuses(chara, item) -> None:
@@ -205,7 +156,7 @@ def remove_item_bonuses(chara, item) -> None:
         return
     remove_equip_bonus(chara, item)
     item.db.bonuses_applied = False
-    refresh_stats(chara)
+    refresh_stats(chara, changed=("gear",))
 
 
 def reset_all_item_bonuses(chara) -> None:
@@ -224,19 +175,19 @@ def reset_all_item_bonuses(chara) -> None:
             add_equip_bonus(chara, itm)
             itm.db.bonuses_applied = True
 
-    refresh_stats(chara)
+    refresh_stats(chara, changed=("gear",))
 
 
 def apply_bonuses(chara, item) -> None:
     """Apply bonuses from ``item`` and refresh character stats."""
     add_equip_bonus(chara, item)
-    refresh_stats(chara)
+    refresh_stats(chara, changed=("gear",))
 
 
 def remove_bonuses(chara, item) -> None:
     """Remove bonuses from ``item`` and refresh character stats."""
     remove_equip_bonus(chara, item)
-    refresh_stats(chara)
+    refresh_stats(chara, changed=("gear",))
 
 
 def clear_all_equipment_bonuses(chara) -> None:
@@ -272,8 +223,8 @@ def _gear_mods(obj) -> Dict[str, int]:  # pragma: no cover - placeholder
     for itm in items:
         if not itm:
             continue
-        for stat, val in collect_item_mods(itm).items():
-            mods[stat] = mods.get(stat, 0) + int(val)
+        for stat, val in item_mods.get_item_mods(itm).mods.items():
+            mods[stat] = mods.get(stat, 0) + val
 
     if not mods:
         mods = getattr(getattr(obj, "db", None), "equip_bonuses", {}) or {}
@@ -347,8 +298,135 @@ def _buff_mods(obj) -> Dict[str, int]:  # pragma: no cover - placeholder
 # -------------------------------------------------------------
 
 
-def refresh_stats(obj) -> None:
-    """Recalculate and cache all stats for ``obj``."""
+# Inputs whose scans can be skipped by an incremental refresh
+STAT_INPUTS = ("gear", "buffs")
+
+_PRIMARY_CAPS = {
+    "STR": MAX_STR,
+    "CON": MAX_CON,
+    "DEX": MAX_DEX,
+    "INT": MAX_INT,
+    "WIS": MAX_WIS,
+    "LUCK": MAX_LUCK,
+}
+
+# primary stats used by the special-cased hit chance and perception formulas
+_HIT_CHANCE_STATS = ("DEX", "STR", "INT", "WIS", "LUCK")
+_PERCEPTION_STATS = ("WIS", "INT", "LUCK")
+
+
+def _build_dependents() -> Dict[str, set]:
+    """Return a mapping of primary stat -> derived keys that scale from it."""
+    deps: Dict[str, set] = {key: set() for key in PRIMARY_STATS}
+    for dkey, mapping in STAT_SCALING.items():
+        for pkey in mapping:
+            deps.setdefault(pkey, set()).add(dkey)
+    for pkey in _HIT_CHANCE_STATS:
+        deps.setdefault(pkey, set()).add("hit_chance")
+    for pkey in _PERCEPTION_STATS:
+        deps.setdefault(pkey, set()).add("perception")
+    return deps
+
+
+_DEPENDENTS = _build_dependents()
+
+
+def _get_stat_cache(obj) -> Dict | None:
+    ndb = getattr(obj, "ndb", None)
+    cache = getattr(ndb, "stat_cache", None) if ndb is not None else None
+    return cache if isinstance(cache, dict) else None
+
+
+def _set_stat_cache(obj, cache: Dict) -> None:
+    ndb = getattr(obj, "ndb", None)
+    if ndb is not None:
+        try:
+            ndb.stat_cache = cache
+        except Exception:  # pragma: no cover - unsaved or mocked objects
+            pass
+
+
+def clear_stat_cache(obj) -> None:
+    """Forget cached refresh inputs so the next refresh rescans everything."""
+    _set_stat_cache(obj, None)
+
+
+def _changed_keys(old: Dict, new: Dict) -> set:
+    return {key for key in set(old) | set(new) if old.get(key, 0) != new.get(key, 0)}
+
+
+def _derive_value(
+    dkey: str,
+    primary_totals: Dict[str, int],
+    gear_bonus: Dict[str, int],
+    buff_bonus: Dict[str, int],
+    base_per: int,
+) -> int:
+    """Return the computed value of derived stat ``dkey`` before overrides."""
+    bonus = gear_bonus.get(dkey, 0) + buff_bonus.get(dkey, 0)
+    if dkey == "hit_chance":
+        return int(
+            max(
+                5,
+                min(
+                    95,
+                    round(
+                        50
+                        + primary_totals.get("DEX", 0) * 0.15
+                        + max(
+                            primary_totals.get("STR", 0),
+                            primary_totals.get("INT", 0),
+                            primary_totals.get("WIS", 0),
+                        )
+                        * 0.10
+                        + primary_totals.get("LUCK", 0) * 0.05
+                        + bonus
+                    ),
+                ),
+            )
+        )
+    if dkey == "perception":
+        per_bonus = (
+            primary_totals.get("WIS", 0) * 0.3
+            + primary_totals.get("INT", 0) * 0.3
+            + primary_totals.get("LUCK", 0) * 0.2
+        )
+        return int(round(base_per + per_bonus + bonus))
+    value = 0
+    for pkey, weight in STAT_SCALING.get(dkey, {}).items():
+        value += primary_totals.get(pkey, 0) * weight
+    return int(round(value + bonus))
+
+
+def _set_trait_base(trait_get, trait_add, key: str, value) -> bool:
+    """Write ``value`` to trait ``key`` only if it differs. Return True on write."""
+    trait = trait_get(key)
+    if not trait:
+        trait_add(key, key, base=value)
+        return True
+    if trait.base != value:
+        trait.base = value
+        return True
+    return False
+
+
+def refresh_stats(obj, changed=None) -> None:
+    """Recalculate and cache all stats for ``obj``.
+
+    Args:
+        obj: The object to refresh.
+        changed (iterable, optional): Inputs known to have changed since the
+            last refresh, drawn from :data:`STAT_INPUTS`. Inputs not listed
+            reuse the values cached by the previous refresh instead of being
+            rescanned, and only derived stats depending on values that
+            actually moved are recomputed. When omitted (or when nothing is
+            cached yet) every input is rescanned.
+
+    Only values that differ from what is already stored are written back to
+    the database.
+    """
+
+    stat_snapshot.invalidate(obj)
 
     traits = getattr(obj, "traits", None)
     trait_get = getattr(traits, "get", None)
@@ -357,19 +435,25 @@ def refresh_stats(obj) -> None:
     if not callable(trait_get) or not callable(trait_add):
         return
 
-    # ensure baseline traits exist
-    stats.apply_stats(obj)
+    cache = _get_stat_cache(obj) if changed is not None else None
+    if cache is None:
+        # ensure baseline traits exist
+        stats.apply_stats(obj)
+        dirty = set(STAT_INPUTS)
+        cache = {}
+    else:
+        dirty = set(changed)
 
     # dynamic bonuses from gear or buffs can change between refreshes
-    gear_bonus = _gear_mods(obj)
-    buff_bonus = _buff_mods(obj)
+    gear_bonus = _gear_mods(obj) if "gear" in dirty else cache["gear"]
+    buff_bonus = _buff_mods(obj) if "buffs" in dirty else cache["buffs"]
 
     # cache base stat values on first run so repeated refreshes don't
     # continue stacking static bonuses like race or class modifiers
     if not hasattr(obj.db, "base_primary_stats") or not isinstance(
-        obj.db.base_primary_stats, dict
+        obj.db.base_primary_stats, Mapping
     ):
-        obj.db.base_primary_stats = {}
+        base_stats = {}
         for key in PRIMARY_STATS:
             trait = trait_get(key)
             base = trait.base if trait else 0
@@ -380,66 +464,20 @@ def refresh_stats(obj) -> None:
             candidate = base - gear_bonus.get(key, 0) - buff_bonus.get(key, 0)
             if candidate < 0:
                 candidate = base
-            obj.db.base_primary_stats[key] = candidate
+            base_stats[key] = candidate
+        obj.db.base_primary_stats = base_stats
+    base_stats = obj.db.base_primary_stats
 
     primary_totals: Dict[str, int] = {}
     for key in PRIMARY_STATS:
-        base = obj.db.base_primary_stats.get(key, 0)
-        total = base
+        total = base_stats.get(key, 0)
         total += gear_bonus.get(key, 0)
         total += buff_bonus.get(key, 0)
-
-        cap_map = {
-            "STR": MAX_STR,
-            "CON": MAX_CON,
-            "DEX": MAX_DEX,
-            "INT": MAX_INT,
-            "WIS": MAX_WIS,
-            "LUCK": MAX_LUCK,
-        }
-        if key in cap_map:
-            total = min(total, cap_map[key])
-
-        trait = trait_get(key)
-        if trait:
-            trait.base = total
-        else:
-            trait_add(key, key, base=total)
+        if key in _PRIMARY_CAPS:
+            total = min(total, _PRIMARY_CAPS[key])
+        _set_trait_base(trait_get, trait_add, key, total)
         primary_totals[key] = total
 
-    derived: Dict[str, int] = {}
-    for dkey, mapping in STAT_SCALING.items():
-        value = 0
-        for pkey, weight in mapping.items():
-            value += primary_totals.get(pkey, 0) * weight
-        value += gear_bonus.get(dkey, 0)
-        value += buff_bonus.get(dkey, 0)
-        result = int(round(value))
-        derived[dkey] = result
-
-    # compute hit chance using primary totals
-    hc_bonus = gear_bonus.get("hit_chance", 0) + buff_bonus.get("hit_chance", 0)
-    derived["hit_chance"] = int(
-        max(
-            5,
-            min(
-                95,
-                round(
-                    50
-                    + primary_totals.get("DEX", 0) * 0.15
-                    + max(
-                        primary_totals.get("STR", 0),
-                        primary_totals.get("INT", 0),
-                        primary_totals.get("WIS", 0),
-                    )
-                    * 0.10
-                    + primary_totals.get("LUCK", 0) * 0.05
-                    + hc_bonus
-                ),
-            ),
-        )
-    )
-
     # perception scales off primary stats but keeps its base value
     perception_trait = trait_get("perception")
     if perception_trait:
@@ -449,48 +487,77 @@ def refresh_stats(obj) -> None:
             obj.db.base_perception = base_per
     else:
         base_per = 0
-    per_bonus = (
-        primary_totals.get("WIS", 0) * 0.3
-        + primary_totals.get("INT", 0) * 0.3
-        + primary_totals.get("LUCK", 0) * 0.2
-    )
-    per_bonus += gear_bonus.get("perception", 0)
-    per_bonus += buff_bonus.get("perception", 0)
-    derived["perception"] = int(round(base_per + per_bonus))
+
+    all_keys = set(STAT_SCALING) | {"perception"}
+    computed = cache.get("computed")
+    if computed is None:
+        affected = all_keys
+        computed = {}
+    else:
+        computed = dict(computed)
+        affected = set()
+        for pkey in _changed_keys(cache["primary"], primary_totals):
+            affected |= _DEPENDENTS.get(pkey, set())
+        affected |= _changed_keys(cache["gear"], gear_bonus)
+        affected |= _changed_keys(cache["buffs"], buff_bonus)
+        if base_per != cache.get("base_per"):
+            affected.add("perception")
+        affected &= all_keys
+
+    for dkey in affected:
+        computed[dkey] = _derive_value(
+            dkey, primary_totals, gear_bonus, buff_bonus, base_per
+        )
 
     overrides = getattr(obj.db, "stat_overrides", {}) or {}
+    derived = dict(computed)
     for key, val in overrides.items():
         derived[key] = val
 
-    obj.db.derived_stats = derived
-    obj.db.primary_stats = primary_totals
+    old_overrides = cache.get("overrides")
+    if old_overrides is None:
+        write_keys = set(derived)
+    else:
+        write_keys = affected | _changed_keys(old_overrides, overrides)
+
+    if obj.db.derived_stats != derived:
+        obj.db.derived_stats = derived
+    if obj.db.primary_stats != primary_totals:
+        obj.db.primary_stats = primary_totals
 
     # update resource traits
-    if hp := trait_get("health"):
-        hp.base = derived.get("HP", hp.base)
-        if hp.current > hp.max:
-            hp.current = hp.max
-    if mp := trait_get("mana"):
-        mp.base = derived.get("MP", mp.base)
-        if mp.current > mp.max:
-            mp.current = mp.max
-    if sp := trait_get("stamina"):
-        sp.base = derived.get("SP", sp.base)
-        if sp.current > sp.max:
-            sp.current = sp.max
+    for res_key, dkey in (("health", "HP"), ("mana", "MP"), ("stamina", "SP")):
+        if dkey not in write_keys:
+            continue
+        if trait := trait_get(res_key):
+            value = derived.get(dkey, trait.base)
+            if trait.base != value:
+                trait.base = value
+            if trait.current > trait.max:
+                trait.current = trait.max
 
     # update or add other derived traits
-    for key, val in derived.items():
-        if key in ("HP", "MP", "SP"):
+    for key in write_keys:
+        if key in ("HP", "MP", "SP") or key not in derived:
             continue
-        trait = trait_get(key)
-        if trait:
-            trait.base = val
-        else:
-            trait_add(key, key, base=val)
+        _set_trait_base(trait_get, trait_add, key, derived[key])
+
+    _set_stat_cache(
+        obj,
+        {
+            "gear": gear_bonus,
+            "buffs": buff_bonus,
+            "primary": primary_totals,
+            "computed": computed,
+            "overrides": dict(overrides),
+            "base_per": base_per,
+        },
+    )
 
     if trait_get("STR"):
-        obj.db.carry_capacity = get_effective_stat(obj, "STR") * 20
+        capacity = get_effective_stat(obj, "STR") * 20
+        if obj.db.carry_capacity != capacity:
+            obj.db.carry_capacity = capacity
 
 
 def get_effective_stat(obj, key: str) -> int:
@@ -499,6 +566,10 @@ def get_effective_stat(obj, key: str) -> int:
     Gracefully handles objects without the trait system by
     falling back to ``0`` for missing values.
     """
+    snap = stat_snapshot.get_snapshot(obj)
+    if snap and key in snap.base:
+        return snap.base[key]
+
     base = 0
     traits = getattr(obj, "traits", None)
     trait_get = getattr(traits, "get", None)
@@ -514,8 +585,8 @@ def get_effective_stat(obj, key: str) -> int:
             pass
     elif hasattr(obj, "attributes"):
         base += obj.attributes.get(f"{key}_bonus", default=0)
+    # effect modifiers are already part of the traits written by refresh_stats
     base += state_manager.get_temp_bonus(obj, key)
-    base += state_manager.get_effect_mods(obj).get(key, 0)
     return int(base)
 
 
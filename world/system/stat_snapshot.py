@@ -0,0 +1,165 @@
+# Per-round stat snapshots used by combat resolution
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional
+
+from evennia.utils.logger import log_trace
+
+from world import stats
+from world.system import item_mods
+
+#: Stat keys precomputed for every snapshot.
+SNAPSHOT_KEYS = frozenset(stat.key for stat in stats.ALL_STATS)
+
+
+@dataclass(frozen=True)
+class StatSnapshot:
+    """Immutable view of an actor's stats at the start of a combat round.
+
+    ``effective`` mirrors :func:`state_manager.get_effective_stat` (which also
+    counts worn clothing bonuses) while ``base`` mirrors
+    :func:`stat_manager.get_effective_stat`.
+    """
+
+    effective: Mapping[str, int]
+    base: Mapping[str, int]
+
+
+# snapshots and participating actors, keyed by ``id(actor)``
+_SNAPSHOTS: Dict[int, StatSnapshot] = {}
+_ACTIVE: Dict[int, object] = {}
+
+
+def _bonus_attributes(obj) -> Dict[str, int]:
+    """Return all ``<stat>_bonus`` attributes stored on ``obj``.
+
+    Attribute keys are case-insensitive, so the result is keyed by the
+    lowercased stat name.
+    """
+
+    bonuses: Dict[str, int] = {}
+    handler = getattr(obj, "attributes", None)
+    if handler is not None and hasattr(handler, "all"):
+        for attr in handler.all():
+            key = getattr(attr, "key", "")
+            if getattr(attr, "category", None) or not key.endswith("_bonus"):
+                continue
+            try:
+                bonuses[key[: -len("_bonus")].lower()] = int(attr.value or 0)
+            except (TypeError, ValueError):
+                continue
+        return bonuses
+
+    getter = getattr(getattr(obj, "db", None), "get", None)
+    if callable(getter):
+        for key in SNAPSHOT_KEYS:
+            try:
+                val = getter(f"{key}_bonus", 0)
+            except Exception:
+                val = 0
+            if val:
+                bonuses[key.lower()] = val
+    return bonuses
+
+
+def _worn_bonuses(obj) -> Dict[str, int]:
+    """Return summed ``<stat>_bonus`` attributes from worn clothing."""
+
+    totals: Dict[str, int] = {}
+    try:
+        from evennia.contrib.game_systems.clothing.clothing import get_worn_clothes
+
+        worn = get_worn_clothes(obj)
+    except Exception:  # pragma: no cover - clothing contrib may not be loaded
+        return totals
+    for item in worn:
+        for key, val in item_mods.get_item_mods(item).bonuses.items():
+            totals[key] = totals.get(key, 0) + val
+    return totals
+
+
+def build_snapshot(obj) -> Optional[StatSnapshot]:
+    """Read every stat input for ``obj`` once and return a snapshot."""
+
+    from world.system import state_manager
+
+    traits = getattr(obj, "traits", None)
+    trait_get = getattr(traits, "get", None)
+    if not callable(trait_get):
+        return None
+
+    own = _bonus_attributes(obj)
+    worn = _worn_bonuses(obj)
+    temp = {
+        key: sum(entry.get("amount", 0) for entry in entries)
+        for key, entries in state_manager._get_bonus_dict(obj).items()
+    }
+
+    base: Dict[str, int] = {}
+    effective: Dict[str, int] = {}
+    for key in SNAPSHOT_KEYS.union(temp):
+        trait = trait_get(key)
+        value = trait.value if trait else 0
+        value += own.get(key.lower(), 0)
+        extra = temp.get(key, 0)
+        base[key] = int(value + extra)
+        effective[key] = value + worn.get(key.lower(), 0) + extra
+
+    return StatSnapshot(
+        effective=MappingProxyType(effective), base=MappingProxyType(base)
+    )
+
+
+def _try_build(obj) -> Optional[StatSnapshot]:
+    try:
+        return build_snapshot(obj)
+    except Exception as err:  # pragma: no cover - fall back to live reads
+        log_trace(f"Could not snapshot stats for {obj}: {err}")
+        return None
+
+
+def take_snapshots(actors: Iterable[object]) -> None:
+    """Snapshot ``actors`` for the round about to be resolved."""
+
+    for actor in actors:
+        _ACTIVE[id(actor)] = actor
+        snap = _try_build(actor)
+        if snap is None:
+            _SNAPSHOTS.pop(id(actor), None)
+        else:
+            _SNAPSHOTS[id(actor)] = snap
+
+
+def release_snapshots(actors: Iterable[object]) -> None:
+    """Drop snapshots for ``actors`` once their round is over."""
+
+    for actor in actors:
+        if _ACTIVE.get(id(actor)) is actor:
+            del _ACTIVE[id(actor)]
+        _SNAPSHOTS.pop(id(actor), None)
+
+
+def invalidate(obj) -> None:
+    """Discard the snapshot for ``obj`` after its effects, gear or traits change.
+
+    Actors still taking part in a round are re-snapshotted on next access.
+    """
+
+    _SNAPSHOTS.pop(id(obj), None)
+
+
+def get_snapshot(obj) -> Optional[StatSnapshot]:
+    """Return the current round snapshot for ``obj`` if it has one."""
+
+    key = id(obj)
+    if _ACTIVE.get(key) is not obj:
+        return None
+    snap = _SNAPSHOTS.get(key)
+    if snap is None:
+        snap = _try_build(obj)
+        if snap is not None:
+            _SNAPSHOTS[key] = snap
+    return snap
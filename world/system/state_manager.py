@@ -1,10 +1,11 @@
 # State manager for temporary effects and cooldowns
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 from world import stats
-from world.system import stat_manager
+from world.system import effect_timers, stat_manager, stat_snapshot
 from world.effects import EFFECTS
 from django.conf import settings
+from evennia.utils import logger
 from .constants import MAX_SATED, MAX_LEVEL
 
 
@@ -61,12 +62,14 @@ def add_temp_stat_bonus(
         effect_key: Optional identifier for the effect providing this bonus.
     """
 
+    _catch_up(chara)
     bonuses = _get_bonus_dict(chara)
     bonuses.setdefault(stat, []).append(
         {"amount": amount, "duration": duration, "key": effect_key}
     )
     _save_bonus_dict(chara, bonuses)
-    stat_manager.refresh_stats(chara)
+    stat_manager.refresh_stats(chara, changed=())
+    schedule_timers(chara)
 
 
 def remove_temp_stat_bonus(chara, stat: str, effect_key: str | None = None):
@@ -76,6 +79,7 @@ def remove_temp_stat_bonus(chara, stat: str, effect_key: str | None = None):
     removed. Otherwise all bonuses for the stat are cleared.
     """
 
+    _catch_up(chara)
     bonuses = _get_bonus_dict(chara)
     if stat not in bonuses:
         return
@@ -89,24 +93,29 @@ def remove_temp_stat_bonus(chara, stat: str, effect_key: str | None = None):
         if not bonuses[stat]:
             del bonuses[stat]
     _save_bonus_dict(chara, bonuses)
-    stat_manager.refresh_stats(chara)
+    stat_manager.refresh_stats(chara, changed=())
+    schedule_timers(chara)
 
 
 def add_status_effect(chara, status: str, duration: int):
     """Add a status effect tag lasting ``duration`` ticks."""
+    _catch_up(chara)
     statuses = _get_status_dict(chara)
     statuses[status] = duration
     chara.tags.add(status, category="status")
     _save_status_dict(chara, statuses)
+    schedule_timers(chara)
 
 
 def remove_status_effect(chara, status: str):
     """Remove ``status`` from ``chara``."""
+    _catch_up(chara)
     statuses = _get_status_dict(chara)
     if status in statuses:
         del statuses[status]
         chara.tags.remove(status, category="status")
         _save_status_dict(chara, statuses)
+        schedule_timers(chara)
 
 
 def has_status(chara, status: str) -> bool:
@@ -145,6 +154,7 @@ def remove_cooldown(chara, key: str):
 
 def add_effect(chara, key: str, duration: int):
     """Add an active effect with a duration."""
+    _catch_up(chara)
     effects = _get_effect_dict(chara)
     effects[key] = duration
     _save_effect_dict(chara, effects)
@@ -153,18 +163,21 @@ def add_effect(chara, key: str, duration: int):
         chara.tags.add(key, category="buff")
     else:
         chara.tags.add(key, category="status")
-    stat_manager.refresh_stats(chara)
+    stat_manager.refresh_stats(chara, changed=("buffs",))
+    schedule_timers(chara)
 
 
 def remove_effect(chara, key: str):
     """Remove an active effect from ``chara``."""
+    _catch_up(chara)
     effects = _get_effect_dict(chara)
     if key in effects:
         del effects[key]
         _save_effect_dict(chara, effects)
         chara.tags.remove(key, category="buff")
         chara.tags.remove(key, category="status")
-        stat_manager.refresh_stats(chara)
+        stat_manager.refresh_stats(chara, changed=("buffs",))
+        schedule_timers(chara)
 
 
 def get_effect_mods(chara) -> Dict[str, int]:
@@ -191,9 +204,13 @@ def get_effective_stat(chara, stat: str) -> int:
     if not hasattr(chara, "traits"):
         return 0
 
+    snap = stat_snapshot.get_snapshot(chara)
+    if snap and stat in snap.effective:
+        return snap.effective[stat]
+
+    # effect modifiers are already part of the traits written by refresh_stats
     base = stats.sum_bonus(chara, stat)
     base += get_temp_bonus(chara, stat)
-    base += get_effect_mods(chara).get(stat, 0)
     return base
 
 
@@ -247,14 +264,14 @@ def apply_regen(chara):
     return healed
 
 
-def tick_character(chara):
-    """Advance effect timers on ``chara`` and expire as needed."""
+def tick_character(chara, ticks: int = 1):
+    """Advance effect timers on ``chara`` by ``ticks`` and expire as needed."""
     bonuses = _get_bonus_dict(chara)
     changed = False
     for stat, entries in list(bonuses.items()):
         for entry in list(entries):
             # duration counts down while preserving the effect key
-            entry["duration"] -= 1
+            entry["duration"] -= ticks
             if entry["duration"] <= 0:
                 entries.remove(entry)
                 changed = True
@@ -263,12 +280,12 @@ def tick_character(chara):
             changed = True
     if changed:
         _save_bonus_dict(chara, bonuses)
-        stat_manager.refresh_stats(chara)
+        stat_manager.refresh_stats(chara, changed=())
 
     effects = _get_effect_dict(chara)
     effect_changed = False
     for key, dur in list(effects.items()):
-        dur -= 1
+        dur -= ticks
         if dur <= 0:
             del effects[key]
             chara.tags.remove(key, category="buff")
@@ -278,12 +295,12 @@ def tick_character(chara):
             effects[key] = dur
     if effect_changed:
         _save_effect_dict(chara, effects)
-        stat_manager.refresh_stats(chara)
+        stat_manager.refresh_stats(chara, changed=("buffs",))
 
     statuses = _get_status_dict(chara)
     status_changed = False
     for status, dur in list(statuses.items()):
-        dur -= 1
+        dur -= ticks
         if dur <= 0:
             del statuses[status]
             chara.tags.remove(status, category="status")
@@ -292,15 +309,15 @@ def tick_character(chara):
             statuses[status] = dur
     if status_changed:
         _save_status_dict(chara, statuses)
-        stat_manager.refresh_stats(chara)
+        stat_manager.refresh_stats(chara, changed=("buffs",))
 
     # Hunger and thirst is ignored for max-level characters
     if hasattr(chara.db, "sated") and (chara.db.level or 1) < MAX_LEVEL:
         sated = min(chara.db.sated or 0, MAX_SATED)
-        if sated > 0:
-            chara.db.sated = sated - 1
-        if chara.db.sated <= 0:
-            chara.db.sated = 0
+        # every tick spent at zero drains resources
+        drains = ticks - sated + 1 if sated > 0 else ticks
+        chara.db.sated = max(sated - ticks, 0)
+        if drains > 0:
             add_effect(chara, "hungry_thirsty", 1)
             drain_pct = 5  # percent of each resource to lose
             for key in ("health", "mana", "stamina"):
@@ -308,15 +325,93 @@ def tick_character(chara):
                     continue
                 max_val = trait.max or trait.current
                 loss = max(1, int(round(max_val * drain_pct / 100)))
-                trait.current = max(trait.current - loss, 0)
+                trait.current = max(trait.current - loss * drains, 0)
+
+
+def next_timer_delay(chara) -> Optional[int]:
+    """Return ticks until ``chara`` next has a timer expire, or None."""
+
+    delays = [
+        entry.get("duration", 0)
+        for entries in _get_bonus_dict(chara).values()
+        for entry in entries
+    ]
+    delays.extend(_get_effect_dict(chara).values())
+    delays.extend(_get_status_dict(chara).values())
+    if hasattr(chara.db, "sated") and (chara.db.level or 1) < MAX_LEVEL:
+        sated = min(chara.db.sated or 0, MAX_SATED)
+        delays.append(sated if sated > 0 else 1)
+    if not delays:
+        return None
+    return max(1, min(int(d) for d in delays))
+
+
+def _catch_up(chara) -> None:
+    """Apply the ticks that passed since ``chara`` was last synced."""
+
+    now = effect_timers.current_tick()
+    last = chara.db.timer_tick
+    if last == now:
+        return
+    # mark first so nested mutators triggered below don't catch up again
+    chara.db.timer_tick = now
+    if isinstance(last, int) and now > last:
+        tick_character(chara, now - last)
+
+
+def schedule_timers(chara) -> None:
+    """Queue ``chara`` to wake when its next timer expires."""
+
+    effect_timers.schedule(chara, next_timer_delay(chara))
+
+
+def sync_timers(chara) -> None:
+    """Bring ``chara``'s timers up to date and reschedule its next wake-up.
+
+    Timers only advance when a character is woken, so call this before
+    reading or writing durations or ``sated`` directly.
+    """
+
+    _catch_up(chara)
+    schedule_timers(chara)
+
+
+def suspend_timers(chara) -> None:
+    """Stop waking ``chara``; elapsed ticks are applied on the next sync."""
+
+    effect_timers.unschedule(chara)
+
+
+def clear_timed_effects(chara) -> None:
+    """Remove every effect, status and temporary bonus from ``chara``.
+
+    Also stops waking ``chara`` and forgets its cached stats, so the next
+    refresh starts from the traits without any of them.
+    """
+
+    for key in list(_get_effect_dict(chara)) + list(_get_status_dict(chara)):
+        chara.tags.remove(key, category="buff")
+        chara.tags.remove(key, category="status")
+    for attr in ("active_effects", "status_effects", "temp_bonuses", "timer_tick"):
+        chara.attributes.remove(attr)
+    effect_timers.unschedule(chara)
+    stat_manager.clear_stat_cache(chara)
+    stat_snapshot.release_snapshots([chara])
+    stat_manager.refresh_stats(chara)
 
 
 def tick_all():
-    """Tick timers for all characters."""
-    from typeclasses.characters import Character
+    """Advance the global tick and wake characters whose timers are due.
 
-    for chara in Character.objects.all():
-        tick_character(chara)
+    Each queued character catches up on every tick missed since it was last
+    synced, so characters without expiring effects are never loaded.
+    """
+
+    for chara in effect_timers.advance():
+        try:
+            sync_timers(chara)
+        except Exception as err:  # pragma: no cover - keep waking others
+            logger.log_trace(f"Could not tick timers for {chara}: {err}")
 
 
 def check_level_up(chara) -> bool:
@@ -350,7 +445,7 @@ def check_level_up(chara) -> bool:
         chara.db.level = level
         chara.msg(f"You have reached |ylevel {level}|n!")
         chara.msg("You gain |C3 practice sessions|n and |C1 training point|n.")
-        stat_manager.refresh_stats(chara)
+        stat_manager.refresh_stats(chara, changed=())
 
     return leveled
 
@@ -370,7 +465,7 @@ def level_up(chara, excess: int = 0) -> None:
         chara.db.experience = (chara.db.experience or 0) - excess
     chara.msg(f"You have reached |ylevel {level}|n!")
     chara.msg("You gain |C3 practice sessions|n and |C1 training point|n.")
-    stat_manager.refresh_stats(chara)
+    stat_manager.refresh_stats(chara, changed=())
 
 
 def gain_xp(chara, amount: int, announce: bool = False) -> None:
@@ -0,0 +1,119 @@
+from unittest.mock import patch
+
+from evennia import create_object, create_script
+from evennia.scripts.models import ScriptDB
+from evennia.utils.test_resources import EvenniaTest
+
+from scripts.combat_ai import BaseCombatAI
+from scripts.guard_patrol import GuardPatrol
+from typeclasses.npcs import BaseNPC
+from utils import npc_pool
+from world.npc_handlers import ai_ticker
+
+
+class TestAITicker(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        ai_ticker.reset()
+        self.addCleanup(ai_ticker.reset)
+        patcher = patch("world.npc_handlers.ai_ticker.delay")
+        self.delay = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.clock = patch("world.npc_handlers.ai_ticker.time.monotonic", return_value=100.0)
+        self.now = self.clock.start()
+        self.addCleanup(self.clock.stop)
+        self.npcs = [
+            create_object(BaseNPC, key=f"guard{i}", location=self.room1) for i in range(20)
+        ]
+
+    def _run_until(self, seconds, interval=10):
+        self.now.return_value = 100.0 + seconds
+        with patch.object(GuardPatrol, "at_repeat", autospec=True) as mock_repeat:
+            ai_ticker._run(interval)
+        return [call.args[0].obj for call in mock_repeat.call_args_list]
+
+    def test_one_timer_per_interval(self):
+        for npc in self.npcs:
+            ai_ticker.subscribe(npc, GuardPatrol)
+        ai_ticker.subscribe(self.npcs[0], BaseCombatAI)
+        metrics = ai_ticker.get_metrics()
+        self.assertEqual(metrics["subscriptions"], 21)
+        self.assertEqual(metrics["buckets"], {10: 20, 5: 1})
+        self.assertEqual(metrics["timers"], 2)
+        self.assertEqual(self.delay.call_count, 2)
+
+    def test_phases_are_staggered(self):
+        for npc in self.npcs:
+            ai_ticker.subscribe(npc, GuardPatrol)
+        first = self._run_until(1)
+        self.assertEqual(len(first), 2)
+        self.assertEqual({npc.id % ai_ticker.PHASES for npc in first}, {0})
+        self.assertEqual(len(self._run_until(5)), 8)
+        # every NPC runs exactly once per interval
+        self.assertEqual(len(self._run_until(10)), 10)
+        self.assertEqual(ai_ticker.get_metrics()["calls"], 20)
+
+    def test_state_lives_in_memory(self):
+        behavior = ai_ticker.subscribe(self.npcs[0], GuardPatrol, state={"patrol": ["east", "west"]})
+        self.assertIs(ai_ticker.get_behavior(self.npcs[0].id, "guard_patrol"), behavior)
+        self.assertEqual(behavior.db.patrol, ["east", "west"])
+        self.assertEqual(behavior.db.index, 0)
+        self.assertFalse(behavior.db.skip_move_if_target)
+        behavior.move()
+        self.assertEqual(behavior.db.index, 1)
+        self.assertFalse(self.npcs[0].attributes.has("index"))
+
+    def test_resubscribe_replaces(self):
+        ai_ticker.subscribe(self.npcs[0], GuardPatrol)
+        ai_ticker.subscribe(self.npcs[0], GuardPatrol, interval=30)
+        self.assertEqual(ai_ticker.get_metrics()["buckets"], {30: 1})
+
+    def test_unsubscribe_and_delete(self):
+        ai_ticker.subscribe(self.npcs[0], GuardPatrol)
+        ai_ticker.subscribe(self.npcs[1], GuardPatrol)
+        self.assertEqual(ai_ticker.unsubscribe(self.npcs[0].id), 1)
+        self.npcs[1].delete()
+        metrics = ai_ticker.get_metrics()
+        self.assertEqual(metrics["subscriptions"], 0)
+        self.assertEqual(metrics["timers"], 0)
+
+    def test_dormant_npcs_are_skipped(self):
+        npc = self.npcs[0]
+        ai_ticker.subscribe(npc, GuardPatrol)
+        npc.location = None
+        npc.tags.add("guard", category=npc_pool.TAG_CATEGORY)
+        self.assertEqual(self._run_until(10), [])
+        self.assertEqual(ai_ticker.get_metrics()["skipped"], 1)
+
+    def test_flush_and_load(self):
+        behavior = ai_ticker.subscribe(self.npcs[0], GuardPatrol, interval=20)
+        behavior.db.patrol = ["east", "west"]
+        behavior.db.index = 1
+        ai_ticker.subscribe(self.npcs[1], BaseCombatAI)
+        self.assertEqual(ai_ticker.flush(), 2)
+        self.assertEqual(ai_ticker.load(), 2)
+        loaded = ai_ticker.get_behavior(self.npcs[0].id, "guard_patrol")
+        self.assertIsNot(loaded, behavior)
+        self.assertEqual(loaded.interval, 20)
+        self.assertEqual((loaded.db.patrol, loaded.db.index), (["east", "west"], 1))
+        self.assertEqual(ai_ticker.get_metrics()["buckets"], {20: 1, 5: 1})
+
+    def test_migrate_scripts(self):
+        npc = self.npcs[0]
+        script = create_script(
+            "typeclasses.scripts.Script", key="guard_patrol", obj=npc, interval=10, autostart=False
+        )
+        script.attributes.add("patrol", ["north", "south"])
+        script.attributes.add("index", 1)
+        # rows saved while the behavior was still a Script
+        ScriptDB.objects.filter(id=script.id).update(
+            db_typeclass_path="scripts.guard_patrol.GuardPatrol"
+        )
+        script.flush_from_cache(force=True)
+
+        self.assertEqual(ai_ticker.migrate_scripts(), 1)
+        self.assertFalse(ScriptDB.objects.filter(db_obj=npc).exists())
+        behavior = ai_ticker.get_behavior(npc.id, "guard_patrol")
+        self.assertEqual(behavior.db.patrol, ["north", "south"])
+        self.assertEqual(behavior.db.index, 1)
+        self.assertEqual(ai_ticker.get_metrics()["buckets"], {10: 1})
@@ -1,26 +1,120 @@
 from unittest import mock
 from evennia.utils.test_resources import EvenniaTest
+from world import areas
 from world.areas import Area, find_area_by_vnum, parse_area_identifier
 
-class TestFindAreaByVnum(EvenniaTest):
+
+def _registry(*entries):
+    """Patch the area files with ``entries``."""
+    areas.clear_area_cache()
+    data = [area.to_dict() for area in entries]
+    return mock.patch("world.areas._load_registry", return_value=(data, [None] * len(data)))
+
+
+class AreaRegistryTest(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(areas.clear_area_cache)
+
+
+class TestFindAreaByVnum(AreaRegistryTest):
     def test_lookup(self):
-        areas = [Area(key="zone", start=1, end=5), Area(key="dungeon", start=10, end=20)]
-        with mock.patch("world.areas.get_areas", return_value=areas):
+        with _registry(Area(key="zone", start=1, end=5), Area(key="dungeon", start=10, end=20)):
             assert find_area_by_vnum(3).key == "zone"
             assert find_area_by_vnum(15).key == "dungeon"
-            assert find_area_by_vnum(30) is None
+            with mock.patch("world.areas.load_all_prototypes", return_value={}):
+                assert find_area_by_vnum(30) is None
+
+    def test_overlapping_ranges_prefer_file_order(self):
+        with _registry(
+            Area(key="wide", start=1, end=100),
+            Area(key="inner", start=40, end=60),
+            Area(key="late", start=50, end=55),
+        ):
+            assert find_area_by_vnum(52).key == "wide"
+            assert find_area_by_vnum(100).key == "wide"
+
+        with _registry(
+            Area(key="inner", start=40, end=60),
+            Area(key="wide", start=1, end=100),
+        ):
+            assert find_area_by_vnum(45).key == "inner"
+            assert find_area_by_vnum(70).key == "wide"
+
+    def test_registry_is_read_once(self):
+        with _registry(Area(key="zone", start=1, end=5)) as mock_load:
+            for _ in range(3):
+                find_area_by_vnum(2)
+                areas.find_area("ZONE")
+        mock_load.assert_called_once()
+
+    def test_returned_areas_are_copies(self):
+        with _registry(Area(key="zone", start=1, end=5)):
+            area = find_area_by_vnum(2)
+            area.rooms.append(3)
+            assert areas.find_area("zone")[1].rooms == []
+
+
+class TestAreaIntervalIndex(AreaRegistryTest):
+    def test_overlaps_are_detected(self):
+        with _registry(
+            Area(key="wide", start=1, end=100),
+            Area(key="inner", start=40, end=60),
+            Area(key="apart", start=200, end=300),
+        ), mock.patch("world.areas.logger.log_warn") as mock_warn:
+            self.assertEqual(areas.get_overlaps(), [("wide", "inner")])
+            mock_warn.assert_called_once()
+            found = areas.find_overlapping_areas(55, 250)
+            self.assertEqual([a.key for a in found], ["wide", "inner", "apart"])
+            found = areas.find_overlapping_areas(101, 199)
+            self.assertEqual(found, [])
+            found = areas.find_overlapping_areas(1, 50, exclude="WIDE")
+            self.assertEqual([a.key for a in found], ["inner"])
+
+    def test_lookup_at_range_edges(self):
+        with _registry(
+            Area(key="low", start=1, end=10),
+            Area(key="high", start=11, end=20),
+        ), mock.patch("world.areas.load_all_prototypes", return_value={}):
+            self.assertIsNone(find_area_by_vnum(0))
+            self.assertEqual(find_area_by_vnum(10).key, "low")
+            self.assertEqual(find_area_by_vnum(11).key, "high")
+            self.assertEqual(find_area_by_vnum("20").key, "high")
+            self.assertIsNone(find_area_by_vnum(21))
+
+    def test_prototype_areas_come_from_reverse_map(self):
+        def _load(category):
+            if category == "room":
+                return {
+                    500: {"area": "ruins", "room_id": 500},
+                    501: {"area": "ruins", "room_id": 503},
+                }
+            return {7: {"area": "camp", "vnum": 7}}
+
+        with _registry(), mock.patch("world.areas.load_all_prototypes", side_effect=_load) as mock_load:
+            self.assertEqual(find_area_by_vnum(501).key, "ruins")
+            self.assertEqual(find_area_by_vnum(503).key, "ruins")
+            idx, area = areas.find_area("Ruins")
+            self.assertEqual((idx, area.start, area.end), (-1, 500, 503))
+            self.assertEqual(areas.find_area("camp")[1].rooms, [])
+            self.assertEqual(find_area_by_vnum(7).key, "camp")
+            self.assertIsNone(find_area_by_vnum(9))
+            self.assertEqual(areas.get_prototype_rooms("ruins"), {500, 503})
+        # both prototype categories were read once for every lookup above
+        self.assertEqual(mock_load.call_count, 2)
 
 
-class TestParseAreaIdentifier(EvenniaTest):
+class TestParseAreaIdentifier(AreaRegistryTest):
     def setUp(self):
-        self.areas = [Area(key="zone", start=1, end=5), Area(key="dungeon", start=10, end=20)]
+        super().setUp()
+        patcher = _registry(Area(key="zone", start=1, end=5), Area(key="dungeon", start=10, end=20))
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_by_name(self):
-        with mock.patch("world.areas.get_areas", return_value=self.areas):
-            area = parse_area_identifier("dungeon")
-            assert area.key == "dungeon"
+        area = parse_area_identifier("dungeon")
+        assert area.key == "dungeon"
 
     def test_by_index(self):
-        with mock.patch("world.areas.get_areas", return_value=self.areas):
-            area = parse_area_identifier("2")
-            assert area.key == "dungeon"
+        area = parse_area_identifier("2")
+        assert area.key == "dungeon"
@@ -1,23 +1,68 @@
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest import mock
+from evennia.utils import create
 from evennia.utils.test_resources import EvenniaTest
+from world import areas
 from world.area_reset import AreaReset
 from world.areas import Area
 
 class TestAreaReset(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        self.tmp = TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patcher = mock.patch("world.areas._BASE_PATH", Path(self.tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(areas.clear_area_cache)
+        areas.save_area(Area(key="town", start=1, end=10, reset_interval=2))
+        self.path = Path(self.tmp.name) / "town.json"
+
+    def _stored_age(self):
+        with self.path.open() as f:
+            return json.load(f)["age"]
+
     def test_age_increment_and_reset(self):
-        area = Area(key="town", start=1, end=10, reset_interval=2)
-        areas = [area]
-        with mock.patch("world.area_reset.get_areas", return_value=areas), \
-             mock.patch("world.area_reset.update_area") as mock_update, \
-             mock.patch("world.area_reset.ScriptDB") as mock_sdb:
-            mock_script = mock.MagicMock()
-            mock_sdb.objects.filter.return_value.first.return_value = mock_script
-            script = AreaReset()
-            script.at_script_creation()
+        script = create.create_script(AreaReset, autostart=False)
+        with mock.patch("world.area_reset.respawn_area") as mock_respawn:
+            script.at_repeat()
+            self.assertEqual(areas.find_area("town")[1].age, 1)
+            mock_respawn.assert_not_called()
+            script.at_repeat()
+        self.assertEqual(areas.find_area("town")[1].age, 0)
+        mock_respawn.assert_called_once_with("town")
+
+    def test_ticks_do_not_write_until_flush(self):
+        script = create.create_script(AreaReset, autostart=False)
+        writes = areas.get_registry_metrics()["writes"]
+        with mock.patch("world.area_reset.respawn_area"), mock.patch.object(
+            AreaReset, "flush_ticks", 3
+        ):
+            script.at_repeat()
             script.at_repeat()
-            self.assertEqual(area.age, 1)
+            self.assertEqual(areas.get_registry_metrics()["writes"], writes)
+            self.assertEqual(self._stored_age(), 0)
+            self.assertEqual(areas.get_registry_metrics()["dirty"], 1)
             script.at_repeat()
-            self.assertEqual(area.age, 0)
-            self.assertTrue(mock_update.called)
-            self.assertTrue(mock_script.force_respawn.called)
+        self.assertEqual(areas.get_registry_metrics()["writes"], writes + 1)
+        self.assertEqual(areas.get_registry_metrics()["dirty"], 0)
+        self.assertEqual(self._stored_age(), 1)
+
+    def test_shutdown_flushes_ages(self):
+        areas.tick_areas()
+        create.create_script(AreaReset, autostart=False).at_server_shutdown()
+        self.assertEqual(self._stored_age(), 1)
+
+    def test_stop_with_kwargs_flushes_ages(self):
+        areas.tick_areas()
+        create.create_script(AreaReset, autostart=False).at_stop(reason="shutdown")
+        self.assertEqual(self._stored_age(), 1)
 
+    def test_ages_survive_reload_of_changed_files(self):
+        areas.tick_areas()
+        areas.save_area(Area(key="city", start=20, end=30))
+        self.assertEqual(areas.find_area("town")[1].age, 1)
+        self.assertEqual(areas.flush_areas(), 1)
+        self.assertEqual(self._stored_age(), 1)
@@ -60,9 +60,7 @@ class TestCombatEngineMinimal(unittest.TestCase):
         engine = CombatEngine([attacker, defender], round_time=0)
         engine.queue_action(defender, NoOpAction(defender))
         engine.queue_action(attacker, DamageAction(attacker, defender))
-        with patch("world.system.state_manager.apply_regen"), patch(
-            "combat.damage_processor.delay"
-        ), patch("random.randint", return_value=0):
+        with patch("world.system.state_manager.apply_regen"), patch("random.randint", return_value=0):
             engine.start_round()
             engine.process_round()
         self.assertEqual(defender.hp, 5)
@@ -75,9 +73,7 @@ class TestCombatEngineMinimal(unittest.TestCase):
         engine = CombatEngine([attacker, defender], round_time=0)
         engine.queue_action(defender, NoOpAction(defender))
         engine.queue_action(attacker, KillAction(attacker, defender))
-        with patch("world.system.state_manager.apply_regen"), patch(
-            "combat.damage_processor.delay"
-        ), patch("random.randint", return_value=0):
+        with patch("world.system.state_manager.apply_regen"), patch("random.randint", return_value=0):
             engine.start_round()
             engine.process_round()
         participants = [p.actor for p in engine.participants]
@@ -91,9 +87,7 @@ class TestCombatEngineMinimal(unittest.TestCase):
         attacker.location = defender.location = room
         engine = CombatEngine([attacker, defender], round_time=0)
         engine.queue_action(attacker, DamageAction(attacker, defender))
-        with patch("world.system.state_manager.apply_regen"), patch(
-            "combat.damage_processor.delay"
-        ), patch("random.randint", return_value=0):
+        with patch("world.system.state_manager.apply_regen"), patch("random.randint", return_value=0):
             engine.start_round()
             engine.process_round()
 
@@ -124,9 +118,7 @@ class TestCombatEngineMinimal(unittest.TestCase):
         defender.engine = engine
         engine.queue_action(defender, NoOpAction(defender))
         engine.queue_action(attacker, KillAction(attacker, defender))
-        with patch("world.system.state_manager.apply_regen"), patch(
-            "combat.damage_processor.delay"
-        ), patch("random.randint", return_value=0), patch.object(
+        with patch("world.system.state_manager.apply_regen"), patch("random.randint", return_value=0), patch.object(
             engine, "award_experience"
         ) as mock_xp:
             engine.start_round()
@@ -155,9 +147,7 @@ class TestCombatEngineMinimal(unittest.TestCase):
         engine = CombatEngine([attacker, defender], round_time=0)
         engine.queue_action(defender, NoOpAction(defender))
         engine.queue_action(attacker, KillAction(attacker, defender))
-        with patch("world.system.state_manager.apply_regen"), patch(
-            "combat.damage_processor.delay"
-        ), patch("random.randint", return_value=0), patch(
+        with patch("world.system.state_manager.apply_regen"), patch("random.randint", return_value=0), patch(
             "world.mechanics.corpse_manager.make_corpse",
             side_effect=lambda victim, killer=None: MagicMock(contents=list(victim.loot)),
         ) as mock_make:
@@ -177,9 +167,7 @@ class TestCombatEngineMinimal(unittest.TestCase):
         engine = CombatEngine([attacker, defender], round_time=0)
         engine.queue_action(defender, NoOpAction(defender))
         engine.queue_action(attacker, KillAction(attacker, defender))
-        with patch("world.system.state_manager.apply_regen"), patch(
-            "combat.damage_processor.delay"
-        ), patch("random.randint", return_value=0):
+        with patch("world.system.state_manager.apply_regen"), patch("random.randint", return_value=0):
             engine.start_round()
             engine.process_round()
 
@@ -0,0 +1,97 @@
+from unittest.mock import MagicMock, patch
+
+from evennia.utils.test_resources import EvenniaTest
+
+from world.scripts.mob_db import PROTO_CATEGORY, get_mobdb
+
+
+class TestMobDB(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        self.mob_db = get_mobdb()
+
+    def _reload(self):
+        """Drop the in-memory state as a server restart would."""
+        self.mob_db.ndb.protos = None
+        self.mob_db.ndb.flush_timer = None
+
+    def test_records_are_stored_per_vnum(self):
+        self.mob_db.add_proto(5, {"key": "orc"})
+        self.mob_db.add_proto(6, {"key": "elf"})
+        self.assertEqual(self.mob_db.attributes.get("5", category=PROTO_CATEGORY)["key"], "orc")
+        self.assertFalse(self.mob_db.attributes.has("vnums"))
+
+        with patch.object(
+            self.mob_db.attributes, "batch_add", wraps=self.mob_db.attributes.batch_add
+        ) as mock_write:
+            self.mob_db.add_proto(6, {"key": "elf", "level": 2})
+        self.assertEqual([args[0] for args in mock_write.call_args[0]], ["6"])
+
+        self._reload()
+        self.assertEqual(self.mob_db.get_proto("5")["key"], "orc")
+        self.assertEqual(self.mob_db.get_proto(6)["level"], 2)
+        self.assertEqual(sorted(self.mob_db.all_protos()), [5, 6])
+
+        self.mob_db.delete_proto(5)
+        self._reload()
+        self.assertIsNone(self.mob_db.get_proto(5))
+
+    def test_get_proto_returns_copy(self):
+        self.mob_db.add_proto(5, {"key": "orc", "flags": ["aggressive"]})
+        proto = self.mob_db.get_proto(5)
+        proto["area"] = "midgaard"
+        proto["flags"].append("sentinel")
+        stored = self.mob_db.get_proto(5)
+        self.assertNotIn("area", stored)
+        self.assertEqual(stored["flags"], ["aggressive"])
+        self.assertEqual(
+            self.mob_db.attributes.get("5", category=PROTO_CATEGORY), stored
+        )
+
+    def test_has_proto_does_not_copy(self):
+        self.mob_db.add_proto(5, {"key": "orc"})
+        with patch("world.scripts.mob_db.copy.deepcopy") as mock_copy:
+            self.assertTrue(self.mob_db.has_proto(5))
+            self.assertTrue(self.mob_db.has_proto("5"))
+            self.assertFalse(self.mob_db.has_proto(6))
+        mock_copy.assert_not_called()
+
+    def test_spawn_counts_are_batched(self):
+        self.mob_db.add_proto(5, {"key": "orc"})
+        handle = MagicMock()
+        with patch("world.scripts.mob_db.delay", return_value=handle) as mock_delay, patch.object(
+            self.mob_db.attributes, "batch_add"
+        ) as mock_write:
+            for _ in range(3):
+                self.mob_db.increment_spawn_count(5)
+        mock_delay.assert_called_once_with(
+            self.mob_db.flush_interval, self.mob_db.flush_spawn_counts
+        )
+        mock_write.assert_not_called()
+        self.assertEqual(self.mob_db.get_proto(5)["spawn_count"], 3)
+
+        self.mob_db.flush_spawn_counts()
+        handle.cancel.assert_called_once()
+        self._reload()
+        self.assertEqual(self.mob_db.get_proto(5)["spawn_count"], 3)
+
+    def test_replace_keeps_counts_and_drops_stale(self):
+        self.mob_db.add_proto(5, {"key": "orc", "spawn_count": 4})
+        self.mob_db.add_proto(6, {"key": "elf"})
+        self.mob_db.replace_protos({5: {"key": "orc"}, 7: {"key": "troll"}})
+        self._reload()
+        self.assertEqual(self.mob_db.get_proto(5)["spawn_count"], 4)
+        self.assertIsNone(self.mob_db.get_proto(6))
+        self.assertEqual(self.mob_db.get_proto(7)["key"], "troll")
+
+    def test_legacy_dict_is_migrated(self):
+        self.mob_db.db.vnums = {5: {"key": "orc"}, "5": {"key": "orc"}}
+        self._reload()
+        self.assertEqual(self.mob_db.get_proto(5)["key"], "orc")
+        self.assertFalse(self.mob_db.attributes.has("vnums"))
+        self.assertEqual(self.mob_db.attributes.get("5", category=PROTO_CATEGORY)["key"], "orc")
+
+    def test_handle_is_cached(self):
+        with patch("world.scripts.mob_db.ScriptDB.objects.get_or_create") as mock_get:
+            self.assertIs(get_mobdb(), self.mob_db)
+        mock_get.assert_not_called()
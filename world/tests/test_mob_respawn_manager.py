@@ -43,8 +43,8 @@ class TestMobRespawnManager(EvenniaTest):
         with patch("scripts.mob_respawn_manager.MobRespawnTracker.process") as mock_proc:
             self.script.at_repeat()
 
-        tracker_zone = self.script.db.trackers["zone"]
-        tracker_other = self.script.db.trackers["other"]
+        tracker_zone = self.script.get_tracker("zone")
+        tracker_other = self.script.get_tracker("other")
         assert set(tracker_zone.rooms.keys()) == {1, 2}
         assert set(tracker_other.rooms.keys()) == {3}
         assert mock_proc.call_count == 2
@@ -76,6 +76,42 @@ class TestMobRespawnManager(EvenniaTest):
             mock_spawn.assert_called_once()
         assert new_npc.location == room
 
+    def test_deaths_queue_one_timer(self):
+        room = create_object(Room, key="R")
+        room.set_area("zone", 1)
+        self._spawn_entry(room, proto="5", rate=5, max_count=2)
+        with patch("scripts.respawn_queue.delay") as mock_delay, patch(
+            "scripts.mob_respawn_manager.time.time", return_value=10
+        ):
+            # same due time, so the heap falls back to the sequence number
+            self.script.record_death(5, room, npc_id=None)
+            self.script.record_death("5", room, npc_id=7)
+        mock_delay.assert_called_once()
+        self.assertEqual(
+            [item[:2] for item in self.script.db.respawn_queue], [[15, 1], [15, 2]]
+        )
+
+    def test_wandered_mob_is_topped_up(self):
+        room = create_object(Room, key="R")
+        room.set_area("zone", 1)
+        self._spawn_entry(room, rate=5)
+        npc = create_object(BaseNPC, key="goblin")
+        with patch.object(self.script, "_spawn", return_value=npc), patch(
+            "scripts.mob_respawn_manager.time.time", return_value=0
+        ):
+            self.script.force_respawn(room.db.room_id)
+        npc.location = self.room1
+
+        new_npc = create_object(BaseNPC, key="goblin")
+        with patch.object(self.script, "_spawn", return_value=new_npc) as mock_spawn:
+            with patch("scripts.mob_respawn_manager.time.time", return_value=3):
+                self.script.at_repeat()
+            mock_spawn.assert_not_called()
+            with patch("scripts.mob_respawn_manager.time.time", return_value=6):
+                self.script.at_repeat()
+            mock_spawn.assert_called_once()
+        self.assertEqual(self.script._live_count("goblin", room), 1)
+
     def test_npc_on_death_updates_tracker(self):
         room = create_object(Room, key="R")
         room.set_area("zone", 1)
@@ -85,6 +121,7 @@ class TestMobRespawnManager(EvenniaTest):
         with patch.object(self.script, "_spawn", return_value=npc):
             with patch("scripts.mob_respawn_manager.time.time", return_value=0):
                 self.script.force_respawn(room.db.room_id)
+        proto, npc_id = npc.db.prototype_key, npc.id
 
         with patch("world.mechanics.on_death_manager.handle_death", return_value=None), \
              patch("utils.script_utils.get_respawn_manager", return_value=self.script), \
@@ -92,8 +129,29 @@ class TestMobRespawnManager(EvenniaTest):
              patch("scripts.mob_respawn_manager.time.time", return_value=1):
             npc.on_death(self.char1)
 
-        mock_rec.assert_called_once_with(npc.db.prototype_key, room, npc_id=npc.id)
+        mock_rec.assert_called_once_with(proto, room, npc_id=npc_id)
         entry = room.db.spawn_entries[0]
         assert entry["active_mobs"] == []
-        assert entry["dead_mobs"][0]["id"] == npc.id
+        assert entry["dead_mobs"][0]["id"] == npc_id
+
+
+    def test_entry_index_follows_edits(self):
+        room = create_object(Room, key="R")
+        room.set_area("zone", 1)
+        self._spawn_entry(room, proto="goblin")
+        idx, entry = self.script._find_entry("goblin", room)
+        self.assertEqual((idx, entry["prototype"]), (0, "goblin"))
 
+        proto_data = {
+            "vnum": 1,
+            "area": "zone",
+            "spawns": [
+                {"prototype": "orc", "max_spawns": 1, "spawn_interval": 5},
+                {"prototype": "5", "max_spawns": 2, "spawn_interval": 5},
+            ],
+        }
+        self.script.register_room_spawn(proto_data)
+        self.assertEqual(self.script._find_entry("goblin", room), (None, None))
+        idx, entry = self.script._find_entry(5, room)
+        self.assertEqual((idx, entry["max_count"]), (1, 2))
+        self.assertEqual(self.script.ndb.entry_index[room.id], {"orc": 0, 5: 1})
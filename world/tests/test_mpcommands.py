@@ -1,7 +1,7 @@
 from unittest.mock import MagicMock, patch
 from evennia.utils.test_resources import EvenniaTest
 from evennia import create_object
-from world.mpcommands import execute_mpcommand
+from world.mpcommands import compile_mobprog, execute_mpcommand
 from typeclasses.npcs import BaseNPC
 
 
@@ -73,3 +73,25 @@ class TestMPCommands(EvenniaTest):
         execute_mpcommand(self.mob, script)
         self.room1.msg_contents.assert_called_once_with("yes")
 
+
+    def test_nested_conditionals_and_break(self):
+        self.room1.msg_contents = MagicMock()
+        script = (
+            "if mob.key == 'mob'; if False; echo a; else; echo b; break; echo c; endif; "
+            "echo d; endif; echo e"
+        )
+        execute_mpcommand(self.mob, script)
+        said = [call.args[0] for call in self.room1.msg_contents.call_args_list]
+        self.assertEqual(said, ["b", "d", "e"])
+
+    def test_return_only_on_taken_branch(self):
+        self.room1.msg_contents = MagicMock()
+        execute_mpcommand(self.mob, "if False\nreturn\nendif\necho go\nreturn\necho never")
+        self.room1.msg_contents.assert_called_once_with("go")
+
+    def test_programs_are_compiled_once(self):
+        script = "if True\necho yes\nendif"
+        self.assertIs(compile_mobprog(script), compile_mobprog(script))
+        with patch("world.mpcommands._parse") as mock_parse:
+            execute_mpcommand(self.mob, script)
+        mock_parse.assert_not_called()
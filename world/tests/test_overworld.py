@@ -0,0 +1,87 @@
+from unittest import mock
+
+from evennia import create_object
+from evennia.objects.objects import DefaultObject
+from evennia.utils.test_resources import EvenniaTest
+
+from world.maps import overworld
+from world.maps.overworld import GRID, MAP_KEY, MAP_STR, OverworldMapProvider, TileGrid
+
+
+def _rows():
+    rows = MAP_STR.split("\n")
+    rows.reverse()
+    return rows
+
+
+class TestTileGrid(EvenniaTest):
+    def test_matches_map_string(self):
+        provider = OverworldMapProvider()
+        rows = _rows()
+        for y, row in enumerate(rows):
+            for x, char in enumerate(row):
+                valid = provider.is_valid_coordinates(None, (x, y))
+                self.assertEqual(valid, char in MAP_KEY)
+                if valid:
+                    biome = MAP_KEY[char].get("biome")
+                    self.assertEqual(provider.get_location_name((x, y)), f"In the {biome}")
+
+    def test_out_of_bounds(self):
+        provider = OverworldMapProvider()
+        for coords in ((-1, 5), (5, -1), (1000, 5), (5, len(_rows()))):
+            self.assertFalse(provider.is_valid_coordinates(None, coords))
+
+    def test_minimap(self):
+        x, y = next(
+            (x, y) for y, row in enumerate(_rows()) for x, char in enumerate(row) if char == "O"
+        )
+        lines = GRID.minimaps[(x, y)].split("\n")
+        self.assertEqual(len(lines), 7)
+        self.assertEqual(lines[3].strip(), '""|g@|n""')
+
+    def test_edge_tiles_are_padded(self):
+        grid = TileGrid("\n%%\n", MAP_KEY)
+        lines = grid.minimaps[(0, 1)].split("\n")
+        self.assertEqual(lines[3], " " * 12 + "  |g@|n% " + " " * 12)
+
+    def test_prepare_room(self):
+        provider = OverworldMapProvider()
+        x, y = next(
+            (x, y) for y, row in enumerate(_rows()) for x, char in enumerate(row) if char == "^"
+        )
+        with mock.patch("world.maps.overworld.randint", return_value=1):
+            provider.at_prepare_room((x, y), self.char1, self.room1)
+        self.assertEqual(self.room1.ndb.active_desc, MAP_KEY["^"]["desc"])
+        self.assertEqual(self.room1.ndb.minimap, GRID.minimaps[(x, y)])
+
+
+class TestBiomePopulation(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        overworld.reset_population()
+        self.addCleanup(overworld.reset_population)
+
+    def _spawn(self, cap):
+        obj = create_object(DefaultObject, key="deer")
+        self.room1.wilderness = mock.Mock()
+        with mock.patch("world.maps.overworld.spawner.spawn", return_value=[obj]):
+            return OverworldMapProvider().spawn_resource(
+                self.room1, (1, 1), (("DOE_DEER", 1),), cap=cap, tag="forest", tag_cat="mob"
+            )
+
+    def test_counts_existing_objects_once(self):
+        self.obj1.tags.add("forest", category="mob")
+        self.assertEqual(overworld.biome_population("forest", "mob"), 1)
+        self.obj2.tags.add("forest", category="mob")
+        self.assertEqual(overworld.biome_population("forest", "mob"), 1)
+
+    def test_cap_tracks_spawns_and_deletes(self):
+        first = self._spawn(cap=2)
+        self.assertTrue(first.tags.has("forest", category="mob"))
+        self.assertIsNotNone(self._spawn(cap=2))
+        self.assertIsNone(self._spawn(cap=2))
+        self.assertEqual(overworld.biome_population("forest", "mob"), 2)
+
+        first.delete()
+        self.assertEqual(overworld.biome_population("forest", "mob"), 1)
+        self.assertIsNotNone(self._spawn(cap=2))
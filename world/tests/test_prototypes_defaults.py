@@ -40,3 +40,52 @@ class TestPrototypeDefaults(EvenniaTest):
         self.assertEqual(proto["race"], "human")
         self.assertEqual(proto["level"], 1)
         self.assertEqual(proto["damage"], 1)
+
+
+class TestNPCRegistryCache(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        self.tmp = TemporaryDirectory()
+        patcher = mock.patch.object(
+            settings, "PROTOTYPE_NPC_FILE", Path(self.tmp.name) / "npcs.json"
+        )
+        self.addCleanup(self.tmp.cleanup)
+        self.addCleanup(patcher.stop)
+        self.addCleanup(prototypes.clear_npc_registry_cache)
+        patcher.start()
+        prototypes.register_npc_prototype(
+            "orc",
+            {"key": "orc", "race": "orc", "roles": ["guard"], "tags": [["north", "zone"]]},
+        )
+        prototypes.register_npc_prototype("elf", {"key": "elf", "race": "elf", "tags": ["archer"]})
+
+    def test_registry_parsed_once(self):
+        loads = prototypes.get_npc_registry_metrics()["loads"]
+        with mock.patch.object(Path, "open") as mock_open:
+            for _ in range(100):
+                proto = prototypes.get_npc_prototype("orc")
+            prototypes.get_npc_prototypes()
+        mock_open.assert_not_called()
+        self.assertEqual(prototypes.get_npc_registry_metrics()["loads"], loads)
+        # every caller gets its own copy
+        proto["race"] = "troll"
+        self.assertEqual(prototypes.get_npc_prototype("orc")["race"], "orc")
+
+    def test_filters_use_indexes(self):
+        self.assertEqual(list(prototypes.get_npc_prototypes({"race": "orc"})), ["orc"])
+        self.assertEqual(list(prototypes.get_npc_prototypes({"role": "guard"})), ["orc"])
+        self.assertEqual(list(prototypes.get_npc_prototypes({"role": "base"})), ["elf"])
+        self.assertEqual(list(prototypes.get_npc_prototypes({"tag": "archer"})), ["elf"])
+        self.assertEqual(list(prototypes.get_npc_prototypes({"zone": "north"})), ["orc"])
+        self.assertEqual(
+            list(prototypes.get_npc_prototypes({"class": "base", "race": "elf"})), ["elf"]
+        )
+        self.assertEqual(prototypes.get_npc_prototypes({"race": "orc", "tag": "archer"}), {})
+
+    def test_file_changes_invalidate(self):
+        path = Path(settings.PROTOTYPE_NPC_FILE)
+        path.write_text(json.dumps({"troll": {"key": "troll"}}))
+        # the package re-exports the functions of the legacy module
+        with mock.patch.object(prototypes._legacy, "NPC_REGISTRY_TTL", 0):
+            self.assertEqual(list(prototypes.get_npc_prototypes()), ["troll"])
+            self.assertIsNone(prototypes.get_npc_prototype("orc"))
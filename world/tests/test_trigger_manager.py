@@ -1,5 +1,12 @@
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 import unittest
+from evennia import create_object
+from evennia.objects.models import ObjectDB
+from evennia.objects.objects import DefaultObject
+from evennia.utils.test_resources import EvenniaTest
+from utils.eval_utils import compile_expr
+from world import triggers
 from world.triggers import TriggerManager
 
 
@@ -62,5 +69,102 @@ class TestTriggerManager(unittest.TestCase):
         self.obj.execute_cmd.assert_not_called()
 
 
+class TestTriggerTables(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        triggers.clear_trigger_cache()
+        self.addCleanup(triggers.clear_trigger_cache)
+        self.obj = create_object(DefaultObject, key="statue", location=self.room1)
+        self.obj.db.triggers = {"greet_prog": [{"match": "HELLO", "response": "say hi"}]}
+
+    def _responses(self, event, **kwargs):
+        with patch.object(TriggerManager, "_execute") as mock_exec:
+            TriggerManager(self.obj, attr="triggers").check(event, **kwargs)
+        return [call.args[1] for call in mock_exec.call_args_list]
+
+    def test_table_is_compiled_once(self):
+        with patch.object(
+            TriggerManager, "_collect_triggers", wraps=TriggerManager(self.obj)._collect_triggers
+        ) as collect:
+            self.assertEqual(self._responses("on_enter", message="well hello"), ["hi"])
+            self.assertEqual(self._responses("on_enter", message="bye"), [])
+            self.assertEqual(self._responses("on_leave"), [])
+            self.assertEqual(self._responses("on_leave"), [])
+        self.assertEqual(collect.call_count, 2)
+
+    def test_writing_the_attribute_recompiles(self):
+        self.assertEqual(self._responses("on_enter", message="hello"), ["hi"])
+        self.obj.db.triggers["greet_prog"].append({"response": "say welcome"})
+        self.assertEqual(self._responses("on_enter", message="hello"), ["hi", "welcome"])
+        self.obj.db.triggers = {"on_enter": {"response": "bow"}}
+        self.assertEqual(self._responses("greet_prog"), [""])
+
+    def test_attribute_added_later(self):
+        obj = create_object(DefaultObject, key="bare", location=self.room1)
+        manager = TriggerManager(obj, attr="obj_triggers")
+        self.assertEqual(manager.prepared("on_look"), ())
+        obj.db.obj_triggers = {"on_look": [{"response": "say boo"}]}
+        self.assertEqual(len(TriggerManager(obj, attr="obj_triggers").prepared("on_look")), 1)
+
+    def test_conditions_are_parsed_once(self):
+        self.obj.db.triggers = {"on_speak": [{"conditions": "npc is not None", "response": "nod"}]}
+        compiled = compile_expr("npc is not None")
+        with patch.object(type(compiled), "__init__") as mock_init:
+            self.assertEqual(self._responses("on_speak"), [""])
+            self.assertEqual(self._responses("on_speak"), [""])
+        mock_init.assert_not_called()
+
+
+class TestTimeTriggerIndex(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        triggers.reset_time_index()
+        self.addCleanup(triggers.reset_time_index)
+        self.dawn = self._obj("rooster", {"hour_prog": [{"hour": 6, "response": "say crow"}]})
+        self.noon = self._obj("bell", {"hour": [{"hour": 12, "response": "say dong"}]})
+        self.clock = self._obj("clock", {"time": [{"time": "06:30", "response": "say tick"}]})
+        self.plain = self._obj("statue", {"on_enter": [{"response": "say hi"}]})
+
+    def _obj(self, key, trigs):
+        obj = create_object(DefaultObject, key=key, location=self.room1)
+        obj.db.triggers = trigs
+        return obj
+
+    def _run(self, func, hour, minute=0):
+        checked = []
+        real_check = TriggerManager.check
+
+        def _check(manager, event, **kwargs):
+            checked.append(manager.obj)
+            return real_check(manager, event, **kwargs)
+
+        with patch.object(TriggerManager, "check", _check), patch.object(
+            TriggerManager, "_execute"
+        ) as mock_exec:
+            func(datetime(2024, 1, 1, hour, minute))
+        return checked, [call.args[1] for call in mock_exec.call_args_list]
+
+    def test_only_due_objects_are_checked(self):
+        self.assertEqual(self._run(triggers.process_hour_triggers, 6), ([self.dawn], ["crow"]))
+        self.assertEqual(self._run(triggers.process_hour_triggers, 7), ([], []))
+        self.assertEqual(
+            self._run(triggers.process_time_triggers, 6, 30), ([self.clock], ["tick"])
+        )
+
+    def test_index_is_kept_up_to_date(self):
+        self._run(triggers.process_hour_triggers, 6)
+        with patch.object(ObjectDB.objects, "get_by_attribute") as mock_query:
+            self.noon.db.triggers = {"hour": [{"hour": 7, "response": "say early"}]}
+            self.plain.db.triggers["hour"] = [{"response": "say hourly"}]
+            late = self._obj("owl", {"hour": [{"hour": 7, "response": "say hoot"}]})
+            self.dawn.delete()
+
+            checked, said = self._run(triggers.process_hour_triggers, 7)
+            self.assertEqual(set(checked), {self.noon, self.plain, late})
+            self.assertEqual(sorted(said), ["early", "hoot", "hourly"])
+            self.assertEqual(self._run(triggers.process_hour_triggers, 12)[0], [self.plain])
+        mock_query.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
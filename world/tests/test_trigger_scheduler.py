@@ -0,0 +1,82 @@
+from unittest.mock import patch
+
+from evennia import create_object
+from evennia.objects.objects import DefaultObject
+from evennia.utils.test_resources import EvenniaTest
+
+from utils import npc_pool
+from world import trigger_scheduler
+from world.triggers import TriggerManager
+
+
+class TestTriggerScheduler(EvenniaTest):
+    def setUp(self):
+        super().setUp()
+        trigger_scheduler.reset()
+        self.addCleanup(trigger_scheduler.reset)
+        patcher = patch("world.trigger_scheduler.delay")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.clock = patch("world.trigger_scheduler.time.monotonic", return_value=100.0)
+        self.now = self.clock.start()
+        self.addCleanup(self.clock.stop)
+        self.obj = create_object(DefaultObject, key="bell", location=self.room1)
+        self.obj.db.triggers = {
+            "random": [{"interval": 2, "response": "say ding"}],
+            "rand_prog": [{"interval": 5, "response": "say dong"}],
+        }
+
+    def _run_until(self, seconds):
+        self.now.return_value = 100.0 + seconds
+        with patch.object(TriggerManager, "_execute") as mock_exec:
+            trigger_scheduler._run()
+        return [call.args[1] for call in mock_exec.call_args_list]
+
+    def test_registration_is_idempotent(self):
+        manager = TriggerManager(self.obj)
+        manager.start_random_triggers()
+        manager.start_random_triggers()
+        self.assertEqual(trigger_scheduler.get_metrics()["scheduled"], 2)
+
+    def test_triggers_fire_on_their_interval(self):
+        TriggerManager(self.obj).start_random_triggers()
+        self.assertEqual(self._run_until(1), [])
+        self.assertEqual(self._run_until(2), ["ding"])
+        self.assertEqual(self._run_until(4), ["ding"])
+        self.assertEqual(sorted(self._run_until(5)), ["dong"])
+        self.assertEqual(self._run_until(6), ["ding"])
+
+    def test_deleted_objects_are_dropped(self):
+        TriggerManager(self.obj).start_random_triggers()
+        obj_id = self.obj.id
+        self.obj.delete()
+        self.assertFalse(trigger_scheduler.is_scheduled(obj_id))
+
+    def test_dormant_objects_are_skipped(self):
+        TriggerManager(self.obj).start_random_triggers()
+        self.obj.location = None
+        self.obj.tags.add("bell", category=npc_pool.TAG_CATEGORY)
+        self.assertEqual(self._run_until(2), [])
+        self.assertTrue(trigger_scheduler.is_scheduled(self.obj.id))
+        self.assertEqual(trigger_scheduler.get_metrics()["skipped"], 1)
+
+    def test_room_triggers_fire(self):
+        self.room2.db.room_triggers = {"random": [{"interval": 2, "response": "say drip"}]}
+        TriggerManager(self.room2).start_random_triggers()
+        self.assertIsNone(self.room2.location)
+        self.assertEqual(self._run_until(2), ["drip"])
+        self.assertEqual(trigger_scheduler.get_metrics()["skipped"], 0)
+
+    def test_schedule_survives_reload(self):
+        TriggerManager(self.obj).start_random_triggers()
+        self._run_until(1)
+        self.assertEqual(trigger_scheduler.flush(), 2)
+        self.assertEqual(trigger_scheduler.load(), 2)
+        self.assertEqual(self._run_until(2), ["ding"])
+
+    def test_legacy_task_hands_over(self):
+        manager = TriggerManager(self.obj)
+        with patch.object(TriggerManager, "_execute") as mock_exec:
+            manager._run_random_trigger({"interval": 2, "response": "say ding"})
+        mock_exec.assert_called_once()
+        self.assertTrue(trigger_scheduler.is_scheduled(self.obj.id))
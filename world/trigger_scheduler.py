@@ -0,0 +1,226 @@
+# Timing wheel running the random triggers of every object
+
+from __future__ import annotations
+
+import time
+from typing import Dict, Iterable, List, Set, Tuple
+
+from evennia.objects.models import ObjectDB
+from evennia.server.models import ServerConfig
+from evennia.utils import delay, logger
+
+from utils import npc_pool
+from utils.object_signals import on_object_deleted
+
+#: ServerConfig key holding the saved schedule.
+CONFIG_KEY = "trigger_schedule"
+#: Slots in the wheel. Each slot covers one second; entries further ahead
+#: stay in their slot until the wheel comes round to their tick.
+WHEEL_SIZE = 256
+#: Ticks between writes of a changed schedule.
+FLUSH_TICKS = 60
+
+Entry = Tuple[int, str, int]
+
+# (object id, trigger attribute, interval) -> tick the entry is due on
+_DUE: Dict[Entry, int] = {}
+_SLOTS: List[Set[Entry]] = [set() for _ in range(WHEEL_SIZE)]
+_BY_OBJ: Dict[int, Set[Entry]] = {}
+_STATE = {
+    "tick": 0,
+    "origin": 0.0,
+    "handle": None,
+    "dirty": False,
+    "since_flush": 0,
+    "batches": 0,
+    "fired": 0,
+    "skipped": 0,
+}
+
+
+def _add(entry: Entry, due: int) -> None:
+    _DUE[entry] = due
+    _SLOTS[due % WHEEL_SIZE].add(entry)
+    _BY_OBJ.setdefault(entry[0], set()).add(entry)
+
+
+def _remove(entry: Entry) -> None:
+    due = _DUE.pop(entry, None)
+    if due is None:
+        return
+    _SLOTS[due % WHEEL_SIZE].discard(entry)
+    entries = _BY_OBJ.get(entry[0])
+    if entries is not None:
+        entries.discard(entry)
+        if not entries:
+            del _BY_OBJ[entry[0]]
+
+
+def schedule(obj, attr: str, intervals: Iterable[int]) -> None:
+    """Run the random triggers in ``attr`` of ``obj`` every interval.
+
+    ``intervals`` are the distinct intervals, in seconds, of the object's
+    random triggers. Entries already scheduled keep their phase, so calling
+    this again for the same object does not stack timers. Intervals no
+    longer listed for ``attr`` are dropped.
+    """
+
+    if not isinstance(getattr(obj, "id", None), int):
+        return
+    wanted = {(obj.id, attr, max(1, int(interval))) for interval in intervals}
+    current = {entry for entry in _BY_OBJ.get(obj.id, ()) if entry[1] == attr}
+    for entry in current - wanted:
+        _remove(entry)
+    for entry in wanted - current:
+        _add(entry, _STATE["tick"] + entry[2])
+    if current != wanted:
+        _STATE["dirty"] = True
+    _arm()
+
+
+def unschedule(obj_id: int) -> None:
+    """Drop every entry of the object with ``obj_id``."""
+
+    for entry in list(_BY_OBJ.get(obj_id, ())):
+        _remove(entry)
+        _STATE["dirty"] = True
+
+
+def is_scheduled(obj_id: int) -> bool:
+    """Return ``True`` if the object with ``obj_id`` has pending entries."""
+
+    return obj_id in _BY_OBJ
+
+
+def _arm() -> None:
+    if _STATE["handle"] is not None or not _DUE:
+        return
+    now = time.monotonic()
+    if not _STATE["origin"]:
+        _STATE["origin"] = now - _STATE["tick"]
+    wait = _STATE["origin"] + _STATE["tick"] + 1 - now
+    _STATE["handle"] = delay(max(wait, 0), _run)
+
+
+def _disarm() -> None:
+    handle = _STATE["handle"]
+    if handle is not None:
+        try:
+            handle.cancel()
+        except Exception:  # pragma: no cover - safety
+            pass
+    _STATE["handle"] = None
+
+
+def _advance() -> List[Entry]:
+    """Move the wheel on by one tick and return the entries now due."""
+
+    _STATE["tick"] += 1
+    tick = _STATE["tick"]
+    slot = _SLOTS[tick % WHEEL_SIZE]
+    due = [entry for entry in slot if _DUE[entry] <= tick]
+    for entry in due:
+        _remove(entry)
+    return due
+
+
+def _run() -> None:
+    """Fire every entry due since the last run in one batch."""
+
+    _STATE["handle"] = None
+    elapsed = int(time.monotonic() - _STATE["origin"])
+    batch: Dict[int, List[Entry]] = {}
+    while _STATE["tick"] < elapsed:
+        for entry in _advance():
+            batch.setdefault(entry[0], []).append(entry)
+        _STATE["since_flush"] += 1
+    if batch:
+        _fire(batch)
+        _STATE["batches"] += 1
+    if _STATE["dirty"] and _STATE["since_flush"] >= FLUSH_TICKS:
+        flush()
+    if _DUE:
+        _arm()
+    else:
+        _STATE["origin"] = 0.0
+
+
+def _fire(batch: Dict[int, List[Entry]]) -> None:
+    from world.triggers import TriggerManager
+
+    tick = _STATE["tick"]
+    for obj_id, entries in batch.items():
+        obj = ObjectDB.objects.get_id(obj_id)
+        if obj is None:
+            _STATE["dirty"] = True
+            continue
+        for entry in entries:
+            _add(entry, tick + entry[2])
+        # pooled NPCs keep their place but do nothing
+        if npc_pool.is_dormant(obj):
+            _STATE["skipped"] += len(entries)
+            continue
+        for _, attr, interval in entries:
+            try:
+                TriggerManager(obj, attr=attr).run_random_triggers(interval)
+            except Exception as err:  # pragma: no cover - log errors
+                logger.log_err(f"Random trigger error on {obj}: {err}")
+            _STATE["fired"] += 1
+
+
+def flush() -> int:
+    """Save the schedule to the database and return the number of entries.
+
+    Each entry is stored as ``(object id, attribute, interval, seconds
+    left)``.
+    """
+
+    tick = _STATE["tick"]
+    table = [(*entry, due - tick) for entry, due in _DUE.items()]
+    ServerConfig.objects.conf(CONFIG_KEY, value=table)
+    _STATE["dirty"] = False
+    _STATE["since_flush"] = 0
+    return len(table)
+
+
+def load() -> int:
+    """Replace the in-memory schedule with the saved one.
+
+    Returns the number of entries loaded.
+    """
+
+    reset()
+    table = ServerConfig.objects.conf(CONFIG_KEY, default=list) or []
+    for obj_id, attr, interval, remaining in table:
+        _add((obj_id, attr, interval), max(1, min(remaining, interval)))
+    _arm()
+    return len(_DUE)
+
+
+def get_metrics() -> Dict[str, int]:
+    """Return the schedule size and how many triggers ran or were skipped."""
+
+    return {
+        "scheduled": len(_DUE),
+        "objects": len(_BY_OBJ),
+        "tick": _STATE["tick"],
+        "batches": _STATE["batches"],
+        "fired": _STATE["fired"],
+        "skipped": _STATE["skipped"],
+    }
+
+
+def reset() -> None:
+    """Forget the in-memory schedule and stop the wheel."""
+
+    _disarm()
+    _DUE.clear()
+    _BY_OBJ.clear()
+    for slot in _SLOTS:
+        slot.clear()
+    _STATE.update(
+        tick=0, origin=0.0, dirty=False, since_flush=0, batches=0, fired=0, skipped=0
+    )
+
+
+on_object_deleted(unschedule)
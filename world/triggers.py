@@ -3,17 +3,110 @@
 from __future__ import annotations
 
 from importlib import import_module
+from collections.abc import Mapping
 from typing import Any, Iterable
 from random import randint
 
 from datetime import datetime
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from evennia.objects.models import ObjectDB
-from evennia.utils import make_iter, logger, delay, lazy_property
-from utils import eval_safe
+from evennia.typeclasses.attributes import Attribute
+from evennia.utils import make_iter, logger, lazy_property
+from utils.eval_utils import compile_expr
 from utils.mob_utils import mobprogs_to_triggers
+from utils.object_signals import on_object_deleted
+from world import trigger_scheduler
 from world.mpcommands import execute_mpcommand
 
 
+# compiled trigger tables by object id and trigger attribute; each table
+# maps an event to the prepared triggers answering it
+_TABLES: dict[int, dict[str, dict[str, tuple]]] = {}
+# id of each trigger attribute read into a table -> id of its object
+_ATTR_OWNERS: dict[int, int] = {}
+# event -> the event and its aliases
+_ALIAS_EVENTS: dict[str, tuple[str, ...]] = {}
+
+
+class PreparedTrigger:
+    """A trigger definition with its condition parsed and responses split."""
+
+    __slots__ = (
+        "condition",
+        "match",
+        "percent",
+        "combat",
+        "bribe",
+        "hp_pct",
+        "hour",
+        "time",
+        "interval",
+        "actions",
+        "disabled",
+    )
+
+    def __init__(self, trig: Mapping):
+        self.disabled = False
+        cond_expr = trig.get("conditions")
+        self.condition = compile_expr(cond_expr) if isinstance(cond_expr, str) else None
+
+        match = trig.get("match")
+        if not match:
+            self.match = ()
+        elif isinstance(match, str):
+            self.match = (match.lower(),)
+        else:
+            self.match = tuple(str(m).lower() for m in make_iter(match))
+
+        self.combat = trig.get("combat")
+        self.bribe = trig.get("bribe")
+        self.hour = trig.get("hour")
+        self.time = trig.get("time")
+        self.percent = self.hp_pct = None
+        try:
+            if (percent := trig.get("percent")) is not None:
+                self.percent = int(percent)
+            if (hp_pct := trig.get("hp_pct")) is not None:
+                self.hp_pct = float(hp_pct)
+            self.interval = max(1, int(trig.get("interval", 60)))
+        except (TypeError, ValueError) as err:
+            logger.log_err(f"Invalid trigger {dict(trig)}: {err}")
+            self.interval = 60
+            self.disabled = True
+
+        responses = (
+            trig.get("responses")
+            or trig.get("response")
+            or trig.get("reactions")
+            or trig.get("reaction")
+            or []
+        )
+        if isinstance(responses, Mapping):
+            responses = [responses]
+        actions = []
+        for react in make_iter(responses):
+            if isinstance(react, str):
+                if " " in react:
+                    action, arg = react.split(" ", 1)
+                else:
+                    action, arg = react, ""
+            elif isinstance(react, Mapping) and len(react) == 1:
+                action, arg = next(iter(react.items()))
+            else:
+                continue
+            actions.append((action.lower(), arg))
+        self.actions = tuple(actions)
+
+
+def clear_trigger_cache(obj_id: int | None = None) -> None:
+    """Discard the compiled trigger tables of ``obj_id`` (or of every object)."""
+    if obj_id is None:
+        _TABLES.clear()
+        _ATTR_OWNERS.clear()
+    else:
+        _TABLES.pop(obj_id, None)
+
+
 class TriggerMixin:
     """Mixin adding trigger support to a typeclass."""
 
@@ -61,6 +154,9 @@ class TriggerManager:
     provided kwargs. ``response`` may be a single command string or a list of
     commands. Each command is split into ``action`` and ``argument`` and
     executed by the handler.
+
+    The definitions of an object are prepared once per event and cached
+    until the trigger attribute is written.
     """
 
     ALIASES = {
@@ -145,20 +241,28 @@ class TriggerManager:
 
     # public ----------------------------------------------------------------
 
-    def _alias_events(self, event: str) -> list[str]:
-        """Return list of event and any aliases."""
-        events = [event]
-        if alias := self.ALIASES.get(event):
-            events.append(alias)
-        for key, val in self.ALIASES.items():
-            if val == event:
-                events.append(key)
-        return list(dict.fromkeys(events))
-
-    def _evaluate(self, trig: dict, **kwargs):
+    @classmethod
+    def _alias_events(cls, event: str) -> tuple[str, ...]:
+        """Return tuple of event and any aliases."""
+        events = _ALIAS_EVENTS.get(event)
+        if events is None:
+            found = [event]
+            if alias := cls.ALIASES.get(event):
+                found.append(alias)
+            for key, val in cls.ALIASES.items():
+                if val == event:
+                    found.append(key)
+            events = _ALIAS_EVENTS[event] = tuple(dict.fromkeys(found))
+        return events
+
+    def _evaluate(self, trig, **kwargs):
+        if not isinstance(trig, PreparedTrigger):
+            trig = PreparedTrigger(trig)
+        if trig.disabled:
+            return
+
         # evaluate optional conditions expression
-        cond_expr = trig.get("conditions")
-        if isinstance(cond_expr, str):
+        if trig.condition is not None:
             sandbox = {
                 "caller": kwargs.get("caller")
                 or kwargs.get("chara")
@@ -169,126 +273,263 @@ class TriggerManager:
                 "room": getattr(self.obj, "location", None),
             }
             sandbox.update(kwargs)
-            if not eval_safe(cond_expr, sandbox):
+            if not trig.condition(sandbox):
                 return
 
-        match = trig.get("match")
-        if match:
-            text = str(kwargs.get("message") or kwargs.get("text") or "")
-            if isinstance(match, (list, tuple)):
-                if not any(m.lower() in text.lower() for m in match):
-                    return
-            elif str(match).lower() not in text.lower():
+        if trig.match:
+            text = str(kwargs.get("message") or kwargs.get("text") or "").lower()
+            if not any(m in text for m in trig.match):
                 return
 
-        percent = trig.get("percent")
-        if percent is not None and randint(1, 100) > int(percent):
+        if trig.percent is not None and randint(1, 100) > trig.percent:
             return
 
-        combat = trig.get("combat")
+        combat = trig.combat
         if combat is not None and bool(getattr(self.obj, "in_combat", False)) != bool(combat):
             return
 
-        bribe = trig.get("bribe")
+        bribe = trig.bribe
         if bribe is not None and kwargs.get("amount", kwargs.get("bribe_amount", 0)) < bribe:
             return
 
-        hp_pct = trig.get("hp_pct")
-        if hp_pct is not None:
+        if trig.hp_pct is not None:
             try:
                 cur = self.obj.traits.health.value
                 maxhp = self.obj.traits.health.max or 1
-                if (cur / maxhp) * 100 > float(hp_pct):
+                if (cur / maxhp) * 100 > trig.hp_pct:
                     return
             except Exception:
                 return
 
-        hour = trig.get("hour")
-        if hour is not None and kwargs.get("hour") != hour:
+        if trig.hour is not None and kwargs.get("hour") != trig.hour:
             return
 
-        time_val = trig.get("time")
-        if time_val is not None and kwargs.get("time") != time_val:
+        if trig.time is not None and kwargs.get("time") != trig.time:
             return
 
-        responses = (
-            trig.get("responses")
-            or trig.get("response")
-            or trig.get("reactions")
-            or trig.get("reaction")
-            or []
-        )
-
-        for react in make_iter(responses):
-            if isinstance(react, str):
-                if " " in react:
-                    action, arg = react.split(" ", 1)
-                else:
-                    action, arg = react, ""
-            elif isinstance(react, dict) and len(react) == 1:
-                action, arg = next(iter(react.items()))
-            else:
-                continue
-            self._execute(action.lower(), arg, **kwargs)
+        for action, arg in trig.actions:
+            self._execute(action, arg, **kwargs)
 
     def _collect_triggers(self, events: Iterable[str]):
+        data = self._data
         for ev in events:
-            trigdata = self._data.get(ev)
+            trigdata = data.get(ev)
             if not trigdata:
                 continue
             if isinstance(trigdata, tuple):
                 yield {"match": trigdata[0], "response": trigdata[1]}
+            elif isinstance(trigdata, Mapping):
+                yield trigdata
             else:
                 for trig in make_iter(trigdata):
-                    if isinstance(trig, dict):
+                    # stored triggers come back as _SaverDicts
+                    if isinstance(trig, Mapping):
                         yield trig
 
+    def _table(self) -> dict:
+        """Return the compiled trigger table of the object."""
+        obj_id = getattr(self.obj, "id", None)
+        attributes = getattr(self.obj, "attributes", None)
+        if not isinstance(obj_id, int) or attributes is None:
+            return {}
+        tables = _TABLES.setdefault(obj_id, {})
+        table = tables.get(self.attr)
+        if table is None:
+            table = tables[self.attr] = {}
+            stored = attributes.get(self.attr, return_obj=True)
+            if stored is not None:
+                _ATTR_OWNERS[stored.id] = obj_id
+        return table
+
+    def prepared(self, event: str) -> tuple:
+        """Return the prepared triggers answering ``event`` (including aliases)."""
+        table = self._table()
+        trigs = table.get(event)
+        if trigs is None:
+            events = self._alias_events(event)
+            trigs = table[event] = tuple(
+                PreparedTrigger(trig) for trig in self._collect_triggers(events)
+            )
+        return trigs
+
     def check(self, event: str, **kwargs):
         """Evaluate triggers for ``event`` (including aliases)."""
-        events = self._alias_events(event)
-        trigs = list(self._collect_triggers(events))
+        trigs = self.prepared(event)
         if not trigs:
             return
         for trig in trigs:
             self._evaluate(trig, **kwargs)
 
     # random trigger helpers -------------------------------------------------
+    def run_random_triggers(self, interval: int):
+        """Evaluate the random triggers firing every ``interval`` seconds."""
+        for trig in self.prepared("random"):
+            if trig.interval == interval:
+                self._evaluate(trig)
+
     def _run_random_trigger(self, trig: dict):
+        """Run a random trigger queued as a persistent task by older versions.
+
+        The object is handed to the trigger scheduler instead of re-arming
+        the task.
+        """
         self._evaluate(trig)
-        interval = int(trig.get("interval", 60))
-        delay(interval, self._run_random_trigger, trig, persistent=True)
+        self.start_random_triggers()
 
     def start_random_triggers(self):
-        """Schedule callbacks for any random triggers."""
-        events = self._alias_events("random")
-        for trig in self._collect_triggers(events):
-            interval = int(trig.get("interval", 60))
-            delay(interval, self._run_random_trigger, trig, persistent=True)
-
-
-def _iter_time_trigger_objects():
-    """Yield pairs of objects and attribute names that may hold time triggers."""
-    attrs = ("triggers", "obj_triggers", "room_triggers")
-    seen = set()
-    for attr in attrs:
-        for obj in ObjectDB.objects.get_by_attribute(key=attr):
-            if obj.id in seen:
-                continue
-            seen.add(obj.id)
-            yield obj, attr
+        """Register any random triggers with the trigger scheduler."""
+        intervals = {trig.interval for trig in self.prepared("random")}
+        trigger_scheduler.schedule(self.obj, self.attr, intervals)
+
+
+# hour/time trigger index ----------------------------------------------------
+
+#: Attributes that may hold hour and time triggers.
+TIME_TRIGGER_ATTRS = ("triggers", "obj_triggers", "room_triggers")
+
+# (object id, trigger attribute) pairs with hour or time triggers, bucketed
+# by event and by the hour or "HH:MM" they fire at; None fires every time
+_TIME_INDEX: dict[str, dict[Any, set[tuple[int, str]]]] = {"hour": {}, "time": {}}
+# object id -> the (event, when, attr) entries it holds in _TIME_INDEX
+_TIME_ENTRIES: dict[int, list[tuple[str, Any, str]]] = {}
+# id of every trigger attribute of an indexed object -> id of the object
+_TIME_ATTRS: dict[int, int] = {}
+# objects whose trigger attributes changed since the last dispatch
+_TIME_DIRTY: set[int] = set()
+_TIME_STATE = {"loaded": False}
+
+
+def _unindex_time_triggers(obj_id: int) -> None:
+    for event, when, attr in _TIME_ENTRIES.pop(obj_id, ()):
+        bucket = _TIME_INDEX[event].get(when)
+        if bucket is not None:
+            bucket.discard((obj_id, attr))
+            if not bucket:
+                del _TIME_INDEX[event][when]
+
+
+def _index_time_triggers(obj) -> None:
+    """Record the hour and time triggers of ``obj`` in the index."""
+    _unindex_time_triggers(obj.id)
+    entries = []
+    for attr in TIME_TRIGGER_ATTRS:
+        stored = obj.attributes.get(attr, return_obj=True)
+        if stored is None:
+            continue
+        _TIME_ATTRS[stored.id] = obj.id
+        manager = TriggerManager(obj, attr=attr)
+        for event, other in (("hour", "time"), ("time", "hour")):
+            for trig in manager.prepared(event):
+                # a trigger also keyed on the other field can never fire
+                if trig.disabled or getattr(trig, other) is not None:
+                    continue
+                when = getattr(trig, event)
+                try:
+                    bucket = _TIME_INDEX[event].setdefault(when, set())
+                except TypeError:
+                    continue
+                bucket.add((obj.id, attr))
+                entries.append((event, when, attr))
+    if entries:
+        _TIME_ENTRIES[obj.id] = entries
+
+
+def _refresh_time_index() -> None:
+    if not _TIME_STATE["loaded"]:
+        reset_time_index()
+        for attr in TIME_TRIGGER_ATTRS:
+            for obj in ObjectDB.objects.get_by_attribute(key=attr):
+                if obj.id not in _TIME_ENTRIES:
+                    _index_time_triggers(obj)
+        _TIME_STATE["loaded"] = True
+    while _TIME_DIRTY:
+        obj_id = _TIME_DIRTY.pop()
+        obj = ObjectDB.objects.get_id(obj_id)
+        if obj is None:
+            _unindex_time_triggers(obj_id)
+        else:
+            _index_time_triggers(obj)
+
+
+def reset_time_index() -> None:
+    """Forget the hour/time trigger index; it is rebuilt on next use."""
+    for buckets in _TIME_INDEX.values():
+        buckets.clear()
+    _TIME_ENTRIES.clear()
+    _TIME_ATTRS.clear()
+    _TIME_DIRTY.clear()
+    _TIME_STATE["loaded"] = False
+
+
+def _iter_due_time_triggers(event: str, when):
+    """Yield pairs of objects and attribute names with ``event`` triggers due at ``when``."""
+    _refresh_time_index()
+    buckets = _TIME_INDEX[event]
+    due = buckets.get(when, set()) | buckets.get(None, set())
+    for obj_id, attr in sorted(due):
+        obj = ObjectDB.objects.get_id(obj_id)
+        if obj is None:
+            _unindex_time_triggers(obj_id)
+            continue
+        yield obj, attr
 
 
 def process_hour_triggers(current_time: datetime | None = None):
-    """Check all objects for hour-based triggers."""
+    """Check the objects with hour-based triggers due this hour."""
     now = current_time or datetime.now()
     hour = now.hour
-    for obj, attr in _iter_time_trigger_objects():
+    for obj, attr in _iter_due_time_triggers("hour", hour):
         TriggerManager(obj, attr=attr).check("hour", hour=hour)
 
 
 def process_time_triggers(current_time: datetime | None = None):
-    """Check all objects for time-based triggers."""
+    """Check the objects with time-based triggers due this minute."""
     now = current_time or datetime.now()
     timestr = now.strftime("%H:%M")
-    for obj, attr in _iter_time_trigger_objects():
+    for obj, attr in _iter_due_time_triggers("time", timestr):
         TriggerManager(obj, attr=attr).check("time", time=timestr)
+
+
+def _on_attribute_changed(sender, instance, **kwargs):
+    obj_id = _ATTR_OWNERS.pop(instance.id, None)
+    if obj_id is not None:
+        _TABLES.pop(obj_id, None)
+    obj_id = _TIME_ATTRS.get(instance.id)
+    if obj_id is not None and _TIME_STATE["loaded"]:
+        _TIME_DIRTY.add(obj_id)
+
+
+def _is_time_attr(attr_id) -> bool:
+    attr = Attribute.get_cached_instance(attr_id)
+    return attr is None or attr.db_key in TIME_TRIGGER_ATTRS
+
+
+def _on_attribute_linked(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    # the index is built from the database on first use; until then there
+    # is nothing to keep up to date
+    indexed = _TIME_STATE["loaded"]
+    if not reverse:
+        _TABLES.pop(instance.id, None)
+        if indexed and (action == "post_clear" or any(map(_is_time_attr, pk_set or ()))):
+            _TIME_DIRTY.add(instance.id)
+    else:
+        for obj_id in pk_set or ():
+            _TABLES.pop(obj_id, None)
+        if indexed and instance.db_key in TIME_TRIGGER_ATTRS:
+            _TIME_DIRTY.update(pk_set or ())
+
+
+def _forget(obj_id: int) -> None:
+    _TABLES.pop(obj_id, None)
+    _unindex_time_triggers(obj_id)
+    _TIME_DIRTY.discard(obj_id)
+
+
+post_save.connect(_on_attribute_changed, sender=Attribute, dispatch_uid="triggers_attr_save")
+post_delete.connect(_on_attribute_changed, sender=Attribute, dispatch_uid="triggers_attr_delete")
+m2m_changed.connect(
+    _on_attribute_linked, sender=ObjectDB.db_attributes.through, dispatch_uid="triggers_attr_add"
+)
+on_object_deleted(_forget)